@@ -32,19 +32,64 @@ class BaseChunker(JSONSerializable):
         remote sources or local content for local loaders.
         :param app_id: App id used to generate the doc_id.
         """
+        chunk_stream = self.stream_chunks(loader, src, app_id=app_id, config=config, **kwargs)
         documents = []
         chunk_ids = []
-        id_map = {}
+        metadatas = []
+        for chunk_id, chunk, metadata in chunk_stream["chunks"]:
+            chunk_ids.append(chunk_id)
+            documents.append(chunk)
+            metadatas.append(metadata)
+        return {
+            "documents": documents,
+            "ids": chunk_ids,
+            "metadatas": metadatas,
+            "doc_id": chunk_stream["doc_id"],
+            # files whose previously stored chunks are outdated (reported by incremental loaders)
+            "stale_files": chunk_stream["stale_files"],
+            # files that were not reloaded because their stored chunks are still current
+            "unchanged_files": chunk_stream["unchanged_files"],
+        }
+
+    def stream_chunks(
+        self,
+        loader,
+        src,
+        app_id=None,
+        config: Optional[ChunkerConfig] = None,
+        **kwargs: Optional[dict[str, Any]],
+    ):
+        """
+        Loads data and lazily chunks it.
+
+        Unlike `create_chunks`, the chunks are not collected in memory: they are
+        produced one record at a time while the caller consumes them.
+
+        :param loader: The loader whose `load_data` method is used to create
+        the raw data.
+        :param src: The data to be handled by the loader. Can be a URL for
+        remote sources or local content for local loaders.
+        :param app_id: App id used to generate the doc_id.
+        :return: dict with the `doc_id`, the `stale_files`, the `unchanged_files`
+        and `chunks`, a generator of `(chunk_id, chunk, metadata)` tuples.
+        """
         min_chunk_size = config.min_chunk_size if config is not None else 1
         logger.info(f"Skipping chunks smaller than {min_chunk_size} characters")
         data_result = loader.load_data(src, **kwargs)
-        data_records = data_result["data"]
         doc_id = data_result["doc_id"]
         # Prefix app_id in the document id if app_id is not None to
         # distinguish between different documents stored in the same
         # elasticsearch or opensearch index
         doc_id = f"{app_id}--{doc_id}" if app_id is not None else doc_id
-        metadatas = []
+        return {
+            "doc_id": doc_id,
+            "stale_files": data_result.get("stale_files", []),
+            "unchanged_files": data_result.get("unchanged_files", []),
+            "chunks": self._iter_chunks(data_result["data"], src, doc_id, app_id, min_chunk_size),
+        }
+
+    def _iter_chunks(self, data_records, src, doc_id, app_id, min_chunk_size):
+        seen_ids = set()
         for data in data_records:
             content = data["content"]
 
@@ -61,17 +106,9 @@ class BaseChunker(JSONSerializable):
             for chunk in chunks:
                 chunk_id = hashlib.sha256((chunk + url).encode()).hexdigest()
                 chunk_id = f"{app_id}--{chunk_id}" if app_id is not None else chunk_id
-                if id_map.get(chunk_id) is None and len(chunk) >= min_chunk_size:
-                    id_map[chunk_id] = True
-                    chunk_ids.append(chunk_id)
-                    documents.append(chunk)
-                    metadatas.append(metadata)
-        return {
-            "documents": documents,
-            "ids": chunk_ids,
-            "metadatas": metadatas,
-            "doc_id": doc_id,
-        }
+                if chunk_id not in seen_ids and len(chunk) >= min_chunk_size:
+                    seen_ids.add(chunk_id)
+                    yield chunk_id, chunk, metadata
 
     def get_chunks(self, content):
         """
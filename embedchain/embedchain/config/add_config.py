@@ -66,6 +66,8 @@ class AddConfig(BaseConfig):
         self,
         chunker: Optional[ChunkerConfig] = None,
         loader: Optional[LoaderConfig] = None,
+        batch_size: int = 2048,
+        max_concurrent_batches: int = 4,
     ):
         """
         Initializes a configuration class instance for the `add` method.
@@ -74,6 +76,17 @@ class AddConfig(BaseConfig):
         :type chunker: Optional[ChunkerConfig], optional
         :param loader: Loader config, defaults to None
         :type loader: Optional[LoaderConfig], optional
+        :param batch_size: Number of chunks embedded and written to the database at once, defaults to 2048
+        :type batch_size: int, optional
+        :param max_concurrent_batches: Maximum number of batches being embedded and written at the same time,
+        defaults to 4
+        :type max_concurrent_batches: int, optional
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+        if max_concurrent_batches < 1:
+            raise ValueError(f"max_concurrent_batches must be a positive integer, got {max_concurrent_batches}")
         self.loader = loader
         self.chunker = chunker
+        self.batch_size = batch_size
+        self.max_concurrent_batches = max_concurrent_batches
@@ -1,6 +1,7 @@
 import hashlib
 import json
 import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Any, Optional, Union
 
 from dotenv import load_dotenv
@@ -21,6 +22,7 @@ from embedchain.embedder.base import BaseEmbedder
 from embedchain.helpers.json_serializable import JSONSerializable
 from embedchain.llm.base import BaseLlm
 from embedchain.loaders.base_loader import BaseLoader
+from embedchain.loaders.directory_loader import DirectoryLoader
 from embedchain.models.data_type import (
     DataType,
     DirectDataType,
@@ -189,7 +191,7 @@ class EmbedChain(JSONSerializable):
         self.user_asks.append([source, data_type.value, metadata])
 
         data_formatter = DataFormatter(data_type, config, loader, chunker)
-        documents, metadatas, _ids, new_chunks = self._load_and_embed(
+        documents, metadatas, _ids, new_chunks, word_count = self._load_and_embed(
             data_formatter.loader, data_formatter.chunker, source, metadata, source_hash, config, dry_run, **kwargs
         )
         if data_type in {DataType.DOCS_SITE}:
@@ -222,10 +224,6 @@ class EmbedChain(JSONSerializable):
 
         # Send anonymous telemetry
         if self.config.collect_metrics:
-            # it's quicker to check the variable twice than to count words when they won't be submitted.
-            word_count = data_formatter.chunker.get_word_count(documents)
-
-            # Send anonymous telemetry
             event_properties = {
                 **self._telemetry_props,
                 "data_type": data_type.value,
@@ -252,6 +250,9 @@ class EmbedChain(JSONSerializable):
             # These types have an indirect source reference
             # As long as the reference is the same, they can be updated.
             where = {"url": src}
+            if chunker.data_type == DataType.DIRECTORY:
+                # chunks of a directory carry the path of their file
+                where = {"directory": src}
             if chunker.data_type == DataType.JSON and is_valid_json_string(src):
                 url = hashlib.sha256((src).encode("utf-8")).hexdigest()
                 where = {"url": url}
@@ -323,30 +324,59 @@ class EmbedChain(JSONSerializable):
         :type add_config: AddConfig, optional
         :param dry_run: A dry run returns chunks and doesn't update DB.
         :type dry_run: bool, defaults to False
-        :return: (list) documents (embedded text), (list) metadata, (list) ids, (int) number of chunks
+        :return: (list) documents (embedded text), (list) metadata, (list) ids, (int) number of new chunks,
+        (int) word count of the new chunks. Only dry runs collect the documents, metadata and ids of the chunks
+        they would add; real runs stream the chunks to the database batch by batch, so they always return empty
+        documents and metadata lists, and the ids of every chunk of the source unless it did not change.
+        :rtype: tuple[list[str], list[dict[str, Any]], list[str], int, int]
         """
+        add_config = add_config or AddConfig()
         existing_doc_id = self._get_existing_doc_id(chunker=chunker, src=src)
         app_id = self.config.id if self.config is not None else None
 
-        # Create chunks
-        embeddings_data = chunker.create_chunks(loader, src, app_id=app_id, config=add_config.chunker, **kwargs)
-        # spread chunking results
-        documents = embeddings_data["documents"]
-        metadatas = embeddings_data["metadatas"]
-        ids = embeddings_data["ids"]
-        new_doc_id = embeddings_data["doc_id"]
+        if isinstance(loader, DirectoryLoader):
+            loader.manifest_scope = f"{app_id}:{self.db.config.collection_name}"
+            # Nothing of the directory is stored in this app and collection (e.g. after a reset), sync every file
+            if existing_doc_id is None:
+                loader.discard_manifest(src)
+
+        # Chunks are produced lazily and consumed batch by batch below
+        chunk_stream = chunker.stream_chunks(loader, src, app_id=app_id, config=add_config.chunker, **kwargs)
+        new_doc_id = chunk_stream["doc_id"]
+        stale_files = chunk_stream["stale_files"]
+        # Incremental loaders skip the files that did not change, whose stored chunks must be kept
+        unchanged_files = chunk_stream["unchanged_files"]
 
         if existing_doc_id and existing_doc_id == new_doc_id:
             logger.info("Doc content has not changed. Skipping creating chunks and embeddings")
-            return [], [], [], 0
+            return [], [], [], 0, 0
+
+        # Incremental loaders only return what changed, drop the chunks of modified and removed files.
+        if stale_files and not dry_run:
+            logger.info(f"Removing chunks of {len(stale_files)} changed or deleted files.")
+            for stale_file in stale_files:
+                stale_where = {"file_path": stale_file}
+                if self.config.id is not None:
+                    stale_where["app_id"] = self.config.id
+                self.db.delete(stale_where)
 
         # this means that doc content has changed.
-        if existing_doc_id and existing_doc_id != new_doc_id:
+        doc_changed = existing_doc_id and existing_doc_id != new_doc_id
+        stored_ids = set()
+        if doc_changed:
             logger.info("Doc content has changed. Recomputing chunks and embeddings intelligently.")
-            self.db.delete({"doc_id": existing_doc_id})
+            # A partial load only holds the changed files, whose old chunks were removed with the stale files.
+            # Diffing it against the whole stored document would drop the chunks of every unchanged file, which
+            # are moved to the new doc_id instead.
+            if not dry_run and unchanged_files:
+                self._retarget_unchanged_chunks(existing_doc_id, new_doc_id, unchanged_files)
+            elif not dry_run:
+                stored_ids = set(self.db.get(where={"doc_id": existing_doc_id})["ids"])
 
         # get existing ids, and discard doc if any common id exist.
         where = {"url": src}
+        if chunker.data_type == DataType.DIRECTORY:
+            where = {"directory": src}
         if chunker.data_type == DataType.JSON and is_valid_json_string(src):
             url = hashlib.sha256((src).encode("utf-8")).hexdigest()
             where = {"url": url}
@@ -358,71 +388,201 @@ class EmbedChain(JSONSerializable):
         if self.config.id is not None:
             where["app_id"] = self.config.id
 
-        db_result = self.db.get(ids=ids, where=where)  # optional filter
-        existing_ids = set(db_result["ids"])
-        if len(existing_ids):
-            data_dict = {id: (doc, meta) for id, doc, meta in zip(ids, documents, metadatas)}
-            data_dict = {id: value for id, value in data_dict.items() if id not in existing_ids}
-
-            if not data_dict:
-                src_copy = src
-                if len(src_copy) > 50:
-                    src_copy = src[:50] + "..."
-                logger.info(f"All data from {src_copy} already exists in the database.")
-                # Make sure to return a matching return type
-                return [], [], [], 0
-
-            ids = list(data_dict.keys())
-            documents, metadatas = zip(*data_dict.values())
-
-        # Loop though all metadatas and add extras.
-        new_metadatas = []
-        for m in metadatas:
-            # Add app id in metadatas so that they can be queried on later
-            if self.config.id:
-                m["app_id"] = self.config.id
-
-            # Add hashed source
-            m["hash"] = source_hash
-
-            # Note: Metadata is the function argument
-            if metadata:
-                # Spread whatever is in metadata into the new object.
-                m.update(metadata)
-
-            new_metadatas.append(m)
-        metadatas = new_metadatas
-
-        if dry_run:
-            return list(documents), metadatas, ids, 0
-
-        # Count before, to calculate a delta in the end.
-        chunks_before_addition = self.db.count()
-
-        # Filter out empty documents and ensure they meet the API requirements
-        valid_documents = [doc for doc in documents if doc and isinstance(doc, str)]
+        all_documents, all_metadatas, all_ids = [], [], []
+        seen_ids, reused_ids = set(), set()
+        chunks_count, count_new_chunks, word_count, failed_batches = 0, 0, 0, 0
 
-        documents = valid_documents
+        def write_batch(batch_docs, batch_meta, batch_ids):
+            self.db.add(documents=batch_docs, metadatas=batch_meta, ids=batch_ids, **kwargs)
+            return len(batch_ids), chunker.get_word_count(batch_docs)
 
-        # Chunk documents into batches of 2048 and handle each batch
-        # helps wigth large loads of embeddings  that hit OpenAI limits
-        document_batches = [documents[i : i + 2048] for i in range(0, len(documents), 2048)]
-        metadata_batches = [metadatas[i : i + 2048] for i in range(0, len(metadatas), 2048)]
-        id_batches = [ids[i : i + 2048] for i in range(0, len(ids), 2048)]
-        for batch_docs, batch_meta, batch_ids in zip(document_batches, metadata_batches, id_batches):
+        def collect(future):
+            nonlocal count_new_chunks, word_count, failed_batches
             try:
-                # Add only valid batches
-                if batch_docs:
-                    self.db.add(documents=batch_docs, metadatas=batch_meta, ids=batch_ids, **kwargs)
+                added, words = future.result()
+                count_new_chunks += added
+                word_count += words
             except Exception as e:
                 logger.info(f"Failed to add batch due to a bad request: {e}")
                 # Handle the error, e.g., by logging, retrying, or skipping
-                pass
+                failed_batches += 1
+
+        # Batches are embedded and written by a bounded pool, so embedding of a batch overlaps with writing the
+        # previous ones while at most `max_concurrent_batches` batches are held in memory.
+        max_in_flight = add_config.max_concurrent_batches
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            in_flight = set()
+            for batch in self._iter_chunk_batches(chunk_stream["chunks"], add_config.batch_size):
+                chunks_count += len(batch)
+                ids, documents, metadatas = [], [], []
+                for chunk_id, document, m in batch:
+                    seen_ids.add(chunk_id)
+                    # Add app id in metadatas so that they can be queried on later
+                    if self.config.id:
+                        m["app_id"] = self.config.id
+
+                    # Add hashed source
+                    m["hash"] = source_hash
+
+                    # Note: Metadata is the function argument
+                    if metadata:
+                        # Spread whatever is in metadata into the new object.
+                        m.update(metadata)
+
+                    # Filter out empty documents and ensure they meet the API requirements
+                    if document and isinstance(document, str):
+                        ids.append(chunk_id)
+                        documents.append(document)
+                        metadatas.append(m)
+
+                if stored_ids:
+                    reused = self._reuse_stored_chunks(existing_doc_id, stored_ids, ids, metadatas)
+                    if reused:
+                        reused_ids |= reused
+                        kept = [(i, doc, meta) for i, doc, meta in zip(ids, documents, metadatas) if i not in reused]
+                        ids, documents, metadatas = (list(column) for column in zip(*kept)) if kept else ([], [], [])
+
+                if ids:
+                    existing_ids = set(self.db.get(ids=ids, where=where)["ids"])  # optional filter
+                    if existing_ids:
+                        kept = [
+                            (i, doc, meta) for i, doc, meta in zip(ids, documents, metadatas) if i not in existing_ids
+                        ]
+                        ids, documents, metadatas = (list(column) for column in zip(*kept)) if kept else ([], [], [])
+
+                if not ids:
+                    continue
+
+                if dry_run:
+                    all_ids.extend(ids)
+                    all_documents.extend(documents)
+                    all_metadatas.extend(metadatas)
+                    continue
+
+                in_flight.add(executor.submit(write_batch, documents, metadatas, ids))
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future)
+
+            for future in in_flight:
+                collect(future)
+
+        removed_count = 0
+        if stored_ids:
+            removed_ids = stored_ids - seen_ids
+            removed_count = len(removed_ids)
+            self._remove_vanished_chunks(existing_doc_id, removed_ids)
 
-        count_new_chunks = self.db.count() - chunks_before_addition
+        if dry_run:
+            return all_documents, all_metadatas, all_ids, 0, chunker.get_word_count(all_documents)
+
+        if not count_new_chunks and not failed_batches and chunks_count > len(reused_ids):
+            src_copy = src
+            if len(src_copy) > 50:
+                src_copy = src[:50] + "..."
+            logger.info(f"All data from {src_copy} already exists in the database.")
+
+        # Only remember the synced directory state if everything made it into the database
+        if isinstance(loader, DirectoryLoader) and not failed_batches:
+            loader.save_manifest(src)
         logger.info(f"Successfully saved {str(src)[:100]} ({chunker.data_type}). New chunks count: {count_new_chunks}")
+        if doc_changed:
+            logger.info(f"Chunks reused: {len(reused_ids)}, added: {count_new_chunks}, removed: {removed_count}")
+
+        return [], [], list(seen_ids), count_new_chunks, word_count
+
+    @staticmethod
+    def _iter_chunk_batches(chunks, batch_size: int):
+        """
+        Group a stream of chunks into lists of at most `batch_size` chunks.
+        """
+        batch = []
+        for chunk in chunks:
+            batch.append(chunk)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _reuse_stored_chunks(
+        self, existing_doc_id: str, stored_ids: set[str], ids: list[str], metadatas: list[dict[str, Any]]
+    ):
+        """
+        Keep the stored chunks of a changed document that are part of its new version.
+
+        Chunk ids are content hashes, so chunks present in both versions keep their
+        embeddings and only get their metadata (e.g. `doc_id`) retargeted. Vector
+        databases without metadata updates fall back to deleting the whole previous
+        document, in which case `stored_ids` is emptied and every chunk is re-embedded.
+
+        :param existing_doc_id: doc_id of the stored version of the document.
+        :type existing_doc_id: str
+        :param stored_ids: Chunk ids of the stored version, emptied on fallback.
+        :type stored_ids: set[str]
+        :param ids: Chunk ids of a batch of the new version.
+        :type ids: list[str]
+        :param metadatas: Metadata of the new chunks, aligned with `ids`.
+        :type metadatas: list[dict[str, Any]]
+        :return: (set) ids of the reused chunks
+        """
+        new_chunks = dict(zip(ids, metadatas))
+        reused_ids = stored_ids & new_chunks.keys()
+        if not reused_ids:
+            return set()
+
+        try:
+            self.db.update_metadatas(ids=list(reused_ids), metadatas=[new_chunks[chunk_id] for chunk_id in reused_ids])
+        except NotImplementedError:
+            self.db.delete({"doc_id": existing_doc_id})
+            stored_ids.clear()
+            return set()
+        return reused_ids
+
+    def _retarget_unchanged_chunks(self, existing_doc_id: str, new_doc_id: str, unchanged_files: list[str]):
+        """
+        Move the stored chunks of the files an incremental load skipped to the new doc_id.
+
+        Vector databases without metadata updates keep them under the previous doc_id.
 
-        return list(documents), metadatas, ids, count_new_chunks
+        :param existing_doc_id: doc_id of the stored version of the document.
+        :type existing_doc_id: str
+        :param new_doc_id: doc_id of the new version of the document.
+        :type new_doc_id: str
+        :param unchanged_files: Paths of the files whose stored chunks are still current.
+        :type unchanged_files: list[str]
+        """
+        stored = self.db.get(where={"doc_id": existing_doc_id})
+        unchanged_files = set(unchanged_files)
+        ids, metadatas = [], []
+        for chunk_id, chunk_metadata in zip(stored["ids"], stored.get("metadatas") or []):
+            if chunk_metadata and chunk_metadata.get("file_path") in unchanged_files:
+                ids.append(chunk_id)
+                metadatas.append({**chunk_metadata, "doc_id": new_doc_id})
+        if not ids:
+            return
+        try:
+            self.db.update_metadatas(ids=ids, metadatas=metadatas)
+        except NotImplementedError:
+            logger.debug(f"Keeping {len(ids)} chunks of unchanged files under doc_id {existing_doc_id}")
+
+    def _remove_vanished_chunks(self, existing_doc_id: str, removed_ids: set[str]):
+        """
+        Delete the stored chunks of a changed document that are not part of its new version.
+
+        :param existing_doc_id: doc_id of the stored version of the document.
+        :type existing_doc_id: str
+        :param removed_ids: Ids of the chunks that vanished.
+        :type removed_ids: set[str]
+        """
+        if not removed_ids:
+            return
+        try:
+            self.db.delete_by_ids(list(removed_ids))
+        except NotImplementedError:
+            # reused chunks already point to the new doc_id, so only the vanished ones are left behind
+            self.db.delete({"doc_id": existing_doc_id})
 
     @staticmethod
     def _format_result(results):
@@ -1,9 +1,13 @@
 import hashlib
+import json
 import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any, Optional
 
 from embedchain.config import AddConfig
+from embedchain.constants import CONFIG_DIR
 from embedchain.data_formatter.data_formatter import DataFormatter
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.loaders.base_loader import BaseLoader
@@ -15,14 +19,29 @@ logger = logging.getLogger(__name__)
 
 @register_deserializable
 class DirectoryLoader(BaseLoader):
-    """Load data from a directory."""
+    """
+    Load data from a directory.
+
+    When `incremental` is enabled (the default), a manifest of
+    `(path, mtime, size, content hash)` is kept for every directory. On a
+    re-sync only new and modified files are loaded, the paths of files that
+    changed or disappeared are returned as `stale_files` so their old chunks can
+    be removed, and the paths of the files that were skipped are returned as
+    `unchanged_files` so their stored chunks are kept.
+    """
 
     def __init__(self, config: Optional[dict[str, Any]] = None):
         super().__init__()
         config = config or {}
         self.recursive = config.get("recursive", True)
         self.extensions = config.get("extensions", None)
+        self.incremental = config.get("incremental", True)
+        self.max_workers = config.get("max_workers", min(8, os.cpu_count() or 1))
+        self.manifest_dir = config.get("manifest_dir", os.path.join(CONFIG_DIR, "manifests"))
+        # Apps and collections syncing the same directory each keep their own manifest
+        self.manifest_scope = ""
         self.errors = []
+        self._pending_manifests = {}
 
     def load_data(self, path: str):
         directory_path = Path(path)
@@ -30,26 +49,139 @@ class DirectoryLoader(BaseLoader):
             raise ValueError(f"Invalid path: {path}")
 
         logger.info(f"Loading data from directory: {path}")
-        data_list = self._process_directory(directory_path)
-        doc_id = hashlib.sha256((str(data_list) + str(directory_path)).encode()).hexdigest()
+        previous_manifest = self._read_manifest(directory_path) if self.incremental else {}
+        data_list, manifest = self._process_directory(directory_path, previous_manifest)
+        # the chunks of the whole directory are tracked through the path it was added with
+        for record in data_list:
+            record["meta_data"]["directory"] = path
+
+        # Files that changed or disappeared since the last sync have stale chunks in the database
+        stale_files = [
+            file_path
+            for file_path, entry in previous_manifest.items()
+            if file_path not in manifest or manifest[file_path]["hash"] != entry["hash"]
+        ]
+        unchanged_files = [
+            file_path
+            for file_path, entry in manifest.items()
+            if file_path in previous_manifest and previous_manifest[file_path]["hash"] == entry["hash"]
+        ]
+        self._pending_manifests[str(directory_path)] = manifest
+
+        content_hashes = "".join(f"{file_path}:{manifest[file_path]['hash']}" for file_path in sorted(manifest))
+        doc_id = hashlib.sha256((content_hashes + str(directory_path)).encode()).hexdigest()
 
         for error in self.errors:
             logger.warning(error)
 
-        return {"doc_id": doc_id, "data": data_list}
+        if previous_manifest:
+            logger.info(
+                f"Directory sync for {path}: {len(data_list)} records reloaded, {len(stale_files)} files stale"
+            )
 
-    def _process_directory(self, directory_path: Path):
-        data_list = []
+        return {"doc_id": doc_id, "data": data_list, "stale_files": stale_files, "unchanged_files": unchanged_files}
+
+    def save_manifest(self, path: str):
+        """
+        Persist the manifest computed by the last `load_data` call for `path`.
+
+        Called once the loaded data has been embedded, so that a failed sync is
+        retried in full next time.
+        """
+        manifest = self._pending_manifests.pop(str(Path(path)), None)
+        if manifest is None or not self.incremental:
+            return
+
+        os.makedirs(self.manifest_dir, exist_ok=True)
+        manifest_path = self._manifest_path(Path(path))
+        tmp_path = f"{manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, manifest_path)
+
+    def discard_manifest(self, path: str):
+        """
+        Forget the last sync of `path`, so that the next `load_data` call loads every file.
+
+        Used when none of the directory is stored, e.g. after a reset.
+        """
+        manifest_path = self._manifest_path(Path(path))
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+
+    def _manifest_path(self, directory_path: Path) -> str:
+        key = hashlib.sha256(f"{self.manifest_scope}:{directory_path.resolve()}".encode()).hexdigest()
+        return os.path.join(self.manifest_dir, f"{key}.json")
+
+    def _read_manifest(self, directory_path: Path) -> dict[str, dict[str, Any]]:
+        manifest_path = self._manifest_path(directory_path)
+        if not os.path.exists(manifest_path):
+            return {}
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable directory manifest {manifest_path}: {e}")
+            return {}
+
+    def _iter_files(self, directory_path: Path):
         for file_path in directory_path.rglob("*") if self.recursive else directory_path.glob("*"):
             # don't include dotfiles
             if file_path.name.startswith("."):
                 continue
             if file_path.is_file() and (not self.extensions or any(file_path.suffix == ext for ext in self.extensions)):
-                loader = self._predict_loader(file_path)
-                data_list.extend(loader.load_data(str(file_path))["data"])
+                yield file_path
             elif file_path.is_dir():
                 logger.info(f"Loading data from directory: {file_path}")
-        return data_list
+
+    def _process_directory(self, directory_path: Path, previous_manifest: dict[str, dict[str, Any]]):
+        """
+        Load every new or modified file in a bounded thread pool.
+
+        Returns the loaded records and the manifest describing the current state of the directory.
+        """
+        data_list = []
+        manifest = {}
+
+        def collect(future):
+            file_path, stat, records = future.result()
+            content_hash = hashlib.sha256("".join(record["content"] for record in records).encode()).hexdigest()
+            manifest[file_path] = {"mtime": stat.st_mtime, "size": stat.st_size, "hash": content_hash}
+            previous = previous_manifest.get(file_path)
+            # A touched file whose content did not change does not need to be re-embedded
+            if previous is None or previous["hash"] != content_hash:
+                data_list.extend(records)
+
+        # Keep at most two loads per worker in flight so memory stays bounded on very large trees
+        max_in_flight = max(1, self.max_workers) * 2
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            in_flight = set()
+            for file_path in self._iter_files(directory_path):
+                stat = file_path.stat()
+                previous = previous_manifest.get(str(file_path))
+                if previous and previous["mtime"] == stat.st_mtime and previous["size"] == stat.st_size:
+                    manifest[str(file_path)] = previous
+                    continue
+
+                in_flight.add(executor.submit(self._load_file, file_path, stat))
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future)
+
+            for future in in_flight:
+                collect(future)
+
+        return data_list, manifest
+
+    def _load_file(self, file_path: Path, stat: os.stat_result):
+        loader = self._predict_loader(file_path)
+        records = loader.load_data(str(file_path))["data"]
+        for record in records:
+            # chunks of a file are tracked through its path, some loaders set a placeholder url (e.g. "local")
+            record["meta_data"]["file_path"] = str(file_path)
+            record["meta_data"].setdefault("url", str(file_path))
+        return str(file_path), stat, records
 
     def _predict_loader(self, file_path: Path) -> BaseLoader:
         try:
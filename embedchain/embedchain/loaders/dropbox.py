@@ -57,7 +57,8 @@ class DropboxLoader(BaseLoader):
                 os.makedirs(local_path, exist_ok=True)
                 self._download_folder(f"{path}/{entry.name}", local_path)
 
-        dir_loader = DirectoryLoader()
+        # The download folder is recreated on every load, so there is nothing to sync incrementally
+        dir_loader = DirectoryLoader(config={"incremental": False})
         data = dir_loader.load_data(root_dir)["data"]
 
         # Clean up
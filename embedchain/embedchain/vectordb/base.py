@@ -80,3 +80,23 @@ class BaseVectorDB(JSONSerializable):
         """Delete from database."""
 
         raise NotImplementedError
+
+    def delete_by_ids(self, ids: list[str]):
+        """
+        Delete embeddings by their chunk ids.
+
+        :param ids: Chunk ids to delete.
+        :type ids: list[str]
+        """
+        raise NotImplementedError
+
+    def update_metadatas(self, ids: list[str], metadatas: list[dict]):
+        """
+        Replace the metadata of stored chunks without re-embedding them.
+
+        :param ids: Chunk ids to update.
+        :type ids: list[str]
+        :param metadatas: New metadata, aligned with `ids`.
+        :type metadatas: list[dict]
+        """
+        raise NotImplementedError
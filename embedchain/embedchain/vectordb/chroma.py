@@ -267,6 +267,14 @@ class ChromaDB(BaseVectorDB):
     def delete(self, where):
         return self.collection.delete(where=self._generate_where_clause(where))
 
+    def delete_by_ids(self, ids: list[str]):
+        for i in range(0, len(ids), self.batch_size):
+            self.collection.delete(ids=ids[i : i + self.batch_size])
+
+    def update_metadatas(self, ids: list[str], metadatas: list[dict]):
+        for i in range(0, len(ids), self.batch_size):
+            self.collection.update(ids=ids[i : i + self.batch_size], metadatas=metadatas[i : i + self.batch_size])
+
     def reset(self):
         """
         Resets the database. Deletes all embeddings irreversibly.
@@ -97,3 +97,21 @@ def test_get_word_count(chunker):
     documents = ["This is a test.", "Another test."]
     result = chunker.get_word_count(documents)
     assert result == 6
+
+
+def test_stream_chunks_is_lazy(chunker, text_splitter_mock, loader_mock, app_id):
+    text_splitter_mock.split_text.return_value = ["Chunk 1", "Chunk 1", "Chunk 2"]
+    loader_mock.load_data.return_value = {
+        "data": [{"content": "Content 1", "meta_data": {"url": "URL 1"}}],
+        "doc_id": "DocID",
+        "stale_files": ["URL 0"],
+        "unchanged_files": ["URL 2"],
+    }
+
+    result = chunker.stream_chunks(loader_mock, "test_src", app_id)
+
+    assert result["doc_id"] == f"{app_id}--DocID"
+    assert result["stale_files"] == ["URL 0"]
+    assert result["unchanged_files"] == ["URL 2"]
+    text_splitter_mock.split_text.assert_not_called()
+    assert [chunk for _, chunk, _ in result["chunks"]] == ["Chunk 1", "Chunk 2"]
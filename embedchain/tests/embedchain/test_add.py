@@ -3,8 +3,11 @@ import os
 import pytest
 
 from embedchain import App
-from embedchain.config import AddConfig, AppConfig, ChunkerConfig
+from embedchain.config import AddConfig, AppConfig, ChromaDbConfig, ChunkerConfig
+from embedchain.embedder.base import BaseEmbedder, EmbeddingFunc
+from embedchain.loaders.directory_loader import DirectoryLoader
 from embedchain.models.data_type import DataType
+from embedchain.vectordb.chroma import ChromaDB
 
 os.environ["OPENAI_API_KEY"] = "test_key"
 
@@ -50,3 +53,26 @@ def test_dry_run(app):
         assert isinstance(item, dict)
         assert "local" in item["url"]
         assert "text" in item["data_type"]
+
+
+def test_readd_directory_keeps_unchanged_files(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.txt").write_text("alpha")
+    (docs / "b.txt").write_text("bravo")
+    embedder = BaseEmbedder()
+    embedder.set_embedding_fn(EmbeddingFunc(lambda texts: [[float(len(text)), 1.0, 0.0] for text in texts]))
+    embedder.set_vector_dimension(3)
+    db = ChromaDB(config=ChromaDbConfig(allow_reset=True, dir=str(tmp_path / "db")))
+    app = App(config=AppConfig(collect_metrics=False), db=db, embedding_model=embedder)
+    loader = DirectoryLoader(config={"manifest_dir": str(tmp_path / "manifests")})
+
+    app.add(str(docs), data_type="directory", loader=loader)
+    (docs / "a.txt").write_text("alpha v2")
+    app.add(str(docs), data_type="directory", loader=loader)
+
+    stored = app.db.get(where={"directory": str(docs)})
+    documents = {metadata["url"]: document for document, metadata in zip(stored["documents"], stored["metadatas"])}
+    assert len(stored["ids"]) == 2
+    assert documents == {str(docs / "a.txt"): "alpha v2", str(docs / "b.txt"): "bravo"}
+    assert len({metadata["doc_id"] for metadata in stored["metadatas"]}) == 1
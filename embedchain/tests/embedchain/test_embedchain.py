@@ -4,10 +4,15 @@ import pytest
 from chromadb.api.models.Collection import Collection
 
 from embedchain import App
-from embedchain.config import AppConfig, ChromaDbConfig
+from embedchain.chunkers.common_chunker import CommonChunker
+from embedchain.chunkers.text import TextChunker
+from embedchain.config import AddConfig, AppConfig, ChromaDbConfig, ChunkerConfig
 from embedchain.embedchain import EmbedChain
 from embedchain.llm.base import BaseLlm
+from embedchain.loaders.directory_loader import DirectoryLoader
+from embedchain.loaders.local_text import LocalTextLoader
 from embedchain.memory.base import ChatHistory
+from embedchain.models.data_type import DataType
 from embedchain.vectordb.chroma import ChromaDB
 
 os.environ["OPENAI_API_KEY"] = "test-api-key"
@@ -73,3 +78,123 @@ def test_add_with_incorrect_content(app_instance, mocker):
 
     with pytest.raises(TypeError):
         app_instance.add(content, data_type="json")
+
+
+def test_reuse_stored_chunks(app_instance, mocker):
+    update_metadatas = mocker.patch.object(app_instance.db, "update_metadatas")
+    stored_ids = {"a", "b", "c"}
+
+    reused_ids = app_instance._reuse_stored_chunks("old-doc", stored_ids, ["a", "b", "d"], [{"doc_id": "new-doc"}] * 3)
+
+    assert reused_ids == {"a", "b"}
+    update_metadatas.assert_called_once()
+    assert sorted(update_metadatas.call_args.kwargs["ids"]) == ["a", "b"]
+
+
+def test_reuse_stored_chunks_without_metadata_updates(app_instance, mocker):
+    mocker.patch.object(app_instance.db, "update_metadatas", side_effect=NotImplementedError)
+    delete = mocker.patch.object(app_instance.db, "delete")
+    stored_ids = {"a", "b"}
+
+    reused_ids = app_instance._reuse_stored_chunks("old-doc", stored_ids, ["a"], [{"doc_id": "new-doc"}])
+
+    assert reused_ids == set()
+    assert stored_ids == set()
+    delete.assert_called_once_with({"doc_id": "old-doc"})
+
+
+def test_remove_vanished_chunks(app_instance, mocker):
+    delete_by_ids = mocker.patch.object(app_instance.db, "delete_by_ids")
+
+    app_instance._remove_vanished_chunks("old-doc", {"c"})
+
+    delete_by_ids.assert_called_once_with(["c"])
+
+
+def test_load_and_embed_streams_batches(app_instance, mocker):
+    mocker.patch.object(app_instance.db, "get", return_value={"ids": [], "metadatas": []})
+    db_add = mocker.patch.object(app_instance.db, "add")
+    config = AddConfig(
+        chunker=ChunkerConfig(chunk_size=1, chunk_overlap=0, min_chunk_size=0), batch_size=10, max_concurrent_batches=2
+    )
+    text = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+    app_instance.add(text, data_type="text", config=config)
+
+    assert db_add.call_count == 4
+    added_ids = [chunk_id for call in db_add.call_args_list for chunk_id in call.kwargs["ids"]]
+    assert len(added_ids) == len(set(added_ids)) == len(text)
+
+
+def test_load_and_embed_counts_failed_batches(app_instance, mocker):
+    mocker.patch.object(app_instance.db, "get", return_value={"ids": [], "metadatas": []})
+    mocker.patch.object(app_instance.db, "add", side_effect=[None, ValueError("bad request"), None])
+    config = AddConfig(
+        chunker=ChunkerConfig(chunk_size=1, chunk_overlap=0, min_chunk_size=0), batch_size=4, max_concurrent_batches=1
+    )
+    chunker = TextChunker(config.chunker)
+    chunker.set_data_type(DataType.TEXT)
+
+    documents, metadatas, ids, new_chunks, word_count = app_instance._load_and_embed(
+        LocalTextLoader(), chunker, "0123456789", add_config=config
+    )
+
+    assert new_chunks == 6
+    assert word_count == 6
+    assert documents == metadatas == []
+
+
+def test_load_and_embed_partial_directory_keeps_unchanged_files(app_instance, mocker):
+    loader = mocker.MagicMock()
+    loader.load_data.return_value = {
+        "doc_id": "new-doc",
+        "data": [
+            {"content": "alpha v2", "meta_data": {"url": "local", "file_path": "docs/a.docx", "directory": "docs"}}
+        ],
+        "stale_files": ["docs/a.docx"],
+        "unchanged_files": ["docs/b.docx"],
+    }
+    chunker = CommonChunker()
+    chunker.set_data_type(DataType.DIRECTORY)
+    mocker.patch.object(app_instance, "_get_existing_doc_id", return_value="old-doc")
+    # loaders such as the docx one set a placeholder url, chunks are matched by their file path
+    stored = {
+        "ids": ["a-chunk", "b-chunk"],
+        "metadatas": [
+            {"url": "local", "file_path": "docs/a.docx", "doc_id": "old-doc"},
+            {"url": "local", "file_path": "docs/b.docx", "doc_id": "old-doc"},
+        ],
+    }
+    mocker.patch.object(app_instance.db, "get", return_value=stored)
+    delete = mocker.patch.object(app_instance.db, "delete")
+    delete_by_ids = mocker.patch.object(app_instance.db, "delete_by_ids")
+    update_metadatas = mocker.patch.object(app_instance.db, "update_metadatas")
+    mocker.patch.object(app_instance.db, "add")
+
+    app_instance._load_and_embed(loader, chunker, "docs")
+
+    deleted = [call.args[0] for call in delete.call_args_list]
+    assert [where["file_path"] for where in deleted] == ["docs/a.docx"]
+    delete_by_ids.assert_not_called()
+    # the chunks of the unchanged file move to the new doc_id
+    update_metadatas.assert_called_once_with(
+        ids=["b-chunk"],
+        metadatas=[{"url": "local", "file_path": "docs/b.docx", "doc_id": f"{app_instance.config.id}--new-doc"}],
+    )
+
+
+def test_load_and_embed_directory_resyncs_when_nothing_is_stored(app_instance, mocker, tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.txt").write_text("alpha")
+    loader = DirectoryLoader(config={"manifest_dir": str(tmp_path / "manifests")})
+    chunker = CommonChunker()
+    chunker.set_data_type(DataType.DIRECTORY)
+    mocker.patch.object(app_instance.db, "get", return_value={"ids": [], "metadatas": []})
+    db_add = mocker.patch.object(app_instance.db, "add")
+
+    app_instance._load_and_embed(loader, chunker, str(docs))
+    # e.g. the app was reset, so the unchanged directory is embedded again
+    app_instance._load_and_embed(loader, chunker, str(docs))
+
+    assert db_add.call_count == 2
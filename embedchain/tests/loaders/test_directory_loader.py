@@ -0,0 +1,109 @@
+import os
+
+import pytest
+
+from embedchain.loaders.directory_loader import DirectoryLoader
+
+
+@pytest.fixture
+def docs_dir(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.txt").write_text("alpha")
+    (docs / "b.txt").write_text("bravo")
+    (docs / "c.txt").write_text("charlie")
+    return docs
+
+
+@pytest.fixture
+def loader(tmp_path):
+    return DirectoryLoader(config={"manifest_dir": str(tmp_path / "manifests"), "max_workers": 2})
+
+
+def _contents(result):
+    return sorted(record["content"] for record in result["data"])
+
+
+def test_load_data_first_sync_loads_everything(loader, docs_dir):
+    result = loader.load_data(str(docs_dir))
+
+    assert _contents(result) == ["alpha", "bravo", "charlie"]
+    assert result["stale_files"] == []
+    for record in result["data"]:
+        assert record["meta_data"]["url"].startswith(str(docs_dir))
+        assert record["meta_data"]["file_path"] == record["meta_data"]["url"]
+        assert record["meta_data"]["directory"] == str(docs_dir)
+
+
+def test_load_data_only_reloads_changed_files(loader, docs_dir):
+    first = loader.load_data(str(docs_dir))
+    loader.save_manifest(str(docs_dir))
+
+    (docs_dir / "a.txt").write_text("alpha v2")
+    os.remove(docs_dir / "b.txt")
+    (docs_dir / "d.txt").write_text("delta")
+
+    second = loader.load_data(str(docs_dir))
+
+    assert _contents(second) == ["alpha v2", "delta"]
+    assert sorted(second["stale_files"]) == [str(docs_dir / "a.txt"), str(docs_dir / "b.txt")]
+    assert second["unchanged_files"] == [str(docs_dir / "c.txt")]
+    assert second["doc_id"] != first["doc_id"]
+
+
+def test_load_data_unchanged_directory(loader, docs_dir):
+    first = loader.load_data(str(docs_dir))
+    loader.save_manifest(str(docs_dir))
+
+    # touching a file without changing its content does not trigger a reload
+    os.utime(docs_dir / "c.txt", (0, 0))
+    second = loader.load_data(str(docs_dir))
+
+    assert second["data"] == []
+    assert second["stale_files"] == []
+    assert second["doc_id"] == first["doc_id"]
+
+
+def test_manifest_not_saved_reloads_everything(loader, docs_dir):
+    loader.load_data(str(docs_dir))
+
+    result = loader.load_data(str(docs_dir))
+
+    assert _contents(result) == ["alpha", "bravo", "charlie"]
+
+
+def test_non_incremental_loader(tmp_path, docs_dir):
+    loader = DirectoryLoader(config={"manifest_dir": str(tmp_path / "manifests"), "incremental": False})
+    loader.load_data(str(docs_dir))
+    loader.save_manifest(str(docs_dir))
+
+    result = loader.load_data(str(docs_dir))
+
+    assert _contents(result) == ["alpha", "bravo", "charlie"]
+    assert not (tmp_path / "manifests").exists()
+
+
+def test_load_data_invalid_path(loader, tmp_path):
+    with pytest.raises(ValueError):
+        loader.load_data(str(tmp_path / "missing"))
+
+
+def test_manifest_is_scoped(loader, docs_dir):
+    loader.manifest_scope = "app-1:collection"
+    loader.load_data(str(docs_dir))
+    loader.save_manifest(str(docs_dir))
+
+    loader.manifest_scope = "app-2:collection"
+    assert _contents(loader.load_data(str(docs_dir))) == ["alpha", "bravo", "charlie"]
+
+    loader.manifest_scope = "app-1:collection"
+    assert loader.load_data(str(docs_dir))["data"] == []
+
+
+def test_discard_manifest_reloads_everything(loader, docs_dir):
+    loader.load_data(str(docs_dir))
+    loader.save_manifest(str(docs_dir))
+
+    loader.discard_manifest(str(docs_dir))
+
+    assert _contents(loader.load_data(str(docs_dir))) == ["alpha", "bravo", "charlie"]
@@ -251,3 +251,24 @@ def test_chroma_db_collection_reset():
     app2.db.reset()
     app3.db.reset()
     app4.db.reset()
+
+
+def test_chroma_db_delete_by_ids_and_update_metadatas():
+    db = ChromaDB(config=ChromaDbConfig(allow_reset=True, dir="test-db"))
+    app = App(config=AppConfig(collect_metrics=False), db=db)
+    app.set_collection_name("chunk_diff_collection")
+
+    app.db.collection.add(
+        embeddings=[[0, 0, 0], [1, 1, 1], [2, 2, 2]],
+        metadatas=[{"doc_id": "old"}, {"doc_id": "old"}, {"doc_id": "old"}],
+        ids=["0", "1", "2"],
+    )
+
+    app.db.delete_by_ids(["2"])
+    app.db.update_metadatas(ids=["0", "1"], metadatas=[{"doc_id": "new"}, {"doc_id": "new"}])
+
+    assert app.db.count() == 2
+    assert sorted(app.db.get(where={"doc_id": "new"})["ids"]) == ["0", "1"]
+
+    # cleanup
+    app.db.reset()
@@ -0,0 +1,121 @@
+"""
+Benchmark entity lookups of the graph memory with and without the native vector index.
+
+Loads synthetic entity nodes into an embedded Kuzu database, then times the node
+lookup that every add runs for its entities (`_search_nodes`) once through the
+HNSW index and once by scanning the scope, and reports how often both agree on
+the matched node.
+
+    python benchmark_graph_vector_index.py --num_nodes 100000 --dims 384
+"""
+
+import argparse
+import tempfile
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from mem0.memory.kuzu_memory import MemoryGraph
+
+
+def load_embeddings(args):
+    """Clustered unit vectors that behave like entity name embeddings, plus noisy copies used as queries."""
+    rng = np.random.default_rng(args.seed)
+    centers = rng.standard_normal((max(1, args.num_nodes // 100), args.dims))
+    assignments = rng.integers(0, len(centers), args.num_nodes)
+    nodes = centers[assignments] + 0.5 * rng.standard_normal((args.num_nodes, args.dims))
+    nodes /= np.linalg.norm(nodes, axis=1, keepdims=True)
+
+    query_rows = rng.choice(args.num_nodes, args.num_queries, replace=False)
+    queries = nodes[query_rows] + 0.05 * rng.standard_normal((args.num_queries, args.dims))
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    return nodes.astype(np.float32), queries.astype(np.float32), query_rows
+
+
+def create_graph(path, dims):
+    config = SimpleNamespace(
+        embedder=SimpleNamespace(provider="benchmark", config={}),
+        vector_store=SimpleNamespace(config={}),
+        graph_store=SimpleNamespace(config=SimpleNamespace(db=path, vector_index=False), llm=None, threshold=0.7),
+        llm=None,
+    )
+    embedding_model = MagicMock()
+    embedding_model.config.embedding_dims = dims
+    with patch("mem0.memory.kuzu_memory.EmbedderFactory") as embedder_factory, patch(
+        "mem0.memory.kuzu_memory.LlmFactory"
+    ):
+        embedder_factory.create.return_value = embedding_model
+        return MemoryGraph(config)
+
+
+def load_nodes(graph, nodes, args):
+    """Bulk create the nodes, spread round-robin over `num_users` scopes."""
+    for start in range(0, len(nodes), args.batch_size):
+        batch = [
+            {"name": f"entity_{i}", "user_id": f"user_{i % args.num_users}", "embedding": nodes[i].tolist()}
+            for i in range(start, min(start + args.batch_size, len(nodes)))
+        ]
+        graph.kuzu_execute(
+            f"""
+            UNWIND $nodes AS node
+            CREATE (:Entity {{
+                name: node.name,
+                user_id: node.user_id,
+                mentions: 1,
+                created: current_timestamp(),
+                embedding: CAST(node.embedding, 'FLOAT[{args.dims}]')
+            }})
+            """,
+            parameters={"nodes": batch},
+        )
+
+
+def measure(graph, queries, query_rows, args):
+    """Latency percentiles of the lookups and the keys of the matched nodes."""
+    latencies, matches = [], []
+    for query, row in zip(queries, query_rows):
+        filters = {"user_id": f"user_{row % args.num_users}"}
+        start = time.perf_counter()
+        node_keys = graph._search_nodes({"query": query.tolist()}, filters, threshold=args.threshold)
+        latencies.append(time.perf_counter() - start)
+        matches.append(node_keys.get("query"))
+    return np.percentile(latencies, 50) * 1000, np.percentile(latencies, 95) * 1000, matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark graph entity lookups with the native vector index")
+    parser.add_argument("--num_nodes", type=int, default=100000, help="Number of entity nodes")
+    parser.add_argument("--num_users", type=int, default=10, help="Number of user scopes the nodes are spread over")
+    parser.add_argument("--dims", type=int, default=384, help="Dimension of the embeddings")
+    parser.add_argument("--num_queries", type=int, default=200, help="Number of lookups")
+    parser.add_argument("--threshold", type=float, default=0.7, help="Similarity threshold of the lookups")
+    parser.add_argument("--batch_size", type=int, default=5000, help="Nodes created per query while loading")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    nodes, queries, query_rows = load_embeddings(args)
+    with tempfile.TemporaryDirectory() as tmp:
+        graph = create_graph(f"{tmp}/graph", args.dims)
+
+        start = time.perf_counter()
+        load_nodes(graph, nodes, args)
+        print(f"Loaded {args.num_nodes} nodes x {args.dims} dims in {time.perf_counter() - start:.1f}s")
+
+        scan_p50, scan_p95, scan_matches = measure(graph, queries, query_rows, args)
+
+        start = time.perf_counter()
+        graph._create_vector_index()
+        print(f"Built the vector index in {time.perf_counter() - start:.1f}s")
+        index_p50, index_p95, index_matches = measure(graph, queries, query_rows, args)
+
+    agreement = np.mean([a == b for a, b in zip(scan_matches, index_matches)])
+    print(f"{'lookup':<8} {'p50 (ms)':>10} {'p95 (ms)':>10}")
+    print(f"{'scan':<8} {scan_p50:>10.2f} {scan_p95:>10.2f}")
+    print(f"{'index':<8} {index_p50:>10.2f} {index_p95:>10.2f}")
+    print(f"Index and scan matched the same node for {agreement:.1%} of the lookups")
+
+
+if __name__ == "__main__":
+    main()
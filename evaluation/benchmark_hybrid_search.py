@@ -0,0 +1,113 @@
+"""
+Benchmark hybrid BM25 + vector search against pure vector search on LOCOMO.
+
+Every turn of a conversation is stored verbatim as a memory of the conversation's user, then each
+question searches those memories. This reports the recall@k of the evidence turns of the questions
+and the median search latency for vector, BM25 and hybrid (reciprocal rank fusion) retrieval.
+
+    python benchmark_hybrid_search.py --k 5 10
+    python benchmark_hybrid_search.py --embedder huggingface --embedder_model multi-qa-MiniLM-L6-cos-v1 --dims 384
+"""
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+
+from tqdm import tqdm
+
+from mem0 import Memory
+
+
+def load_conversations(path, max_conversations=None):
+    """Turns ("dia_id", "speaker: text") and questions with evidence of every LOCOMO conversation."""
+    with open(path) as f:
+        data = json.load(f)
+    conversations = []
+    for item in data[:max_conversations]:
+        conversation = item["conversation"]
+        turns = []
+        for key, session in conversation.items():
+            if key.startswith("session_") and isinstance(session, list):
+                turns += [(turn["dia_id"], f"{turn['speaker']}: {turn['text']}") for turn in session]
+        questions = [(qa["question"], set(qa["evidence"])) for qa in item["qa"] if qa.get("evidence")]
+        conversations.append((item["sample_id"], turns, questions))
+    return conversations
+
+
+def build_memory(args, tmp):
+    config = {
+        "vector_store": {
+            "provider": "qdrant",
+            "config": {"collection_name": "locomo", "path": f"{tmp}/qdrant", "embedding_model_dims": args.dims},
+        },
+        "embedder": {"provider": args.embedder, "config": {"model": args.embedder_model}},
+        "history_db_path": f"{tmp}/history.db",
+        "hybrid_search": {"candidates": args.candidates, "rrf_k": args.rrf_k},
+    }
+    return Memory.from_config(config)
+
+
+def evaluate(search, conversations, k_values):
+    """Recall@k of the evidence turns for every k, and the latencies of `search(user_id, question, limit)`."""
+    recalls = {k: [] for k in k_values}
+    latencies = []
+    for user_id, dia_ids, questions in conversations:
+        for question, evidence in questions:
+            start = time.perf_counter()
+            found = [dia_ids.get(memory_id) for memory_id in search(user_id, question, max(k_values))]
+            latencies.append(time.perf_counter() - start)
+            for k in k_values:
+                recalls[k].append(len(evidence & set(found[:k])) / len(evidence))
+    return {k: statistics.mean(values) for k, values in recalls.items()}, statistics.median(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hybrid search on LOCOMO")
+    parser.add_argument("--dataset", type=str, default="dataset/locomo10.json", help="Path to the LOCOMO dataset")
+    parser.add_argument("--max_conversations", type=int, default=None, help="Only use the first conversations")
+    parser.add_argument("--k", type=int, nargs="+", default=[5, 10], help="Recall is measured at every k")
+    parser.add_argument("--embedder", type=str, default="openai", help="Embedder provider")
+    parser.add_argument("--embedder_model", type=str, default="text-embedding-3-small", help="Embedding model")
+    parser.add_argument("--dims", type=int, default=1536, help="Dimension of the embeddings")
+    parser.add_argument("--candidates", type=int, default=50, help="Results of each search before fusion")
+    parser.add_argument("--rrf_k", type=int, default=60, help="Rank offset of the reciprocal rank fusion")
+    args = parser.parse_args()
+
+    conversations = load_conversations(args.dataset, args.max_conversations)
+    with tempfile.TemporaryDirectory() as tmp:
+        memory = build_memory(args, tmp)
+        indexed = []
+        for user_id, turns, questions in conversations:
+            dia_ids = {}
+            for dia_id, text in tqdm(turns, desc=f"Adding {user_id}"):
+                for added in memory.add([{"role": "user", "content": text}], user_id=user_id, infer=False)["results"]:
+                    dia_ids[added["id"]] = dia_id
+            indexed.append((user_id, dia_ids, questions))
+
+        lexical_index = memory.lexical_index
+
+        def vector_search(user_id, question, limit):
+            results = memory.search(question, user_id=user_id, limit=limit, rerank=False)["results"]
+            return [result["id"] for result in results]
+
+        def bm25_search(user_id, question, limit):
+            return [memory_id for memory_id, _ in lexical_index.search(question, {"user_id": user_id}, limit)]
+
+        rows = []
+        memory.lexical_index = None
+        rows.append(("vector", *evaluate(vector_search, indexed, args.k)))
+        rows.append(("bm25", *evaluate(bm25_search, indexed, args.k)))
+        memory.lexical_index = lexical_index
+        rows.append(("hybrid", *evaluate(vector_search, indexed, args.k)))
+
+    print(f"{sum(len(questions) for _, _, questions in indexed)} questions over {len(indexed)} conversations")
+    header = "".join(f"{f'recall@{k}':>12}" for k in args.k)
+    print(f"{'retrieval':<10}{header}{'p50 (ms)':>12}")
+    for name, recalls, latency in rows:
+        print(f"{name:<10}" + "".join(f"{recalls[k]:>12.3f}" for k in args.k) + f"{latency * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
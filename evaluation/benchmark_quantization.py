@@ -0,0 +1,151 @@
+"""
+Benchmark vector quantization modes of the self-hosted vector stores.
+
+For every mode this reports recall@10 against exact float32 search, the memory
+footprint of the index and single-query throughput (QPS). FAISS always runs;
+pgvector runs when a connection string is given.
+
+    python benchmark_quantization.py --num_vectors 100000 --dims 768
+    python benchmark_quantization.py --vectors embeddings.npy --pg_connection_string postgresql://...
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import uuid
+
+import faiss
+import numpy as np
+
+from mem0.vector_stores.faiss import FAISS
+
+FAISS_MODES = [None, "sq_fp16", "sq8", "binary"]
+PGVECTOR_MODES = [None, "halfvec", "bit"]
+
+
+def load_vectors(args):
+    """Load embeddings from a .npy file, or generate clustered unit vectors that behave like text embeddings."""
+    rng = np.random.default_rng(args.seed)
+    if args.vectors:
+        vectors = np.load(args.vectors).astype(np.float32)
+    else:
+        centers = rng.standard_normal((max(1, args.num_vectors // 100), args.dims))
+        assignments = rng.integers(0, len(centers), args.num_vectors)
+        vectors = (centers[assignments] + 0.5 * rng.standard_normal((args.num_vectors, args.dims))).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    query_rows = rng.choice(len(vectors), args.num_queries, replace=False)
+    queries = vectors[query_rows] + 0.05 * rng.standard_normal((args.num_queries, vectors.shape[1])).astype(np.float32)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    return vectors, queries.astype(np.float32)
+
+
+def ground_truth(vectors, queries, k):
+    """Exact cosine top-k for every query."""
+    scores = queries @ vectors.T
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def measure(store, queries, truth, k, positions):
+    """Recall@k and QPS of a store, `positions` maps its ids back to the rows of the vectors."""
+    found = []
+    start = time.perf_counter()
+    for query in queries:
+        found.append([positions[result.id] for result in store.search("", query.tolist(), limit=k)])
+    elapsed = time.perf_counter() - start
+    recall = np.mean([len(set(row) & set(expected)) / k for row, expected in zip(found, truth)])
+    return recall, len(queries) / elapsed
+
+
+def faiss_memory(store):
+    """Bytes of the serialized index, which is what FAISS keeps in memory."""
+    if store.quantization == "binary":
+        return len(faiss.serialize_index_binary(store.index))
+    return len(faiss.serialize_index(store.index))
+
+
+def bench_faiss(vectors, queries, truth, args):
+    rows = []
+    ids = [str(i) for i in range(len(vectors))]
+    positions = {id: i for i, id in enumerate(ids)}
+    for mode in FAISS_MODES:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = FAISS(
+                collection_name="bench",
+                path=os.path.join(tmp, "bench"),
+                distance_strategy="cosine",
+                embedding_model_dims=vectors.shape[1],
+                quantization=mode,
+                rescore_multiplier=args.rescore_multiplier,
+            )
+            # Persisting after every batch dominates load time, so load everything in one insert
+            store.insert(vectors.tolist(), [{} for _ in ids], ids)
+            recall, qps = measure(store, queries, truth, args.k, positions)
+            rows.append(("faiss", mode or "float32", recall, faiss_memory(store), qps))
+    return rows
+
+
+def bench_pgvector(vectors, queries, truth, args):
+    from mem0.vector_stores.pgvector import PGVector
+
+    rows = []
+    # pgvector ids are UUIDs
+    ids = [str(uuid.UUID(int=i + 1)) for i in range(len(vectors))]
+    positions = {id: i for i, id in enumerate(ids)}
+    for mode in PGVECTOR_MODES:
+        collection = f"bench_quantization_{mode or 'float32'}"
+        store = PGVector(
+            dbname=None,
+            collection_name=collection,
+            embedding_model_dims=vectors.shape[1],
+            user=None,
+            password=None,
+            host=None,
+            port=None,
+            diskann=False,
+            hnsw=True,
+            connection_string=args.pg_connection_string,
+            defer_index_creation=True,
+            quantization=mode,
+            rescore_multiplier=args.rescore_multiplier,
+        )
+        store.bulk_insert(vectors.tolist(), [{} for _ in ids], ids)
+        recall, qps = measure(store, queries, truth, args.k, positions)
+        with store._get_cursor() as cur:
+            cur.execute("SELECT pg_total_relation_size(%s)", (collection,))
+            memory = cur.fetchone()[0]
+        rows.append(("pgvector", mode or "float32", recall, memory, qps))
+        if not args.keep_tables:
+            store.delete_col()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vector store quantization modes")
+    parser.add_argument("--vectors", type=str, default=None, help="Path to a .npy matrix of embeddings")
+    parser.add_argument("--num_vectors", type=int, default=20000, help="Number of synthetic vectors")
+    parser.add_argument("--dims", type=int, default=768, help="Dimension of the synthetic vectors")
+    parser.add_argument("--num_queries", type=int, default=200, help="Number of queries")
+    parser.add_argument("--k", type=int, default=10, help="Recall is measured at k")
+    parser.add_argument("--rescore_multiplier", type=int, default=4, help="Candidates rescored per result")
+    parser.add_argument("--pg_connection_string", type=str, default=None, help="Also benchmark pgvector")
+    parser.add_argument("--keep_tables", action="store_true", help="Keep the pgvector benchmark tables")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    vectors, queries = load_vectors(args)
+    truth = ground_truth(vectors, queries, args.k)
+    print(f"{len(vectors)} vectors x {vectors.shape[1]} dims, {len(queries)} queries")
+
+    rows = bench_faiss(vectors, queries, truth, args)
+    if args.pg_connection_string:
+        rows += bench_pgvector(vectors, queries, truth, args)
+
+    print(f"{'store':<10} {'mode':<10} {f'recall@{args.k}':>10} {'memory (MB)':>12} {'QPS':>10}")
+    for store, mode, recall, memory, qps in rows:
+        print(f"{store:<10} {mode:<10} {recall:>10.3f} {memory / 2**20:>12.1f} {qps:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark the CPU throughput of the cross-encoder rerankers for every inference backend.
+
+Each question of a LOCOMO conversation reranks a random sample of the conversation's turns. This
+reports the pairs scored per second with fp32 and int8 weights on PyTorch and ONNX Runtime, with the
+score cache disabled, then the pairs reranked per second when the same searches repeat with the cache on.
+
+    python benchmark_reranker.py --provider huggingface --model BAAI/bge-reranker-base
+    python benchmark_reranker.py --provider sentence_transformer --model cross-encoder/ms-marco-MiniLM-L6-v2
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+
+from mem0.utils.factory import RerankerFactory
+
+BACKENDS = [("torch", False), ("torch", True), ("onnx", False), ("onnx", True)]
+
+
+def load_searches(path, num_queries, candidates, seed):
+    """(question, candidate memories) pairs built from the first LOCOMO conversation."""
+    with open(path) as f:
+        item = json.load(f)[0]
+    turns = [
+        f"{turn['speaker']}: {turn['text']}"
+        for key, session in item["conversation"].items()
+        if key.startswith("session_") and isinstance(session, list)
+        for turn in session
+    ]
+    rng = random.Random(seed)
+    questions = [qa["question"] for qa in item["qa"]][:num_queries]
+    return [(question, [{"memory": text} for text in rng.sample(turns, candidates)]) for question in questions]
+
+
+def throughput(reranker, searches):
+    """Pairs reranked per second over all the searches."""
+    start = time.perf_counter()
+    for query, documents in searches:
+        reranker.rerank(query, documents)
+    return sum(len(documents) for _, documents in searches) / (time.perf_counter() - start)
+
+
+def build_reranker(args, backend, quantize, cache_size, onnx_dir):
+    config = {
+        "model": args.model,
+        "device": "cpu",
+        "batch_size": args.batch_size,
+        "backend": backend,
+        "quantize": quantize,
+        "cache_size": cache_size,
+    }
+    if args.provider == "huggingface":
+        config["onnx_dir"] = f"{onnx_dir}/{'int8' if quantize else 'fp32'}"
+    return RerankerFactory.create(args.provider, config)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cross-encoder reranker backends on CPU")
+    parser.add_argument("--provider", type=str, default="huggingface", choices=["huggingface", "sentence_transformer"])
+    parser.add_argument("--model", type=str, default="BAAI/bge-reranker-base", help="Cross-encoder model")
+    parser.add_argument("--dataset", type=str, default="dataset/locomo10.json", help="Path to the LOCOMO dataset")
+    parser.add_argument("--num_queries", type=int, default=50, help="Number of searches")
+    parser.add_argument("--candidates", type=int, default=50, help="Memories reranked per search")
+    parser.add_argument("--batch_size", type=int, default=32, help="Pairs per forward pass")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    searches = load_searches(args.dataset, args.num_queries, args.candidates, args.seed)
+    print(f"{args.provider} {args.model}: {len(searches)} searches x {args.candidates} candidates")
+
+    rows = []
+    with tempfile.TemporaryDirectory() as onnx_dir:
+        for backend, quantize in BACKENDS:
+            try:
+                reranker = build_reranker(args, backend, quantize, 0, onnx_dir)
+            except Exception as e:
+                print(f"Skipping {backend} {'int8' if quantize else 'fp32'}: {e}")
+                continue
+            cold = throughput(reranker, searches)
+
+            reranker = build_reranker(args, backend, quantize, len(searches) * args.candidates, onnx_dir)
+            throughput(reranker, searches)
+            warm = throughput(reranker, searches)
+            rows.append((backend, "int8" if quantize else "fp32", cold, warm))
+
+    print(f"{'backend':<10} {'weights':<8} {'pairs/s':>10} {'cached pairs/s':>16}")
+    for backend, weights, cold, warm in rows:
+        print(f"{backend:<10} {weights:<8} {cold:>10.1f} {warm:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ import threading
 from collections import defaultdict
 
 from metrics.llm_judge import evaluate_llm_judge
-from metrics.utils import calculate_bleu_scores, calculate_metrics
+from metrics.utils import calculate_metrics_many
 from tqdm import tqdm
 
 
@@ -13,18 +13,12 @@ def process_item(item_data):
     k, v = item_data
     local_results = defaultdict(list)
 
-    for item in v:
+    for item, metrics in v:
         gt_answer = str(item["answer"])
         pred_answer = str(item["response"])
         category = str(item["category"])
         question = str(item["question"])
 
-        # Skip category 5
-        if category == "5":
-            continue
-
-        metrics = calculate_metrics(pred_answer, gt_answer)
-        bleu_scores = calculate_bleu_scores(pred_answer, gt_answer)
         llm_score = evaluate_llm_judge(question, gt_answer, pred_answer)
 
         # Extract latency metrics if available
@@ -38,7 +32,7 @@ def process_item(item_data):
                 "answer": gt_answer,
                 "response": pred_answer,
                 "category": category,
-                "bleu_score": bleu_scores["bleu1"],
+                "bleu_score": metrics["bleu1"],
                 "f1_score": metrics["f1"],
                 "llm_score": llm_score,
                 "search_time": search_time,
@@ -50,6 +44,22 @@ def process_item(item_data):
     return local_results
 
 
+def score_items(data, max_workers=None):
+    """Compute the lexical metrics of every item in one batch, grouped back by conversation."""
+    # Skip category 5
+    items = [(k, item) for k, v in data.items() for item in v if str(item["category"]) != "5"]
+    all_metrics = calculate_metrics_many(
+        [str(item["response"]) for _, item in items],
+        [str(item["answer"]) for _, item in items],
+        max_workers=max_workers,
+    )
+
+    scored = defaultdict(list)
+    for (k, item), metrics in zip(items, all_metrics):
+        scored[k].append((item, metrics))
+    return scored
+
+
 def main():
     parser = argparse.ArgumentParser(description="Evaluate RAG results")
     parser.add_argument(
@@ -59,6 +69,9 @@ def main():
         "--output_file", type=str, default="evaluation_metrics.json", help="Path to save the evaluation results"
     )
     parser.add_argument("--max_workers", type=int, default=3, help="Maximum number of worker threads (default: 3 to avoid rate limits)")
+    parser.add_argument(
+        "--metric_workers", type=int, default=None, help="Number of processes for lexical metrics (default: CPU count)"
+    )
 
     args = parser.parse_args()
 
@@ -68,9 +81,11 @@ def main():
     results = defaultdict(list)
     results_lock = threading.Lock()
 
+    scored = score_items(data, max_workers=args.metric_workers)
+
     # Use ThreadPoolExecutor with specified workers
     with concurrent.futures.ThreadPoolExecutor(max_workers=args.max_workers) as executor:
-        futures = [executor.submit(process_item, item_data) for item_data in data.items()]
+        futures = [executor.submit(process_item, item_data) for item_data in scored.items()]
 
         for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures)):
             local_results = future.result()
@@ -10,19 +10,21 @@ Borrowed from https://github.com/WujiangXu/AgenticMemory/blob/main/utils.py
 }
 """
 
+import os
 import statistics
 from collections import defaultdict
-from typing import Dict, List, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Union
 
 import nltk
-from bert_score import score as bert_score
+import numpy as np
+from bert_score import BERTScorer
 from nltk.translate.bleu_score import SmoothingFunction, sentence_bleu
 from nltk.translate.meteor_score import meteor_score
 from rouge_score import rouge_scorer
 from sentence_transformers import SentenceTransformer
 
 # from load_dataset import load_locomo_dataset, QA, Turn, Session, Conversation
-from sentence_transformers.util import pytorch_cos_sim
 
 # Download required NLTK data
 try:
@@ -31,12 +33,50 @@ try:
 except Exception as e:
     print(f"Error downloading NLTK data: {e}")
 
-# Initialize SentenceTransformer model (this will be reused)
-try:
-    sentence_model = SentenceTransformer("all-MiniLM-L6-v2")
-except Exception as e:
-    print(f"Warning: Could not load SentenceTransformer model: {e}")
-    sentence_model = None
+# Models are loaded on first use and then reused, so process-pool workers that only
+# compute lexical metrics never pay for loading them.
+sentence_model = None
+_sentence_model_loaded = False
+_bert_scorer = None
+
+# Below this many pairs the process pool startup costs more than it saves
+MIN_PAIRS_FOR_PROCESS_POOL = 256
+
+EMPTY_METRICS = {
+    "exact_match": 0,
+    "f1": 0.0,
+    "rouge1_f": 0.0,
+    "rouge2_f": 0.0,
+    "rougeL_f": 0.0,
+    "bleu1": 0.0,
+    "bleu2": 0.0,
+    "bleu3": 0.0,
+    "bleu4": 0.0,
+    "bert_f1": 0.0,
+    "meteor": 0.0,
+    "sbert_similarity": 0.0,
+}
+
+
+def get_sentence_model():
+    """Return the shared SentenceTransformer model, loading it on first use."""
+    global sentence_model, _sentence_model_loaded
+    if not _sentence_model_loaded:
+        _sentence_model_loaded = True
+        try:
+            sentence_model = SentenceTransformer("all-MiniLM-L6-v2")
+        except Exception as e:
+            print(f"Warning: Could not load SentenceTransformer model: {e}")
+            sentence_model = None
+    return sentence_model
+
+
+def get_bert_scorer() -> BERTScorer:
+    """Return the shared BERTScorer, building it on first use."""
+    global _bert_scorer
+    if _bert_scorer is None:
+        _bert_scorer = BERTScorer(lang="en")
+    return _bert_scorer
 
 
 def simple_tokenize(text):
@@ -79,12 +119,24 @@ def calculate_bleu_scores(prediction: str, reference: str) -> Dict[str, float]:
 
 def calculate_bert_scores(prediction: str, reference: str) -> Dict[str, float]:
     """Calculate BERTScore for semantic similarity."""
+    return calculate_bert_scores_many([prediction], [reference])[0]
+
+
+def calculate_bert_scores_many(
+    predictions: Sequence[str], references: Sequence[str], batch_size: int = 64
+) -> List[Dict[str, float]]:
+    """Calculate BERTScore for many pairs with a single scorer and batched inference."""
+    if not predictions:
+        return []
     try:
-        P, R, F1 = bert_score([prediction], [reference], lang="en", verbose=False)
-        return {"bert_precision": P.item(), "bert_recall": R.item(), "bert_f1": F1.item()}
+        P, R, F1 = get_bert_scorer().score(list(predictions), list(references), batch_size=batch_size)
+        return [
+            {"bert_precision": p, "bert_recall": r, "bert_f1": f}
+            for p, r, f in zip(P.tolist(), R.tolist(), F1.tolist())
+        ]
     except Exception as e:
         print(f"Error calculating BERTScore: {e}")
-        return {"bert_precision": 0.0, "bert_recall": 0.0, "bert_f1": 0.0}
+        return [{"bert_precision": 0.0, "bert_recall": 0.0, "bert_f1": 0.0} for _ in predictions]
 
 
 def calculate_meteor_score(prediction: str, reference: str) -> float:
@@ -98,39 +150,35 @@ def calculate_meteor_score(prediction: str, reference: str) -> float:
 
 def calculate_sentence_similarity(prediction: str, reference: str) -> float:
     """Calculate sentence embedding similarity using SentenceBERT."""
-    if sentence_model is None:
-        return 0.0
-    try:
-        # Encode sentences
-        embedding1 = sentence_model.encode([prediction], convert_to_tensor=True)
-        embedding2 = sentence_model.encode([reference], convert_to_tensor=True)
+    return calculate_sentence_similarity_many([prediction], [reference])[0]
+
 
-        # Calculate cosine similarity
-        similarity = pytorch_cos_sim(embedding1, embedding2).item()
-        return float(similarity)
+def calculate_sentence_similarity_many(
+    predictions: Sequence[str], references: Sequence[str], batch_size: int = 64
+) -> List[float]:
+    """Calculate SentenceBERT similarity for many pairs by encoding them as two batched matrices."""
+    model = get_sentence_model()
+    if model is None or not predictions:
+        return [0.0 for _ in predictions]
+    try:
+        # Normalized embeddings turn the row-wise cosine similarity into a plain dot product
+        pred_embeddings = model.encode(
+            list(predictions), batch_size=batch_size, convert_to_numpy=True, normalize_embeddings=True
+        )
+        ref_embeddings = model.encode(
+            list(references), batch_size=batch_size, convert_to_numpy=True, normalize_embeddings=True
+        )
+        return np.einsum("ij,ij->i", pred_embeddings, ref_embeddings).astype(float).tolist()
     except Exception as e:
         print(f"Error calculating sentence similarity: {e}")
-        return 0.0
+        return [0.0 for _ in predictions]
 
 
 def calculate_metrics(prediction: str, reference: str) -> Dict[str, float]:
     """Calculate comprehensive evaluation metrics for a prediction."""
     # Handle empty or None values
     if not prediction or not reference:
-        return {
-            "exact_match": 0,
-            "f1": 0.0,
-            "rouge1_f": 0.0,
-            "rouge2_f": 0.0,
-            "rougeL_f": 0.0,
-            "bleu1": 0.0,
-            "bleu2": 0.0,
-            "bleu3": 0.0,
-            "bleu4": 0.0,
-            "bert_f1": 0.0,
-            "meteor": 0.0,
-            "sbert_similarity": 0.0,
-        }
+        return dict(EMPTY_METRICS)
 
     # Convert to strings if they're not already
     prediction = str(prediction).strip()
@@ -164,6 +212,60 @@ def calculate_metrics(prediction: str, reference: str) -> Dict[str, float]:
     return metrics
 
 
+def _calculate_lexical_metrics(pair) -> Dict[str, float]:
+    """Calculate the per-pair metrics, plus ROUGE and METEOR when `extended` is set."""
+    prediction, reference, extended = pair
+    metrics = calculate_metrics(prediction, reference)
+    if extended and prediction and reference:
+        prediction = str(prediction).strip()
+        reference = str(reference).strip()
+        metrics.update(calculate_rouge_scores(prediction, reference))
+        metrics["meteor"] = calculate_meteor_score(prediction, reference)
+    return metrics
+
+
+def calculate_metrics_many(
+    predictions: Sequence[str],
+    references: Sequence[str],
+    extended: bool = False,
+    max_workers: Optional[int] = None,
+    batch_size: int = 64,
+) -> List[Dict[str, float]]:
+    """Calculate evaluation metrics for many prediction/reference pairs at once.
+
+    Lexical metrics are spread across a process pool. With `extended` set, ROUGE,
+    METEOR, BERTScore and SentenceBERT similarity are added; the model based ones
+    reuse a single scorer and encode all pairs in batches.
+    """
+    if len(predictions) != len(references):
+        raise ValueError("predictions and references must have the same length")
+
+    pairs = [(prediction, reference, extended) for prediction, reference in zip(predictions, references)]
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers > 1 and len(pairs) >= MIN_PAIRS_FOR_PROCESS_POOL:
+        chunksize = max(1, len(pairs) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            all_metrics = list(executor.map(_calculate_lexical_metrics, pairs, chunksize=chunksize))
+    else:
+        all_metrics = [_calculate_lexical_metrics(pair) for pair in pairs]
+
+    if not extended:
+        return all_metrics
+
+    # Empty pairs keep their zero scores and are left out of the model batches
+    indices = [i for i, (prediction, reference) in enumerate(zip(predictions, references)) if prediction and reference]
+    batch_predictions = [str(predictions[i]).strip() for i in indices]
+    batch_references = [str(references[i]).strip() for i in indices]
+
+    bert_scores = calculate_bert_scores_many(batch_predictions, batch_references, batch_size=batch_size)
+    similarities = calculate_sentence_similarity_many(batch_predictions, batch_references, batch_size=batch_size)
+    for i, bert, similarity in zip(indices, bert_scores, similarities):
+        all_metrics[i]["bert_f1"] = bert["bert_f1"]
+        all_metrics[i]["sbert_similarity"] = similarity
+
+    return all_metrics
+
+
 def aggregate_metrics(
     all_metrics: List[Dict[str, float]], all_categories: List[int]
 ) -> Dict[str, Dict[str, Union[float, Dict[str, float]]]]:
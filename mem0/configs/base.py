@@ -1,5 +1,5 @@
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -27,6 +27,106 @@ class MemoryItem(BaseModel):
     updated_at: Optional[str] = Field(None, description="The timestamp when the memory was updated")
 
 
+class IngestionQueueConfig(BaseModel):
+    path: Optional[str] = Field(
+        description="Path to the SQLite database holding the queued add jobs, "
+        "defaults to a file next to the history database named after the collection",
+        default=None,
+    )
+    async_mode: bool = Field(
+        description="Queue every add by default, as if it was called with wait=False",
+        default=False,
+    )
+    workers: int = Field(description="Number of worker threads draining the queue", default=2)
+    max_retries: int = Field(description="Retries of a failed job before it is dead-lettered", default=3)
+    retry_backoff: float = Field(
+        description="Seconds before the first retry of a failed job, doubled on every further retry",
+        default=1.0,
+    )
+    lease_duration: float = Field(
+        description="Seconds a running job stays leased to its process without a renewal, "
+        "after which another process sharing the queue runs it again",
+        default=60.0,
+    )
+
+
+class AddCoalescingConfig(BaseModel):
+    window: float = Field(
+        description="Seconds the first add of a scope waits for more adds to merge into the same add cycle",
+        default=0.05,
+    )
+    max_batch_size: int = Field(description="Maximum number of adds merged into one add cycle", default=16)
+
+
+class ExtractionGateConfig(BaseModel):
+    min_chars: int = Field(description="Messages with fewer letters and digits than this are not extracted", default=3)
+    stopwords: Optional[List[str]] = Field(
+        description="Words and phrases that never hold a fact, messages made only of them are not extracted. "
+        "Defaults to common acknowledgements and greetings",
+        default=None,
+    )
+    skip_patterns: List[str] = Field(
+        description="Regular expressions matching whole messages that are not extracted, e.g. tool acknowledgements",
+        default_factory=list,
+    )
+    embedding_filter: bool = Field(
+        description="Also skip short messages whose embedding is close to known no-fact messages",
+        default=False,
+    )
+    no_fact_examples: Optional[List[str]] = Field(
+        description="Messages seeding the no-fact centroids of the embedding filter. "
+        "Defaults to common acknowledgements and greetings",
+        default=None,
+    )
+    similarity_threshold: float = Field(
+        description="Cosine similarity to a no-fact centroid above which the embedding filter skips a message",
+        default=0.85,
+    )
+    embedding_max_chars: int = Field(
+        description="Longer messages are never skipped by the embedding filter",
+        default=200,
+    )
+    learn_from_extraction: bool = Field(
+        description="Fold messages whose extraction returned no facts into the no-fact centroids",
+        default=False,
+    )
+
+
+class SearchCacheConfig(BaseModel):
+    max_size: int = Field(description="Maximum number of search results held in memory", default=1024)
+    ttl: Optional[float] = Field(
+        description="Seconds after which a cached search result expires, never when None",
+        default=300,
+    )
+    redis_url: Optional[str] = Field(
+        description="URL of a Redis server sharing the cache and its write versions across processes",
+        default=None,
+    )
+    key_prefix: str = Field(
+        description="Prefix of the Redis keys of the cache, followed by the vector store provider and collection name",
+        default="mem0:search",
+    )
+
+
+class HybridSearchConfig(BaseModel):
+    path: Optional[str] = Field(
+        description="Path to the SQLite database persisting the BM25 index, defaults to the history database",
+        default=None,
+    )
+    candidates: int = Field(
+        description="Results retrieved by each of the BM25 and vector searches before they are fused",
+        default=50,
+    )
+    rrf_k: int = Field(description="Rank offset of the reciprocal rank fusion", default=60)
+    k1: float = Field(description="BM25 term frequency saturation", default=1.5)
+    b: float = Field(description="BM25 document length normalization", default=0.75)
+    backfill_limit: int = Field(
+        description="Memories of the vector store indexed on the first hybrid search when the BM25 index is empty, "
+        "e.g. memories stored before hybrid search was enabled",
+        default=10000,
+    )
+
+
 class MemoryConfig(BaseModel):
     vector_store: VectorStoreConfig = Field(
         description="Configuration for the vector store",
@@ -64,6 +164,31 @@ class MemoryConfig(BaseModel):
         description="Custom prompt for the update memory",
         default=None,
     )
+    ingestion_queue: IngestionQueueConfig = Field(
+        description="Configuration for the queue of adds called with wait=False",
+        default_factory=IngestionQueueConfig,
+    )
+    add_coalescing: Optional[AddCoalescingConfig] = Field(
+        description="Merge concurrent adds of the same session ids into one add cycle, disabled when None",
+        default=None,
+    )
+    extraction_gate: Optional[ExtractionGateConfig] = Field(
+        description="Skip the fact extraction of uninformative messages, disabled when None",
+        default=None,
+    )
+    streaming_extraction: bool = Field(
+        description="Stream the fact extraction and embed and search each fact while the next ones are generated",
+        default=False,
+    )
+    search_cache: Optional[SearchCacheConfig] = Field(
+        description="Cache the results of search and get_all until a write touches their session ids, "
+        "disabled when None",
+        default=None,
+    )
+    hybrid_search: Optional[HybridSearchConfig] = Field(
+        description="Fuse a BM25 search over the memory text with the vector search, disabled when None",
+        default=None,
+    )
 
 
 class AzureConfig(BaseModel):
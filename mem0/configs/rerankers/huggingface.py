@@ -15,3 +15,7 @@ class HuggingFaceRerankerConfig(BaseRerankerConfig):
     batch_size: int = Field(default=32, description="Batch size for processing documents")
     max_length: int = Field(default=512, description="Maximum length for tokenization")
     normalize: bool = Field(default=True, description="Whether to normalize scores")
+    backend: str = Field(default="torch", description="Inference backend, 'torch' or 'onnx' for ONNX Runtime through optimum")
+    quantize: bool = Field(default=False, description="Quantize the weights to int8 with dynamic quantization for CPU inference")
+    onnx_dir: Optional[str] = Field(default=None, description="Directory of the exported ONNX model, exported there when missing")
+    cache_size: int = Field(default=10000, description="Maximum number of cached query and memory scores, 0 to disable the cache")
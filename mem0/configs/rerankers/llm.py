@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import Field
 
 from mem0.configs.rerankers.base import BaseRerankerConfig
@@ -14,8 +14,16 @@ class LLMRerankerConfig(BaseRerankerConfig):
         provider (str): LLM provider. Defaults to "openai".
         top_k (int): Number of top documents to return after reranking.
         temperature (float): Temperature for LLM generation. Defaults to 0.0 for deterministic scoring.
-        max_tokens (int): Maximum tokens for LLM response. Defaults to 100.
+        max_tokens (int): Maximum tokens for LLM response. Defaults to 512, enough for a listwise chunk.
         scoring_prompt (str): Custom prompt template for scoring documents.
+        mode (str): "listwise" scores chunks of candidates in one call each, "pointwise" scores every
+            candidate in its own call. Defaults to "pointwise" when only a custom scoring_prompt is set,
+            "listwise" otherwise.
+        listwise_prompt (str): Custom prompt template for scoring a chunk of documents.
+        chunk_size (int): Candidates scored per listwise call. Defaults to 20.
+        top_n (int): Only the first top_n candidates are reranked, the others follow in their original order.
+        max_workers (int): Maximum number of concurrent LLM calls. Defaults to 8.
+        timeout (float): Deadline of a rerank in seconds, candidates not scored by then keep their order.
     """
     
     model: str = Field(
@@ -39,10 +47,35 @@ class LLMRerankerConfig(BaseRerankerConfig):
         description="Temperature for LLM generation"
     )
     max_tokens: int = Field(
-        default=100,
+        default=512,
         description="Maximum tokens for LLM response"
     )
     scoring_prompt: Optional[str] = Field(
         default=None,
         description="Custom prompt template for scoring documents"
     )
+    mode: Optional[Literal["listwise", "pointwise"]] = Field(
+        default=None,
+        description="'listwise' to score chunks of candidates in one call, 'pointwise' to score them one by one, "
+        "None for 'pointwise' when only a custom scoring_prompt is set and 'listwise' otherwise"
+    )
+    listwise_prompt: Optional[str] = Field(
+        default=None,
+        description="Custom prompt template for scoring a chunk of documents"
+    )
+    chunk_size: int = Field(
+        default=20,
+        description="Number of candidates scored per listwise call"
+    )
+    top_n: Optional[int] = Field(
+        default=None,
+        description="Only rerank the first top_n candidates, None to rerank all of them"
+    )
+    max_workers: int = Field(
+        default=8,
+        description="Maximum number of concurrent LLM calls"
+    )
+    timeout: Optional[float] = Field(
+        default=None,
+        description="Deadline of a rerank in seconds, candidates not scored by then keep their order"
+    )
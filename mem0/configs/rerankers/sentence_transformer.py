@@ -14,3 +14,7 @@ class SentenceTransformerRerankerConfig(BaseRerankerConfig):
     device: Optional[str] = Field(default=None, description="Device to run the model on ('cpu', 'cuda', etc.)")
     batch_size: int = Field(default=32, description="Batch size for processing documents")
     show_progress_bar: bool = Field(default=False, description="Whether to show progress bar during processing")
+    backend: str = Field(default="torch", description="Inference backend passed to sentence-transformers, 'torch', 'onnx' or 'openvino'")
+    quantize: bool = Field(default=False, description="Use int8 weights: dynamic quantization with torch, the quantized model file with onnx")
+    onnx_file_name: Optional[str] = Field(default=None, description="ONNX file of the model to load, defaults to onnx/model_qint8_avx2.onnx when quantize is set")
+    cache_size: int = Field(default=10000, description="Maximum number of cached query and memory scores, 0 to disable the cache")
@@ -25,6 +25,11 @@ class AzureMySQLConfig(BaseModel):
         None,
         description="Pre-configured connection pool object (overrides other connection parameters)"
     )
+    use_vector_functions: Optional[bool] = Field(
+        None,
+        description="Store vectors in a VECTOR column ranked with DISTANCE() (auto-detected when not set)"
+    )
+    scan_batch_size: int = Field(5000, description="Rows decoded per batch when ranking vectors on the client")
 
     @model_validator(mode="before")
     @classmethod
@@ -25,6 +25,14 @@ class CassandraConfig(BaseModel):
         None,
         description="Custom load balancing policy object"
     )
+    use_vector_index: bool = Field(
+        True,
+        description="Store vectors in a native vector column with an SAI index and search it with ANN queries"
+    )
+    scan_page_size: int = Field(
+        1000,
+        description="Rows scored per page when searching without a vector index"
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -13,6 +13,12 @@ class FAISSConfig(BaseModel):
         False, description="Whether to normalize L2 vectors (only applicable for euclidean distance)"
     )
     embedding_model_dims: int = Field(1536, description="Dimension of the embedding vector")
+    quantization: Optional[str] = Field(
+        None, description="Index compression. Options: 'sq_fp16', 'sq8', 'binary' (rescored with float vectors)"
+    )
+    rescore_multiplier: int = Field(
+        4, description="With binary quantization, limit * rescore_multiplier candidates are rescored"
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -22,6 +28,14 @@ class FAISSConfig(BaseModel):
             raise ValueError("Invalid distance_strategy. Must be one of: 'euclidean', 'inner_product', 'cosine'")
         return values
 
+    @model_validator(mode="before")
+    @classmethod
+    def validate_quantization(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        quantization = values.get("quantization")
+        if quantization and quantization not in ["sq_fp16", "sq8", "binary"]:
+            raise ValueError("Invalid quantization. Must be one of: 'sq_fp16', 'sq8', 'binary'")
+        return values
+
     @model_validator(mode="before")
     @classmethod
     def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -19,6 +19,13 @@ class PGVectorConfig(BaseModel):
     sslmode: Optional[str] = Field(None, description="SSL mode for PostgreSQL connection (e.g., 'require', 'prefer', 'disable')")
     connection_string: Optional[str] = Field(None, description="PostgreSQL connection string (overrides individual connection parameters)")
     connection_pool: Optional[Any] = Field(None, description="psycopg connection pool object (overrides connection string and individual parameters)")
+    hnsw_ef_search: Optional[int] = Field(None, description="hnsw.ef_search for searches, raised to the requested limit if lower")
+    hnsw_iterative_scan: Optional[str] = Field("relaxed_order", description="hnsw.iterative_scan mode for filtered searches ('relaxed_order', 'strict_order' or None), needs pgvector 0.8+")
+    defer_index_creation: Optional[bool] = Field(False, description="Build the HNSW/DiskANN index after the first bulk_insert instead of when creating the collection")
+    insert_batch_size: Optional[int] = Field(1000, description="Rows per multi-row upsert statement")
+    quantization: Optional[str] = Field(None, description="'halfvec' stores float16 vectors, 'bit' indexes binary quantized vectors and re-ranks the candidates with the full vectors")
+    rescore_multiplier: Optional[int] = Field(4, description="With 'bit' quantization, limit * rescore_multiplier candidates are re-ranked")
+    migrate_filter_columns: Optional[bool] = Field(False, description="Add the generated scope columns and filter indexes to an existing collection on start, rewriting the table under an exclusive lock")
 
     @model_validator(mode="before")
     def check_auth_and_connection(cls, values):
@@ -39,6 +46,14 @@ class PGVectorConfig(BaseModel):
             raise ValueError("Both 'host' and 'port' must be provided when not using connection_string.")
         return values
 
+    @model_validator(mode="before")
+    @classmethod
+    def validate_quantization(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        quantization = values.get("quantization")
+        if quantization and quantization not in ["halfvec", "bit"]:
+            raise ValueError("Invalid quantization. Must be one of: 'halfvec', 'bit'")
+        return values
+
     @model_validator(mode="before")
     @classmethod
     def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -17,6 +17,11 @@ class QdrantConfig(BaseModel):
     url: Optional[str] = Field(None, description="Full URL for Qdrant server")
     api_key: Optional[str] = Field(None, description="API key for Qdrant server")
     on_disk: Optional[bool] = Field(False, description="Enables persistent storage")
+    payload_indexes: Optional[Dict[str, str]] = Field(
+        None,
+        description="Extra payload indexes, mapping field names to an index type "
+        "(keyword, integer, float, bool, datetime, text or uuid)",
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -32,6 +37,21 @@ class QdrantConfig(BaseModel):
             raise ValueError("Either 'host' and 'port' or 'url' and 'api_key' or 'path' must be provided.")
         return values
 
+    @model_validator(mode="before")
+    @classmethod
+    def check_payload_indexes(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_schemas = {"keyword", "integer", "float", "bool", "datetime", "text", "uuid"}
+        invalid = {
+            field: schema
+            for field, schema in (values.get("payload_indexes") or {}).items()
+            if schema not in allowed_schemas
+        }
+        if invalid:
+            raise ValueError(
+                f"Unsupported payload index types: {invalid}. Use one of: {', '.join(sorted(allowed_schemas))}"
+            )
+        return values
+
     @model_validator(mode="before")
     @classmethod
     def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
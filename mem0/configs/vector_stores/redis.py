@@ -8,6 +8,8 @@ class RedisDBConfig(BaseModel):
     redis_url: str = Field(..., description="Redis URL")
     collection_name: str = Field("mem0", description="Collection name")
     embedding_model_dims: int = Field(1536, description="Embedding model dimensions")
+    hybrid_search: bool = Field(False, description="Combine a BM25 score on the memory text with the KNN search")
+    hybrid_alpha: float = Field(0.7, description="Weight of the vector similarity in hybrid scores")
 
     @model_validator(mode="before")
     @classmethod
@@ -53,3 +53,19 @@ class AzureOpenAIEmbedding(EmbeddingBase):
         """
         text = text.replace("\n", " ")
         return self.client.embeddings.create(input=[text], model=self.config.model).data[0].embedding
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts using OpenAI, in one request.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the order of the texts.
+        """
+        if not texts:
+            return []
+        texts = [text.replace("\n", " ") for text in texts]
+        response = self.client.embeddings.create(input=texts, model=self.config.model)
+        return [item.embedding for item in response.data]
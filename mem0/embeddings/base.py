@@ -29,3 +29,17 @@ class EmbeddingBase(ABC):
             list: The embedding vector.
         """
         pass
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts.
+
+        Providers that accept several inputs per request override this to embed them in one call.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the order of the texts.
+        """
+        return [self.embed(text, memory_action) for text in texts]
@@ -11,6 +11,9 @@ class Neo4jConfig(BaseModel):
     password: Optional[str] = Field(None, description="Password for the graph database")
     database: Optional[str] = Field(None, description="Database for the graph database")
     base_label: Optional[bool] = Field(None, description="Whether to use base node label __Entity__ for all entities")
+    vector_index: Optional[bool] = Field(
+        True, description="Look up entities with a native vector index (needs base_label), instead of scanning"
+    )
 
     @model_validator(mode="before")
     def check_host_port_or_path(cls, values):
@@ -75,6 +78,9 @@ class NeptuneConfig(BaseModel):
 
 class KuzuConfig(BaseModel):
     db: Optional[str] = Field(":memory:", description="Path to a Kuzu database file")
+    vector_index: Optional[bool] = Field(
+        True, description="Look up entities with an HNSW vector index, instead of scanning"
+    )
 
 
 class GraphStoreConfig(BaseModel):
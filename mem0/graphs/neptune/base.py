@@ -1,7 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
 
-from mem0.memory.utils import format_entities
+from mem0.memory.utils import format_entities, plan_entity_rows, split_rows
 
 try:
     from rank_bm25 import BM25Okapi
@@ -44,7 +44,7 @@ class NeptuneBase(ABC):
         """
         :return: the llm model used for memory store
         """
-        return LlmFactory.create(llm_provider, config.llm.config)
+        return LlmFactory.create(llm_provider, config.llm.config, cache=getattr(config.llm, "cache", None))
 
     @staticmethod
     def _create_vector_store(vector_store_provider, config):
@@ -190,25 +190,28 @@ class NeptuneBase(ABC):
 
     def _delete_entities(self, to_be_deleted, user_id):
         """
-        Delete the entities from the graph.
+        Delete the entities from the graph, in one query.
         """
 
-        results = []
-        for item in to_be_deleted:
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
+        if not to_be_deleted:
+            return []
 
-            # Delete the specific relationship between nodes
-            cypher, params = self._delete_entities_cypher(source, destination, relationship, user_id)
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
-        return results
+        rows = [
+            {
+                "row": index,
+                "source": item["source"],
+                "destination": item["destination"],
+                "relationship": item["relationship"],
+            }
+            for index, item in enumerate(to_be_deleted)
+        ]
+        cypher, params = self._delete_entities_cypher(rows, user_id)
+        return split_rows(self.graph.query(cypher, params=params), len(to_be_deleted))
 
     @abstractmethod
-    def _delete_entities_cypher(self, source, destination, relationship, user_id):
+    def _delete_entities_cypher(self, rows, user_id):
         """
-        Returns the OpenCypher query and parameters for deleting entities in the graph DB
+        Returns the OpenCypher query and parameters for deleting the relationships of the rows in the graph DB
         """
 
         pass
@@ -216,138 +219,116 @@ class NeptuneBase(ABC):
     def _add_entities(self, to_be_added, user_id, entity_type_map):
         """
         Add the new entities to the graph. Merge the nodes if they already exist.
-        """
 
-        results = []
-        for item in to_be_added:
-            # entities
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
-
-            # types
-            source_type = entity_type_map.get(source, "__User__")
-            destination_type = entity_type_map.get(destination, "__User__")
+        The entity names are embedded in one batch and resolved to existing nodes in one query. Relationship
+        types and node labels can't be query parameters, so the rows are then written with one UNWIND query
+        per relationship type, node types and combination of matched/new nodes.
+        """
 
-            # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
+        if not to_be_added:
+            return []
 
-            # search for the nodes with the closest embeddings
-            source_node_search_result = self._search_source_node(source_embedding, user_id, threshold=self.threshold)
-            destination_node_search_result = self._search_destination_node(dest_embedding, user_id, threshold=self.threshold)
+        names = list(dict.fromkeys(name for item in to_be_added for name in (item["source"], item["destination"])))
+        embeddings = dict(zip(names, self.embedding_model.embed_batch(names)))
+
+        # search for the nodes with the closest embeddings
+        node_ids = self._search_nodes(embeddings, user_id, threshold=self.threshold)
+        rows = plan_entity_rows(to_be_added, embeddings, node_ids, self.threshold)
+        self._index_new_nodes(rows, user_id, entity_type_map)
+
+        groups = {}
+        for row in rows:
+            key = (
+                row["relationship"],
+                entity_type_map.get(row["source"], "__User__"),
+                entity_type_map.get(row["destination"], "__User__"),
+                row["source_id"] is None,
+                row["destination_id"] is None,
+            )
+            groups.setdefault(key, []).append(row)
 
+        records = []
+        for (relationship, source_type, destination_type, new_source, new_destination), group in groups.items():
             cypher, params = self._add_entities_cypher(
-                source_node_search_result,
-                source,
-                source_embedding,
+                group,
                 source_type,
-                destination_node_search_result,
-                destination,
-                dest_embedding,
                 destination_type,
+                new_source,
+                new_destination,
                 relationship,
                 user_id,
             )
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
-        return results
+            records.extend(self.graph.query(cypher, params=params))
+        return split_rows(records, len(to_be_added))
 
     def _add_entities_cypher(
         self,
-        source_node_list,
-        source,
-        source_embedding,
+        rows,
         source_type,
-        destination_node_list,
-        destination,
-        dest_embedding,
         destination_type,
+        new_source,
+        new_destination,
         relationship,
         user_id,
     ):
         """
-        Returns the OpenCypher query and parameters for adding entities in the graph DB
-        """
-        if not destination_node_list and source_node_list:
-            return self._add_entities_by_source_cypher(
-                source_node_list,
-                destination,
-                dest_embedding,
-                destination_type,
-                relationship,
-                user_id)
-        elif destination_node_list and not source_node_list:
-            return self._add_entities_by_destination_cypher(
-                source,
-                source_embedding,
-                source_type,
-                destination_node_list,
-                relationship,
-                user_id)
-        elif source_node_list and destination_node_list:
-            return self._add_relationship_entities_cypher(
-                source_node_list,
-                destination_node_list,
-                relationship,
-                user_id)
-        # else source_node_list and destination_node_list are empty
-        return self._add_new_entities_cypher(
-            source,
-            source_embedding,
-            source_type,
-            destination,
-            dest_embedding,
-            destination_type,
-            relationship,
-            user_id)
-
-    @abstractmethod
-    def _add_entities_by_source_cypher(
-            self,
-            source_node_list,
-            destination,
-            dest_embedding,
-            destination_type,
-            relationship,
-            user_id,
-    ):
-        pass
-
-    @abstractmethod
-    def _add_entities_by_destination_cypher(
-            self,
-            source,
-            source_embedding,
-            source_type,
-            destination_node_list,
-            relationship,
-            user_id,
-    ):
-        pass
+        Returns the OpenCypher query and parameters for adding the rows of one relationship in the graph DB
+
+        :param rows: rows planned by plan_entity_rows
+        :param source_type: source node label
+        :param destination_type: destination node label
+        :param new_source: whether the source nodes are merged by name instead of matched by id
+        :param new_destination: whether the destination nodes are merged by name instead of matched by id
+        :param relationship: relationship label
+        :param user_id: user id to use
+        :return: str, dict
+        """
+        source_clause = self._upsert_node_cypher("source", source_type, new_source, "row")
+        destination_clause = self._upsert_node_cypher("destination", destination_type, new_destination, "row, source")
+        if new_source or new_destination:
+            relationship_set = """ON CREATE SET
+                    r.created = timestamp(),
+                    r.updated = timestamp(),
+                    r.mentions = 1
+                ON MATCH SET
+                    r.mentions = coalesce(r.mentions, 0) + 1,
+                    r.updated = timestamp()"""
+        else:
+            relationship_set = """ON CREATE SET
+                    r.created_at = timestamp(),
+                    r.updated_at = timestamp(),
+                    r.mentions = 1
+                ON MATCH SET r.mentions = coalesce(r.mentions, 0) + 1"""
+
+        cypher = f"""
+                UNWIND $rows AS row
+                {source_clause}
+                WITH row, source
+                {destination_clause}
+                WITH row, source, destination
+                MERGE (source)-[r:{relationship}]->(destination)
+                {relationship_set}
+                RETURN row.row AS row, source.name AS source, type(r) AS relationship, destination.name AS target
+                """
+        params = {
+            "rows": rows,
+            "user_id": user_id,
+        }
+        logger.debug(f"_add_entities:\n  rows={len(rows)}\n  query={cypher}")
+        return cypher, params
 
     @abstractmethod
-    def _add_relationship_entities_cypher(
-            self,
-            source_node_list,
-            destination_node_list,
-            relationship,
-            user_id,
-    ):
+    def _upsert_node_cypher(self, variable, node_type, new, carried):
+        """
+        Returns the OpenCypher clause binding `variable` to the node of the current row, matched by
+        row.<variable>_id, or merged by name if `new`. `carried` lists the variables bound before it.
+        """
         pass
 
-    @abstractmethod
-    def _add_new_entities_cypher(
-            self,
-            source,
-            source_embedding,
-            source_type,
-            destination,
-            dest_embedding,
-            destination_type,
-            relationship,
-            user_id,
-    ):
+    def _index_new_nodes(self, rows, user_id, entity_type_map):
+        """
+        Called before the rows are written, for stores that index the embeddings of new nodes themselves.
+        """
         pass
 
     def search(self, query, filters, limit=100):
@@ -385,27 +366,24 @@ class NeptuneBase(ABC):
 
         return search_results
 
-    def _search_source_node(self, source_embedding, user_id, threshold=0.9):
-        cypher, params = self._search_source_node_cypher(source_embedding, user_id, threshold)
-        result = self.graph.query(cypher, params=params)
-        return result
-
-    @abstractmethod
-    def _search_source_node_cypher(self, source_embedding, user_id, threshold):
-        """
-        Returns the OpenCypher query and parameters to search for source nodes
+    def _search_nodes(self, embeddings, user_id, threshold=0.9):
         """
-        pass
+        Find the closest existing node of every entity name, in one query.
 
-    def _search_destination_node(self, destination_embedding, user_id, threshold=0.9):
-        cypher, params = self._search_destination_node_cypher(destination_embedding, user_id, threshold)
-        result = self.graph.query(cypher, params=params)
-        return result
+        :param embeddings: dict of the embedding of every entity name
+        :return: dict of the matched node id of the names that matched a node
+        """
+        cypher, params = self._search_nodes_cypher(embeddings, user_id, threshold)
+        node_ids = {}
+        for record in self.graph.query(cypher, params=params):
+            node_ids.setdefault(record["name"], record["id"])
+        return node_ids
 
     @abstractmethod
-    def _search_destination_node_cypher(self, destination_embedding, user_id, threshold):
+    def _search_nodes_cypher(self, embeddings, user_id, threshold):
         """
-        Returns the OpenCypher query and parameters to search for destination nodes
+        Returns the OpenCypher query and parameters to search for the nodes of the entity names, returning
+        the "name" and "id" of the candidates ordered from the closest
         """
         pass
 
@@ -1,5 +1,5 @@
 import os
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
 try:
     import anthropic
@@ -40,6 +40,27 @@ class AnthropicLLM(LLMBase):
         api_key = self.config.api_key or os.getenv("ANTHROPIC_API_KEY")
         self.client = anthropic.Anthropic(api_key=api_key)
 
+    def _prepare_params(self, messages: List[Dict[str, str]], **kwargs) -> Dict:
+        """Build the request parameters shared by generate_response and generate_response_stream."""
+        # Separate system message from other messages
+        system_message = ""
+        filtered_messages = []
+        for message in messages:
+            if message["role"] == "system":
+                system_message = message["content"]
+            else:
+                filtered_messages.append(message)
+
+        params = self._get_supported_params(messages=messages, **kwargs)
+        params.update(
+            {
+                "model": self.config.model,
+                "messages": filtered_messages,
+                "system": system_message,
+            }
+        )
+        return params
+
     def generate_response(
         self,
         messages: List[Dict[str, str]],
@@ -61,23 +82,7 @@ class AnthropicLLM(LLMBase):
         Returns:
             str: The generated response.
         """
-        # Separate system message from other messages
-        system_message = ""
-        filtered_messages = []
-        for message in messages:
-            if message["role"] == "system":
-                system_message = message["content"]
-            else:
-                filtered_messages.append(message)
-
-        params = self._get_supported_params(messages=messages, **kwargs)
-        params.update(
-            {
-                "model": self.config.model,
-                "messages": filtered_messages,
-                "system": system_message,
-            }
-        )
+        params = self._prepare_params(messages, **kwargs)
 
         if tools:  # TODO: Remove tools if no issues found with new memory addition logic
             params["tools"] = tools
@@ -85,3 +90,21 @@ class AnthropicLLM(LLMBase):
 
         response = self.client.messages.create(**params)
         return response.content[0].text
+
+    def generate_response_stream(
+        self, messages: List[Dict[str, str]], response_format=None, **kwargs
+    ) -> Iterator[str]:
+        """
+        Generate a text response using Anthropic, yielding it in chunks as it is generated.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            **kwargs: Additional Anthropic-specific parameters.
+
+        Yields:
+            str: The next chunk of the response.
+        """
+        params = self._prepare_params(messages, **kwargs)
+        with self.client.messages.stream(**params) as stream:
+            yield from stream.text_stream
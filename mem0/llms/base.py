@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
 from mem0.configs.llms.base import BaseLlmConfig
 
@@ -112,6 +112,26 @@ class LLMBase(ABC):
         """
         pass
 
+    def generate_response_stream(
+        self, messages: List[Dict[str, str]], response_format=None, **kwargs
+    ) -> Iterator[str]:
+        """
+        Generate a text response, yielding it in chunks as it is generated.
+
+        Providers without streaming support yield the whole response as a single chunk.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            **kwargs: Additional provider-specific parameters.
+
+        Yields:
+            str: The next chunk of the response.
+        """
+        if response_format is not None:
+            kwargs["response_format"] = response_format
+        yield self.generate_response(messages=messages, **kwargs)
+
     def _get_common_params(self, **kwargs) -> Dict:
         """
         Get common parameters that most providers use.
@@ -0,0 +1,232 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Union
+
+from mem0.llms.base import LLMBase
+from mem0.llms.configs import LlmCacheConfig
+
+logger = logging.getLogger(__name__)
+
+
+class CachedLLM(LLMBase):
+    """
+    Wraps an LLM and caches the responses of its deterministic calls.
+
+    Responses are kept in an in-memory LRU and, when a path is configured, in a SQLite database
+    shared across processes and runs. A call is cached when the temperature of the LLM is 0, or when
+    it is flagged with `cacheable=True`; `cacheable=False` always bypasses the cache.
+    """
+
+    def __init__(self, llm: LLMBase, provider: str, config: Optional[Union[LlmCacheConfig, Dict]] = None):
+        self.llm = llm
+        self.provider = provider
+        if config is None:
+            config = LlmCacheConfig()
+        elif isinstance(config, dict):
+            config = LlmCacheConfig(**config)
+        self.cache_config = config
+        self.config = llm.config
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+        self.connection = None
+        if self.cache_config.path:
+            self.connection = sqlite3.connect(self.cache_config.path, check_same_thread=False)
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key          TEXT PRIMARY KEY,
+                    response     TEXT,
+                    created_at   REAL
+                )
+            """
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_created_at ON llm_cache (created_at)")
+            self.connection.commit()
+
+    def __getattr__(self, name):
+        # Only called for attributes missing on the wrapper, e.g. provider specific helpers
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        cacheable: Optional[bool] = None,
+        **kwargs,
+    ):
+        """
+        Generate a response, served from the cache when the same call was made before.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+            cacheable (bool, optional): Force caching the call on or off. Defaults to caching it when
+                the temperature is 0.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            str or dict: The generated response.
+        """
+        if cacheable is None:
+            cacheable = self.cache_config.cache_all_temperatures or getattr(self.config, "temperature", None) == 0
+        if not cacheable:
+            return self.llm.generate_response(messages=messages, tools=tools, tool_choice=tool_choice, **kwargs)
+
+        key = self._cache_key(messages, tools, tool_choice, kwargs)
+        found, response = self._get(key)
+        if found:
+            return response
+
+        response = self.llm.generate_response(messages=messages, tools=tools, tool_choice=tool_choice, **kwargs)
+        self._set(key, response)
+        return response
+
+    def generate_response_stream(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        cacheable: Optional[bool] = None,
+        **kwargs,
+    ) -> Iterator[str]:
+        """
+        Stream a response, replayed as a single chunk when the same call was made before.
+
+        Streamed and non-streamed calls with the same arguments share their cache entries.
+
+        Yields:
+            str: The next chunk of the response.
+        """
+        if response_format is not None:
+            kwargs["response_format"] = response_format
+        if cacheable is None:
+            cacheable = self.cache_config.cache_all_temperatures or getattr(self.config, "temperature", None) == 0
+        if not cacheable:
+            yield from self.llm.generate_response_stream(messages=messages, **kwargs)
+            return
+
+        key = self._cache_key(messages, None, "auto", kwargs)
+        found, response = self._get(key)
+        if found:
+            yield response
+            return
+
+        chunks = []
+        for chunk in self.llm.generate_response_stream(messages=messages, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        self._set(key, "".join(chunks))
+
+    def _cache_key(self, messages, tools, tool_choice, kwargs):
+        normalized_messages = []
+        for message in messages:
+            content = message.get("content")
+            normalized_messages.append({**message, "content": content.strip() if isinstance(content, str) else content})
+        payload = {
+            "provider": self.provider,
+            "model": getattr(self.config, "model", None),
+            "temperature": getattr(self.config, "temperature", None),
+            "max_tokens": getattr(self.config, "max_tokens", None),
+            "top_p": getattr(self.config, "top_p", None),
+            "messages": normalized_messages,
+            "tools": tools,
+            "tool_choice": tool_choice if tools else None,
+            **kwargs,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _expired(self, created_at):
+        return self.cache_config.ttl is not None and time.time() - created_at > self.cache_config.ttl
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                response, created_at = entry
+                if not self._expired(created_at):
+                    self._entries.move_to_end(key)
+                    self._memory_hits += 1
+                    return True, json.loads(response)
+                del self._entries[key]
+
+            if self.connection is not None:
+                row = self.connection.execute(
+                    "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and not self._expired(row[1]):
+                    self._remember(key, row[0], row[1])
+                    self._disk_hits += 1
+                    return True, json.loads(row[0])
+
+            self._misses += 1
+            return False, None
+
+    def _set(self, key, response):
+        try:
+            serialized = json.dumps(response)
+        except TypeError:
+            logger.debug(f"Not caching a response of type {type(response).__name__}")
+            return
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, serialized, created_at)
+            if self.connection is not None:
+                try:
+                    self.connection.execute(
+                        "INSERT OR REPLACE INTO llm_cache (key, response, created_at) VALUES (?, ?, ?)",
+                        (key, serialized, created_at),
+                    )
+                    if self.cache_config.ttl is not None:
+                        self.connection.execute(
+                            "DELETE FROM llm_cache WHERE created_at < ?", (created_at - self.cache_config.ttl,)
+                        )
+                    self.connection.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to write the LLM cache: {e}")
+
+    def _remember(self, key, serialized, created_at):
+        self._entries[key] = (serialized, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.cache_config.max_size:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Hit and miss counts of the cache since it was created.
+
+        Returns:
+            dict: "hits" (split into "memory_hits" and "disk_hits"), "misses", "hit_rate" and the
+                number of responses held in memory under "size".
+        """
+        with self._lock:
+            hits = self._memory_hits + self._disk_hits
+            lookups = hits + self._misses
+            return {
+                "hits": hits,
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+            }
+
+    def clear(self):
+        """Drop every cached response, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            if self.connection is not None:
+                self.connection.execute("DELETE FROM llm_cache")
+                self.connection.commit()
@@ -1,11 +1,31 @@
+import os
 from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from mem0.memory.setup import mem0_dir
+
+
+class LlmCacheConfig(BaseModel):
+    max_size: int = Field(description="Number of responses kept in the in-memory LRU tier", default=1024)
+    path: Optional[str] = Field(
+        description="Path to the SQLite database of the disk tier, None to only cache in memory",
+        default=os.path.join(mem0_dir, "llm_cache.db"),
+    )
+    ttl: Optional[int] = Field(
+        description="Seconds after which a cached response expires, None to never expire", default=7 * 24 * 3600
+    )
+    cache_all_temperatures: bool = Field(
+        description="Also cache calls made with a temperature above 0, which are not deterministic", default=False
+    )
+
 
 class LlmConfig(BaseModel):
     provider: str = Field(description="Provider of the LLM (e.g., 'ollama', 'openai')", default="openai")
     config: Optional[dict] = Field(description="Configuration for the specific LLM", default={})
+    cache: Optional[LlmCacheConfig] = Field(
+        description="Cache the responses of deterministic calls, disabled if None", default=None
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
 try:
     from ollama import Client
@@ -66,27 +66,8 @@ class OllamaLLM(LLMBase):
         else:
             return content
 
-    def generate_response(
-        self,
-        messages: List[Dict[str, str]],
-        response_format=None,
-        tools: Optional[List[Dict]] = None,
-        tool_choice: str = "auto",
-        **kwargs,
-    ):
-        """
-        Generate a response based on the given messages using Ollama.
-
-        Args:
-            messages (list): List of message dicts containing 'role' and 'content'.
-            response_format (str or object, optional): Format of the response. Defaults to "text".
-            tools (list, optional): List of tools that the model can call. Defaults to None.
-            tool_choice (str, optional): Tool choice method. Defaults to "auto".
-            **kwargs: Additional Ollama-specific parameters.
-
-        Returns:
-            str: The generated response.
-        """
+    def _prepare_params(self, messages: List[Dict[str, str]], response_format=None) -> Dict:
+        """Build the request parameters shared by generate_response and generate_response_stream."""
         # Build parameters for Ollama
         params = {
             "model": self.config.model,
@@ -112,6 +93,49 @@ class OllamaLLM(LLMBase):
 
         # Remove OpenAI-specific parameters that Ollama doesn't support
         params.pop("max_tokens", None)  # Ollama uses different parameter names
+        return params
 
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Generate a response based on the given messages using Ollama.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+            **kwargs: Additional Ollama-specific parameters.
+
+        Returns:
+            str: The generated response.
+        """
+        params = self._prepare_params(messages, response_format)
         response = self.client.chat(**params)
         return self._parse_response(response, tools)
+
+    def generate_response_stream(
+        self, messages: List[Dict[str, str]], response_format=None, **kwargs
+    ) -> Iterator[str]:
+        """
+        Generate a text response using Ollama, yielding it in chunks as it is generated.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            **kwargs: Additional Ollama-specific parameters.
+
+        Yields:
+            str: The next chunk of the response.
+        """
+        params = self._prepare_params(messages, response_format)
+        for chunk in self.client.chat(stream=True, **params):
+            content = chunk["message"]["content"] if isinstance(chunk, dict) else chunk.message.content
+            if content:
+                yield content
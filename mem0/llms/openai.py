@@ -1,7 +1,7 @@
 import json
 import logging
 import os
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
 from openai import OpenAI
 
@@ -80,27 +80,8 @@ class OpenAILLM(LLMBase):
         else:
             return response.choices[0].message.content
 
-    def generate_response(
-        self,
-        messages: List[Dict[str, str]],
-        response_format=None,
-        tools: Optional[List[Dict]] = None,
-        tool_choice: str = "auto",
-        **kwargs,
-    ):
-        """
-        Generate a JSON response based on the given messages using OpenAI.
-
-        Args:
-            messages (list): List of message dicts containing 'role' and 'content'.
-            response_format (str or object, optional): Format of the response. Defaults to "text".
-            tools (list, optional): List of tools that the model can call. Defaults to None.
-            tool_choice (str, optional): Tool choice method. Defaults to "auto".
-            **kwargs: Additional OpenAI-specific parameters.
-
-        Returns:
-            json: The generated response.
-        """
+    def _prepare_params(self, messages: List[Dict[str, str]], response_format=None, **kwargs) -> Dict:
+        """Build the request parameters shared by generate_response and generate_response_stream."""
         params = self._get_supported_params(messages=messages, **kwargs)
         
         params.update({
@@ -132,6 +113,30 @@ class OpenAILLM(LLMBase):
             
         if response_format:
             params["response_format"] = response_format
+        return params
+
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Generate a JSON response based on the given messages using OpenAI.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+            **kwargs: Additional OpenAI-specific parameters.
+
+        Returns:
+            json: The generated response.
+        """
+        params = self._prepare_params(messages, response_format, **kwargs)
         if tools:  # TODO: Remove tools if no issues found with new memory addition logic
             params["tools"] = tools
             params["tool_choice"] = tool_choice
@@ -145,3 +150,22 @@ class OpenAILLM(LLMBase):
                 logging.error(f"Error due to callback: {e}")
                 pass
         return parsed_response
+
+    def generate_response_stream(
+        self, messages: List[Dict[str, str]], response_format=None, **kwargs
+    ) -> Iterator[str]:
+        """
+        Generate a text response using OpenAI, yielding it in chunks as it is generated.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            **kwargs: Additional OpenAI-specific parameters.
+
+        Yields:
+            str: The next chunk of the response.
+        """
+        params = self._prepare_params(messages, response_format, **kwargs)
+        for chunk in self.client.chat.completions.create(stream=True, **params):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
 from openai import OpenAI
 
@@ -105,3 +105,31 @@ class VllmLLM(LLMBase):
 
         response = self.client.chat.completions.create(**params)
         return self._parse_response(response, tools)
+
+    def generate_response_stream(
+        self, messages: List[Dict[str, str]], response_format=None, **kwargs
+    ) -> Iterator[str]:
+        """
+        Generate a text response using vLLM, yielding it in chunks as it is generated.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            **kwargs: Additional vLLM-specific parameters.
+
+        Yields:
+            str: The next chunk of the response.
+        """
+        params = self._get_supported_params(messages=messages, **kwargs)
+        params.update(
+            {
+                "model": self.config.model,
+                "messages": messages,
+            }
+        )
+        if response_format:
+            params["response_format"] = response_format
+
+        for chunk in self.client.chat.completions.create(stream=True, **params):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
@@ -0,0 +1,160 @@
+import asyncio
+import threading
+from copy import deepcopy
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Runs one add cycle for the merged messages of a batch
+AddRunner = Callable[[List[Dict[str, Any]]], Any]
+AsyncAddRunner = Callable[[List[Dict[str, Any]]], Awaitable[Any]]
+
+
+class _Batch:
+    def __init__(self, event_type):
+        self.messages = []
+        self.callers = 0
+        self.full = event_type()
+        self.done = event_type()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class _CoalescerStats:
+    def __init__(self):
+        self.adds = 0
+        self.batches = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Number of adds submitted and of add cycles they were merged into.
+
+        Returns:
+            dict: "adds", "batches", and "saved_cycles", the add cycles saved by merging.
+        """
+        return {"adds": self.adds, "batches": self.batches, "saved_cycles": self.adds - self.batches}
+
+
+class AddCoalescer(_CoalescerStats):
+    """
+    Merges the adds of a scope made within a short window into a single add cycle.
+
+    The first add of a batch waits `window` seconds, or until `max_batch_size` adds joined, then runs one
+    extraction and update cycle on the concatenated messages of the batch; every caller of the batch gets
+    its result. Batches of the same scope run one after the other, in the order they were closed, so
+    concurrent adds of a scope never race on the same memories.
+    """
+
+    def __init__(self, window: float = 0.05, max_batch_size: int = 16):
+        super().__init__()
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._open: Dict[str, _Batch] = {}
+        # Last closed batch of each scope, the next batch of the scope waits for it
+        self._tails: Dict[str, _Batch] = {}
+
+    def submit(self, scope: str, key: str, messages: List[Dict[str, Any]], run: AddRunner):
+        """
+        Add messages to the open batch of `key`, and return the result of the batch once it ran.
+
+        Args:
+            scope (str): Batches of the same scope run one at a time.
+            key (str): Adds are only merged with adds of the same key, which must imply the same scope
+                and the same add arguments apart from the messages.
+            messages (list): Messages of the add.
+            run (callable): Runs the add cycle for the merged messages, called once per batch.
+        """
+        with self._lock:
+            self.adds += 1
+            batch = self._open.get(key)
+            leader = batch is None
+            if leader:
+                batch = self._open[key] = _Batch(threading.Event)
+            batch.messages.extend(messages)
+            batch.callers += 1
+            if batch.callers >= self.max_batch_size:
+                del self._open[key]
+                batch.full.set()
+
+        if not leader:
+            batch.done.wait()
+            if batch.error is not None:
+                raise batch.error
+            return deepcopy(batch.result)
+
+        batch.full.wait(self.window)
+        with self._lock:
+            if self._open.get(key) is batch:
+                del self._open[key]
+            previous = self._tails.get(scope)
+            self._tails[scope] = batch
+            self.batches += 1
+
+        if previous is not None:
+            previous.done.wait()
+        try:
+            batch.result = run(batch.messages)
+            return batch.result
+        except BaseException as e:
+            batch.error = e
+            raise
+        finally:
+            batch.done.set()
+            with self._lock:
+                if self._tails.get(scope) is batch:
+                    del self._tails[scope]
+
+
+class AsyncAddCoalescer(_CoalescerStats):
+    """Event loop counterpart of `AddCoalescer`, for `AsyncMemory`."""
+
+    def __init__(self, window: float = 0.05, max_batch_size: int = 16):
+        super().__init__()
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._open: Dict[str, _Batch] = {}
+        self._tails: Dict[str, _Batch] = {}
+
+    async def submit(self, scope: str, key: str, messages: List[Dict[str, Any]], run: AsyncAddRunner):
+        """See `AddCoalescer.submit`, with `run` returning an awaitable."""
+        self.adds += 1
+        batch = self._open.get(key)
+        leader = batch is None
+        if leader:
+            batch = self._open[key] = _Batch(asyncio.Event)
+        batch.messages.extend(messages)
+        batch.callers += 1
+        if batch.callers >= self.max_batch_size:
+            del self._open[key]
+            batch.full.set()
+
+        if not leader:
+            await batch.done.wait()
+            if batch.error is not None:
+                raise batch.error
+            return deepcopy(batch.result)
+
+        try:
+            try:
+                await asyncio.wait_for(batch.full.wait(), self.window)
+            except asyncio.TimeoutError:
+                pass
+            if self._open.get(key) is batch:
+                del self._open[key]
+            previous = self._tails.get(scope)
+            self._tails[scope] = batch
+            self.batches += 1
+
+            if previous is not None:
+                await previous.done.wait()
+            batch.result = await run(batch.messages)
+            return batch.result
+        except BaseException as e:
+            batch.error = e
+            raise
+        finally:
+            # Also close the batch when the leader was cancelled during the window
+            if self._open.get(key) is batch:
+                del self._open[key]
+            batch.done.set()
+            if self._tails.get(scope) is batch:
+                del self._tails[scope]
@@ -0,0 +1,261 @@
+import logging
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Turns that almost never hold a fact worth remembering
+DEFAULT_NO_FACT_PHRASES = [
+    "ok",
+    "okay",
+    "k",
+    "sure",
+    "yes",
+    "yeah",
+    "yep",
+    "no",
+    "nope",
+    "thanks",
+    "thank you",
+    "thx",
+    "ty",
+    "cool",
+    "great",
+    "nice",
+    "awesome",
+    "got it",
+    "sounds good",
+    "hi",
+    "hello",
+    "hey",
+    "bye",
+    "goodbye",
+    "lol",
+    "haha",
+    "hmm",
+    "done",
+    "continue",
+    "go on",
+    "please",
+    "np",
+    "no problem",
+    "you're welcome",
+]
+
+_WORD = re.compile(r"[\w']+")
+
+
+class ExtractionFilter(ABC):
+    """A check flagging message contents that don't need a fact extraction."""
+
+    name = "filter"
+
+    @abstractmethod
+    def is_uninformative(self, content: str) -> bool:
+        pass
+
+    def learn(self, contents: List[str]) -> None:
+        """Learn from contents whose extraction returned no facts. Does nothing by default."""
+
+
+class RuleFilter(ExtractionFilter):
+    """
+    Flags empty or very short contents, contents made only of stopwords, and contents matching a pattern.
+    """
+
+    name = "rules"
+
+    def __init__(
+        self,
+        min_chars: int = 3,
+        stopwords: Optional[Iterable[str]] = None,
+        skip_patterns: Optional[Iterable[str]] = None,
+    ):
+        self.min_chars = min_chars
+        phrases = DEFAULT_NO_FACT_PHRASES if stopwords is None else stopwords
+        self.stopwords = {word for phrase in phrases for word in _WORD.findall(phrase.lower())}
+        self.skip_patterns = [re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in skip_patterns or []]
+
+    def is_uninformative(self, content: str) -> bool:
+        words = _WORD.findall(content.lower())
+        if len("".join(words)) < self.min_chars:
+            return True
+        if all(word in self.stopwords for word in words):
+            return True
+        stripped = content.strip()
+        return any(pattern.fullmatch(stripped) for pattern in self.skip_patterns)
+
+
+class EmbeddingFilter(ExtractionFilter):
+    """
+    Flags short contents whose embedding is close to a centroid of no-fact turns.
+
+    The centroids start as the embeddings of `examples`; `learn` folds the embeddings of turns whose
+    extraction returned no facts into them, merging into the nearest centroid once `max_centroids` exist.
+    """
+
+    name = "embedding"
+
+    def __init__(
+        self,
+        embedding_model,
+        examples: Optional[Sequence[str]] = None,
+        threshold: float = 0.85,
+        max_chars: int = 200,
+        max_centroids: int = 64,
+    ):
+        self.embedding_model = embedding_model
+        self.threshold = threshold
+        self.max_chars = max_chars
+        self.max_centroids = max_centroids
+        self._lock = threading.Lock()
+        # Running sum and count of the embeddings folded into each centroid
+        self._sums = np.zeros((0, 0), dtype=np.float32)
+        self._counts = np.zeros(0, dtype=np.int64)
+        self.learn(list(DEFAULT_NO_FACT_PHRASES if examples is None else examples))
+
+    def _embed(self, contents: List[str]) -> np.ndarray:
+        vectors = np.asarray(self.embedding_model.embed_batch(contents, "add"), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def _centroids(self) -> np.ndarray:
+        centroids = self._sums / self._counts[:, None]
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        return centroids / np.where(norms == 0, 1, norms)
+
+    def is_uninformative(self, content: str) -> bool:
+        if len(content) > self.max_chars or not len(self._counts):
+            return False
+        vector = self._embed([content])[0]
+        with self._lock:
+            similarity = float(np.max(self._centroids() @ vector))
+        return similarity >= self.threshold
+
+    def learn(self, contents: List[str]) -> None:
+        contents = [content for content in contents if len(content) <= self.max_chars]
+        if not contents:
+            return
+        vectors = self._embed(contents)
+        with self._lock:
+            for vector in vectors:
+                if not len(self._counts):
+                    self._sums = vector[None, :].copy()
+                    self._counts = np.ones(1, dtype=np.int64)
+                elif len(self._counts) < self.max_centroids:
+                    self._sums = np.vstack([self._sums, vector])
+                    self._counts = np.append(self._counts, 1)
+                else:
+                    nearest = int(np.argmax(self._centroids() @ vector))
+                    self._sums[nearest] += vector
+                    self._counts[nearest] += 1
+
+
+class ExtractionGate:
+    """
+    Decides whether the messages of an add need a fact extraction LLM call.
+
+    Extraction is skipped when every user and assistant message is flagged by one of the filters, which
+    run in order, cheapest first. Counters of checked and skipped adds measure the LLM calls saved.
+    """
+
+    def __init__(self, filters: List[ExtractionFilter], learn_from_extraction: bool = False):
+        self.filters = filters
+        self.learn_from_extraction = learn_from_extraction
+        self._lock = threading.Lock()
+        self._checked = 0
+        self._skipped = 0
+        self._flagged = {f.name: 0 for f in filters}
+
+    @classmethod
+    def from_config(cls, config, embedding_model=None) -> "ExtractionGate":
+        filters = [RuleFilter(config.min_chars, config.stopwords, config.skip_patterns)]
+        if config.embedding_filter:
+            filters.append(
+                EmbeddingFilter(
+                    embedding_model,
+                    examples=config.no_fact_examples,
+                    threshold=config.similarity_threshold,
+                    max_chars=config.embedding_max_chars,
+                )
+            )
+        return cls(filters, learn_from_extraction=config.learn_from_extraction)
+
+    @staticmethod
+    def _contents(messages: List[Dict]) -> Optional[List[str]]:
+        contents = []
+        for message in messages:
+            if not isinstance(message, dict) or message.get("role") == "system":
+                continue
+            content = message.get("content")
+            if content is None:
+                continue
+            if not isinstance(content, str):
+                # Images and other structured contents always go through extraction
+                return None
+            contents.append(content)
+        return contents
+
+    def should_extract(self, messages: List[Dict]) -> bool:
+        """
+        Whether the messages need a fact extraction.
+
+        Args:
+            messages (list): Messages of the add, after vision parsing.
+
+        Returns:
+            bool: False when every message was flagged as uninformative by a filter.
+        """
+        contents = self._contents(messages)
+        flagged_by = []
+        if contents is not None:
+            for content in contents:
+                flagged = next((f.name for f in self.filters if f.is_uninformative(content)), None)
+                if flagged is None:
+                    break
+                flagged_by.append(flagged)
+        # Adds without user or assistant text, e.g. only system messages, are extracted as before
+        skip = bool(contents) and len(flagged_by) == len(contents)
+
+        with self._lock:
+            self._checked += 1
+            if skip:
+                self._skipped += 1
+                for name in flagged_by:
+                    self._flagged[name] += 1
+        if skip:
+            logger.debug(f"Skipping fact extraction of {len(contents)} uninformative messages")
+        return not skip
+
+    def record_no_facts(self, messages: List[Dict]) -> None:
+        """Let the filters learn from messages whose extraction returned no facts."""
+        if not self.learn_from_extraction:
+            return
+        contents = self._contents(messages)
+        if not contents:
+            return
+        for f in self.filters:
+            try:
+                f.learn(contents)
+            except Exception as e:
+                logger.warning(f"Extraction filter {f.name} failed to learn: {e}")
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Counters of the gate since it was created.
+
+        Returns:
+            dict: "checked" adds, "skipped" extractions, "skip_rate", and under "flagged" the number of
+                messages flagged by each filter.
+        """
+        with self._lock:
+            return {
+                "checked": self._checked,
+                "skipped": self._skipped,
+                "skip_rate": self._skipped / self._checked if self._checked else 0.0,
+                "flagged": dict(self._flagged),
+            }
@@ -1,9 +1,17 @@
 import logging
 
-from mem0.memory.utils import format_entities, sanitize_relationship_for_cypher
+from mem0.memory.utils import (
+    VECTOR_INDEX_CANDIDATES,
+    format_entities,
+    plan_entity_rows,
+    sanitize_relationship_for_cypher,
+    select_scoped_nodes,
+    split_rows,
+)
 
 try:
     from langchain_neo4j import Neo4jGraph
+    from neo4j import GraphDatabase
 except ImportError:
     raise ImportError("langchain_neo4j is not installed. Please install it using pip install langchain-neo4j")
 
@@ -37,6 +45,12 @@ class MemoryGraph:
             refresh_schema=False,
             driver_config={"notifications_min_severity": "OFF"},
         )
+        # Batched writes run several statements in one transaction, which Neo4jGraph.query can't do
+        self.driver = GraphDatabase.driver(
+            self.config.graph_store.config.url,
+            auth=(self.config.graph_store.config.username, self.config.graph_store.config.password),
+            notifications_min_severity="OFF",
+        )
         self.embedding_model = EmbedderFactory.create(
             self.config.embedder.provider, self.config.embedder.config, self.config.vector_store.config
         )
@@ -55,6 +69,11 @@ class MemoryGraph:
             except Exception:
                 pass
 
+        # The vector index covers the base label, without it entity lookups scan the user's nodes
+        self.vector_index = None
+        if self.config.graph_store.config.base_label and self.config.graph_store.config.vector_index:
+            self._create_vector_index()
+
         # Default to openai if no specific provider is configured
         self.llm_provider = "openai"
         if self.config.llm and self.config.llm.provider:
@@ -64,11 +83,14 @@ class MemoryGraph:
 
         # Get LLM config with proper null checks
         llm_config = None
+        llm_cache = None
         if self.config.graph_store and self.config.graph_store.llm and hasattr(self.config.graph_store.llm, "config"):
             llm_config = self.config.graph_store.llm.config
+            llm_cache = getattr(self.config.graph_store.llm, "cache", None)
         elif hasattr(self.config.llm, "config"):
             llm_config = self.config.llm.config
-        self.llm = LlmFactory.create(self.llm_provider, llm_config)
+            llm_cache = getattr(self.config.llm, "cache", None)
+        self.llm = LlmFactory.create(self.llm_provider, llm_config, cache=llm_cache)
         self.user_id = None
         # Use threshold from graph_store config, default to 0.7 for backward compatibility
         self.threshold = self.config.graph_store.threshold if hasattr(self.config.graph_store, 'threshold') else 0.7
@@ -86,7 +108,6 @@ class MemoryGraph:
         search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
         to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
 
-        # TODO: Batch queries with APOC plugin
         # TODO: Add more filter support
         deleted_entities = self._delete_entities(to_be_deleted, filters)
         added_entities = self._add_entities(to_be_added, filters, entity_type_map)
@@ -283,6 +304,11 @@ class MemoryGraph:
         for node in node_list:
             n_embedding = self.embedding_model.embed(node)
 
+            hits = self._query_vector_index(n_embedding, filters, self.threshold)
+            if hits is not None:
+                result_relations.extend(self._expand_nodes(hits, filters, node_props_str, limit))
+                continue
+
             cypher_query = f"""
             MATCH (n {self.node_label} {{{node_props_str}}})
             WHERE n.embedding IS NOT NULL
@@ -319,6 +345,43 @@ class MemoryGraph:
 
         return result_relations
 
+    def _expand_nodes(self, hits, filters, node_props_str, limit):
+        """Return the incoming and outgoing relations of the nodes found with the vector index."""
+        if not hits:
+            return []
+
+        cypher_query = f"""
+        UNWIND $hits AS hit
+        MATCH (n {self.node_label})
+        WHERE elementId(n) = hit.id
+        WITH n, hit.similarity AS similarity
+        CALL {{
+            WITH n
+            MATCH (n)-[r]->(m {self.node_label} {{{node_props_str}}})
+            RETURN n.name AS source, elementId(n) AS source_id, type(r) AS relationship, elementId(r) AS relation_id, m.name AS destination, elementId(m) AS destination_id
+            UNION
+            WITH n
+            MATCH (n)<-[r]-(m {self.node_label} {{{node_props_str}}})
+            RETURN m.name AS source, elementId(m) AS source_id, type(r) AS relationship, elementId(r) AS relation_id, n.name AS destination, elementId(n) AS destination_id
+        }}
+        WITH distinct source, source_id, relationship, relation_id, destination, destination_id, similarity
+        RETURN source, source_id, relationship, relation_id, destination, destination_id, similarity
+        ORDER BY similarity DESC
+        LIMIT $limit
+        """
+
+        params = {
+            "hits": [{"id": hit["id"], "similarity": hit["similarity"]} for hit in hits],
+            "user_id": filters["user_id"],
+            "limit": limit,
+        }
+        if filters.get("agent_id"):
+            params["agent_id"] = filters["agent_id"]
+        if filters.get("run_id"):
+            params["run_id"] = filters["run_id"]
+
+        return self.graph.query(cypher_query, params=params)
+
     def _get_delete_entities_from_search_output(self, search_output, data, filters):
         """Get the entities to be deleted from the search output."""
         search_output_string = format_entities(search_output)
@@ -356,255 +419,153 @@ class MemoryGraph:
         return to_be_deleted
 
     def _delete_entities(self, to_be_deleted, filters):
-        """Delete the entities from the graph."""
+        """Delete the entities from the graph, all relations in one query."""
         user_id = filters["user_id"]
         agent_id = filters.get("agent_id", None)
         run_id = filters.get("run_id", None)
-        results = []
-
-        for item in to_be_deleted:
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
-
-            # Build the agent filter for the query
+        if not to_be_deleted:
+            return []
 
-            params = {
-                "source_name": source,
-                "dest_name": destination,
-                "user_id": user_id,
-            }
+        params = {
+            "rows": [
+                {"row": index, **item}
+                for index, item in enumerate(to_be_deleted)
+                if item not in to_be_deleted[:index]
+            ],
+            "user_id": user_id,
+        }
+        if agent_id:
+            params["agent_id"] = agent_id
+        if run_id:
+            params["run_id"] = run_id
 
-            if agent_id:
-                params["agent_id"] = agent_id
-            if run_id:
-                params["run_id"] = run_id
-
-            # Build node properties for filtering
-            source_props = ["name: $source_name", "user_id: $user_id"]
-            dest_props = ["name: $dest_name", "user_id: $user_id"]
-            if agent_id:
-                source_props.append("agent_id: $agent_id")
-                dest_props.append("agent_id: $agent_id")
-            if run_id:
-                source_props.append("run_id: $run_id")
-                dest_props.append("run_id: $run_id")
-            source_props_str = ", ".join(source_props)
-            dest_props_str = ", ".join(dest_props)
-
-            # Delete the specific relationship between nodes
-            cypher = f"""
-            MATCH (n {self.node_label} {{{source_props_str}}})
-            -[r:{relationship}]->
-            (m {self.node_label} {{{dest_props_str}}})
-            
-            DELETE r
-            RETURN 
-                n.name AS source,
-                m.name AS target,
-                type(r) AS relationship
-            """
+        # Build node properties for filtering
+        node_props = ["user_id: $user_id"]
+        if agent_id:
+            node_props.append("agent_id: $agent_id")
+        if run_id:
+            node_props.append("run_id: $run_id")
+        node_props_str = ", ".join(node_props)
 
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
+        # Relationship types can't be parameters, so the specific relationship is matched on its type
+        cypher = f"""
+        UNWIND $rows AS row
+        MATCH (n {self.node_label} {{name: row.source, {node_props_str}}})
+        -[r]->
+        (m {self.node_label} {{name: row.destination, {node_props_str}}})
+        WHERE type(r) = row.relationship
+        DELETE r
+        RETURN
+            row.row AS row,
+            n.name AS source,
+            m.name AS target,
+            type(r) AS relationship
+        """
 
-        return results
+        records = self.graph.query(cypher, params=params)
+        return split_rows(records, len(to_be_deleted))
 
     def _add_entities(self, to_be_added, filters, entity_type_map):
-        """Add the new entities to the graph. Merge the nodes if they already exist."""
+        """
+        Add the new entities to the graph. Merge the nodes if they already exist.
+
+        All entity names are embedded in one batch and looked up in one query, then the relations are
+        upserted with one UNWIND query per relationship type and node labels, in a single transaction.
+        """
         user_id = filters["user_id"]
         agent_id = filters.get("agent_id", None)
         run_id = filters.get("run_id", None)
-        results = []
-        for item in to_be_added:
-            # entities
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
-
-            # types
-            source_type = entity_type_map.get(source, "__User__")
-            source_label = self.node_label if self.node_label else f":`{source_type}`"
-            source_extra_set = f", source:`{source_type}`" if self.node_label else ""
-            destination_type = entity_type_map.get(destination, "__User__")
-            destination_label = self.node_label if self.node_label else f":`{destination_type}`"
-            destination_extra_set = f", destination:`{destination_type}`" if self.node_label else ""
-
-            # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
-
-            # search for the nodes with the closest embeddings
-            source_node_search_result = self._search_source_node(source_embedding, filters, threshold=self.threshold)
-            destination_node_search_result = self._search_destination_node(dest_embedding, filters, threshold=self.threshold)
-
-            # TODO: Create a cypher query and common params for all the cases
-            if not destination_node_search_result and source_node_search_result:
-                # Build destination MERGE properties
-                merge_props = ["name: $destination_name", "user_id: $user_id"]
-                if agent_id:
-                    merge_props.append("agent_id: $agent_id")
-                if run_id:
-                    merge_props.append("run_id: $run_id")
-                merge_props_str = ", ".join(merge_props)
-
-                cypher = f"""
-                MATCH (source)
-                WHERE elementId(source) = $source_id
-                SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                MERGE (destination {destination_label} {{{merge_props_str}}})
-                ON CREATE SET
-                    destination.created = timestamp(),
-                    destination.mentions = 1
-                    {destination_extra_set}
-                ON MATCH SET
-                    destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH source, destination
-                CALL db.create.setNodeVectorProperty(destination, 'embedding', $destination_embedding)
-                WITH source, destination
+        if not to_be_added:
+            return []
+
+        names = list(dict.fromkeys(name for item in to_be_added for name in (item["source"], item["destination"])))
+        embeddings = dict(zip(names, self.embedding_model.embed_batch(names)))
+        node_ids = self._search_nodes(embeddings, filters, threshold=self.threshold)
+        rows = plan_entity_rows(to_be_added, embeddings, node_ids, self.threshold)
+
+        params = {"user_id": user_id}
+        # Build MERGE properties shared by new source and destination nodes
+        merge_props = ["user_id: $user_id"]
+        if agent_id:
+            merge_props.append("agent_id: $agent_id")
+            params["agent_id"] = agent_id
+        if run_id:
+            merge_props.append("run_id: $run_id")
+            params["run_id"] = run_id
+        merge_props_str = ", ".join(merge_props)
+
+        # Labels and relationship types can't be parameters, rows sharing them are upserted together
+        groups = {}
+        for row in rows:
+            key = (
+                row["relationship"],
+                entity_type_map.get(row["source"], "__User__"),
+                entity_type_map.get(row["destination"], "__User__"),
+                row["source_id"] is None,
+                row["destination_id"] is None,
+            )
+            groups.setdefault(key, []).append(row)
+
+        statements = []
+        for (relationship, source_type, destination_type, new_source, new_destination), group in groups.items():
+            source_clause = self._upsert_node_clause("source", source_type, new_source, merge_props_str)
+            destination_clause = self._upsert_node_clause(
+                "destination", destination_type, new_destination, merge_props_str
+            )
+            if new_source or new_destination:
+                created_set = "r.created = timestamp(),"
+            else:
+                created_set = "r.created_at = timestamp(), r.updated_at = timestamp(),"
+            cypher = f"""
+                UNWIND $rows AS row
+                {source_clause}
+                WITH row, source
+                {destination_clause}
+                WITH row, source, destination
                 MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET 
-                    r.created = timestamp(),
+                ON CREATE SET
+                    {created_set}
                     r.mentions = 1
                 ON MATCH SET
                     r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
+                RETURN row.row AS row, source.name AS source, type(r) AS relationship, destination.name AS target
                 """
+            statements.append((cypher, {**params, "rows": group}))
 
-                params = {
-                    "source_id": source_node_search_result[0]["elementId(source_candidate)"],
-                    "destination_name": destination,
-                    "destination_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-                if run_id:
-                    params["run_id"] = run_id
-
-            elif destination_node_search_result and not source_node_search_result:
-                # Build source MERGE properties
-                merge_props = ["name: $source_name", "user_id: $user_id"]
-                if agent_id:
-                    merge_props.append("agent_id: $agent_id")
-                if run_id:
-                    merge_props.append("run_id: $run_id")
-                merge_props_str = ", ".join(merge_props)
-
-                cypher = f"""
-                MATCH (destination)
-                WHERE elementId(destination) = $destination_id
-                SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH destination
-                MERGE (source {source_label} {{{merge_props_str}}})
+        return split_rows(self._execute_write(statements), len(to_be_added))
+
+    def _upsert_node_clause(self, variable, node_type, new, merge_props_str):
+        """Cypher clause binding `variable` to the source or destination node of a row, merged by name if new."""
+        if not new:
+            return f"""
+                MATCH ({variable})
+                WHERE elementId({variable}) = row.{variable}_id
+                SET {variable}.mentions = coalesce({variable}.mentions, 0) + 1
+            """
+
+        label = self.node_label if self.node_label else f":`{node_type}`"
+        extra_set = f", {variable}:`{node_type}`" if self.node_label else ""
+        carried = "row, source" if variable == "destination" else "row"
+        return f"""
+                MERGE ({variable} {label} {{name: row.{variable}, {merge_props_str}}})
                 ON CREATE SET
-                    source.created = timestamp(),
-                    source.mentions = 1
-                    {source_extra_set}
-                ON MATCH SET
-                    source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source, destination
-                CALL db.create.setNodeVectorProperty(source, 'embedding', $source_embedding)
-                WITH source, destination
-                MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET 
-                    r.created = timestamp(),
-                    r.mentions = 1
+                    {variable}.created = timestamp(),
+                    {variable}.mentions = 1
+                    {extra_set}
                 ON MATCH SET
-                    r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                """
-
-                params = {
-                    "destination_id": destination_node_search_result[0]["elementId(destination_candidate)"],
-                    "source_name": source,
-                    "source_embedding": source_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-                if run_id:
-                    params["run_id"] = run_id
-
-            elif source_node_search_result and destination_node_search_result:
-                cypher = f"""
-                MATCH (source)
-                WHERE elementId(source) = $source_id
-                SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                MATCH (destination)
-                WHERE elementId(destination) = $destination_id
-                SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET 
-                    r.created_at = timestamp(),
-                    r.updated_at = timestamp(),
-                    r.mentions = 1
-                ON MATCH SET r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                """
+                    {variable}.mentions = coalesce({variable}.mentions, 0) + 1
+                WITH {carried}, {variable}
+                CALL db.create.setNodeVectorProperty({variable}, 'embedding', row.{variable}_embedding)
+            """
 
-                params = {
-                    "source_id": source_node_search_result[0]["elementId(source_candidate)"],
-                    "destination_id": destination_node_search_result[0]["elementId(destination_candidate)"],
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-                if run_id:
-                    params["run_id"] = run_id
+    def _execute_write(self, statements):
+        """Run (cypher, params) statements in one write transaction and return all their records."""
 
-            else:
-                # Build dynamic MERGE props for both source and destination
-                source_props = ["name: $source_name", "user_id: $user_id"]
-                dest_props = ["name: $dest_name", "user_id: $user_id"]
-                if agent_id:
-                    source_props.append("agent_id: $agent_id")
-                    dest_props.append("agent_id: $agent_id")
-                if run_id:
-                    source_props.append("run_id: $run_id")
-                    dest_props.append("run_id: $run_id")
-                source_props_str = ", ".join(source_props)
-                dest_props_str = ", ".join(dest_props)
-
-                cypher = f"""
-                MERGE (source {source_label} {{{source_props_str}}})
-                ON CREATE SET source.created = timestamp(),
-                            source.mentions = 1
-                            {source_extra_set}
-                ON MATCH SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                CALL db.create.setNodeVectorProperty(source, 'embedding', $source_embedding)
-                WITH source
-                MERGE (destination {destination_label} {{{dest_props_str}}})
-                ON CREATE SET destination.created = timestamp(),
-                            destination.mentions = 1
-                            {destination_extra_set}
-                ON MATCH SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH source, destination
-                CALL db.create.setNodeVectorProperty(destination, 'embedding', $dest_embedding)
-                WITH source, destination
-                MERGE (source)-[rel:{relationship}]->(destination)
-                ON CREATE SET rel.created = timestamp(), rel.mentions = 1
-                ON MATCH SET rel.mentions = coalesce(rel.mentions, 0) + 1
-                RETURN source.name AS source, type(rel) AS relationship, destination.name AS target
-                """
+        def work(tx):
+            return [record.data() for cypher, params in statements for record in tx.run(cypher, params)]
 
-                params = {
-                    "source_name": source,
-                    "dest_name": destination,
-                    "source_embedding": source_embedding,
-                    "dest_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-                if run_id:
-                    params["run_id"] = run_id
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
-        return results
+        with self.driver.session(database=self.config.graph_store.config.database) as session:
+            return session.execute_write(work)
 
     def _remove_spaces_from_entities(self, entity_list):
         for item in entity_list:
@@ -614,7 +575,160 @@ class MemoryGraph:
             item["destination"] = item["destination"].lower().replace(" ", "_")
         return entity_list
 
+    def _create_vector_index(self):
+        """Create the native vector index over entity embeddings."""
+        embedding_dims = getattr(self.embedding_model.config, "embedding_dims", None)
+        if not embedding_dims:
+            logger.info("Embedding dimensions are unknown, entity lookups will scan the user's nodes")
+            return
+        try:
+            self.graph.query(
+                f"""
+                CREATE VECTOR INDEX entity_embedding IF NOT EXISTS
+                FOR (n {self.node_label}) ON (n.embedding)
+                OPTIONS {{indexConfig: {{
+                    `vector.dimensions`: {int(embedding_dims)},
+                    `vector.similarity_function`: 'cosine'
+                }}}}
+                """
+            )
+            self.vector_index = "entity_embedding"
+        except Exception as e:
+            logger.warning(f"Could not create the Neo4j vector index, entity lookups will scan the user's nodes: {e}")
+
+    def _query_vector_index(self, embedding, filters, threshold, limit=None):
+        """
+        Find the entity nodes most similar to an embedding with the vector index.
+
+        The index searches all users, so the nearest candidates are post-filtered by scope.
+
+        Returns:
+            list or None: Dicts with the node "id" and "similarity", or None if the scope has to be scanned.
+        """
+        if not self.vector_index:
+            return None
+
+        scope_conditions = ["node.user_id = $user_id"]
+        params = {
+            "index_name": self.vector_index,
+            "k": VECTOR_INDEX_CANDIDATES,
+            "embedding": embedding,
+            "user_id": filters["user_id"],
+        }
+        if filters.get("agent_id"):
+            scope_conditions.append("node.agent_id = $agent_id")
+            params["agent_id"] = filters["agent_id"]
+        if filters.get("run_id"):
+            scope_conditions.append("node.run_id = $run_id")
+            params["run_id"] = filters["run_id"]
+
+        cypher = f"""
+            CALL db.index.vector.queryNodes($index_name, $k, $embedding)
+            YIELD node, score
+            RETURN elementId(node) AS id,
+                round(2 * score - 1, 4) AS similarity, // denormalize for backward compatibility
+                coalesce({" AND ".join(scope_conditions)}, false) AS in_scope
+            ORDER BY similarity DESC
+            """
+        try:
+            candidates = self.graph.query(cypher, params=params)
+        except Exception as e:
+            logger.warning(f"Vector index query failed, scanning the user's nodes instead: {e}")
+            return None
+        return select_scoped_nodes(candidates, threshold, VECTOR_INDEX_CANDIDATES, limit)
+
+    def _search_nodes(self, embeddings, filters, threshold):
+        """
+        Find the existing node most similar to each entity, looking all entities up in one query.
+
+        Entities the vector index can't answer for are looked up together by scanning the scope.
+
+        Args:
+            embeddings (dict): Embedding of every entity name.
+            filters (dict): The user_id, agent_id and run_id of the nodes.
+            threshold (float): Minimum similarity of a match.
+
+        Returns:
+            dict: elementId of the matched node, for the names that matched one.
+        """
+        scope_conditions = ["candidate.user_id = $user_id"]
+        params = {"user_id": filters["user_id"]}
+        if filters.get("agent_id"):
+            scope_conditions.append("candidate.agent_id = $agent_id")
+            params["agent_id"] = filters["agent_id"]
+        if filters.get("run_id"):
+            scope_conditions.append("candidate.run_id = $run_id")
+            params["run_id"] = filters["run_id"]
+        scope = " AND ".join(scope_conditions)
+
+        node_ids = {}
+        to_scan = list(embeddings)
+        if self.vector_index:
+            cypher = f"""
+                UNWIND $entities AS entity
+                CALL db.index.vector.queryNodes($index_name, $k, entity.embedding)
+                YIELD node AS candidate, score
+                RETURN entity.name AS name,
+                    elementId(candidate) AS id,
+                    round(2 * score - 1, 4) AS similarity, // denormalize for backward compatibility
+                    coalesce({scope}, false) AS in_scope
+                ORDER BY similarity DESC
+                """
+            index_params = {
+                **params,
+                "index_name": self.vector_index,
+                "k": VECTOR_INDEX_CANDIDATES,
+                "entities": [{"name": name, "embedding": embedding} for name, embedding in embeddings.items()],
+            }
+            try:
+                candidates = self.graph.query(cypher, params=index_params)
+            except Exception as e:
+                logger.warning(f"Vector index query failed, scanning the user's nodes instead: {e}")
+                candidates = []
+
+            to_scan = []
+            for name in embeddings:
+                hits = select_scoped_nodes(
+                    [candidate for candidate in candidates if candidate["name"] == name],
+                    threshold,
+                    VECTOR_INDEX_CANDIDATES,
+                    limit=1,
+                )
+                if hits is None:
+                    to_scan.append(name)
+                elif hits:
+                    node_ids[name] = hits[0]["id"]
+
+        if to_scan:
+            cypher = f"""
+                UNWIND $entities AS entity
+                CALL {{
+                    WITH entity
+                    MATCH (candidate {self.node_label})
+                    WHERE candidate.embedding IS NOT NULL AND {scope}
+                    WITH candidate,
+                    round(2 * vector.similarity.cosine(candidate.embedding, entity.embedding) - 1, 4) AS similarity
+                    WHERE similarity >= $threshold
+                    RETURN candidate
+                    ORDER BY similarity DESC
+                    LIMIT 1
+                }}
+                RETURN entity.name AS name, elementId(candidate) AS id
+                """
+            scan_params = {
+                **params,
+                "threshold": threshold,
+                "entities": [{"name": name, "embedding": embeddings[name]} for name in to_scan],
+            }
+            for record in self.graph.query(cypher, params=scan_params):
+                node_ids[record["name"]] = record["id"]
+        return node_ids
+
     def _search_source_node(self, source_embedding, filters, threshold=0.9):
+        hits = self._query_vector_index(source_embedding, filters, threshold, limit=1)
+        if hits is not None:
+            return [{"elementId(source_candidate)": hit["id"]} for hit in hits]
+
         # Build WHERE conditions
         where_conditions = ["source_candidate.embedding IS NOT NULL", "source_candidate.user_id = $user_id"]
         if filters.get("agent_id"):
@@ -652,6 +766,10 @@ class MemoryGraph:
         return result
 
     def _search_destination_node(self, destination_embedding, filters, threshold=0.9):
+        hits = self._query_vector_index(destination_embedding, filters, threshold, limit=1)
+        if hits is not None:
+            return [{"elementId(destination_candidate)": hit["id"]} for hit in hits]
+
         # Build WHERE conditions
         where_conditions = ["destination_candidate.embedding IS NOT NULL", "destination_candidate.user_id = $user_id"]
         if filters.get("agent_id"):
@@ -0,0 +1,342 @@
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Jobs in these states still have to run, and hold back the later jobs of their scope
+_OPEN_STATUSES = ("pending", "running")
+
+# Bounds of the backoff of a worker whose queue database is unavailable (e.g. locked by another process)
+_DB_RETRY_DELAY = 0.1
+_DB_RETRY_MAX_DELAY = 5.0
+
+
+def default_queue_path(history_db_path: Optional[str], collection_name: Optional[str]) -> str:
+    """
+    Path of the queue database of a memory, next to its history database and named after its collection.
+
+    Memories with different history databases or collections never share a queue; a memory with an
+    in-memory history gets an in-memory queue.
+    """
+    if not history_db_path or history_db_path == ":memory:":
+        return ":memory:"
+    root, _ = os.path.splitext(history_db_path)
+    return f"{root}_{collection_name or 'mem0'}_ingestion_queue.db"
+
+
+class IngestionQueue:
+    """
+    Durable queue of add jobs, drained by a pool of worker threads.
+
+    Jobs are stored in SQLite, so jobs queued before a crash or restart are picked up again by the next
+    queue opened on the same file. Jobs of the same scope run one at a time in the order they were
+    queued; a failed job is retried with exponential backoff, holding back the later jobs of its scope,
+    and is moved to the "dead" status once its retries are exhausted.
+
+    Several processes can share the file. A running job is leased to the queue that claimed it, which
+    renews the lease while the job runs; a job whose lease expired was interrupted, and is claimed again
+    by any queue on the file.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Dict[str, Any]], Any],
+        db_path: str = ":memory:",
+        workers: int = 2,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        lease_duration: float = 60.0,
+    ):
+        self.handler = handler
+        self.workers = workers
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.lease_duration = lease_duration
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        # Queues of other processes hold the write lock while they claim or finish a job
+        self.connection = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._stopped = False
+        self._stop_renewing = threading.Event()
+        self._create_jobs_table()
+
+        self._threads = [
+            threading.Thread(target=self._work, name=f"mem0-ingestion-{i}", daemon=True) for i in range(workers)
+        ]
+        self._threads.append(threading.Thread(target=self._renew_leases, name="mem0-ingestion-lease", daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def _create_jobs_table(self) -> None:
+        with self._lock:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    seq           INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id            TEXT UNIQUE,
+                    scope         TEXT,
+                    payload       TEXT,
+                    status        TEXT,
+                    attempts      INTEGER,
+                    available_at  REAL,
+                    created_at    REAL,
+                    updated_at    REAL,
+                    error         TEXT,
+                    result        TEXT,
+                    claimed_by    TEXT,
+                    lease_expires_at REAL
+                )
+            """
+            )
+            # Queues created before jobs were leased
+            columns = {row[1] for row in self.connection.execute("PRAGMA table_info(jobs)")}
+            for column, column_type in (("claimed_by", "TEXT"), ("lease_expires_at", "REAL")):
+                if column not in columns:
+                    self.connection.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, seq)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS idx_jobs_scope ON jobs (scope, status, seq)")
+            self.connection.commit()
+
+    def enqueue(self, payload: Dict[str, Any], scope: str) -> str:
+        """
+        Queue a job.
+
+        Args:
+            payload (dict): JSON serializable arguments passed to the handler.
+            scope (str): Jobs with the same scope run one at a time, in the order they were queued.
+
+        Returns:
+            str: The ID of the job.
+        """
+        job_id = str(uuid.uuid4())
+        now = time.time()
+        serialized = json.dumps(payload)
+        with self._changed:
+            self.connection.execute(
+                """
+                INSERT INTO jobs (id, scope, payload, status, attempts, available_at, created_at, updated_at)
+                VALUES (?, ?, ?, 'pending', 0, ?, ?, ?)
+            """,
+                (job_id, scope, serialized, now, now, now),
+            )
+            self.connection.commit()
+            self._changed.notify_all()
+        return job_id
+
+    def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the status of a job: "pending", "running", "done", or "dead" once its retries are exhausted.
+
+        Returns:
+            dict or None: The status, attempts, last error and result of the job, None if it doesn't exist.
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT id, status, attempts, error, result, created_at, updated_at FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "job_id": row[0],
+            "status": row[1],
+            "attempts": row[2],
+            "error": row[3],
+            "result": json.loads(row[4]) if row[4] is not None else None,
+            "created_at": row[5],
+            "updated_at": row[6],
+        }
+
+    def _open_jobs(self) -> int:
+        placeholders = ", ".join("?" for _ in _OPEN_STATUSES)
+        return self.connection.execute(
+            f"SELECT COUNT(*) FROM jobs WHERE status IN ({placeholders})", _OPEN_STATUSES
+        ).fetchone()[0]
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued job has run, or failed all its retries.
+
+        Args:
+            timeout (float, optional): Maximum number of seconds to wait. Defaults to waiting until drained.
+
+        Returns:
+            bool: True if the queue was drained, False on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while self._open_jobs():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                # Wake up regularly in case a job waits for its retry backoff
+                self._changed.wait(0.5 if remaining is None else min(0.5, remaining))
+            return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Drain the queue, then stop the workers and close the database.
+
+        Returns:
+            bool: True if the queue was drained, False if jobs were left for the next queue opened on the file.
+        """
+        drained = self.flush(timeout)
+        with self._changed:
+            self._stopped = True
+            self._changed.notify_all()
+        self._stop_renewing.set()
+        # Workers finish the job they are running before they stop
+        for thread in self._threads:
+            thread.join()
+        with self._lock:
+            self.connection.close()
+        return drained
+
+    def _claim(self):
+        """
+        Lease the oldest runnable job to this queue and mark it as running. Must be called with the lock held.
+
+        A pending job is runnable once its retry backoff elapsed, a running job once its lease expired. The
+        job is selected and leased inside one write transaction, so queues of other processes never claim
+        it too.
+        """
+        now = time.time()
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.connection.execute(
+                """
+                SELECT seq, id, payload, attempts FROM jobs AS job
+                WHERE ((status = 'pending' AND available_at <= :now)
+                       OR (status = 'running' AND coalesce(lease_expires_at, 0) < :now))
+                  AND NOT EXISTS (
+                      SELECT 1 FROM jobs AS earlier
+                      WHERE earlier.scope = job.scope AND earlier.seq < job.seq
+                        AND earlier.status IN ('pending', 'running')
+                  )
+                ORDER BY seq
+                LIMIT 1
+            """,
+                {"now": now},
+            ).fetchone()
+            if row is not None:
+                self.connection.execute(
+                    """
+                    UPDATE jobs
+                    SET status = 'running', attempts = attempts + 1, claimed_by = ?, lease_expires_at = ?,
+                        updated_at = ?
+                    WHERE seq = ?
+                """,
+                    (self.owner, now + self.lease_duration, now, row[0]),
+                )
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            raise
+        if row is None:
+            return None
+        return row[1], json.loads(row[2]), row[3] + 1
+
+    def _renew_leases(self) -> None:
+        """Extend the leases of the jobs this queue is running, until it is stopped."""
+        while not self._stop_renewing.wait(self.lease_duration / 3):
+            with self._lock:
+                try:
+                    self.connection.execute(
+                        "UPDATE jobs SET lease_expires_at = ? WHERE status = 'running' AND claimed_by = ?",
+                        (time.time() + self.lease_duration, self.owner),
+                    )
+                    self.connection.commit()
+                except sqlite3.Error as e:
+                    self.connection.rollback()
+                    logger.warning(f"Failed to renew the ingestion job leases: {e}")
+
+    def _work(self) -> None:
+        delay = _DB_RETRY_DELAY
+        while True:
+            with self._changed:
+                job = None
+                while not self._stopped:
+                    try:
+                        job = self._claim()
+                    except sqlite3.Error as e:
+                        logger.warning(f"Failed to claim an ingestion job, retrying in {delay}s: {e}")
+                        self._changed.wait(delay)
+                        delay = min(delay * 2, _DB_RETRY_MAX_DELAY)
+                        continue
+                    delay = _DB_RETRY_DELAY
+                    if job is not None:
+                        break
+                    self._changed.wait(0.5)
+                if self._stopped:
+                    return
+
+            job_id, payload, attempts = job
+            try:
+                result = self.handler(payload)
+            except Exception as e:
+                self._record(self._fail, job_id, attempts, e)
+            else:
+                self._record(self._finish, job_id, result)
+
+    def _record(self, update: Callable[..., None], *args) -> None:
+        """
+        Record the outcome of a job, retrying with a backoff while the queue database is unavailable.
+
+        The job stays leased to this queue until its outcome is recorded, so giving up would leave it running.
+        """
+        delay = _DB_RETRY_DELAY
+        while True:
+            try:
+                update(*args)
+                return
+            except sqlite3.Error as e:
+                with self._lock:
+                    self.connection.rollback()
+                logger.warning(f"Failed to record the outcome of ingestion job {args[0]}, retrying in {delay}s: {e}")
+                time.sleep(delay)
+                delay = min(delay * 2, _DB_RETRY_MAX_DELAY)
+
+    def _finish(self, job_id: str, result: Any) -> None:
+        with self._changed:
+            cur = self.connection.execute(
+                """
+                UPDATE jobs SET status = 'done', result = ?, error = NULL, updated_at = ?
+                WHERE id = ? AND claimed_by = ?
+            """,
+                (json.dumps(result, default=str), time.time(), job_id, self.owner),
+            )
+            self.connection.commit()
+            if not cur.rowcount:
+                logger.warning(f"Ingestion job {job_id} finished after its lease was taken over")
+            self._changed.notify_all()
+
+    def _fail(self, job_id: str, attempts: int, error: Exception) -> None:
+        now = time.time()
+        with self._changed:
+            if attempts > self.max_retries:
+                logger.error(f"Ingestion job {job_id} failed {attempts} times, giving up: {error}")
+                self.connection.execute(
+                    "UPDATE jobs SET status = 'dead', error = ?, updated_at = ? WHERE id = ? AND claimed_by = ?",
+                    (str(error), now, job_id, self.owner),
+                )
+            else:
+                delay = self.retry_backoff * 2 ** (attempts - 1)
+                logger.warning(f"Ingestion job {job_id} failed, retrying in {delay}s: {error}")
+                self.connection.execute(
+                    """
+                    UPDATE jobs SET status = 'pending', error = ?, available_at = ?, updated_at = ?
+                    WHERE id = ? AND claimed_by = ?
+                """,
+                    (str(error), now + delay, now, job_id, self.owner),
+                )
+            self.connection.commit()
+            self._changed.notify_all()
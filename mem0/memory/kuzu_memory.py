@@ -1,6 +1,12 @@
 import logging
 
-from mem0.memory.utils import format_entities
+from mem0.memory.utils import (
+    VECTOR_INDEX_CANDIDATES,
+    format_entities,
+    plan_entity_rows,
+    select_scoped_nodes,
+    split_rows,
+)
 
 try:
     import kuzu
@@ -47,6 +53,10 @@ class MemoryGraph:
         self.rel_label = ":CONNECTED_TO"
         self.kuzu_create_schema()
 
+        self.vector_index = None
+        if self.config.graph_store.config.vector_index:
+            self._create_vector_index()
+
         # Default to openai if no specific provider is configured
         self.llm_provider = "openai"
         if self.config.llm and self.config.llm.provider:
@@ -55,11 +65,14 @@ class MemoryGraph:
             self.llm_provider = self.config.graph_store.llm.provider
         # Get LLM config with proper null checks
         llm_config = None
+        llm_cache = None
         if self.config.graph_store and self.config.graph_store.llm and hasattr(self.config.graph_store.llm, "config"):
             llm_config = self.config.graph_store.llm.config
+            llm_cache = getattr(self.config.graph_store.llm, "cache", None)
         elif hasattr(self.config.llm, "config"):
             llm_config = self.config.llm.config
-        self.llm = LlmFactory.create(self.llm_provider, llm_config)
+            llm_cache = getattr(self.config.llm, "cache", None)
+        self.llm = LlmFactory.create(self.llm_provider, llm_config, cache=llm_cache)
 
         self.user_id = None
         # Use threshold from graph_store config, default to 0.7 for backward compatibility
@@ -67,7 +80,7 @@ class MemoryGraph:
 
     def kuzu_create_schema(self):
         self.kuzu_execute(
-            """
+            f"""
             CREATE NODE TABLE IF NOT EXISTS Entity(
                 id SERIAL PRIMARY KEY,
                 user_id STRING,
@@ -76,7 +89,7 @@ class MemoryGraph:
                 name STRING,
                 mentions INT64,
                 created TIMESTAMP,
-                embedding FLOAT[]);
+                embedding FLOAT[{self.embedding_dims}]);
             """
         )
         self.kuzu_execute(
@@ -95,6 +108,107 @@ class MemoryGraph:
         results = self.graph.execute(query, parameters)
         return list(results.rows_as_dict())
 
+    def _create_vector_index(self):
+        """Create the HNSW index over entity embeddings, without it entity lookups scan the scope."""
+        try:
+            self.kuzu_execute("INSTALL vector")
+            self.kuzu_execute("LOAD vector")
+        except RuntimeError as e:
+            logger.warning(f"Could not load the Kuzu vector extension, entity lookups will scan the scope: {e}")
+            return
+
+        # Databases created before the index was supported store embeddings as variable-length lists
+        columns = {row["name"]: row["type"] for row in self.kuzu_execute("CALL TABLE_INFO('Entity') RETURN *")}
+        if columns.get("embedding") != f"FLOAT[{self.embedding_dims}]":
+            logger.info("Entity embeddings are not fixed-size arrays, entity lookups will scan the scope")
+            return
+
+        indexes = self.kuzu_execute("CALL SHOW_INDEXES() RETURN *")
+        if not any(index["index_name"] == "entity_embedding" for index in indexes):
+            self.kuzu_execute("CALL CREATE_VECTOR_INDEX('Entity', 'entity_embedding', 'embedding', metric := 'cosine')")
+        self.vector_index = "entity_embedding"
+
+    def _query_vector_index(self, embedding, filters, threshold, limit=None):
+        """
+        Find the entity nodes most similar to an embedding with the vector index.
+
+        The index searches all users, so the nearest candidates are post-filtered by scope.
+
+        Returns:
+            list or None: Dicts with the node's internal "id", primary "key" and "similarity", or None if
+                the scope has to be scanned.
+        """
+        if not self.vector_index:
+            return None
+
+        scope_conditions = ["node.user_id = $user_id"]
+        params = {"k": VECTOR_INDEX_CANDIDATES, "embedding": embedding, "user_id": filters["user_id"]}
+        if filters.get("agent_id"):
+            scope_conditions.append("node.agent_id = $agent_id")
+            params["agent_id"] = filters["agent_id"]
+        if filters.get("run_id"):
+            scope_conditions.append("node.run_id = $run_id")
+            params["run_id"] = filters["run_id"]
+
+        # An index emptied by deletes stops returning nodes added later, the empty result falls back to a scan
+        candidates = self.kuzu_execute(
+            f"""
+            CALL QUERY_VECTOR_INDEX('Entity', '{self.vector_index}', $embedding, $k)
+            RETURN
+                id(node) AS id,
+                node.id AS key,
+                1 - distance AS similarity,
+                coalesce({" AND ".join(scope_conditions)}, false) AS in_scope
+            ORDER BY similarity DESC
+            """,
+            parameters=params,
+        )
+        return select_scoped_nodes(candidates, threshold, VECTOR_INDEX_CANDIDATES, limit)
+
+    def _create_entity_nodes(self, nodes, filters):
+        """
+        Create the entity nodes of the scope that don't exist yet, together with their embedding.
+
+        Kuzu can't update a property covered by a vector index, so embeddings are written when a node
+        is created instead of in the ON CREATE SET of the MERGE that follows.
+
+        Args:
+            nodes (list): Dicts with the "name" and "embedding" of each node.
+            filters (dict): The user_id, agent_id and run_id of the nodes.
+        """
+        params = {
+            "nodes": list({node["name"]: node for node in nodes}.values()),
+            "user_id": filters["user_id"],
+        }
+        match_conditions = ["n.name = node.name", "n.user_id = $user_id"]
+        create_props = ["name: node.name", "user_id: $user_id"]
+        if filters.get("agent_id"):
+            match_conditions.append("n.agent_id = $agent_id")
+            create_props.append("agent_id: $agent_id")
+            params["agent_id"] = filters["agent_id"]
+        if filters.get("run_id"):
+            match_conditions.append("n.run_id = $run_id")
+            create_props.append("run_id: $run_id")
+            params["run_id"] = filters["run_id"]
+        create_props_str = ", ".join(create_props)
+
+        self.kuzu_execute(
+            f"""
+            UNWIND $nodes AS node
+            OPTIONAL MATCH (n {self.node_label})
+            WHERE {" AND ".join(match_conditions)}
+            WITH node, n
+            WHERE n IS NULL
+            CREATE (:Entity {{
+                {create_props_str},
+                mentions: 0,
+                created: current_timestamp(),
+                embedding: CAST(node.embedding, 'FLOAT[{self.embedding_dims}]')
+            }})
+            """,
+            parameters=params,
+        )
+
     def add(self, data, filters):
         """
         Adds data to the graph.
@@ -298,8 +412,8 @@ class MemoryGraph:
         """Search similar nodes among and their respective incoming and outgoing relations."""
         result_relations = []
 
+        threshold = threshold if threshold else self.threshold
         params = {
-            "threshold": threshold if threshold else self.threshold,
             "user_id": filters["user_id"],
             "limit": limit,
         }
@@ -315,7 +429,28 @@ class MemoryGraph:
 
         for node in node_list:
             n_embedding = self.embedding_model.embed(node)
-            params["n_embedding"] = n_embedding
+            node_params = dict(params)
+
+            hits = self._query_vector_index(n_embedding, filters, threshold)
+            if hits is not None:
+                if not hits:
+                    continue
+                node_params["hits"] = [{"key": hit["key"], "similarity": hit["similarity"]} for hit in hits]
+                node_selection = """
+                    UNWIND $hits AS hit
+                    MATCH (n:Entity)
+                    WHERE n.id = hit.key
+                    WITH n, hit.similarity AS similarity
+                """
+            else:
+                node_params["n_embedding"] = n_embedding
+                node_params["threshold"] = threshold
+                node_selection = f"""
+                    MATCH (n {self.node_label} {{{node_props_str}}})
+                    WHERE n.embedding IS NOT NULL
+                    WITH n, array_cosine_similarity(n.embedding, CAST($n_embedding,'FLOAT[{self.embedding_dims}]')) AS similarity
+                    WHERE similarity >= CAST($threshold, 'DOUBLE')
+                """
 
             results = []
             for match_fragment in [
@@ -324,10 +459,7 @@ class MemoryGraph:
             ]:
                 results.extend(self.kuzu_execute(
                     f"""
-                    MATCH (n {self.node_label} {{{node_props_str}}})
-                    WHERE n.embedding IS NOT NULL
-                    WITH n, array_cosine_similarity(n.embedding, CAST($n_embedding,'FLOAT[{self.embedding_dims}]')) AS similarity
-                    WHERE similarity >= CAST($threshold, 'DOUBLE')
+                    {node_selection}
                     MATCH {match_fragment}
                     RETURN
                         src.name AS source,
@@ -339,7 +471,7 @@ class MemoryGraph:
                         similarity
                     LIMIT $limit
                     """,
-                    parameters=params))
+                    parameters=node_params))
 
             # Kuzu does not support sort/limit over unions. Do it manually for now.
             result_relations.extend(sorted(results, key=lambda x: x["similarity"], reverse=True)[:limit])
@@ -383,328 +515,235 @@ class MemoryGraph:
         return to_be_deleted
 
     def _delete_entities(self, to_be_deleted, filters):
-        """Delete the entities from the graph."""
+        """Delete the entities from the graph, all relations in one query."""
         user_id = filters["user_id"]
         agent_id = filters.get("agent_id", None)
         run_id = filters.get("run_id", None)
-        results = []
-
-        for item in to_be_deleted:
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
-
-            params = {
-                "source_name": source,
-                "dest_name": destination,
-                "user_id": user_id,
-                "relationship_name": relationship,
-            }
-            # Build node properties for filtering
-            source_props = ["name: $source_name", "user_id: $user_id"]
-            dest_props = ["name: $dest_name", "user_id: $user_id"]
-            if agent_id:
-                source_props.append("agent_id: $agent_id")
-                dest_props.append("agent_id: $agent_id")
-                params["agent_id"] = agent_id
-            if run_id:
-                source_props.append("run_id: $run_id")
-                dest_props.append("run_id: $run_id")
-                params["run_id"] = run_id
-            source_props_str = ", ".join(source_props)
-            dest_props_str = ", ".join(dest_props)
-
-            # Delete the specific relationship between nodes
-            cypher = f"""
-            MATCH (n {self.node_label} {{{source_props_str}}})
-            -[r {self.rel_label} {{name: $relationship_name}}]->
-            (m {self.node_label} {{{dest_props_str}}})
-            DELETE r
-            RETURN
-                n.name AS source,
-                r.name AS relationship,
-                m.name AS target
-            """
+        if not to_be_deleted:
+            return []
 
-            result = self.kuzu_execute(cypher, parameters=params)
-            results.append(result)
+        params = {
+            "rows": [
+                {"row": index, **item}
+                for index, item in enumerate(to_be_deleted)
+                if item not in to_be_deleted[:index]
+            ],
+            "user_id": user_id,
+        }
+        # Kuzu property maps can't refer to the unwound row, so nodes are filtered in WHERE
+        where_conditions = [
+            "n.name = row.source",
+            "m.name = row.destination",
+            "r.name = row.relationship",
+            "n.user_id = $user_id",
+            "m.user_id = $user_id",
+        ]
+        if agent_id:
+            where_conditions.extend(["n.agent_id = $agent_id", "m.agent_id = $agent_id"])
+            params["agent_id"] = agent_id
+        if run_id:
+            where_conditions.extend(["n.run_id = $run_id", "m.run_id = $run_id"])
+            params["run_id"] = run_id
+        where_clause = " AND ".join(where_conditions)
 
-        return results
+        # Delete the specific relationships between nodes
+        cypher = f"""
+        UNWIND $rows AS row
+        MATCH (n {self.node_label})-[r {self.rel_label}]->(m {self.node_label})
+        WHERE {where_clause}
+        DELETE r
+        RETURN
+            row.row AS row,
+            n.name AS source,
+            r.name AS relationship,
+            m.name AS target
+        """
+
+        records = self.kuzu_execute(cypher, parameters=params)
+        return split_rows(records, len(to_be_deleted))
 
     def _add_entities(self, to_be_added, filters, entity_type_map):
-        """Add the new entities to the graph. Merge the nodes if they already exist."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
-        run_id = filters.get("run_id", None)
-        results = []
-        for item in to_be_added:
-            # entities
-            source = item["source"]
-            source_label = self.node_label
-
-            destination = item["destination"]
-            destination_label = self.node_label
-
-            relationship = item["relationship"]
-            relationship_label = self.rel_label
-
-            # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
-
-            # search for the nodes with the closest embeddings
-            source_node_search_result = self._search_source_node(source_embedding, filters, threshold=self.threshold)
-            destination_node_search_result = self._search_destination_node(dest_embedding, filters, threshold=self.threshold)
-
-            if not destination_node_search_result and source_node_search_result:
-                params = {
-                    "table_id": source_node_search_result[0]["id"]["table"],
-                    "offset_id": source_node_search_result[0]["id"]["offset"],
-                    "destination_name": destination,
-                    "destination_embedding": dest_embedding,
-                    "relationship_name": relationship,
-                    "user_id": user_id,
-                }
-                # Build source MERGE properties
-                merge_props = ["name: $destination_name", "user_id: $user_id"]
-                if agent_id:
-                    merge_props.append("agent_id: $agent_id")
-                    params["agent_id"] = agent_id
-                if run_id:
-                    merge_props.append("run_id: $run_id")
-                    params["run_id"] = run_id
-                merge_props_str = ", ".join(merge_props)
-
-                cypher = f"""
-                MATCH (source)
-                WHERE id(source) = internal_id($table_id, $offset_id)
-                SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                MERGE (destination {destination_label} {{{merge_props_str}}})
-                ON CREATE SET
-                    destination.created = current_timestamp(),
-                    destination.mentions = 1,
-                    destination.embedding = CAST($destination_embedding,'FLOAT[{self.embedding_dims}]')
-                ON MATCH SET
-                    destination.mentions = coalesce(destination.mentions, 0) + 1,
-                    destination.embedding = CAST($destination_embedding,'FLOAT[{self.embedding_dims}]')
-                WITH source, destination
-                MERGE (source)-[r {relationship_label} {{name: $relationship_name}}]->(destination)
-                ON CREATE SET
-                    r.created = current_timestamp(),
-                    r.mentions = 1
-                ON MATCH SET
-                    r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN
-                    source.name AS source,
-                    r.name AS relationship,
-                    destination.name AS target
-                """
-            elif destination_node_search_result and not source_node_search_result:
-                params = {
-                    "table_id": destination_node_search_result[0]["id"]["table"],
-                    "offset_id": destination_node_search_result[0]["id"]["offset"],
-                    "source_name": source,
-                    "source_embedding": source_embedding,
-                    "user_id": user_id,
-                    "relationship_name": relationship,
-                }
-                # Build source MERGE properties
-                merge_props = ["name: $source_name", "user_id: $user_id"]
-                if agent_id:
-                    merge_props.append("agent_id: $agent_id")
-                    params["agent_id"] = agent_id
-                if run_id:
-                    merge_props.append("run_id: $run_id")
-                    params["run_id"] = run_id
-                merge_props_str = ", ".join(merge_props)
-
-                cypher = f"""
-                MATCH (destination)
-                WHERE id(destination) = internal_id($table_id, $offset_id)
-                SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH destination
-                MERGE (source {source_label} {{{merge_props_str}}})
-                ON CREATE SET
-                source.created = current_timestamp(),
-                source.mentions = 1,
-                source.embedding = CAST($source_embedding,'FLOAT[{self.embedding_dims}]')
-                ON MATCH SET
-                source.mentions = coalesce(source.mentions, 0) + 1,
-                source.embedding = CAST($source_embedding,'FLOAT[{self.embedding_dims}]')
-                WITH source, destination
-                MERGE (source)-[r {relationship_label} {{name: $relationship_name}}]->(destination)
-                ON CREATE SET
-                    r.created = current_timestamp(),
-                    r.mentions = 1
-                ON MATCH SET
-                    r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN
-                    source.name AS source,
-                    r.name AS relationship,
-                    destination.name AS target
-                """
-            elif source_node_search_result and destination_node_search_result:
-                cypher = f"""
-                MATCH (source)
-                WHERE id(source) = internal_id($src_table, $src_offset)
-                SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                MATCH (destination)
-                WHERE id(destination) = internal_id($dst_table, $dst_offset)
-                SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                MERGE (source)-[r {relationship_label} {{name: $relationship_name}}]->(destination)
-                ON CREATE SET
-                    r.created = current_timestamp(),
-                    r.updated = current_timestamp(),
-                    r.mentions = 1
-                ON MATCH SET r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN
-                    source.name AS source,
-                    r.name AS relationship,
-                    destination.name AS target
-                """
+        """
+        Add the new entities to the graph. Merge the nodes if they already exist.
 
-                params = {
-                    "src_table": source_node_search_result[0]["id"]["table"],
-                    "src_offset": source_node_search_result[0]["id"]["offset"],
-                    "dst_table": destination_node_search_result[0]["id"]["table"],
-                    "dst_offset": destination_node_search_result[0]["id"]["offset"],
-                    "relationship_name": relationship,
-                }
-            else:
-                params = {
-                    "source_name": source,
-                    "dest_name": destination,
-                    "relationship_name": relationship,
-                    "source_embedding": source_embedding,
-                    "dest_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                # Build dynamic MERGE props for both source and destination
-                source_props = ["name: $source_name", "user_id: $user_id"]
-                dest_props = ["name: $dest_name", "user_id: $user_id"]
-                if agent_id:
-                    source_props.append("agent_id: $agent_id")
-                    dest_props.append("agent_id: $agent_id")
-                    params["agent_id"] = agent_id
-                if run_id:
-                    source_props.append("run_id: $run_id")
-                    dest_props.append("run_id: $run_id")
-                    params["run_id"] = run_id
-                source_props_str = ", ".join(source_props)
-                dest_props_str = ", ".join(dest_props)
-
-                cypher = f"""
-                MERGE (source {source_label} {{{source_props_str}}})
-                ON CREATE SET
-                    source.created = current_timestamp(),
-                    source.mentions = 1,
-                    source.embedding = CAST($source_embedding,'FLOAT[{self.embedding_dims}]')
-                ON MATCH SET
-                    source.mentions = coalesce(source.mentions, 0) + 1,
-                    source.embedding = CAST($source_embedding,'FLOAT[{self.embedding_dims}]')
-                WITH source
-                MERGE (destination {destination_label} {{{dest_props_str}}})
-                ON CREATE SET
-                    destination.created = current_timestamp(),
-                    destination.mentions = 1,
-                    destination.embedding = CAST($dest_embedding,'FLOAT[{self.embedding_dims}]')
-                ON MATCH SET
-                    destination.mentions = coalesce(destination.mentions, 0) + 1,
-                    destination.embedding = CAST($dest_embedding,'FLOAT[{self.embedding_dims}]')
-                WITH source, destination
-                MERGE (source)-[rel {relationship_label} {{name: $relationship_name}}]->(destination)
-                ON CREATE SET
-                    rel.created = current_timestamp(),
-                    rel.mentions = 1
-                ON MATCH SET
-                    rel.mentions = coalesce(rel.mentions, 0) + 1
-                RETURN
-                    source.name AS source,
-                    rel.name AS relationship,
-                    destination.name AS target
-                """
+        All entity names are embedded in one batch and looked up together, then the new nodes, the
+        mentions and the relationships are written by one UNWIND query each, in a single transaction.
+        """
+        if not to_be_added:
+            return []
 
-            result = self.kuzu_execute(cypher, parameters=params)
-            results.append(result)
+        names = list(dict.fromkeys(name for item in to_be_added for name in (item["source"], item["destination"])))
+        embeddings = dict(zip(names, self.embedding_model.embed_batch(names)))
+        node_keys = self._search_nodes(embeddings, filters, threshold=self.threshold)
+        rows = plan_entity_rows(to_be_added, embeddings, node_keys, self.threshold)
 
+        self.kuzu_execute("BEGIN TRANSACTION")
+        try:
+            new_nodes = [
+                {"name": row[end], "embedding": row[f"{end}_embedding"]}
+                for row in rows
+                for end in ("source", "destination")
+                if row[f"{end}_id"] is None
+            ]
+            if new_nodes:
+                self._create_entity_nodes(new_nodes, filters)
+                node_keys = {**self._get_node_keys([node["name"] for node in new_nodes], filters), **node_keys}
+
+            # Kuzu doesn't see the writes of earlier rows of the same query, so repeated nodes and
+            # relationships are counted here and updated once each. Relationships between two nodes
+            # that already existed are written separately, as they also get an updated timestamp.
+            mentions = {}
+            relations = {False: {}, True: {}}
+            for row in rows:
+                matched = row["source_id"] is not None and row["destination_id"] is not None
+                source_key, destination_key = node_keys[row["source"]], node_keys[row["destination"]]
+                mentions[source_key] = mentions.get(source_key, 0) + 1
+                mentions[destination_key] = mentions.get(destination_key, 0) + 1
+                relation = relations[matched].setdefault(
+                    (source_key, row["relationship"], destination_key),
+                    {
+                        "source": source_key,
+                        "name": row["relationship"],
+                        "destination": destination_key,
+                        "mentions": 0,
+                        "rows": [],
+                    },
+                )
+                relation["mentions"] += 1
+                relation["rows"].append(row["row"])
+
+            self.kuzu_execute(
+                f"""
+                UNWIND $nodes AS node
+                MATCH (n {self.node_label})
+                WHERE n.id = node.key
+                SET n.mentions = coalesce(n.mentions, 0) + node.mentions
+                """,
+                parameters={"nodes": [{"key": key, "mentions": count} for key, count in mentions.items()]},
+            )
+            records = []
+            for matched, batch in relations.items():
+                if not batch:
+                    continue
+                updated_set = "r.updated = current_timestamp()," if matched else ""
+                records += self.kuzu_execute(
+                    f"""
+                    UNWIND $relations AS relation
+                    MATCH (source {self.node_label})
+                    WHERE source.id = relation.source
+                    MATCH (destination {self.node_label})
+                    WHERE destination.id = relation.destination
+                    MERGE (source)-[r {self.rel_label} {{name: relation.name}}]->(destination)
+                    ON CREATE SET
+                        r.created = current_timestamp(),
+                        {updated_set}
+                        r.mentions = relation.mentions
+                    ON MATCH SET
+                        r.mentions = coalesce(r.mentions, 0) + relation.mentions
+                    RETURN
+                        relation.rows AS rows,
+                        source.name AS source,
+                        r.name AS relationship,
+                        destination.name AS target
+                    """,
+                    parameters={"relations": list(batch.values())},
+                )
+            self.kuzu_execute("COMMIT")
+        except Exception:
+            self.kuzu_execute("ROLLBACK")
+            raise
+
+        results = [[] for _ in to_be_added]
+        for record in records:
+            for row in record.pop("rows"):
+                results[row].append(record)
         return results
 
-    def _remove_spaces_from_entities(self, entity_list):
-        for item in entity_list:
-            item["source"] = item["source"].lower().replace(" ", "_")
-            item["relationship"] = item["relationship"].lower().replace(" ", "_")
-            item["destination"] = item["destination"].lower().replace(" ", "_")
-        return entity_list
-
-    def _search_source_node(self, source_embedding, filters, threshold=0.9):
-        params = {
-            "source_embedding": source_embedding,
-            "user_id": filters["user_id"],
-            "threshold": threshold,
-        }
-        where_conditions = ["source_candidate.embedding IS NOT NULL", "source_candidate.user_id = $user_id"]
+    def _get_node_keys(self, names, filters):
+        """Primary keys of the entity nodes of the scope with the given names."""
+        params = {"names": list(set(names)), "user_id": filters["user_id"]}
+        where_conditions = ["n.name IN $names", "n.user_id = $user_id"]
         if filters.get("agent_id"):
-            where_conditions.append("source_candidate.agent_id = $agent_id")
+            where_conditions.append("n.agent_id = $agent_id")
             params["agent_id"] = filters["agent_id"]
         if filters.get("run_id"):
-            where_conditions.append("source_candidate.run_id = $run_id")
+            where_conditions.append("n.run_id = $run_id")
             params["run_id"] = filters["run_id"]
-        where_clause = " AND ".join(where_conditions)
 
-        cypher = f"""
-            MATCH (source_candidate {self.node_label})
-            WHERE {where_clause}
+        records = self.kuzu_execute(
+            f"""
+            MATCH (n {self.node_label})
+            WHERE {" AND ".join(where_conditions)}
+            RETURN n.name AS name, n.id AS key
+            """,
+            parameters=params,
+        )
+        return {record["name"]: record["key"] for record in records}
 
-            WITH source_candidate,
-            array_cosine_similarity(source_candidate.embedding, CAST($source_embedding,'FLOAT[{self.embedding_dims}]')) AS source_similarity
+    def _remove_spaces_from_entities(self, entity_list):
+        for item in entity_list:
+            item["source"] = item["source"].lower().replace(" ", "_")
+            item["relationship"] = item["relationship"].lower().replace(" ", "_")
+            item["destination"] = item["destination"].lower().replace(" ", "_")
+        return entity_list
 
-            WHERE source_similarity >= $threshold
+    def _search_nodes(self, embeddings, filters, threshold):
+        """
+        Find the existing node most similar to each entity.
 
-            WITH source_candidate, source_similarity
-            ORDER BY source_similarity DESC
-            LIMIT 2
+        Kuzu's vector index is queried once per entity as it only takes a literal or parameter query
+        vector, which costs no round trip in an embedded database. The entities it can't answer for
+        are compared with the scope's nodes in one query.
 
-            RETURN id(source_candidate) as id, source_similarity
-            """
+        Args:
+            embeddings (dict): Embedding of every entity name.
+            filters (dict): The user_id, agent_id and run_id of the nodes.
+            threshold (float): Minimum similarity of a match.
 
-        return self.kuzu_execute(cypher, parameters=params)
+        Returns:
+            dict: Primary key of the matched node, for the names that matched one.
+        """
+        node_keys = {}
+        to_scan = []
+        for name, embedding in embeddings.items():
+            hits = self._query_vector_index(embedding, filters, threshold, limit=1)
+            if hits is None:
+                to_scan.append(name)
+            elif hits:
+                node_keys[name] = hits[0]["key"]
+        if not to_scan:
+            return node_keys
 
-    def _search_destination_node(self, destination_embedding, filters, threshold=0.9):
         params = {
-            "destination_embedding": destination_embedding,
+            "entities": [{"name": name, "embedding": embeddings[name]} for name in to_scan],
             "user_id": filters["user_id"],
             "threshold": threshold,
         }
-        where_conditions = ["destination_candidate.embedding IS NOT NULL", "destination_candidate.user_id = $user_id"]
+        where_conditions = ["candidate.embedding IS NOT NULL", "candidate.user_id = $user_id"]
         if filters.get("agent_id"):
-            where_conditions.append("destination_candidate.agent_id = $agent_id")
+            where_conditions.append("candidate.agent_id = $agent_id")
             params["agent_id"] = filters["agent_id"]
         if filters.get("run_id"):
-            where_conditions.append("destination_candidate.run_id = $run_id")
+            where_conditions.append("candidate.run_id = $run_id")
             params["run_id"] = filters["run_id"]
-        where_clause = " AND ".join(where_conditions)
 
-        cypher = f"""
-            MATCH (destination_candidate {self.node_label})
-            WHERE {where_clause}
-
-            WITH destination_candidate,
-            array_cosine_similarity(destination_candidate.embedding, CAST($destination_embedding,'FLOAT[{self.embedding_dims}]')) AS destination_similarity
-
-            WHERE destination_similarity >= $threshold
-
-            WITH destination_candidate, destination_similarity
-            ORDER BY destination_similarity DESC
-            LIMIT 2
-
-            RETURN id(destination_candidate) as id, destination_similarity
-            """
-
-        return self.kuzu_execute(cypher, parameters=params)
+        records = self.kuzu_execute(
+            f"""
+            UNWIND $entities AS entity
+            MATCH (candidate {self.node_label})
+            WHERE {" AND ".join(where_conditions)}
+            WITH entity, candidate,
+            array_cosine_similarity(candidate.embedding, CAST(entity.embedding, 'FLOAT[{self.embedding_dims}]')) AS similarity
+            WHERE similarity >= $threshold
+            RETURN entity.name AS name, candidate.id AS key, similarity
+            ORDER BY similarity DESC
+            """,
+            parameters=params,
+        )
+        for record in records:
+            node_keys.setdefault(record["name"], record["key"])
+        return node_keys
 
-    # Reset is not defined in base.py
     def reset(self):
         """Reset the graph by clearing all nodes and relationships."""
         logger.warning("Clearing graph...")
@@ -0,0 +1,214 @@
+import heapq
+import json
+import logging
+import math
+import re
+import sqlite3
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from mem0.memory.search_cache import SESSION_ID_KEYS, session_scopes
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def lexical_filters_supported(filters: Dict[str, Any]) -> bool:
+    """
+    Whether the lexical search can honour the filters of a search.
+
+    BM25 hits are checked against the filters with plain equality, so filters with operators or logical
+    groups only use the vector search.
+    """
+    if not session_scopes(filters):
+        return False
+    return all(isinstance(value, (str, int, float, bool)) for value in filters.values())
+
+
+def matches_filters(payload: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    return all(payload.get(key) == value for key, value in filters.items())
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """
+    Fuse rankings of ids, scoring each id by the sum of 1 / (k + rank) over the rankings it appears in.
+
+    Returns:
+        list: (id, fused score) pairs, best first.
+    """
+    scores = defaultdict(float)
+    for ranking in rankings:
+        for rank, id in enumerate(ranking, start=1):
+            scores[id] += 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class _Document:
+    __slots__ = ("scopes", "terms", "length")
+
+    def __init__(self, scopes: List[str], terms: Counter):
+        self.scopes = scopes
+        self.terms = terms
+        self.length = sum(terms.values())
+
+
+class BM25Index:
+    """
+    Incremental BM25 index over the text of memories, partitioned by session ids.
+
+    The inverted index lives in memory and every change is written through to a SQLite table, from which
+    the index is rebuilt on start. The table can be shared by several vector store collections, each
+    indexing its memories under its own `collection`. A search only scores the memories holding every
+    session id of its filters, with document frequencies and lengths computed over those memories alone.
+    """
+
+    def __init__(self, db_path: str = ":memory:", k1: float = 1.5, b: float = 0.75, collection: str = ""):
+        self.k1 = k1
+        self.b = b
+        self.collection = collection
+        self._lock = threading.Lock()
+        self._documents: Dict[str, _Document] = {}
+        self._postings: Dict[str, set] = defaultdict(set)
+        self._scopes: Dict[str, set] = defaultdict(set)
+        self._scope_lengths: Dict[str, int] = defaultdict(int)
+
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock:
+            columns = {row[1] for row in self.connection.execute("PRAGMA table_info(lexical_index)")}
+            if columns and "collection" not in columns:
+                # Entries without a collection can't be attributed, the index is backfilled from the vector store
+                logger.info("Recreating the lexical index table with a collection column.")
+                self.connection.execute("DROP TABLE lexical_index")
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS lexical_index (
+                    collection   TEXT NOT NULL DEFAULT '',
+                    memory_id    TEXT NOT NULL,
+                    scopes       TEXT,
+                    text         TEXT,
+                    PRIMARY KEY (collection, memory_id)
+                )
+            """
+            )
+            self.connection.commit()
+            rows = self.connection.execute(
+                "SELECT memory_id, scopes, text FROM lexical_index WHERE collection = ?", (collection,)
+            ).fetchall()
+            for memory_id, scopes, text in rows:
+                self._index(memory_id, json.loads(scopes), text)
+
+    def __len__(self):
+        return len(self._documents)
+
+    def _index(self, memory_id: str, scopes: List[str], text: str) -> None:
+        document = _Document(scopes, Counter(tokenize(text)))
+        self._documents[memory_id] = document
+        for term in document.terms:
+            self._postings[term].add(memory_id)
+        for scope in scopes:
+            self._scopes[scope].add(memory_id)
+            self._scope_lengths[scope] += document.length
+
+    def _unindex(self, memory_id: str) -> None:
+        document = self._documents.pop(memory_id, None)
+        if document is None:
+            return
+        for term in document.terms:
+            self._postings[term].discard(memory_id)
+            if not self._postings[term]:
+                del self._postings[term]
+        for scope in document.scopes:
+            self._scopes[scope].discard(memory_id)
+            self._scope_lengths[scope] -= document.length
+            if not self._scopes[scope]:
+                del self._scopes[scope]
+                del self._scope_lengths[scope]
+
+    def upsert(self, memory_id: str, text: str, payload: Dict[str, Any]) -> None:
+        """Index or re-index the text of a memory, under the session ids of its payload."""
+        scopes = session_scopes({key: payload.get(key) for key in SESSION_ID_KEYS})
+        with self._lock:
+            self._unindex(memory_id)
+            self._index(memory_id, scopes, text)
+            try:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO lexical_index (collection, memory_id, scopes, text) VALUES (?, ?, ?, ?)",
+                    (self.collection, memory_id, json.dumps(scopes), text),
+                )
+                self.connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to persist the lexical index entry of {memory_id}: {e}")
+
+    def delete(self, memory_id: str) -> None:
+        with self._lock:
+            self._unindex(memory_id)
+            try:
+                self.connection.execute(
+                    "DELETE FROM lexical_index WHERE collection = ? AND memory_id = ?", (self.collection, memory_id)
+                )
+                self.connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to delete the lexical index entry of {memory_id}: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+            self._postings.clear()
+            self._scopes.clear()
+            self._scope_lengths.clear()
+            self.connection.execute("DELETE FROM lexical_index WHERE collection = ?", (self.collection,))
+            self.connection.commit()
+
+    def search(self, query: str, filters: Dict[str, Any], limit: int = 100) -> List[Tuple[str, float]]:
+        """
+        Rank the memories of the session ids of `filters` by their BM25 score for `query`.
+
+        Only the session ids of the filters are applied; the caller checks the other filters.
+
+        Returns:
+            list: (memory id, score) pairs of memories sharing at least one term with the query, best first.
+        """
+        scopes = session_scopes(filters)
+        terms = set(tokenize(query))
+        if not scopes or not terms:
+            return []
+
+        with self._lock:
+            if len(scopes) == 1:
+                candidates = self._scopes.get(scopes[0], set())
+                total_length = self._scope_lengths.get(scopes[0], 0)
+            else:
+                candidates = set.intersection(*(self._scopes.get(scope, set()) for scope in scopes))
+                total_length = sum(self._documents[memory_id].length for memory_id in candidates)
+            count = len(candidates)
+            if not count:
+                return []
+            average_length = total_length / count or 1
+
+            scores = defaultdict(float)
+            for term in terms:
+                matched = self._postings.get(term, set()) & candidates
+                if not matched:
+                    continue
+                idf = math.log(1 + (count - len(matched) + 0.5) / (len(matched) + 0.5))
+                for memory_id in matched:
+                    document = self._documents[memory_id]
+                    tf = document.terms[term]
+                    norm = self.k1 * (1 - self.b + self.b * document.length / average_length)
+                    scores[memory_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+
+def create_lexical_index(config, history_db_path: Optional[str] = None, collection: str = "") -> BM25Index:
+    """
+    Create the BM25 index of `collection` described by a `HybridSearchConfig`, stored with the history by
+    default.
+    """
+    return BM25Index(config.path or history_db_path or ":memory:", k1=config.k1, b=config.b, collection=collection)
@@ -5,11 +5,12 @@ import hashlib
 import json
 import logging
 import os
+import threading
 import uuid
 import warnings
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import pytz
 from pydantic import ValidationError
@@ -22,10 +23,21 @@ from mem0.configs.prompts import (
 )
 from mem0.exceptions import ValidationError as Mem0ValidationError
 from mem0.memory.base import MemoryBase
+from mem0.memory.coalescer import AddCoalescer, AsyncAddCoalescer
+from mem0.memory.gate import ExtractionGate
+from mem0.memory.ingestion import IngestionQueue, default_queue_path
+from mem0.memory.lexical import (
+    create_lexical_index,
+    lexical_filters_supported,
+    matches_filters,
+    reciprocal_rank_fusion,
+)
+from mem0.memory.search_cache import create_search_cache
 from mem0.memory.setup import mem0_dir, setup_config
 from mem0.memory.storage import SQLiteManager
 from mem0.memory.telemetry import capture_event
 from mem0.memory.utils import (
+    JsonArrayStreamParser,
     extract_json,
     get_fact_retrieval_messages,
     parse_messages,
@@ -165,10 +177,253 @@ def _build_filters_and_metadata(
     return base_metadata_template, effective_query_filters
 
 
+def _collection_scope(config):
+    """Identify the vector store collection of a memory config in the indexes shared through the history database."""
+    return f"{config.vector_store.provider}:{config.vector_store.config.collection_name}"
+
+
+def _drop_stored_facts(memory, facts, filters):
+    """
+    Drop the facts already stored verbatim in the scope of `filters`, and the repeated ones.
+
+    Exact duplicates would only come back from the update LLM as "NONE", so they are removed using the hash
+    index of the history database before any embedding, search or LLM call. A fact is only dropped once its
+    memory is found in the vector store; hashes of memories that are gone (e.g. after the collection was wiped)
+    are forgotten.
+    """
+    facts = list(dict.fromkeys(facts))
+    if not facts or not filters:
+        return facts
+    hashes = {fact: hashlib.md5(fact.encode()).hexdigest() for fact in facts}
+    stored = memory.db.get_memory_hashes(list(hashes.values()), filters, collection=memory.collection_scope)
+    if stored:
+        missing = []
+        existing = _get_vectors(memory.vector_store, list(dict.fromkeys(stored.values())), missing)
+        for memory_id in missing:
+            memory.db.delete_memory_hash(memory_id, collection=memory.collection_scope)
+        stored = {content_hash: memory_id for content_hash, memory_id in stored.items() if memory_id in existing}
+        logger.debug(f"Skipping {len(stored)} facts already stored as memories.")
+    return [fact for fact in facts if hashes[fact] not in stored]
+
+
+def _get_vectors(vector_store, memory_ids, failed):
+    """
+    Fetch the stored memories by ID, in one request when the vector store supports it.
+
+    Returns:
+        dict: Memory ID to stored memory; unknown IDs are appended to `failed`.
+    """
+    found = {}
+    if hasattr(vector_store, "get_many"):
+        try:
+            found = {str(memory.id): memory for memory in vector_store.get_many(vector_ids=memory_ids)}
+        except Exception as e:
+            logger.warning(f"Failed to fetch {len(memory_ids)} memories: {e}")
+    else:
+        for memory_id in memory_ids:
+            try:
+                memory = vector_store.get(vector_id=memory_id)
+            except Exception as e:
+                logger.warning(f"Failed to fetch memory {memory_id}: {e}")
+                memory = None
+            if memory is not None:
+                found[memory_id] = memory
+    failed.extend(memory_id for memory_id in memory_ids if memory_id not in found)
+    return {memory_id: found[memory_id] for memory_id in memory_ids if memory_id in found}
+
+
+def _delete_vectors(vector_store, memory_ids, failed):
+    """
+    Delete the vectors of memories, in one request when the vector store supports it.
+
+    Returns:
+        list: IDs of the deleted memories; the others are appended to `failed`.
+    """
+    if not memory_ids:
+        return []
+    if hasattr(vector_store, "delete_many"):
+        try:
+            vector_store.delete_many(vector_ids=memory_ids)
+            return memory_ids
+        except Exception as e:
+            logger.warning(f"Failed to delete {len(memory_ids)} memories from the vector store: {e}")
+            failed.extend(memory_ids)
+            return []
+    deleted = []
+    for memory_id in memory_ids:
+        try:
+            vector_store.delete(vector_id=memory_id)
+            deleted.append(memory_id)
+        except Exception as e:
+            logger.warning(f"Failed to delete memory {memory_id} from the vector store: {e}")
+            failed.append(memory_id)
+    return deleted
+
+
+def _index_memory_hash(memory, memory_id, payload):
+    """Record the content hash of a memory under its collection and scope."""
+    memory.db.add_memory_hash(
+        memory_id,
+        payload.get("hash"),
+        user_id=payload.get("user_id"),
+        agent_id=payload.get("agent_id"),
+        run_id=payload.get("run_id"),
+        collection=memory.collection_scope,
+    )
+
+
+def _memory_item(mem):
+    """Format a memory of the vector store as a result item."""
+    promoted_payload_keys = ["user_id", "agent_id", "run_id", "actor_id", "role"]
+    core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
+
+    item = MemoryItem(
+        id=mem.id,
+        memory=mem.payload.get("data", ""),
+        hash=mem.payload.get("hash"),
+        created_at=mem.payload.get("created_at"),
+        updated_at=mem.payload.get("updated_at"),
+    ).model_dump()
+    for key in promoted_payload_keys:
+        if key in mem.payload:
+            item[key] = mem.payload[key]
+    additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
+    if additional_metadata:
+        item["metadata"] = additional_metadata
+    return item
+
+
+def _listed_memories(memories_result):
+    """The memories of a `vector_store.list` result, whose shape differs between vector stores."""
+    # Handle different vector store return formats by inspecting first element
+    if isinstance(memories_result, (tuple, list)) and len(memories_result) > 0:
+        first_element = memories_result[0]
+
+        # If first element is a container, unwrap one level
+        if isinstance(first_element, (list, tuple)):
+            return first_element
+        # First element is a memory object, structure is already flat
+        return memories_result
+    return memories_result
+
+
+def _backfill_lexical_index(vector_store, lexical_index, limit):
+    """
+    Index the memories of the vector store into an empty BM25 index, e.g. memories stored before hybrid
+    search was enabled. An index that already holds memories of its collection is left as it is.
+    """
+    if len(lexical_index):
+        return
+    memories = _listed_memories(vector_store.list(filters=None, limit=limit)) or []
+    for mem in memories:
+        if mem.payload and mem.payload.get("data"):
+            lexical_index.upsert(mem.id, mem.payload["data"], mem.payload)
+    logger.info(f"Backfilled the BM25 index with {len(lexical_index)} memories of the vector store")
+
+
+def _fuse_search_results(vector_store, vector_memories, lexical_hits, filters, limit, rrf_k, threshold=None):
+    """
+    Fuse the results of the vector and BM25 searches with reciprocal rank fusion.
+
+    Results are ordered by their fused score, returned as "fused_score", while "score" keeps the vector
+    similarity. Memories only found by BM25 have no similarity: they are fetched from the vector store and
+    checked against the filters, and left out when a `threshold` is set, as they can't be shown to pass it.
+    """
+    by_id = {item["id"]: item for item in vector_memories}
+    fused = reciprocal_rank_fusion([list(by_id), [memory_id for memory_id, _ in lexical_hits]], k=rrf_k)
+
+    results = []
+    for memory_id, fused_score in fused:
+        if len(results) >= limit:
+            break
+        item = by_id.get(memory_id)
+        if item is None:
+            if threshold is not None:
+                continue
+            try:
+                mem = vector_store.get(vector_id=memory_id)
+            except Exception as e:
+                logger.debug(f"Skipping BM25 hit {memory_id} missing from the vector store: {e}")
+                continue
+            if mem is None or not matches_filters(mem.payload, filters):
+                continue
+            item = _memory_item(mem)
+        results.append({**item, "fused_score": fused_score})
+    return results
+
+
+def _parse_facts(response):
+    """Parse the facts of a fact extraction response, None when it is malformed."""
+    try:
+        response = remove_code_blocks(response)
+        if not response.strip():
+            return None
+        try:
+            # First try direct JSON parsing
+            return json.loads(response)["facts"]
+        except json.JSONDecodeError:
+            # Try extracting JSON from response using built-in function
+            extracted_json = extract_json(response)
+            return json.loads(extracted_json)["facts"]
+    except Exception as e:
+        logger.error(f"Error in new_retrieved_facts: {e}")
+        return None
+
+
+def _search_fact(memory, fact, filters, skip_stored=False):
+    """
+    Embed a new fact and find the existing memories it may update.
+
+    Returns:
+        tuple or None: The embedding of the fact and the existing memories. None when `skip_stored` is set
+            and the fact is already stored verbatim.
+    """
+    if skip_stored and not _drop_stored_facts(memory, [fact], filters):
+        return None
+    embeddings = memory.embedding_model.embed(fact, "add")
+    existing_memories = memory.vector_store.search(query=fact, vectors=embeddings, limit=5, filters=filters)
+    return embeddings, existing_memories
+
+
+def _stream_facts(llm, extraction_messages, search_fact, max_workers=4):
+    """
+    Run the fact extraction as a stream, starting `search_fact` on each fact as soon as it is generated.
+
+    Returns:
+        tuple: The extracted facts, the result of `search_fact` for each of them, and whether the response
+            was well-formed.
+    """
+    parser = JsonArrayStreamParser("facts")
+    searches = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        chunks = llm.generate_response_stream(messages=extraction_messages, response_format={"type": "json_object"})
+        for chunk in chunks:
+            for fact in parser.feed(chunk):
+                if isinstance(fact, str) and fact not in searches:
+                    searches[fact] = executor.submit(search_fact, fact)
+
+        # Responses the parser could not follow, e.g. without a "facts" array, are parsed as a whole
+        parsed = parser.items if parser.done else _parse_facts(parser.text)
+        facts = list(dict.fromkeys(parsed or []))
+        for fact in facts:
+            if fact not in searches:
+                searches[fact] = executor.submit(search_fact, fact)
+        return facts, {fact: searches[fact].result() for fact in facts}, parsed is not None
+
+
 setup_config()
 logger = logging.getLogger(__name__)
 
 
+def _session_scope(user_id, agent_id, run_id):
+    return json.dumps([user_id, agent_id, run_id])
+
+
+def _coalescing_key(metadata, infer):
+    # Only adds storing the same metadata, which holds the session ids, are merged into one add cycle
+    return json.dumps([metadata, infer], sort_keys=True, default=str)
+
+
 class Memory(MemoryBase):
     def __init__(self, config: MemoryConfig = MemoryConfig()):
         self.config = config
@@ -183,9 +438,10 @@ class Memory(MemoryBase):
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
-        self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
+        self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config, cache=self.config.llm.cache)
         self.db = SQLiteManager(self.config.history_db_path)
         self.collection_name = self.config.vector_store.config.collection_name
+        self.collection_scope = _collection_scope(self.config)
         self.api_version = self.config.version
         
         # Initialize reranker if configured
@@ -196,6 +452,36 @@ class Memory(MemoryBase):
                 config.reranker.config
             )
 
+        self._ingestion_queue = None
+        self._ingestion_queue_lock = threading.Lock()
+        if self.config.ingestion_queue.async_mode:
+            # Start the workers now, so jobs left queued by a previous process resume
+            self._get_ingestion_queue()
+
+        self._add_coalescer = None
+        if self.config.add_coalescing:
+            self._add_coalescer = AddCoalescer(
+                self.config.add_coalescing.window, self.config.add_coalescing.max_batch_size
+            )
+
+        self.extraction_gate = None
+        if self.config.extraction_gate:
+            self.extraction_gate = ExtractionGate.from_config(self.config.extraction_gate, self.embedding_model)
+        self.streaming_extraction = self.config.streaming_extraction
+        self.search_cache = (
+            create_search_cache(self.config.search_cache, namespace=self.collection_scope)
+            if self.config.search_cache
+            else None
+        )
+        self.hybrid_search = self.config.hybrid_search
+        self.lexical_index = None
+        if self.hybrid_search:
+            self.lexical_index = create_lexical_index(
+                self.hybrid_search, self.config.history_db_path, collection=self.collection_scope
+            )
+        self._lexical_index_backfilled = False
+        self._lexical_index_backfill_lock = threading.Lock()
+
         self.enable_graph = False
 
         if self.config.graph_store.config:
@@ -289,6 +575,7 @@ class Memory(MemoryBase):
         infer: bool = True,
         memory_type: Optional[str] = None,
         prompt: Optional[str] = None,
+        wait: Optional[bool] = None,
     ):
         """
         Create a new memory.
@@ -311,6 +598,9 @@ class Memory(MemoryBase):
                 creating procedural memories (typically requires 'agent_id'). Otherwise, memories
                 are treated as general conversational/factual memories.memory_type (str, optional): Type of memory to create. Defaults to None. By default, it creates the short term memories and long term (semantic and episodic) memories. Pass "procedural_memory" to create procedural memories.
             prompt (str, optional): Prompt to use for the memory creation. Defaults to None.
+            wait (bool, optional): If False, the add is queued and run in the background, see
+                `get_job_status` and `flush`. Defaults to True, or to False when `ingestion_queue.async_mode`
+                is set in the config.
 
 
         Returns:
@@ -318,6 +608,9 @@ class Memory(MemoryBase):
                   including a list of memory items affected (added, updated) under a "results" key,
                   and potentially "relations" if graph store is enabled.
                   Example for v1.1+: `{"results": [{"id": "...", "memory": "...", "event": "ADD"}]}`
+                  When queued: `{"job_id": "...", "status": "pending"}`
+                  With `add_coalescing` configured, concurrent adds of the same session ids are merged into
+                  one add cycle and each of them returns the result of the whole cycle.
 
         Raises:
             Mem0ValidationError: If input validation fails (invalid memory_type, messages format, etc.).
@@ -357,10 +650,37 @@ class Memory(MemoryBase):
                 suggestion="Convert your input to a string, dictionary, or list of dictionaries."
             )
 
+        if wait is None:
+            wait = not self.config.ingestion_queue.async_mode
+        if not wait:
+            payload = {
+                "messages": messages,
+                "user_id": user_id,
+                "agent_id": agent_id,
+                "run_id": run_id,
+                "metadata": metadata,
+                "infer": infer,
+                "memory_type": memory_type,
+                "prompt": prompt,
+            }
+            # Adds of the same session ids apply in the order they were queued
+            job_id = self._get_ingestion_queue().enqueue(payload, scope=_session_scope(user_id, agent_id, run_id))
+            return {"job_id": job_id, "status": "pending"}
+
         if agent_id is not None and memory_type == MemoryType.PROCEDURAL.value:
             results = self._create_procedural_memory(messages, metadata=processed_metadata, prompt=prompt)
             return results
 
+        if self._add_coalescer is not None:
+            return self._add_coalescer.submit(
+                _session_scope(user_id, agent_id, run_id),
+                _coalescing_key(processed_metadata, infer),
+                messages,
+                lambda merged: self._add_messages(merged, processed_metadata, effective_filters, infer),
+            )
+        return self._add_messages(messages, processed_metadata, effective_filters, infer)
+
+    def _add_messages(self, messages, processed_metadata, effective_filters, infer):
         if self.config.llm.config.get("enable_vision"):
             messages = parse_vision_messages(messages, self.llm, self.config.llm.config.get("vision_details"))
         else:
@@ -383,6 +703,49 @@ class Memory(MemoryBase):
 
         return {"results": vector_store_result}
 
+    def _get_ingestion_queue(self) -> IngestionQueue:
+        with self._ingestion_queue_lock:
+            if self._ingestion_queue is None:
+                queue_config = self.config.ingestion_queue
+                self._ingestion_queue = IngestionQueue(
+                    handler=lambda payload: self.add(**payload, wait=True),
+                    db_path=queue_config.path or default_queue_path(self.config.history_db_path, self.collection_name),
+                    workers=queue_config.workers,
+                    max_retries=queue_config.max_retries,
+                    retry_backoff=queue_config.retry_backoff,
+                    lease_duration=queue_config.lease_duration,
+                )
+            return self._ingestion_queue
+
+    def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the status of an add queued with `wait=False`.
+
+        Args:
+            job_id (str): ID returned by the queued add.
+
+        Returns:
+            dict or None: The job with its "status" ("pending", "running", "done", or "dead" once its retries
+                are exhausted), "attempts", last "error", and the "result" of the add once done. None if the
+                job doesn't exist.
+        """
+        return self._get_ingestion_queue().get_status(job_id)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every add queued with `wait=False` has run, e.g. before shutting down.
+
+        Args:
+            timeout (float, optional): Maximum number of seconds to wait. Defaults to waiting until drained.
+
+        Returns:
+            bool: True if the queue was drained, False on timeout. Jobs left in the queue run the next time
+                it is opened.
+        """
+        if self._ingestion_queue is None:
+            return True
+        return self._ingestion_queue.flush(timeout)
+
     def _add_to_vector_store(self, messages, metadata, filters, infer):
         if not infer:
             returned_memories = []
@@ -420,6 +783,9 @@ class Memory(MemoryBase):
                 )
             return returned_memories
 
+        if self.extraction_gate is not None and not self.extraction_gate.should_extract(messages):
+            return []
+
         parsed_messages = parse_messages(messages)
 
         if self.config.custom_fact_extraction_prompt:
@@ -430,36 +796,11 @@ class Memory(MemoryBase):
             # and role types in messages
             is_agent_memory = self._should_use_agent_memory_extraction(messages, metadata)
             system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages, is_agent_memory)
+        extraction_messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
 
-        response = self.llm.generate_response(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
-        )
-
-        try:
-            response = remove_code_blocks(response)
-            if not response.strip():
-                new_retrieved_facts = []
-            else:
-                try:
-                    # First try direct JSON parsing
-                    new_retrieved_facts = json.loads(response)["facts"]
-                except json.JSONDecodeError:
-                    # Try extracting JSON from response using built-in function
-                    extracted_json = extract_json(response)
-                    new_retrieved_facts = json.loads(extracted_json)["facts"]
-        except Exception as e:
-            logger.error(f"Error in new_retrieved_facts: {e}")
-            new_retrieved_facts = []
-
-        if not new_retrieved_facts:
-            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
-
-        retrieved_old_memory = []
-        new_message_embeddings = {}
         # Search for existing memories using the provided session identifiers
         # Use all available session identifiers for accurate memory retrieval
         search_filters = {}
@@ -469,15 +810,35 @@ class Memory(MemoryBase):
             search_filters["agent_id"] = filters["agent_id"]
         if filters.get("run_id"):
             search_filters["run_id"] = filters["run_id"]
+
+        if self.streaming_extraction:
+            # Embed and search each fact while the LLM is still generating the next ones
+            extracted_facts, fact_searches, facts_parsed = _stream_facts(
+                self.llm, extraction_messages, lambda fact: _search_fact(self, fact, search_filters, skip_stored=True)
+            )
+            new_retrieved_facts = [fact for fact in extracted_facts if fact_searches[fact] is not None]
+        else:
+            response = self.llm.generate_response(
+                messages=extraction_messages,
+                response_format={"type": "json_object"},
+            )
+            extracted_facts = _parse_facts(response)
+            facts_parsed = extracted_facts is not None
+            extracted_facts = extracted_facts or []
+            new_retrieved_facts = _drop_stored_facts(self, extracted_facts, search_filters)
+            fact_searches = {fact: _search_fact(self, fact, search_filters) for fact in new_retrieved_facts}
+
+        # A failed extraction, e.g. malformed JSON, says nothing about whether the messages hold facts
+        if facts_parsed and not extracted_facts and self.extraction_gate is not None:
+            self.extraction_gate.record_no_facts(messages)
+        if not new_retrieved_facts:
+            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
+
+        retrieved_old_memory = []
+        new_message_embeddings = {}
         for new_mem in new_retrieved_facts:
-            messages_embeddings = self.embedding_model.embed(new_mem, "add")
+            messages_embeddings, existing_memories = fact_searches[new_mem]
             new_message_embeddings[new_mem] = messages_embeddings
-            existing_memories = self.vector_store.search(
-                query=new_mem,
-                vectors=messages_embeddings,
-                limit=5,
-                filters=search_filters,
-            )
             for mem in existing_memories:
                 retrieved_old_memory.append({"id": mem.id, "text": mem.payload.get("data", "")})
 
@@ -493,7 +854,11 @@ class Memory(MemoryBase):
             temp_uuid_mapping[str(idx)] = item["id"]
             retrieved_old_memory[idx]["id"] = str(idx)
 
-        if new_retrieved_facts:
+        if new_retrieved_facts and not retrieved_old_memory:
+            # Nothing to update or delete, every fact is added
+            logger.debug("No existing memories found. Skipping memory update LLM call.")
+            new_memories_with_actions = {"memory": [{"text": fact, "event": "ADD"} for fact in new_retrieved_facts]}
+        elif new_retrieved_facts:
             function_calling_prompt = get_update_memory_messages(
                 retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
             )
@@ -580,6 +945,12 @@ class Memory(MemoryBase):
                                 vector=None,  # Keep same embeddings
                                 payload=updated_metadata,
                             )
+                            if updated_metadata.get("hash"):
+                                _index_memory_hash(self, memory_id, updated_metadata)
+                            if self.search_cache is not None:
+                                self.search_cache.invalidate(existing_memory.payload, updated_metadata)
+                            if self.lexical_index is not None:
+                                self.lexical_index.upsert(memory_id, updated_metadata.get("data", ""), updated_metadata)
                             logger.info(f"Updated session IDs for memory {memory_id}")
                         else:
                             logger.info("NOOP for Memory.")
@@ -604,6 +975,8 @@ class Memory(MemoryBase):
 
             data = "\n".join([msg["content"] for msg in messages if "content" in msg and msg["role"] != "system"])
             added_entities = self.graph.add(data, filters)
+            if self.search_cache is not None:
+                self.search_cache.invalidate(filters)
 
         return added_entities
 
@@ -690,6 +1063,13 @@ class Memory(MemoryBase):
             "mem0.get_all", self, {"limit": limit, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"}
         )
 
+        cache_key = None
+        if self.search_cache is not None:
+            cache_key = self.search_cache.key("get_all", None, effective_filters, limit=limit)
+            found, cached = self.search_cache.get(cache_key) if cache_key else (False, None)
+            if found:
+                return cached
+
         with concurrent.futures.ThreadPoolExecutor() as executor:
             future_memories = executor.submit(self._get_all_from_vector_store, effective_filters, limit)
             future_graph_entities = (
@@ -703,26 +1083,16 @@ class Memory(MemoryBase):
             all_memories_result = future_memories.result()
             graph_entities_result = future_graph_entities.result() if future_graph_entities else None
 
+        result = {"results": all_memories_result}
         if self.enable_graph:
-            return {"results": all_memories_result, "relations": graph_entities_result}
+            result["relations"] = graph_entities_result
 
-        return {"results": all_memories_result}
+        if cache_key is not None:
+            self.search_cache.set(cache_key, result)
+        return result
 
     def _get_all_from_vector_store(self, filters, limit):
-        memories_result = self.vector_store.list(filters=filters, limit=limit)
-
-        # Handle different vector store return formats by inspecting first element
-        if isinstance(memories_result, (tuple, list)) and len(memories_result) > 0:
-            first_element = memories_result[0]
-
-            # If first element is a container, unwrap one level
-            if isinstance(first_element, (list, tuple)):
-                actual_memories = first_element
-            else:
-                # First element is a memory object, structure is already flat
-                actual_memories = memories_result
-        else:
-            actual_memories = memories_result
+        actual_memories = _listed_memories(self.vector_store.list(filters=filters, limit=limit))
 
         promoted_payload_keys = [
             "user_id",
@@ -829,19 +1199,49 @@ class Memory(MemoryBase):
             },
         )
 
+        cache_key = None
+        if self.search_cache is not None:
+            cache_key = self.search_cache.key(
+                "search", query, effective_filters, limit=limit, threshold=threshold, rerank=rerank
+            )
+            found, cached = self.search_cache.get(cache_key) if cache_key else (False, None)
+            if found:
+                return cached
+
+        hybrid = self.lexical_index is not None and lexical_filters_supported(effective_filters)
+        search_limit = max(limit, self.hybrid_search.candidates) if hybrid else limit
+        if hybrid:
+            self._ensure_lexical_index_backfilled()
+
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._search_vector_store, query, effective_filters, limit, threshold)
+            future_memories = executor.submit(
+                self._search_vector_store, query, effective_filters, search_limit, threshold
+            )
+            future_lexical = (
+                executor.submit(self.lexical_index.search, query, effective_filters, search_limit) if hybrid else None
+            )
             future_graph_entities = (
                 executor.submit(self.graph.search, query, effective_filters, limit) if self.enable_graph else None
             )
 
             concurrent.futures.wait(
-                [future_memories, future_graph_entities] if future_graph_entities else [future_memories]
+                [future for future in (future_memories, future_lexical, future_graph_entities) if future]
             )
 
             original_memories = future_memories.result()
             graph_entities = future_graph_entities.result() if future_graph_entities else None
 
+        if hybrid:
+            original_memories = _fuse_search_results(
+                self.vector_store,
+                original_memories,
+                future_lexical.result(),
+                effective_filters,
+                limit,
+                self.hybrid_search.rrf_k,
+                threshold,
+            )
+
         # Apply reranking if enabled and reranker is available
         if rerank and self.reranker and original_memories:
             try:
@@ -850,10 +1250,13 @@ class Memory(MemoryBase):
             except Exception as e:
                 logger.warning(f"Reranking failed, using original results: {e}")
 
+        result = {"results": original_memories}
         if self.enable_graph:
-            return {"results": original_memories, "relations": graph_entities}
+            result["relations"] = graph_entities
 
-        return {"results": original_memories}
+        if cache_key is not None:
+            self.search_cache.set(cache_key, result)
+        return result
 
     def _process_metadata_filters(self, metadata_filters: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -951,6 +1354,17 @@ class Memory(MemoryBase):
                 return True
         return False
 
+    def _ensure_lexical_index_backfilled(self):
+        """Backfill the BM25 index from the vector store once, before the first hybrid search."""
+        with self._lexical_index_backfill_lock:
+            if self._lexical_index_backfilled:
+                return
+            try:
+                _backfill_lexical_index(self.vector_store, self.lexical_index, self.hybrid_search.backfill_limit)
+            except Exception as e:
+                logger.warning(f"Failed to backfill the BM25 index from the vector store: {e}")
+            self._lexical_index_backfilled = True
+
     def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
         embeddings = self.embedding_model.embed(query, "search")
         memories = self.vector_store.search(query=query, vectors=embeddings, limit=limit, filters=filters)
@@ -1022,6 +1436,29 @@ class Memory(MemoryBase):
         self._delete_memory(memory_id)
         return {"message": "Memory deleted successfully!"}
 
+    def delete_many(self, memory_ids: List[str], batch_size: int = 500) -> List[str]:
+        """
+        Delete memories by ID, fetching and removing each batch with one request when the vector store supports it.
+
+        Every deleted memory gets the same history entry, hash and cache bookkeeping as `delete`.
+
+        Args:
+            memory_ids (list): IDs of the memories to delete.
+            batch_size (int): Maximum number of memories removed per vector store request.
+
+        Returns:
+            list: IDs of the memories that could not be deleted.
+        """
+        memory_ids = [str(memory_id) for memory_id in memory_ids]
+        capture_event("mem0.delete_many", self, {"count": len(memory_ids), "sync_type": "sync"})
+        failed = []
+        for start in range(0, len(memory_ids), batch_size):
+            existing_memories = _get_vectors(self.vector_store, memory_ids[start:start + batch_size], failed)
+            deleted = _delete_vectors(self.vector_store, list(existing_memories), failed)
+            for memory_id in deleted:
+                self._record_deletion(memory_id, existing_memories[memory_id])
+        return failed
+
     def delete_all(self, user_id: Optional[str] = None, agent_id: Optional[str] = None, run_id: Optional[str] = None):
         """
         Delete all memories.
@@ -1051,6 +1488,12 @@ class Memory(MemoryBase):
         for memory in memories:
             self._delete_memory(memory.id)
         self.vector_store.reset()
+        # The reset dropped the memories of every scope
+        self.db.reset_memory_hashes(self.collection_scope)
+        if self.search_cache is not None:
+            self.search_cache.clear()
+        if self.lexical_index is not None:
+            self.lexical_index.clear()
 
         logger.info(f"Deleted {len(memories)} memories")
 
@@ -1089,6 +1532,11 @@ class Memory(MemoryBase):
             ids=[memory_id],
             payloads=[metadata],
         )
+        _index_memory_hash(self, memory_id, metadata)
+        if self.search_cache is not None:
+            self.search_cache.invalidate(metadata)
+        if self.lexical_index is not None:
+            self.lexical_index.upsert(memory_id, data, metadata)
         self.db.add_history(
             memory_id,
             None,
@@ -1179,6 +1627,11 @@ class Memory(MemoryBase):
             vector=embeddings,
             payload=new_metadata,
         )
+        _index_memory_hash(self, memory_id, new_metadata)
+        if self.search_cache is not None:
+            self.search_cache.invalidate(existing_memory.payload, new_metadata)
+        if self.lexical_index is not None:
+            self.lexical_index.upsert(memory_id, data, new_metadata)
         logger.info(f"Updating memory with ID {memory_id=} with {data=}")
 
         self.db.add_history(
@@ -1196,8 +1649,17 @@ class Memory(MemoryBase):
     def _delete_memory(self, memory_id):
         logger.info(f"Deleting memory with {memory_id=}")
         existing_memory = self.vector_store.get(vector_id=memory_id)
-        prev_value = existing_memory.payload.get("data", "")
         self.vector_store.delete(vector_id=memory_id)
+        self._record_deletion(memory_id, existing_memory)
+        return memory_id
+
+    def _record_deletion(self, memory_id, existing_memory):
+        prev_value = existing_memory.payload.get("data", "")
+        self.db.delete_memory_hash(memory_id, collection=self.collection_scope)
+        if self.search_cache is not None:
+            self.search_cache.invalidate(existing_memory.payload)
+        if self.lexical_index is not None:
+            self.lexical_index.delete(memory_id)
         self.db.add_history(
             memory_id,
             prev_value,
@@ -1207,7 +1669,6 @@ class Memory(MemoryBase):
             role=existing_memory.payload.get("role"),
             is_deleted=1,
         )
-        return memory_id
 
     def reset(self):
         """
@@ -1220,6 +1681,7 @@ class Memory(MemoryBase):
 
         if hasattr(self.db, "connection") and self.db.connection:
             self.db.connection.execute("DROP TABLE IF EXISTS history")
+            self.db.reset_memory_hashes(self.collection_scope)
             self.db.connection.close()
 
         self.db = SQLiteManager(self.config.history_db_path)
@@ -1232,6 +1694,10 @@ class Memory(MemoryBase):
             self.vector_store = VectorStoreFactory.create(
                 self.config.vector_store.provider, self.config.vector_store.config
             )
+        if self.search_cache is not None:
+            self.search_cache.clear()
+        if self.lexical_index is not None:
+            self.lexical_index.clear()
         capture_event("mem0.reset", self, {"sync_type": "sync"})
 
     def chat(self, query):
@@ -1250,9 +1716,10 @@ class AsyncMemory(MemoryBase):
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
-        self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
+        self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config, cache=self.config.llm.cache)
         self.db = SQLiteManager(self.config.history_db_path)
         self.collection_name = self.config.vector_store.config.collection_name
+        self.collection_scope = _collection_scope(self.config)
         self.api_version = self.config.version
         
         # Initialize reranker if configured
@@ -1263,6 +1730,30 @@ class AsyncMemory(MemoryBase):
                 config.reranker.config
             )
 
+        self._add_coalescer = None
+        if self.config.add_coalescing:
+            self._add_coalescer = AsyncAddCoalescer(
+                self.config.add_coalescing.window, self.config.add_coalescing.max_batch_size
+            )
+
+        self.extraction_gate = None
+        if self.config.extraction_gate:
+            self.extraction_gate = ExtractionGate.from_config(self.config.extraction_gate, self.embedding_model)
+        self.streaming_extraction = self.config.streaming_extraction
+        self.search_cache = (
+            create_search_cache(self.config.search_cache, namespace=self.collection_scope)
+            if self.config.search_cache
+            else None
+        )
+        self.hybrid_search = self.config.hybrid_search
+        self.lexical_index = None
+        if self.hybrid_search:
+            self.lexical_index = create_lexical_index(
+                self.hybrid_search, self.config.history_db_path, collection=self.collection_scope
+            )
+        self._lexical_index_backfilled = False
+        self._lexical_index_backfill_lock = threading.Lock()
+
         self.enable_graph = False
 
         if self.config.graph_store.config:
@@ -1356,7 +1847,8 @@ class AsyncMemory(MemoryBase):
             prompt (str, optional): Prompt to use for the memory creation. Defaults to None.
             llm (BaseChatModel, optional): LLM class to use for generating procedural memories. Defaults to None. Useful when user is using LangChain ChatModel.
         Returns:
-            dict: A dictionary containing the result of the memory addition operation.
+            dict: A dictionary containing the result of the memory addition operation. With `add_coalescing`
+                configured, concurrent adds of the same session ids return the result of their merged add cycle.
         """
         processed_metadata, effective_filters = _build_filters_and_metadata(
             user_id=user_id, agent_id=agent_id, run_id=run_id, input_metadata=metadata
@@ -1387,6 +1879,16 @@ class AsyncMemory(MemoryBase):
             )
             return results
 
+        if self._add_coalescer is not None:
+            return await self._add_coalescer.submit(
+                _session_scope(user_id, agent_id, run_id),
+                _coalescing_key(processed_metadata, infer),
+                messages,
+                lambda merged: self._add_messages(merged, processed_metadata, effective_filters, infer),
+            )
+        return await self._add_messages(messages, processed_metadata, effective_filters, infer)
+
+    async def _add_messages(self, messages, processed_metadata, effective_filters, infer):
         if self.config.llm.config.get("enable_vision"):
             messages = parse_vision_messages(messages, self.llm, self.config.llm.config.get("vision_details"))
         else:
@@ -1450,6 +1952,11 @@ class AsyncMemory(MemoryBase):
                 )
             return returned_memories
 
+        if self.extraction_gate is not None and not await asyncio.to_thread(
+            self.extraction_gate.should_extract, messages
+        ):
+            return []
+
         parsed_messages = parse_messages(messages)
         if self.config.custom_fact_extraction_prompt:
             system_prompt = self.config.custom_fact_extraction_prompt
@@ -1459,30 +1966,7 @@ class AsyncMemory(MemoryBase):
             # and role types in messages
             is_agent_memory = self._should_use_agent_memory_extraction(messages, metadata)
             system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages, is_agent_memory)
-
-        response = await asyncio.to_thread(
-            self.llm.generate_response,
-            messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
-            response_format={"type": "json_object"},
-        )
-        try:
-            response = remove_code_blocks(response)
-            if not response.strip():
-                new_retrieved_facts = []
-            else:
-                try:
-                    # First try direct JSON parsing
-                    new_retrieved_facts = json.loads(response)["facts"]
-                except json.JSONDecodeError:
-                    # Try extracting JSON from response using built-in function
-                    extracted_json = extract_json(response)
-                    new_retrieved_facts = json.loads(extracted_json)["facts"]
-        except Exception as e:
-            logger.error(f"Error in new_retrieved_facts: {e}")
-            new_retrieved_facts = []
-
-        if not new_retrieved_facts:
-            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
+        extraction_messages = [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}]
 
         retrieved_old_memory = []
         new_message_embeddings = {}
@@ -1496,22 +1980,53 @@ class AsyncMemory(MemoryBase):
         if effective_filters.get("run_id"):
             search_filters["run_id"] = effective_filters["run_id"]
 
-        async def process_fact_for_search(new_mem_content):
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, new_mem_content, "add")
-            new_message_embeddings[new_mem_content] = embeddings
-            existing_mems = await asyncio.to_thread(
-                self.vector_store.search,
-                query=new_mem_content,
-                vectors=embeddings,
-                limit=5,
-                filters=search_filters,
+        if self.streaming_extraction:
+            # Embed and search each fact while the LLM is still generating the next ones
+            extracted_facts, fact_searches, facts_parsed = await asyncio.to_thread(
+                _stream_facts,
+                self.llm,
+                extraction_messages,
+                lambda fact: _search_fact(self, fact, search_filters, skip_stored=True),
             )
-            return [{"id": mem.id, "text": mem.payload.get("data", "")} for mem in existing_mems]
+            new_retrieved_facts = [fact for fact in extracted_facts if fact_searches[fact] is not None]
+            for fact in new_retrieved_facts:
+                embeddings, existing_mems = fact_searches[fact]
+                new_message_embeddings[fact] = embeddings
+                for mem in existing_mems:
+                    retrieved_old_memory.append({"id": mem.id, "text": mem.payload.get("data", "")})
+        else:
+            response = await asyncio.to_thread(
+                self.llm.generate_response,
+                messages=extraction_messages,
+                response_format={"type": "json_object"},
+            )
+            extracted_facts = _parse_facts(response)
+            facts_parsed = extracted_facts is not None
+            extracted_facts = extracted_facts or []
+            new_retrieved_facts = await asyncio.to_thread(_drop_stored_facts, self, extracted_facts, search_filters)
+
+            async def process_fact_for_search(new_mem_content):
+                embeddings = await asyncio.to_thread(self.embedding_model.embed, new_mem_content, "add")
+                new_message_embeddings[new_mem_content] = embeddings
+                existing_mems = await asyncio.to_thread(
+                    self.vector_store.search,
+                    query=new_mem_content,
+                    vectors=embeddings,
+                    limit=5,
+                    filters=search_filters,
+                )
+                return [{"id": mem.id, "text": mem.payload.get("data", "")} for mem in existing_mems]
 
-        search_tasks = [process_fact_for_search(fact) for fact in new_retrieved_facts]
-        search_results_list = await asyncio.gather(*search_tasks)
-        for result_group in search_results_list:
-            retrieved_old_memory.extend(result_group)
+            search_tasks = [process_fact_for_search(fact) for fact in new_retrieved_facts]
+            search_results_list = await asyncio.gather(*search_tasks)
+            for result_group in search_results_list:
+                retrieved_old_memory.extend(result_group)
+
+        # A failed extraction, e.g. malformed JSON, says nothing about whether the messages hold facts
+        if facts_parsed and not extracted_facts and self.extraction_gate is not None:
+            await asyncio.to_thread(self.extraction_gate.record_no_facts, messages)
+        if not new_retrieved_facts:
+            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
 
         unique_data = {}
         for item in retrieved_old_memory:
@@ -1523,7 +2038,11 @@ class AsyncMemory(MemoryBase):
             temp_uuid_mapping[str(idx)] = item["id"]
             retrieved_old_memory[idx]["id"] = str(idx)
 
-        if new_retrieved_facts:
+        if new_retrieved_facts and not retrieved_old_memory:
+            # Nothing to update or delete, every fact is added
+            logger.debug("No existing memories found. Skipping memory update LLM call.")
+            new_memories_with_actions = {"memory": [{"text": fact, "event": "ADD"} for fact in new_retrieved_facts]}
+        elif new_retrieved_facts:
             function_calling_prompt = get_update_memory_messages(
                 retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
             )
@@ -1602,6 +2121,19 @@ class AsyncMemory(MemoryBase):
                                     vector=None,  # Keep same embeddings
                                     payload=updated_metadata,
                                 )
+                                if updated_metadata.get("hash"):
+                                    await asyncio.to_thread(_index_memory_hash, self, mem_id, updated_metadata)
+                                if self.search_cache is not None:
+                                    await asyncio.to_thread(
+                                        self.search_cache.invalidate, existing_memory.payload, updated_metadata
+                                    )
+                                if self.lexical_index is not None:
+                                    await asyncio.to_thread(
+                                        self.lexical_index.upsert,
+                                        mem_id,
+                                        updated_metadata.get("data", ""),
+                                        updated_metadata,
+                                    )
                                 logger.info(f"Updated session IDs for memory {mem_id} (async)")
 
                             task = asyncio.create_task(update_session_ids(memory_id, metadata))
@@ -1648,6 +2180,8 @@ class AsyncMemory(MemoryBase):
 
             data = "\n".join([msg["content"] for msg in messages if "content" in msg and msg["role"] != "system"])
             added_entities = await asyncio.to_thread(self.graph.add, data, filters)
+            if self.search_cache is not None:
+                await asyncio.to_thread(self.search_cache.invalidate, filters)
 
         return added_entities
 
@@ -1737,6 +2271,13 @@ class AsyncMemory(MemoryBase):
             "mem0.get_all", self, {"limit": limit, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"}
         )
 
+        cache_key = None
+        if self.search_cache is not None:
+            cache_key = await asyncio.to_thread(self.search_cache.key, "get_all", None, effective_filters, limit=limit)
+            found, cached = await asyncio.to_thread(self.search_cache.get, cache_key) if cache_key else (False, None)
+            if found:
+                return cached
+
         vector_store_task = asyncio.create_task(self._get_all_from_vector_store(effective_filters, limit))
 
         graph_task = None
@@ -1755,23 +2296,13 @@ class AsyncMemory(MemoryBase):
         else:
             results_dict.update({"results": await vector_store_task})
 
+        if cache_key is not None:
+            await asyncio.to_thread(self.search_cache.set, cache_key, results_dict)
         return results_dict
 
     async def _get_all_from_vector_store(self, filters, limit):
         memories_result = await asyncio.to_thread(self.vector_store.list, filters=filters, limit=limit)
-
-        # Handle different vector store return formats by inspecting first element
-        if isinstance(memories_result, (tuple, list)) and len(memories_result) > 0:
-            first_element = memories_result[0]
-
-            # If first element is a container, unwrap one level
-            if isinstance(first_element, (list, tuple)):
-                actual_memories = first_element
-            else:
-                # First element is a memory object, structure is already flat
-                actual_memories = memories_result
-        else:
-            actual_memories = memories_result
+        actual_memories = _listed_memories(memories_result)
 
         promoted_payload_keys = [
             "user_id",
@@ -1880,7 +2411,34 @@ class AsyncMemory(MemoryBase):
             },
         )
 
-        vector_store_task = asyncio.create_task(self._search_vector_store(query, effective_filters, limit, threshold))
+        cache_key = None
+        if self.search_cache is not None:
+            cache_key = await asyncio.to_thread(
+                self.search_cache.key,
+                "search",
+                query,
+                effective_filters,
+                limit=limit,
+                threshold=threshold,
+                rerank=rerank,
+            )
+            found, cached = await asyncio.to_thread(self.search_cache.get, cache_key) if cache_key else (False, None)
+            if found:
+                return cached
+
+        hybrid = self.lexical_index is not None and lexical_filters_supported(effective_filters)
+        search_limit = max(limit, self.hybrid_search.candidates) if hybrid else limit
+        if hybrid:
+            await asyncio.to_thread(self._ensure_lexical_index_backfilled)
+
+        vector_store_task = asyncio.create_task(
+            self._search_vector_store(query, effective_filters, search_limit, threshold)
+        )
+        lexical_task = None
+        if hybrid:
+            lexical_task = asyncio.create_task(
+                asyncio.to_thread(self.lexical_index.search, query, effective_filters, search_limit)
+            )
 
         graph_task = None
         if self.enable_graph:
@@ -1895,6 +2453,18 @@ class AsyncMemory(MemoryBase):
             original_memories = await vector_store_task
             graph_entities = None
 
+        if lexical_task:
+            original_memories = await asyncio.to_thread(
+                _fuse_search_results,
+                self.vector_store,
+                original_memories,
+                await lexical_task,
+                effective_filters,
+                limit,
+                self.hybrid_search.rrf_k,
+                threshold,
+            )
+
         # Apply reranking if enabled and reranker is available
         if rerank and self.reranker and original_memories:
             try:
@@ -1906,10 +2476,13 @@ class AsyncMemory(MemoryBase):
             except Exception as e:
                 logger.warning(f"Reranking failed, using original results: {e}")
 
+        result = {"results": original_memories}
         if self.enable_graph:
-            return {"results": original_memories, "relations": graph_entities}
+            result["relations"] = graph_entities
 
-        return {"results": original_memories}
+        if cache_key is not None:
+            await asyncio.to_thread(self.search_cache.set, cache_key, result)
+        return result
 
     def _process_metadata_filters(self, metadata_filters: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -2007,6 +2580,17 @@ class AsyncMemory(MemoryBase):
                 return True
         return False
 
+    def _ensure_lexical_index_backfilled(self):
+        """Backfill the BM25 index from the vector store once, before the first hybrid search."""
+        with self._lexical_index_backfill_lock:
+            if self._lexical_index_backfilled:
+                return
+            try:
+                _backfill_lexical_index(self.vector_store, self.lexical_index, self.hybrid_search.backfill_limit)
+            except Exception as e:
+                logger.warning(f"Failed to backfill the BM25 index from the vector store: {e}")
+            self._lexical_index_backfilled = True
+
     async def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
         embeddings = await asyncio.to_thread(self.embedding_model.embed, query, "search")
         memories = await asyncio.to_thread(
@@ -2081,6 +2665,32 @@ class AsyncMemory(MemoryBase):
         await self._delete_memory(memory_id)
         return {"message": "Memory deleted successfully!"}
 
+    async def delete_many(self, memory_ids: List[str], batch_size: int = 500) -> List[str]:
+        """
+        Delete memories by ID asynchronously, removing each batch with one request when the vector store
+        supports it.
+
+        Every deleted memory gets the same history entry, hash and cache bookkeeping as `delete`.
+
+        Args:
+            memory_ids (list): IDs of the memories to delete.
+            batch_size (int): Maximum number of memories removed per vector store request.
+
+        Returns:
+            list: IDs of the memories that could not be deleted.
+        """
+        memory_ids = [str(memory_id) for memory_id in memory_ids]
+        capture_event("mem0.delete_many", self, {"count": len(memory_ids), "sync_type": "async"})
+        failed = []
+        for start in range(0, len(memory_ids), batch_size):
+            existing_memories = await asyncio.to_thread(
+                _get_vectors, self.vector_store, memory_ids[start:start + batch_size], failed
+            )
+            deleted = await asyncio.to_thread(_delete_vectors, self.vector_store, list(existing_memories), failed)
+            for memory_id in deleted:
+                await self._record_deletion(memory_id, existing_memories[memory_id])
+        return failed
+
     async def delete_all(self, user_id=None, agent_id=None, run_id=None):
         """
         Delete all memories asynchronously.
@@ -2117,6 +2727,8 @@ class AsyncMemory(MemoryBase):
 
         if self.enable_graph:
             await asyncio.to_thread(self.graph.delete_all, filters)
+            if self.search_cache is not None:
+                await asyncio.to_thread(self.search_cache.invalidate, filters)
 
         return {"message": "Memories deleted successfully!"}
 
@@ -2152,6 +2764,11 @@ class AsyncMemory(MemoryBase):
             ids=[memory_id],
             payloads=[metadata],
         )
+        await asyncio.to_thread(_index_memory_hash, self, memory_id, metadata)
+        if self.search_cache is not None:
+            await asyncio.to_thread(self.search_cache.invalidate, metadata)
+        if self.lexical_index is not None:
+            await asyncio.to_thread(self.lexical_index.upsert, memory_id, data, metadata)
 
         await asyncio.to_thread(
             self.db.add_history,
@@ -2261,6 +2878,11 @@ class AsyncMemory(MemoryBase):
             vector=embeddings,
             payload=new_metadata,
         )
+        await asyncio.to_thread(_index_memory_hash, self, memory_id, new_metadata)
+        if self.search_cache is not None:
+            await asyncio.to_thread(self.search_cache.invalidate, existing_memory.payload, new_metadata)
+        if self.lexical_index is not None:
+            await asyncio.to_thread(self.lexical_index.upsert, memory_id, data, new_metadata)
         logger.info(f"Updating memory with ID {memory_id=} with {data=}")
 
         await asyncio.to_thread(
@@ -2279,9 +2901,17 @@ class AsyncMemory(MemoryBase):
     async def _delete_memory(self, memory_id):
         logger.info(f"Deleting memory with {memory_id=}")
         existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
-        prev_value = existing_memory.payload.get("data", "")
-
         await asyncio.to_thread(self.vector_store.delete, vector_id=memory_id)
+        await self._record_deletion(memory_id, existing_memory)
+        return memory_id
+
+    async def _record_deletion(self, memory_id, existing_memory):
+        prev_value = existing_memory.payload.get("data", "")
+        await asyncio.to_thread(self.db.delete_memory_hash, memory_id, collection=self.collection_scope)
+        if self.search_cache is not None:
+            await asyncio.to_thread(self.search_cache.invalidate, existing_memory.payload)
+        if self.lexical_index is not None:
+            await asyncio.to_thread(self.lexical_index.delete, memory_id)
         await asyncio.to_thread(
             self.db.add_history,
             memory_id,
@@ -2293,8 +2923,6 @@ class AsyncMemory(MemoryBase):
             is_deleted=1,
         )
 
-        return memory_id
-
     async def reset(self):
         """
         Reset the memory store asynchronously by:
@@ -2312,6 +2940,7 @@ class AsyncMemory(MemoryBase):
 
         if hasattr(self.db, "connection") and self.db.connection:
             await asyncio.to_thread(lambda: self.db.connection.execute("DROP TABLE IF EXISTS history"))
+            await asyncio.to_thread(self.db.reset_memory_hashes, self.collection_scope)
             await asyncio.to_thread(self.db.connection.close)
 
         self.db = SQLiteManager(self.config.history_db_path)
@@ -2319,6 +2948,10 @@ class AsyncMemory(MemoryBase):
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
+        if self.search_cache is not None:
+            await asyncio.to_thread(self.search_cache.clear)
+        if self.lexical_index is not None:
+            await asyncio.to_thread(self.lexical_index.clear)
         capture_event("mem0.reset", self, {"sync_type": "async"})
 
     async def chat(self, query):
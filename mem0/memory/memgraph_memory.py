@@ -1,9 +1,19 @@
 import logging
 
-from mem0.memory.utils import format_entities, sanitize_relationship_for_cypher
+import numpy as np
+
+from mem0.memory.utils import (
+    VECTOR_INDEX_CANDIDATES,
+    format_entities,
+    plan_entity_rows,
+    sanitize_relationship_for_cypher,
+    select_scoped_nodes,
+    split_rows,
+)
 
 try:
     from langchain_memgraph.graphs.memgraph import Memgraph
+    from neo4j import GraphDatabase
 except ImportError:
     raise ImportError("langchain_memgraph is not installed. Please install it using pip install langchain-memgraph")
 
@@ -34,6 +44,11 @@ class MemoryGraph:
             self.config.graph_store.config.username,
             self.config.graph_store.config.password,
         )
+        # Batched writes run several statements in one transaction, which Memgraph.query can't do
+        self.driver = GraphDatabase.driver(
+            self.config.graph_store.config.url,
+            auth=(self.config.graph_store.config.username, self.config.graph_store.config.password),
+        )
         self.embedding_model = EmbedderFactory.create(
             self.config.embedder.provider,
             self.config.embedder.config,
@@ -49,11 +64,14 @@ class MemoryGraph:
 
         # Get LLM config with proper null checks
         llm_config = None
+        llm_cache = None
         if self.config.graph_store and self.config.graph_store.llm and hasattr(self.config.graph_store.llm, "config"):
             llm_config = self.config.graph_store.llm.config
+            llm_cache = getattr(self.config.graph_store.llm, "cache", None)
         elif hasattr(self.config.llm, "config"):
             llm_config = self.config.llm.config
-        self.llm = LlmFactory.create(self.llm_provider, llm_config)
+            llm_cache = getattr(self.config.llm, "cache", None)
+        self.llm = LlmFactory.create(self.llm_provider, llm_config, cache=llm_cache)
         self.user_id = None
         # Use threshold from graph_store config, default to 0.7 for backward compatibility
         self.threshold = self.config.graph_store.threshold if hasattr(self.config.graph_store, 'threshold') else 0.7
@@ -91,7 +109,6 @@ class MemoryGraph:
         search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
         to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
 
-        # TODO: Batch queries with APOC plugin
         # TODO: Add more filter support
         deleted_entities = self._delete_entities(to_be_deleted, filters)
         added_entities = self._add_entities(to_be_added, filters, entity_type_map)
@@ -274,59 +291,42 @@ class MemoryGraph:
         """Search similar nodes among and their respective incoming and outgoing relations."""
         result_relations = []
 
+        # Build node properties for filtering
+        node_props = ["user_id: $user_id"]
+        if filters.get("agent_id"):
+            node_props.append("agent_id: $agent_id")
+        if filters.get("run_id"):
+            node_props.append("run_id: $run_id")
+        node_props_str = ", ".join(node_props)
+
         for node in node_list:
             n_embedding = self.embedding_model.embed(node)
-
-            # Build query based on whether agent_id is provided
+            hits = self._search_similar_nodes(n_embedding, filters, self.threshold)
+            if not hits:
+                continue
+
+            cypher_query = f"""
+            UNWIND $hits AS hit
+            MATCH (n:Entity)
+            WHERE id(n) = hit.id
+            WITH n, hit.similarity AS similarity
+            MATCH (n)-[r]->(m:Entity {{{node_props_str}}})
+            RETURN n.name AS source, id(n) AS source_id, type(r) AS relationship, id(r) AS relation_id, m.name AS destination, id(m) AS destination_id, similarity
+            UNION
+            UNWIND $hits AS hit
+            MATCH (n:Entity)
+            WHERE id(n) = hit.id
+            WITH n, hit.similarity AS similarity
+            MATCH (m:Entity {{{node_props_str}}})-[r]->(n)
+            RETURN m.name AS source, id(m) AS source_id, type(r) AS relationship, id(r) AS relation_id, n.name AS destination, id(n) AS destination_id, similarity
+            ORDER BY similarity DESC
+            LIMIT $limit;
+            """
+            params = {"hits": hits, "user_id": filters["user_id"], "limit": limit}
             if filters.get("agent_id"):
-                cypher_query = """
-                CALL vector_search.search("memzero", $limit, $n_embedding)
-                YIELD distance, node, similarity
-                WITH node AS n, similarity
-                WHERE n:Entity AND n.user_id = $user_id AND n.agent_id = $agent_id AND n.embedding IS NOT NULL AND similarity >= $threshold
-                MATCH (n)-[r]->(m:Entity)
-                RETURN n.name AS source, id(n) AS source_id, type(r) AS relationship, id(r) AS relation_id, m.name AS destination, id(m) AS destination_id, similarity
-                UNION
-                CALL vector_search.search("memzero", $limit, $n_embedding)
-                YIELD distance, node, similarity
-                WITH node AS n, similarity
-                WHERE n:Entity AND n.user_id = $user_id AND n.agent_id = $agent_id AND n.embedding IS NOT NULL AND similarity >= $threshold
-                MATCH (m:Entity)-[r]->(n)
-                RETURN m.name AS source, id(m) AS source_id, type(r) AS relationship, id(r) AS relation_id, n.name AS destination, id(n) AS destination_id, similarity
-                ORDER BY similarity DESC
-                LIMIT $limit;
-                """
-                params = {
-                    "n_embedding": n_embedding,
-                    "threshold": self.threshold,
-                    "user_id": filters["user_id"],
-                    "agent_id": filters["agent_id"],
-                    "limit": limit,
-                }
-            else:
-                cypher_query = """
-                CALL vector_search.search("memzero", $limit, $n_embedding)
-                YIELD distance, node, similarity
-                WITH node AS n, similarity
-                WHERE n:Entity AND n.user_id = $user_id AND n.embedding IS NOT NULL AND similarity >= $threshold
-                MATCH (n)-[r]->(m:Entity)
-                RETURN n.name AS source, id(n) AS source_id, type(r) AS relationship, id(r) AS relation_id, m.name AS destination, id(m) AS destination_id, similarity
-                UNION
-                CALL vector_search.search("memzero", $limit, $n_embedding)
-                YIELD distance, node, similarity
-                WITH node AS n, similarity
-                WHERE n:Entity AND n.user_id = $user_id AND n.embedding IS NOT NULL AND similarity >= $threshold
-                MATCH (m:Entity)-[r]->(n)
-                RETURN m.name AS source, id(m) AS source_id, type(r) AS relationship, id(r) AS relation_id, n.name AS destination, id(n) AS destination_id, similarity
-                ORDER BY similarity DESC
-                LIMIT $limit;
-                """
-                params = {
-                    "n_embedding": n_embedding,
-                    "threshold": self.threshold,
-                    "user_id": filters["user_id"],
-                    "limit": limit,
-                }
+                params["agent_id"] = filters["agent_id"]
+            if filters.get("run_id"):
+                params["run_id"] = filters["run_id"]
 
             ans = self.graph.query(cypher_query, params=params)
             result_relations.extend(ans)
@@ -361,170 +361,135 @@ class MemoryGraph:
         return to_be_deleted
 
     def _delete_entities(self, to_be_deleted, filters):
-        """Delete the entities from the graph."""
+        """Delete the entities from the graph, all relations in one query."""
         user_id = filters["user_id"]
         agent_id = filters.get("agent_id", None)
-        results = []
-
-        for item in to_be_deleted:
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
-
-            # Build the agent filter for the query
-            agent_filter = ""
-            params = {
-                "source_name": source,
-                "dest_name": destination,
-                "user_id": user_id,
-            }
-
-            if agent_id:
-                agent_filter = "AND n.agent_id = $agent_id AND m.agent_id = $agent_id"
-                params["agent_id"] = agent_id
+        if not to_be_deleted:
+            return []
 
-            # Delete the specific relationship between nodes
-            cypher = f"""
-            MATCH (n:Entity {{name: $source_name, user_id: $user_id}})
-            -[r:{relationship}]->
-            (m:Entity {{name: $dest_name, user_id: $user_id}})
-            WHERE 1=1 {agent_filter}
-            DELETE r
-            RETURN 
-                n.name AS source,
-                m.name AS target,
-                type(r) AS relationship
-            """
+        # Build the agent filter for the query
+        agent_filter = ""
+        params = {
+            "rows": [
+                {"row": index, **item}
+                for index, item in enumerate(to_be_deleted)
+                if item not in to_be_deleted[:index]
+            ],
+            "user_id": user_id,
+        }
 
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
+        if agent_id:
+            agent_filter = "AND n.agent_id = $agent_id AND m.agent_id = $agent_id"
+            params["agent_id"] = agent_id
+
+        # Relationship types can't be parameters, so the specific relationship is matched on its type
+        cypher = f"""
+        UNWIND $rows AS row
+        MATCH (n:Entity {{name: row.source, user_id: $user_id}})
+        -[r]->
+        (m:Entity {{name: row.destination, user_id: $user_id}})
+        WHERE type(r) = row.relationship {agent_filter}
+        DELETE r
+        RETURN
+            row.row AS row,
+            n.name AS source,
+            m.name AS target,
+            type(r) AS relationship
+        """
 
-        return results
+        records = self.graph.query(cypher, params=params)
+        return split_rows(records, len(to_be_deleted))
 
     # added Entity label to all nodes for vector search to work
     def _add_entities(self, to_be_added, filters, entity_type_map):
-        """Add the new entities to the graph. Merge the nodes if they already exist."""
+        """
+        Add the new entities to the graph. Merge the nodes if they already exist.
+
+        All entity names are embedded in one batch and looked up in one query, then the relations are
+        upserted with one UNWIND query per relationship type and node labels, in a single transaction.
+        """
         user_id = filters["user_id"]
         agent_id = filters.get("agent_id", None)
-        results = []
+        if not to_be_added:
+            return []
 
-        for item in to_be_added:
-            # entities
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
-
-            # types
-            source_type = entity_type_map.get(source, "__User__")
-            destination_type = entity_type_map.get(destination, "__User__")
-
-            # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
-
-            # search for the nodes with the closest embeddings
-            source_node_search_result = self._search_source_node(source_embedding, filters, threshold=self.threshold)
-            destination_node_search_result = self._search_destination_node(dest_embedding, filters, threshold=self.threshold)
-
-            # Prepare agent_id for node creation
-            agent_id_clause = ""
-            if agent_id:
-                agent_id_clause = ", agent_id: $agent_id"
-
-            # TODO: Create a cypher query and common params for all the cases
-            if not destination_node_search_result and source_node_search_result:
-                cypher = f"""
-                    MATCH (source:Entity)
-                    WHERE id(source) = $source_id
-                    MERGE (destination:{destination_type}:Entity {{name: $destination_name, user_id: $user_id{agent_id_clause}}})
-                    ON CREATE SET
-                        destination.created = timestamp(),
-                        destination.embedding = $destination_embedding,
-                        destination:Entity
-                    MERGE (source)-[r:{relationship}]->(destination)
-                    ON CREATE SET 
-                        r.created = timestamp()
-                    RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                    """
-
-                params = {
-                    "source_id": source_node_search_result[0]["id(source_candidate)"],
-                    "destination_name": destination,
-                    "destination_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-
-            elif destination_node_search_result and not source_node_search_result:
-                cypher = f"""
-                    MATCH (destination:Entity)
-                    WHERE id(destination) = $destination_id
-                    MERGE (source:{source_type}:Entity {{name: $source_name, user_id: $user_id{agent_id_clause}}})
-                    ON CREATE SET
-                        source.created = timestamp(),
-                        source.embedding = $source_embedding,
-                        source:Entity
-                    MERGE (source)-[r:{relationship}]->(destination)
-                    ON CREATE SET 
-                        r.created = timestamp()
-                    RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                    """
-
-                params = {
-                    "destination_id": destination_node_search_result[0]["id(destination_candidate)"],
-                    "source_name": source,
-                    "source_embedding": source_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-
-            elif source_node_search_result and destination_node_search_result:
-                cypher = f"""
-                    MATCH (source:Entity)
-                    WHERE id(source) = $source_id
-                    MATCH (destination:Entity)
-                    WHERE id(destination) = $destination_id
-                    MERGE (source)-[r:{relationship}]->(destination)
-                    ON CREATE SET 
-                        r.created_at = timestamp(),
-                        r.updated_at = timestamp()
-                    RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                    """
-                params = {
-                    "source_id": source_node_search_result[0]["id(source_candidate)"],
-                    "destination_id": destination_node_search_result[0]["id(destination_candidate)"],
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
+        names = list(dict.fromkeys(name for item in to_be_added for name in (item["source"], item["destination"])))
+        embeddings = dict(zip(names, self.embedding_model.embed_batch(names)))
+        node_ids = self._search_nodes(embeddings, filters, threshold=self.threshold)
+        rows = plan_entity_rows(to_be_added, embeddings, node_ids, self.threshold)
 
+        # Prepare agent_id for node creation
+        params = {"user_id": user_id}
+        agent_id_clause = ""
+        if agent_id:
+            agent_id_clause = ", agent_id: $agent_id"
+            params["agent_id"] = agent_id
+
+        # Labels and relationship types can't be parameters, rows sharing them are upserted together
+        groups = {}
+        for row in rows:
+            key = (
+                row["relationship"],
+                entity_type_map.get(row["source"], "__User__"),
+                entity_type_map.get(row["destination"], "__User__"),
+                row["source_id"] is None,
+                row["destination_id"] is None,
+            )
+            groups.setdefault(key, []).append(row)
+
+        statements = []
+        for (relationship, source_type, destination_type, new_source, new_destination), group in groups.items():
+            # Nodes merged together with their relationship have their embedding refreshed
+            refresh_embedding = new_source and new_destination
+            source_clause = self._upsert_node_clause(
+                "source", source_type, new_source, agent_id_clause, refresh_embedding
+            )
+            destination_clause = self._upsert_node_clause(
+                "destination", destination_type, new_destination, agent_id_clause, refresh_embedding
+            )
+            if new_source or new_destination:
+                created_set = "r.created = timestamp()"
             else:
-                cypher = f"""
-                    MERGE (n:{source_type}:Entity {{name: $source_name, user_id: $user_id{agent_id_clause}}})
-                    ON CREATE SET n.created = timestamp(), n.embedding = $source_embedding, n:Entity
-                    ON MATCH SET n.embedding = $source_embedding
-                    MERGE (m:{destination_type}:Entity {{name: $dest_name, user_id: $user_id{agent_id_clause}}})
-                    ON CREATE SET m.created = timestamp(), m.embedding = $dest_embedding, m:Entity
-                    ON MATCH SET m.embedding = $dest_embedding
-                    MERGE (n)-[rel:{relationship}]->(m)
-                    ON CREATE SET rel.created = timestamp()
-                    RETURN n.name AS source, type(rel) AS relationship, m.name AS target
-                    """
-                params = {
-                    "source_name": source,
-                    "dest_name": destination,
-                    "source_embedding": source_embedding,
-                    "dest_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
+                created_set = "r.created_at = timestamp(), r.updated_at = timestamp()"
+            cypher = f"""
+                UNWIND $rows AS row
+                {source_clause}
+                WITH row, source
+                {destination_clause}
+                MERGE (source)-[r:{relationship}]->(destination)
+                ON CREATE SET
+                    {created_set}
+                RETURN row.row AS row, source.name AS source, type(r) AS relationship, destination.name AS target
+                """
+            statements.append((cypher, {**params, "rows": group}))
 
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
-        return results
+        return split_rows(self._execute_write(statements), len(to_be_added))
+
+    def _upsert_node_clause(self, variable, node_type, new, agent_id_clause, refresh_embedding=False):
+        """Cypher clause binding `variable` to the source or destination node of a row, merged by name if new."""
+        if not new:
+            return f"""
+                MATCH ({variable}:Entity)
+                WHERE id({variable}) = row.{variable}_id
+            """
+        on_match = f"ON MATCH SET {variable}.embedding = row.{variable}_embedding" if refresh_embedding else ""
+        return f"""
+                MERGE ({variable}:{node_type}:Entity {{name: row.{variable}, user_id: $user_id{agent_id_clause}}})
+                ON CREATE SET
+                    {variable}.created = timestamp(),
+                    {variable}.embedding = row.{variable}_embedding,
+                    {variable}:Entity
+                {on_match}
+            """
+
+    def _execute_write(self, statements):
+        """Run (cypher, params) statements in one write transaction and return all their records."""
+
+        def work(tx):
+            return [record.data() for cypher, params in statements for record in tx.run(cypher, params)]
+
+        with self.driver.session() as session:
+            return session.execute_write(work)
 
     def _remove_spaces_from_entities(self, entity_list):
         for item in entity_list:
@@ -534,84 +499,129 @@ class MemoryGraph:
             item["destination"] = item["destination"].lower().replace(" ", "_")
         return entity_list
 
-    def _search_source_node(self, source_embedding, filters, threshold=0.9):
-        """Search for source nodes with similar embeddings."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
+    def _search_nodes(self, embeddings, filters, threshold):
+        """
+        Find the existing node most similar to each entity, looking all entities up in one query.
 
-        if agent_id:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $source_embedding) 
-                YIELD distance, node, similarity
-                WITH node AS source_candidate, similarity
-                WHERE source_candidate.user_id = $user_id 
-                AND source_candidate.agent_id = $agent_id 
-                AND similarity >= $threshold
-                RETURN id(source_candidate);
-                """
-            params = {
-                "source_embedding": source_embedding,
-                "user_id": user_id,
-                "agent_id": agent_id,
-                "threshold": threshold,
-            }
-        else:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $source_embedding) 
-                YIELD distance, node, similarity
-                WITH node AS source_candidate, similarity
-                WHERE source_candidate.user_id = $user_id 
-                AND similarity >= $threshold
-                RETURN id(source_candidate);
-                """
-            params = {
-                "source_embedding": source_embedding,
-                "user_id": user_id,
-                "threshold": threshold,
-            }
+        Entities the vector index can't answer for are compared together with the scope's nodes.
 
-        result = self.graph.query(cypher, params=params)
-        return result
+        Args:
+            embeddings (dict): Embedding of every entity name.
+            filters (dict): The user_id, agent_id and run_id of the nodes.
+            threshold (float): Minimum similarity of a match.
 
-    def _search_destination_node(self, destination_embedding, filters, threshold=0.9):
-        """Search for destination nodes with similar embeddings."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
+        Returns:
+            dict: Id of the matched node, for the names that matched one.
+        """
+        scope_conditions = ["node.user_id = $user_id"]
+        params = {
+            "k": VECTOR_INDEX_CANDIDATES,
+            "entities": [{"name": name, "embedding": embedding} for name, embedding in embeddings.items()],
+            "user_id": filters["user_id"],
+        }
+        if filters.get("agent_id"):
+            scope_conditions.append("node.agent_id = $agent_id")
+            params["agent_id"] = filters["agent_id"]
+        if filters.get("run_id"):
+            scope_conditions.append("node.run_id = $run_id")
+            params["run_id"] = filters["run_id"]
+
+        cypher = f"""
+            UNWIND $entities AS entity
+            CALL vector_search.search("memzero", $k, entity.embedding)
+            YIELD node, similarity
+            RETURN entity.name AS name, id(node) AS id, similarity,
+                coalesce({" AND ".join(scope_conditions)}, false) AS in_scope
+            ORDER BY similarity DESC;
+            """
+        candidates = self.graph.query(cypher, params=params)
+
+        node_ids = {}
+        to_scan = []
+        for name in embeddings:
+            hits = select_scoped_nodes(
+                [candidate for candidate in candidates if candidate["name"] == name],
+                threshold,
+                VECTOR_INDEX_CANDIDATES,
+                limit=1,
+            )
+            if hits is None:
+                to_scan.append(name)
+            elif hits:
+                node_ids[name] = hits[0]["id"]
 
-        if agent_id:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $destination_embedding) 
-                YIELD distance, node, similarity
-                WITH node AS destination_candidate, similarity
-                WHERE node.user_id = $user_id 
-                AND node.agent_id = $agent_id 
-                AND similarity >= $threshold
-                RETURN id(destination_candidate);
-                """
-            params = {
-                "destination_embedding": destination_embedding,
-                "user_id": user_id,
-                "agent_id": agent_id,
-                "threshold": threshold,
-            }
-        else:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $destination_embedding) 
-                YIELD distance, node, similarity
-                WITH node AS destination_candidate, similarity
-                WHERE node.user_id = $user_id 
-                AND similarity >= $threshold
-                RETURN id(destination_candidate);
-                """
-            params = {
-                "destination_embedding": destination_embedding,
-                "user_id": user_id,
-                "threshold": threshold,
-            }
+        if to_scan:
+            scanned = self._scan_similar_nodes([embeddings[name] for name in to_scan], filters, threshold, limit=1)
+            node_ids.update({name: hits[0]["id"] for name, hits in zip(to_scan, scanned) if hits})
+        return node_ids
+
+    def _search_similar_nodes(self, embedding, filters, threshold, limit=None):
+        """
+        Find the entity nodes in the scope most similar to an embedding.
 
-        result = self.graph.query(cypher, params=params)
-        return result
+        The "memzero" vector index searches all users, so its nearest candidates are post-filtered
+        by scope. When they can't answer the query the scope's nodes are scanned instead.
 
+        Returns:
+            list: Dicts with the node "id" and "similarity", most similar first.
+        """
+        scope_conditions = ["node.user_id = $user_id"]
+        params = {"k": VECTOR_INDEX_CANDIDATES, "embedding": embedding, "user_id": filters["user_id"]}
+        if filters.get("agent_id"):
+            scope_conditions.append("node.agent_id = $agent_id")
+            params["agent_id"] = filters["agent_id"]
+        if filters.get("run_id"):
+            scope_conditions.append("node.run_id = $run_id")
+            params["run_id"] = filters["run_id"]
+
+        cypher = f"""
+            CALL vector_search.search("memzero", $k, $embedding)
+            YIELD node, similarity
+            RETURN id(node) AS id, similarity, coalesce({" AND ".join(scope_conditions)}, false) AS in_scope
+            ORDER BY similarity DESC;
+            """
+        hits = select_scoped_nodes(self.graph.query(cypher, params=params), threshold, VECTOR_INDEX_CANDIDATES, limit)
+        if hits is None:
+            hits = self._scan_similar_nodes([embedding], filters, threshold, limit)[0]
+        return [{"id": hit["id"], "similarity": hit["similarity"]} for hit in hits]
+
+    def _scan_similar_nodes(self, embeddings, filters, threshold, limit=None):
+        """Compare embeddings with every entity node of the scope, fetching the scope's nodes once."""
+        node_props = ["user_id: $user_id"]
+        params = {"user_id": filters["user_id"]}
+        if filters.get("agent_id"):
+            node_props.append("agent_id: $agent_id")
+            params["agent_id"] = filters["agent_id"]
+        if filters.get("run_id"):
+            node_props.append("run_id: $run_id")
+            params["run_id"] = filters["run_id"]
+        node_props_str = ", ".join(node_props)
+
+        rows = self.graph.query(
+            f"""
+            MATCH (n:Entity {{{node_props_str}}})
+            WHERE n.embedding IS NOT NULL
+            RETURN id(n) AS id, n.embedding AS embedding;
+            """,
+            params=params,
+        )
+        if not rows:
+            return [[] for _ in embeddings]
+
+        node_embeddings = np.array([row["embedding"] for row in rows], dtype=np.float32)
+        node_norms = np.linalg.norm(node_embeddings, axis=1)
+        results = []
+        for embedding in embeddings:
+            query = np.asarray(embedding, dtype=np.float32)
+            norms = node_norms * np.linalg.norm(query)
+            similarities = node_embeddings @ query / np.where(norms == 0, 1, norms)
+            hits = [
+                {"id": rows[i]["id"], "similarity": float(similarities[i])}
+                for i in np.argsort(-similarities)
+                if similarities[i] >= threshold
+            ]
+            results.append(hits[:limit] if limit else hits)
+        return results
 
     def _vector_index_exists(self, index_info, index_name):
         """
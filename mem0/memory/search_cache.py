@@ -0,0 +1,234 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SESSION_ID_KEYS = ("user_id", "agent_id", "run_id")
+
+# Bumped by `clear`, so every entry written before it is unreachable
+_EPOCH = "__epoch__"
+
+
+def session_scopes(payload: Dict[str, Any]) -> List[str]:
+    """
+    The scopes a memory or query belongs to, one per plain session id it holds.
+
+    A search only returns memories holding every plain session id of its filters, so any write it could
+    see bumps the version of at least one of its scopes.
+    """
+    return [
+        f"{key}={payload[key]}"
+        for key in SESSION_ID_KEYS
+        if isinstance(payload.get(key), (str, int)) and not isinstance(payload.get(key), bool)
+    ]
+
+
+class SearchCache:
+    """
+    Caches the results of `search` and `get_all`, invalidated by per-scope write versions.
+
+    Every key embeds the current write version of the scopes of its filters. Writes bump the version of
+    the scopes of the memories they touch, so results computed before a write are never served after it;
+    they just age out of the bounded LRU or expire after `ttl` seconds.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = 300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def versions(self, scopes: List[str]) -> Optional[List[int]]:
+        """Write versions of the scopes, after the epoch. None when they can't be read."""
+        with self._lock:
+            return [self._versions.get(scope, 0) for scope in [_EPOCH, *scopes]]
+
+    def bump(self, scopes: List[str]) -> None:
+        with self._lock:
+            for scope in scopes:
+                self._versions[scope] = self._versions.get(scope, 0) + 1
+
+    def invalidate(self, *payloads: Dict[str, Any]) -> None:
+        """Bump the write version of the scopes of the given memory payloads."""
+        scopes = sorted({scope for payload in payloads if payload for scope in session_scopes(payload)})
+        if scopes:
+            self.bump(scopes)
+
+    def key(self, kind: str, query: Optional[str], filters: Dict[str, Any], **params) -> Optional[str]:
+        """
+        Cache key of a search or get_all call, including the write versions of its scopes.
+
+        Queries are compared after collapsing whitespace and case. Returns None when the filters hold no
+        plain session id, e.g. only operators, as no write version covers such a call, or when the write
+        versions can't be read.
+        """
+        scopes = session_scopes(filters)
+        if not scopes:
+            return None
+        versions = self.versions(scopes)
+        if versions is None:
+            return None
+        normalized_query = " ".join(query.split()).lower() if query is not None else None
+        payload = {
+            "kind": kind,
+            "query": normalized_query,
+            "filters": filters,
+            "params": params,
+            "versions": versions,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _read(self, key: str) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        value, expires_at = entry
+        if expires_at is not None and time.monotonic() > expires_at:
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            found, value = self._read(key)
+            if found:
+                self._hits += 1
+                return True, deepcopy(value)
+            self._misses += 1
+            return False, None
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (deepcopy(value), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached result, e.g. after a reset."""
+        with self._lock:
+            self._entries.clear()
+            self._versions[_EPOCH] = self._versions.get(_EPOCH, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit and miss counts of the cache since it was created.
+
+        Returns:
+            dict: "hits", "misses", "hit_rate" and the number of results held under "size".
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+            }
+
+
+class RedisSearchCache(SearchCache):
+    """
+    `SearchCache` shared through Redis by every process using the same `key_prefix` and `namespace`.
+
+    Write versions are Redis counters, so a write in one process invalidates the results cached by the
+    others. Results expire after `ttl` seconds; bound the memory used with the eviction policy of the
+    Redis server. Memories on different collections sharing a Redis server keep their results and write
+    versions apart through their `namespace`.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        ttl: Optional[float] = 300,
+        key_prefix: str = "mem0:search",
+        client=None,
+        namespace: Optional[str] = None,
+    ):
+        super().__init__(max_size=0, ttl=ttl)
+        if client is None:
+            try:
+                import redis
+            except ImportError:
+                raise ImportError(
+                    "The 'redis' library is required for the shared search cache. "
+                    "Please install it using 'pip install redis'."
+                )
+            client = redis.Redis.from_url(redis_url)
+        self.client = client
+        self.key_prefix = f"{key_prefix}:{namespace}" if namespace else key_prefix
+
+    def _version_key(self, scope: str) -> str:
+        return f"{self.key_prefix}:version:{scope}"
+
+    def versions(self, scopes: List[str]) -> Optional[List[int]]:
+        try:
+            values = self.client.mget([self._version_key(scope) for scope in [_EPOCH, *scopes]])
+        except Exception as e:
+            logger.warning(f"Failed to read the search cache versions, bypassing the cache: {e}")
+            return None
+        return [int(value) if value is not None else 0 for value in values]
+
+    def bump(self, scopes: List[str]) -> None:
+        if not scopes:
+            return
+        try:
+            pipeline = self.client.pipeline()
+            for scope in scopes:
+                pipeline.incr(self._version_key(scope))
+            pipeline.execute()
+        except Exception as e:
+            logger.warning(f"Failed to invalidate the search cache, results may be stale until they expire: {e}")
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        try:
+            value = self.client.get(f"{self.key_prefix}:result:{key}")
+        except Exception as e:
+            logger.warning(f"Failed to read the search cache: {e}")
+            value = None
+        with self._lock:
+            if value is None:
+                self._misses += 1
+                return False, None
+            self._hits += 1
+        return True, json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            serialized = json.dumps(value, default=str)
+            # Milliseconds, so sub-second TTLs don't round down to an invalid expiry of 0
+            ttl = max(1, int(self.ttl * 1000)) if self.ttl is not None else None
+            self.client.set(f"{self.key_prefix}:result:{key}", serialized, px=ttl)
+        except Exception as e:
+            logger.warning(f"Failed to write the search cache: {e}")
+
+    def clear(self) -> None:
+        self.bump([_EPOCH])
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats.pop("size")
+        return stats
+
+
+def create_search_cache(config, namespace: Optional[str] = None) -> SearchCache:
+    """
+    Create the search cache described by a `SearchCacheConfig`.
+
+    `namespace` identifies the collection of the memory, so caches shared through Redis never serve the
+    results of another collection.
+    """
+    if config.redis_url:
+        return RedisSearchCache(config.redis_url, ttl=config.ttl, key_prefix=config.key_prefix, namespace=namespace)
+    return SearchCache(max_size=config.max_size, ttl=config.ttl)
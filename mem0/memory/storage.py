@@ -14,6 +14,7 @@ class SQLiteManager:
         self._lock = threading.Lock()
         self._migrate_history_table()
         self._create_history_table()
+        self._create_memory_hashes_table()
 
     def _migrate_history_table(self) -> None:
         """
@@ -123,6 +124,44 @@ class SQLiteManager:
                 logger.error(f"Failed to create history table: {e}")
                 raise
 
+    def _create_memory_hashes_table(self) -> None:
+        """
+        Index the content hash of every memory by collection and scope, so that
+        facts already stored verbatim can be found without an embedding or
+        vector search. The history database is shared by every collection, so
+        each row records the vector store collection its memory lives in.
+        """
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                cur = self.connection.execute("PRAGMA table_info(memory_hashes)")
+                columns = {row[1] for row in cur.fetchall()}
+                if columns and "collection" not in columns:
+                    # The index is derived from the vector store, rows without a collection cannot be attributed
+                    logger.info("Recreating the memory hashes table with a collection column.")
+                    self.connection.execute("DROP TABLE memory_hashes")
+                self.connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS memory_hashes (
+                        collection   TEXT NOT NULL DEFAULT '',
+                        memory_id    TEXT NOT NULL,
+                        hash         TEXT,
+                        user_id      TEXT,
+                        agent_id     TEXT,
+                        run_id       TEXT,
+                        PRIMARY KEY (collection, memory_id)
+                    )
+                """
+                )
+                self.connection.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_memory_hashes_hash ON memory_hashes (collection, hash)"
+                )
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to create memory hashes table: {e}")
+                raise
+
     def add_history(
         self,
         memory_id: str,
@@ -196,14 +235,93 @@ class SQLiteManager:
             for r in rows
         ]
 
+    def add_memory_hash(
+        self,
+        memory_id: str,
+        hash: str,
+        *,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        collection: str = "",
+    ) -> None:
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.execute(
+                    """
+                    INSERT OR REPLACE INTO memory_hashes (collection, memory_id, hash, user_id, agent_id, run_id)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                    (collection, memory_id, hash, user_id, agent_id, run_id),
+                )
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to add memory hash: {e}")
+                raise
+
+    def delete_memory_hash(self, memory_id: str, collection: str = "") -> None:
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.execute(
+                    "DELETE FROM memory_hashes WHERE collection = ? AND memory_id = ?", (collection, memory_id)
+                )
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to delete memory hash: {e}")
+                raise
+
+    def get_memory_hashes(self, hashes: List[str], filters: Dict[str, Any], collection: str = "") -> Dict[str, str]:
+        """
+        Find the memories of `collection` in the scope given by the user_id,
+        agent_id and run_id of `filters` whose content has one of the hashes,
+        as a hash -> memory_id map.
+        """
+        if not hashes:
+            return {}
+        conditions = ["collection = ?", f"hash IN ({', '.join('?' for _ in hashes)})"]
+        params = [collection, *hashes]
+        for key in ("user_id", "agent_id", "run_id"):
+            if filters.get(key):
+                conditions.append(f"{key} = ?")
+                params.append(filters[key])
+        with self._lock:
+            cur = self.connection.execute(
+                f"SELECT hash, memory_id FROM memory_hashes WHERE {' AND '.join(conditions)}",
+                params,
+            )
+            rows = cur.fetchall()
+        return {r[0]: r[1] for r in rows}
+
+    def reset_memory_hashes(self, collection: Optional[str] = None) -> None:
+        """Forget the memory hashes of `collection`, or drop and recreate the whole table when it is None."""
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                if collection is None:
+                    self.connection.execute("DROP TABLE IF EXISTS memory_hashes")
+                else:
+                    self.connection.execute("DELETE FROM memory_hashes WHERE collection = ?", (collection,))
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to reset memory hashes table: {e}")
+                raise
+        self._create_memory_hashes_table()
+
     def reset(self) -> None:
         """Drop and recreate the history table."""
         with self._lock:
             try:
                 self.connection.execute("BEGIN")
                 self.connection.execute("DROP TABLE IF EXISTS history")
+                self.connection.execute("DROP TABLE IF EXISTS memory_hashes")
                 self.connection.execute("COMMIT")
                 self._create_history_table()
+                self._create_memory_hashes_table()
             except Exception as e:
                 self.connection.execute("ROLLBACK")
                 logger.error(f"Failed to reset history table: {e}")
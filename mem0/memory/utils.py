@@ -1,4 +1,6 @@
 import hashlib
+import json
+import math
 import re
 
 from mem0.configs.prompts import (
@@ -83,6 +85,75 @@ def extract_json(text):
     return json_str
 
 
+class JsonArrayStreamParser:
+    """
+    Parses the items of a JSON array under `key` while the JSON document is still being generated.
+
+    `feed` returns the items completed by each chunk. Text before the key, such as a code fence, is
+    ignored; items that are not valid JSON are skipped. `done` is set once the array is closed.
+    """
+
+    def __init__(self, key: str = "facts"):
+        self.key_pattern = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        self.text = ""
+        self.items = []
+        self.done = False
+        self._pos = None  # Next character to scan, once inside the array
+        self._item_start = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> list:
+        self.text += chunk
+        if self.done:
+            return []
+        if self._pos is None:
+            match = self.key_pattern.search(self.text)
+            if match is None:
+                return []
+            self._pos = match.end()
+
+        completed = []
+        text = self.text
+        for i in range(self._pos, len(text)):
+            char = text[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+            if char.isspace():
+                continue
+            if self._item_start is None and char not in ",]":
+                self._item_start = i
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+            elif char in "}]" and self._depth > 0:
+                self._depth -= 1
+            elif char in ",]" and self._depth == 0:
+                if self._item_start is not None:
+                    try:
+                        completed.append(json.loads(text[self._item_start : i]))
+                    except json.JSONDecodeError:
+                        pass
+                    self._item_start = None
+                if char == "]":
+                    self.done = True
+                    self._pos = i + 1
+                    break
+        else:
+            self._pos = len(text)
+
+        self.items.extend(completed)
+        return completed
+
+
 def get_image_description(image_obj, llm, vision_details):
     """
     Get the description of the image
@@ -156,6 +227,98 @@ def process_telemetry_filters(filters):
     return list(filters.keys()), encoded_ids
 
 
+# Nearest neighbours fetched from a graph store's vector index before filtering them by scope
+VECTOR_INDEX_CANDIDATES = 100
+
+
+def select_scoped_nodes(candidates, threshold, k, limit=None):
+    """
+    Keep the vector index candidates that pass the threshold and belong to the caller's scope.
+
+    Graph vector indexes search the nodes of all users, so the user/agent/run scope is applied to the
+    candidates afterwards. None is returned when the candidates can't answer the query and the scope
+    has to be scanned instead: when the index returned nothing, or when all k candidates pass the
+    threshold without `limit` of them being in scope, as closer in-scope nodes may lie beyond them.
+
+    Args:
+        candidates (list): Dicts with "similarity" and "in_scope", ordered by decreasing similarity.
+        threshold (float): Minimum similarity.
+        k (int): Number of candidates requested from the index.
+        limit (int, optional): Number of nodes wanted, all matching nodes if None.
+
+    Returns:
+        list or None: The matching candidates, or None if the scope must be scanned.
+    """
+    if not candidates:
+        return None
+    above = [candidate for candidate in candidates if candidate["similarity"] >= threshold]
+    hits = [candidate for candidate in above if candidate["in_scope"]]
+    if len(above) >= k and (limit is None or len(hits) < limit):
+        return None
+    return hits[:limit] if limit else hits
+
+
+def _cosine_similarity(a, b):
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return sum(x * y for x, y in zip(a, b)) / norm if norm else 0.0
+
+
+def plan_entity_rows(to_be_added, embeddings, node_ids, threshold):
+    """
+    Turn extracted relations into the rows of a batched graph upsert.
+
+    An entity that matched an existing node refers to it by id, the other entities are merged by name.
+    When relations were added one by one, an entity could also match a node created by an earlier
+    relation of the same batch. The batch keeps that behaviour by merging such an entity into the
+    earlier one instead of creating a near-duplicate node.
+
+    Args:
+        to_be_added (list): Dicts with the "source", "destination" and "relationship" of each relation.
+        embeddings (dict): Embedding of every entity name.
+        node_ids (dict): Id of the existing node matched by an entity name, for the names that matched one.
+        threshold (float): Minimum similarity for an entity to reuse a node created earlier in the batch.
+
+    Returns:
+        list: One dict per relation, with its index under "row", its "relationship" and the name, matched
+            node id (None for new nodes) and embedding of its source and destination.
+    """
+    created = {}
+    rows = []
+    for index, item in enumerate(to_be_added):
+        row = {"row": index, "relationship": item["relationship"]}
+        new_names = []
+        for end in ("source", "destination"):
+            name = item[end]
+            if name not in node_ids and name not in created:
+                # Both ends of a relation were looked up before either was created
+                name = next(
+                    (
+                        other
+                        for other, embedding in created.items()
+                        if _cosine_similarity(embeddings[name], embedding) >= threshold
+                    ),
+                    name,
+                )
+                if name == item[end]:
+                    new_names.append(name)
+            row[end] = name
+            row[f"{end}_id"] = node_ids.get(name)
+            row[f"{end}_embedding"] = embeddings[name]
+        for name in new_names:
+            created[name] = embeddings[name]
+        rows.append(row)
+    return rows
+
+
+def split_rows(records, num_rows):
+    """Split the records of a batched query into one list per input row, using their "row" field."""
+    results = [[] for _ in range(num_rows)]
+    for record in records:
+        record = dict(record)
+        results[record.pop("row")].append(record)
+    return results
+
+
 def sanitize_relationship_for_cypher(relationship) -> str:
     """Sanitize relationship text for Cypher queries by replacing problematic characters."""
     char_map = {
@@ -1,7 +1,10 @@
+import os
+import re
 from typing import List, Dict, Any, Union
 import numpy as np
 
 from mem0.reranker.base import BaseReranker
+from mem0.reranker.scoring import ScoreCache, score_documents
 from mem0.configs.rerankers.base import BaseRerankerConfig
 from mem0.configs.rerankers.huggingface import HuggingFaceRerankerConfig
 
@@ -52,9 +55,70 @@ class HuggingFaceReranker(BaseReranker):
 
         # Load model and tokenizer
         self.tokenizer = AutoTokenizer.from_pretrained(self.config.model)
-        self.model = AutoModelForSequenceClassification.from_pretrained(self.config.model)
+        if self.config.backend == "onnx":
+            self.model = self._load_onnx_model()
+        elif self.config.backend == "torch":
+            self.model = AutoModelForSequenceClassification.from_pretrained(self.config.model)
+            self.model.eval()
+            if self.config.quantize:
+                # Dynamic int8 quantization of the linear layers, only supported on CPU
+                self.device = "cpu"
+                self.model = torch.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+        else:
+            raise ValueError(f"Unsupported HuggingFace reranker backend: {self.config.backend}")
         self.model.to(self.device)
-        self.model.eval()
+
+        self.cache = ScoreCache(self.config.cache_size) if self.config.cache_size > 0 else None
+
+    def _load_onnx_model(self):
+        """Load the model with ONNX Runtime, exporting and optionally quantizing it on first use."""
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        except ImportError:
+            raise ImportError("optimum is required for the onnx backend. Install with: pip install optimum[onnxruntime]")
+
+        from mem0.memory.setup import mem0_dir
+
+        onnx_dir = self.config.onnx_dir or os.path.join(
+            mem0_dir, "rerankers", re.sub(r"[^\w.-]", "_", self.config.model)
+        )
+        file_name = "model_quantized.onnx" if self.config.quantize else "model.onnx"
+        if os.path.exists(os.path.join(onnx_dir, file_name)):
+            return ORTModelForSequenceClassification.from_pretrained(onnx_dir, file_name=file_name)
+
+        model = ORTModelForSequenceClassification.from_pretrained(self.config.model, export=True)
+        model.save_pretrained(onnx_dir)
+        if not self.config.quantize:
+            return model
+
+        quantizer = ORTQuantizer.from_pretrained(model)
+        quantization_config = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+        quantizer.quantize(save_dir=onnx_dir, quantization_config=quantization_config)
+        return ORTModelForSequenceClassification.from_pretrained(onnx_dir, file_name=file_name)
+
+    def _score_batch(self, query: str, batch_docs: List[str]) -> List[float]:
+        """Score a batch of documents, padded to its longest pair."""
+        batch_pairs = [[query, doc] for doc in batch_docs]
+
+        # Tokenize batch
+        inputs = self.tokenizer(
+            batch_pairs,
+            padding=True,
+            truncation=True,
+            max_length=self.config.max_length,
+            return_tensors="pt"
+        ).to(self.device)
+
+        # Get scores
+        with torch.no_grad():
+            outputs = self.model(**inputs)
+            batch_scores = outputs.logits.squeeze(-1).cpu().numpy()
+
+        # Handle single item case
+        if batch_scores.ndim == 0:
+            return [float(batch_scores)]
+        return batch_scores.tolist()
 
     def rerank(self, query: str, documents: List[Dict[str, Any]], top_k: int = None) -> List[Dict[str, Any]]:
         """
@@ -84,34 +148,15 @@ class HuggingFaceReranker(BaseReranker):
                 doc_texts.append(str(doc))
 
         try:
-            scores = []
-
-            # Process documents in batches
-            for i in range(0, len(doc_texts), self.config.batch_size):
-                batch_docs = doc_texts[i:i + self.config.batch_size]
-                batch_pairs = [[query, doc] for doc in batch_docs]
-
-                # Tokenize batch
-                inputs = self.tokenizer(
-                    batch_pairs,
-                    padding=True,
-                    truncation=True,
-                    max_length=self.config.max_length,
-                    return_tensors="pt"
-                ).to(self.device)
-
-                # Get scores
-                with torch.no_grad():
-                    outputs = self.model(**inputs)
-                    batch_scores = outputs.logits.squeeze(-1).cpu().numpy()
-
-                    # Handle single item case
-                    if batch_scores.ndim == 0:
-                        batch_scores = [float(batch_scores)]
-                    else:
-                        batch_scores = batch_scores.tolist()
-
-                    scores.extend(batch_scores)
+            # Process documents in batches of similar length, skipping the cached scores
+            scores = score_documents(
+                query,
+                doc_texts,
+                self._score_batch,
+                self.config.batch_size,
+                cache=self.cache,
+                doc_hashes=[doc.get('hash') for doc in documents],
+            )
 
             # Normalize scores if requested
             if self.config.normalize:
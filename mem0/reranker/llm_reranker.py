@@ -1,10 +1,17 @@
+import concurrent.futures
+import json
+import logging
 import re
-from typing import List, Dict, Any, Union
+import time
+from typing import List, Dict, Any, Optional, Union
 
 from mem0.reranker.base import BaseReranker
 from mem0.utils.factory import LlmFactory
 from mem0.configs.rerankers.base import BaseRerankerConfig
 from mem0.configs.rerankers.llm import LLMRerankerConfig
+from mem0.memory.utils import extract_json, remove_code_blocks
+
+logger = logging.getLogger(__name__)
 
 
 class LLMReranker(BaseReranker):
@@ -28,7 +35,6 @@ class LLMReranker(BaseReranker):
                 api_key=getattr(config, 'api_key', None),
                 top_k=getattr(config, 'top_k', None),
                 temperature=0.0,  # Default for reranking
-                max_tokens=100,   # Default for reranking
             )
 
         self.config = config
@@ -49,7 +55,17 @@ class LLMReranker(BaseReranker):
 
         # Default scoring prompt
         self.scoring_prompt = getattr(self.config, 'scoring_prompt', None) or self._get_default_prompt()
-        
+        self.listwise_prompt = self.config.listwise_prompt or self._get_default_listwise_prompt()
+
+        # A custom scoring prompt only applies to pointwise calls, so it selects that mode unless told otherwise
+        custom_scoring_prompt = self.config.scoring_prompt and not self.config.listwise_prompt
+        self.mode = self.config.mode or ("pointwise" if custom_scoring_prompt else "listwise")
+        if custom_scoring_prompt and self.mode == "listwise":
+            logger.warning(
+                "The custom scoring_prompt of the LLM reranker is only used for pointwise calls, "
+                "set a listwise_prompt too or use mode='pointwise'"
+            )
+
     def _get_default_prompt(self) -> str:
         """Get the default scoring prompt template."""
         return """You are a relevance scoring assistant. Given a query and a document, you need to score how relevant the document is to the query.
@@ -66,6 +82,23 @@ Document: "{document}"
 
 Provide only a single numerical score between 0.0 and 1.0. Do not include any explanation or additional text."""
 
+    def _get_default_listwise_prompt(self) -> str:
+        """Get the default prompt template scoring a chunk of documents in one call."""
+        return """You are a relevance scoring assistant. Given a query and a numbered list of documents, score how relevant each document is to the query.
+
+Score the relevance on a scale from 0.0 to 1.0, where:
+- 1.0 = Perfectly relevant and directly answers the query
+- 0.8-0.9 = Highly relevant with good information
+- 0.6-0.7 = Moderately relevant with some useful information
+- 0.4-0.5 = Slightly relevant with limited useful information
+- 0.0-0.3 = Not relevant or no useful information
+
+Query: "{query}"
+Documents:
+{documents}
+
+Return only a JSON object with a score for every document, in the format {{"scores": [{{"id": 0, "score": 0.9}}, ...]}}."""
+
     def _extract_score(self, response_text: str) -> float:
         """Extract numerical score from LLM response."""
         # Look for decimal numbers between 0.0 and 1.0
@@ -79,64 +112,128 @@ Provide only a single numerical score between 0.0 and 1.0. Do not include any ex
         # Fallback: return 0.5 if no valid score found
         return 0.5
     
+    @staticmethod
+    def _document_text(doc: Dict[str, Any]) -> str:
+        if 'memory' in doc:
+            return doc['memory']
+        if 'text' in doc:
+            return doc['text']
+        if 'content' in doc:
+            return doc['content']
+        return str(doc)
+
+    def _score_document(self, query: str, doc_text: str) -> float:
+        """Score a single document, 0.5 when the LLM call fails."""
+        try:
+            prompt = self.scoring_prompt.format(query=query, document=doc_text)
+            response = self.llm.generate_response(messages=[{"role": "user", "content": prompt}])
+            return self._extract_score(response)
+        except Exception as e:
+            # Fallback: assign neutral score if scoring fails
+            logger.debug(f"Pointwise scoring failed: {e}")
+            return 0.5
+
+    def _score_chunk(self, query: str, doc_texts: List[str]) -> Dict[int, float]:
+        """Score a chunk of documents in one call, keyed by their position in the chunk."""
+        documents = "\n".join(f"[{i}] {text}" for i, text in enumerate(doc_texts))
+        prompt = self.listwise_prompt.format(query=query, documents=documents)
+        response = self.llm.generate_response(
+            messages=[{"role": "user", "content": prompt}],
+            response_format={"type": "json_object"},
+        )
+        scores = {}
+        for entry in json.loads(extract_json(remove_code_blocks(response))).get("scores", []):
+            position = int(entry["id"])
+            if 0 <= position < len(doc_texts):
+                scores[position] = min(max(float(entry["score"]), 0.0), 1.0)
+        return scores
+
+    def _run(
+        self, executor: concurrent.futures.Executor, calls: Dict[Any, Any], deadline: Optional[float]
+    ) -> Dict[Any, Any]:
+        """Run calls on the pool, returning the results of those that succeeded by the deadline."""
+        futures = {executor.submit(call): key for key, call in calls.items()}
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        done, not_done = concurrent.futures.wait(futures, timeout=timeout)
+        for future in not_done:
+            future.cancel()
+
+        results = {}
+        for future in done:
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                logger.warning(f"LLM reranking call failed: {e}")
+        return results
+
+    def _score(self, query: str, doc_texts: List[str], deadline: Optional[float]) -> Dict[int, float]:
+        """Scores of the documents that were scored by the deadline, keyed by their position."""
+        # Each rerank has its own pool, so LLM calls still running past the deadline of a rerank, which
+        # can't be interrupted, never hold the workers of the next ones
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.config.max_workers)
+        try:
+            scores = {}
+            if self.mode == "listwise":
+                size = max(1, self.config.chunk_size)
+                chunks = {start: doc_texts[start:start + size] for start in range(0, len(doc_texts), size)}
+                calls = {
+                    start: (lambda texts=texts: self._score_chunk(query, texts)) for start, texts in chunks.items()
+                }
+                for start, chunk_scores in self._run(executor, calls, deadline).items():
+                    scores.update({start + position: score for position, score in chunk_scores.items()})
+
+            # Pointwise mode, and fallback for documents missing from failed or incomplete listwise responses
+            missing = [i for i in range(len(doc_texts)) if i not in scores]
+            if missing and (deadline is None or time.monotonic() < deadline):
+                calls = {i: (lambda text=doc_texts[i]: self._score_document(query, text)) for i in missing}
+                scores.update(self._run(executor, calls, deadline))
+            return scores
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def rerank(self, query: str, documents: List[Dict[str, Any]], top_k: int = None) -> List[Dict[str, Any]]:
         """
         Rerank documents using LLM scoring.
-        
+
+        The first `top_n` candidates are scored, in chunks of `chunk_size` per call in listwise mode or one
+        call per document in pointwise mode, with the calls running in parallel. When the `timeout`
+        deadline hits, the scored documents come first and the others keep their original order.
+
         Args:
             query: The search query
             documents: List of documents to rerank
             top_k: Number of top documents to return
-            
+
         Returns:
-            List of reranked documents with rerank_score
+            List of reranked documents, with rerank_score on the scored ones
         """
         if not documents:
             return documents
-        
+
+        deadline = time.monotonic() + self.config.timeout if self.config.timeout is not None else None
+        candidates = documents if self.config.top_n is None else documents[:self.config.top_n]
+        scores = self._score(query, [self._document_text(doc) for doc in candidates], deadline)
+
         scored_docs = []
-        
-        for doc in documents:
-            # Extract text content
-            if 'memory' in doc:
-                doc_text = doc['memory']
-            elif 'text' in doc:
-                doc_text = doc['text']  
-            elif 'content' in doc:
-                doc_text = doc['content']
-            else:
-                doc_text = str(doc)
-            
-            try:
-                # Generate scoring prompt
-                prompt = self.scoring_prompt.format(query=query, document=doc_text)
-                
-                # Get LLM response
-                response = self.llm.generate_response(
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                
-                # Extract score from response
-                score = self._extract_score(response)
-                
-                # Create scored document
+        unscored_docs = []
+        for i, doc in enumerate(candidates):
+            if i in scores:
                 scored_doc = doc.copy()
-                scored_doc['rerank_score'] = score
+                scored_doc['rerank_score'] = scores[i]
                 scored_docs.append(scored_doc)
+            else:
+                unscored_docs.append(doc.copy())
+        if unscored_docs:
+            logger.warning(f"Reranking deadline hit, {len(unscored_docs)} of {len(candidates)} candidates not scored")
 
-            except Exception:
-                # Fallback: assign neutral score if scoring fails
-                scored_doc = doc.copy()
-                scored_doc['rerank_score'] = 0.5
-                scored_docs.append(scored_doc)
-        
         # Sort by relevance score in descending order
         scored_docs.sort(key=lambda x: x['rerank_score'], reverse=True)
-        
+        scored_docs += unscored_docs + [doc.copy() for doc in documents[len(candidates):]]
+
         # Apply top_k limit
         if top_k:
             scored_docs = scored_docs[:top_k]
         elif self.config.top_k:
             scored_docs = scored_docs[:self.config.top_k]
-            
-        return scored_docs
\ No newline at end of file
+
+        return scored_docs
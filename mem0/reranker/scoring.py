@@ -0,0 +1,125 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Scores a batch of (query, document) pairs sharing the same query
+BatchScorer = Callable[[str, List[str]], List[float]]
+
+
+def _md5(text: str) -> str:
+    return hashlib.md5(text.encode()).hexdigest()
+
+
+class ScoreCache:
+    """
+    LRU cache of cross-encoder scores, keyed by the hashes of the query and of the memory text.
+
+    Memories are immutable for a given hash, so a score stays valid until it is evicted.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get_many(self, keys: Sequence[Tuple[str, str]]) -> List[Optional[float]]:
+        with self._lock:
+            scores = []
+            for key in keys:
+                score = self._entries.get(key)
+                if score is None:
+                    self._misses += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                scores.append(score)
+            return scores
+
+    def set_many(self, items: Dict[Tuple[str, str], float]) -> None:
+        with self._lock:
+            for key, score in items.items():
+                self._entries[key] = score
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Hit and miss counts of the cache since it was created.
+
+        Returns:
+            dict: "hits", "misses", "hit_rate" and the number of scores held under "size".
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+            }
+
+
+def length_bucketed_batches(lengths: Sequence[int], batch_size: int) -> List[List[int]]:
+    """
+    Group positions into batches of items of similar length, so batches padded to their longest item
+    waste little compute on padding.
+
+    Returns:
+        list: Batches of positions into `lengths`, shortest items first.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+    size = max(1, batch_size)
+    return [order[start:start + size] for start in range(0, len(order), size)]
+
+
+def score_documents(
+    query: str,
+    doc_texts: List[str],
+    score_batch: BatchScorer,
+    batch_size: int,
+    cache: Optional[ScoreCache] = None,
+    doc_hashes: Optional[List[Optional[str]]] = None,
+) -> List[float]:
+    """
+    Score every document for the query, in length-bucketed batches, reusing cached scores.
+
+    Args:
+        query: The search query.
+        doc_texts: Texts of the documents.
+        score_batch: Scores the pairs of the query and a batch of texts.
+        batch_size: Maximum number of pairs per call of `score_batch`.
+        cache: Cache of the scores, None to always score.
+        doc_hashes: Hashes of the document texts, e.g. the "hash" of memories, computed when missing.
+
+    Returns:
+        list: Raw scores, in the order of `doc_texts`.
+    """
+    scores: List[Optional[float]] = [None] * len(doc_texts)
+    keys = []
+    if cache is not None:
+        query_hash = _md5(query)
+        doc_hashes = doc_hashes or [None] * len(doc_texts)
+        keys = [(query_hash, doc_hash or _md5(text)) for doc_hash, text in zip(doc_hashes, doc_texts)]
+        scores = cache.get_many(keys)
+
+    missing = [i for i, score in enumerate(scores) if score is None]
+    # Identical texts are only scored once
+    unique_texts = list(dict.fromkeys(doc_texts[i] for i in missing))
+    new_scores = {}
+    for batch in length_bucketed_batches([len(text) for text in unique_texts], batch_size):
+        batch_texts = [unique_texts[i] for i in batch]
+        new_scores.update(zip(batch_texts, (float(score) for score in score_batch(query, batch_texts))))
+
+    for i in missing:
+        scores[i] = new_scores[doc_texts[i]]
+    if cache is not None and missing:
+        cache.set_many({keys[i]: scores[i] for i in missing})
+    return scores
@@ -2,11 +2,12 @@ from typing import List, Dict, Any, Union
 import numpy as np
 
 from mem0.reranker.base import BaseReranker
+from mem0.reranker.scoring import ScoreCache, score_documents
 from mem0.configs.rerankers.base import BaseRerankerConfig
 from mem0.configs.rerankers.sentence_transformer import SentenceTransformerRerankerConfig
 
 try:
-    from sentence_transformers import SentenceTransformer
+    from sentence_transformers import CrossEncoder
     SENTENCE_TRANSFORMERS_AVAILABLE = True
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
@@ -41,8 +42,42 @@ class SentenceTransformerReranker(BaseReranker):
             )
 
         self.config = config
-        self.model = SentenceTransformer(self.config.model, device=self.config.device)
-        
+        self.model = self._load_model()
+        self.cache = ScoreCache(self.config.cache_size) if self.config.cache_size > 0 else None
+
+    def _load_model(self):
+        """Load the cross-encoder with the configured backend, with int8 weights when quantize is set."""
+        if self.config.backend == "torch":
+            if not self.config.quantize:
+                return CrossEncoder(self.config.model, device=self.config.device)
+
+            import torch
+
+            # Dynamic int8 quantization of the linear layers, only supported on CPU
+            model = CrossEncoder(self.config.model, device="cpu")
+            model.model = torch.quantization.quantize_dynamic(model.model, {torch.nn.Linear}, dtype=torch.qint8)
+            return model
+
+        model_kwargs = {}
+        file_name = self.config.onnx_file_name
+        if file_name is None and self.config.quantize and self.config.backend == "onnx":
+            file_name = "onnx/model_qint8_avx2.onnx"
+        if file_name:
+            model_kwargs["file_name"] = file_name
+        return CrossEncoder(
+            self.config.model, device=self.config.device, backend=self.config.backend, model_kwargs=model_kwargs
+        )
+
+    def _score_batch(self, query: str, batch_docs: List[str]) -> List[float]:
+        scores = self.model.predict(
+            [[query, doc] for doc in batch_docs],
+            batch_size=len(batch_docs),
+            show_progress_bar=self.config.show_progress_bar,
+        )
+        if isinstance(scores, np.ndarray):
+            scores = scores.tolist()
+        return scores
+
     def rerank(self, query: str, documents: List[Dict[str, Any]], top_k: int = None) -> List[Dict[str, Any]]:
         """
         Rerank documents using sentence transformer cross-encoder.
@@ -71,13 +106,15 @@ class SentenceTransformerReranker(BaseReranker):
                 doc_texts.append(str(doc))
         
         try:
-            # Create query-document pairs
-            pairs = [[query, doc_text] for doc_text in doc_texts]
-            
-            # Get similarity scores
-            scores = self.model.predict(pairs)
-            if isinstance(scores, np.ndarray):
-                scores = scores.tolist()
+            # Get similarity scores, in batches of similar length, skipping the cached scores
+            scores = score_documents(
+                query,
+                doc_texts,
+                self._score_batch,
+                self.config.batch_size,
+                cache=self.cache,
+                doc_hashes=[doc.get('hash') for doc in documents],
+            )
             
             # Combine documents with scores
             doc_score_pairs = list(zip(documents, scores))
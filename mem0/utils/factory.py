@@ -16,6 +16,7 @@ from mem0.configs.rerankers.sentence_transformer import SentenceTransformerReran
 from mem0.configs.rerankers.zero_entropy import ZeroEntropyRerankerConfig
 from mem0.configs.rerankers.llm import LLMRerankerConfig
 from mem0.configs.rerankers.huggingface import HuggingFaceRerankerConfig
+from mem0.llms.configs import LlmCacheConfig
 from mem0.embeddings.mock import MockEmbeddings
 
 
@@ -53,13 +54,20 @@ class LlmFactory:
     }
 
     @classmethod
-    def create(cls, provider_name: str, config: Optional[Union[BaseLlmConfig, Dict]] = None, **kwargs):
+    def create(
+        cls,
+        provider_name: str,
+        config: Optional[Union[BaseLlmConfig, Dict]] = None,
+        cache: Optional[Union[LlmCacheConfig, Dict]] = None,
+        **kwargs,
+    ):
         """
         Create an LLM instance with the appropriate configuration.
 
         Args:
             provider_name (str): The provider name (e.g., 'openai', 'anthropic')
             config: Configuration object or dict. If None, will create default config
+            cache: Response cache configuration. If given, the LLM is wrapped in a CachedLLM
             **kwargs: Additional configuration parameters
 
         Returns:
@@ -106,7 +114,12 @@ class LlmFactory:
             # Assume it's already the correct config type
             pass
 
-        return llm_class(config)
+        llm = llm_class(config)
+        if cache:
+            from mem0.llms.cache import CachedLLM
+
+            llm = CachedLLM(llm, provider_name, cache)
+        return llm
 
     @classmethod
     def register_provider(cls, name: str, class_path: str, config_class=None):
@@ -181,6 +194,7 @@ class VectorStoreFactory:
         "supabase": "mem0.vector_stores.supabase.Supabase",
         "weaviate": "mem0.vector_stores.weaviate.Weaviate",
         "faiss": "mem0.vector_stores.faiss.FAISS",
+        "numpy_mmap": "mem0.vector_stores.numpy_mmap.NumpyMmap",
         "langchain": "mem0.vector_stores.langchain.Langchain",
         "s3_vectors": "mem0.vector_stores.s3_vectors.S3Vectors",
         "baidu": "mem0.vector_stores.baidu.BaiduDB",
@@ -1,13 +1,15 @@
 import json
 import logging
+import uuid
 from contextlib import contextmanager
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from pydantic import BaseModel
 
 try:
     import pymysql
-    from pymysql.cursors import DictCursor
+    from pymysql.cursors import DictCursor, SSDictCursor
     from dbutils.pooled_db import PooledDB
 except ImportError:
     raise ImportError(
@@ -25,6 +27,9 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# Payload keys exposed as indexed generated columns so filters on them don't scan JSON
+SCOPE_COLUMNS = ("user_id", "agent_id", "run_id")
+
 
 class OutputData(BaseModel):
     id: Optional[str]
@@ -48,6 +53,8 @@ class AzureMySQL(VectorStoreBase):
         minconn: int = 1,
         maxconn: int = 5,
         connection_pool: Optional[Any] = None,
+        use_vector_functions: Optional[bool] = None,
+        scan_batch_size: int = 5000,
     ):
         """
         Initialize the Azure MySQL vector store.
@@ -66,6 +73,9 @@ class AzureMySQL(VectorStoreBase):
             minconn (int): Minimum number of connections in the pool
             maxconn (int): Maximum number of connections in the pool
             connection_pool (Any, optional): Pre-configured connection pool
+            use_vector_functions (bool, optional): Store vectors in a VECTOR column and rank them with the
+                server's DISTANCE() function. Detected from the server when not set.
+            scan_batch_size (int): Rows decoded per batch when ranking vectors on the client (default: 5000)
         """
         self.host = host
         self.port = port
@@ -78,6 +88,10 @@ class AzureMySQL(VectorStoreBase):
         self.ssl_ca = ssl_ca
         self.ssl_disabled = ssl_disabled
         self.connection_pool = connection_pool
+        self.use_vector_functions = use_vector_functions
+        self.scan_batch_size = scan_batch_size
+        # Storage format of the vector column: "vector" (native), "binary" (packed float32) or "json" (legacy)
+        self.vector_format = None
 
         # Handle Azure authentication
         if use_azure_credential:
@@ -92,10 +106,15 @@ class AzureMySQL(VectorStoreBase):
         if self.connection_pool is None:
             self._setup_connection_pool(minconn, maxconn)
 
+        if self.use_vector_functions is None:
+            self.use_vector_functions = self._probe_vector_functions()
+
         # Create collection if it doesn't exist
         collections = self.list_cols()
         if collection_name not in collections:
             self.create_col(name=collection_name, vector_size=embedding_model_dims, distance="cosine")
+        else:
+            self._prepare_existing_col()
 
     def _setup_azure_auth(self):
         """Setup Azure authentication using DefaultAzureCredential."""
@@ -145,13 +164,17 @@ class AzureMySQL(VectorStoreBase):
             raise
 
     @contextmanager
-    def _get_cursor(self, commit: bool = False):
+    def _get_cursor(self, commit: bool = False, cursor_class=None):
         """
         Context manager to get a cursor from the connection pool.
         Auto-commits or rolls back based on exception.
+
+        Args:
+            commit (bool): Commit once the block completes.
+            cursor_class: Cursor class to use instead of the pool's buffered `DictCursor`.
         """
         conn = self.connection_pool.connection()
-        cur = conn.cursor()
+        cur = conn.cursor(cursor_class) if cursor_class else conn.cursor()
         try:
             yield cur
             if commit:
@@ -164,10 +187,34 @@ class AzureMySQL(VectorStoreBase):
             cur.close()
             conn.close()
 
+    def _probe_vector_functions(self) -> bool:
+        """Check whether the server has a VECTOR type with the DISTANCE() function (MySQL HeatWave, 9.x)."""
+        conn = self.connection_pool.connection()
+        cur = conn.cursor()
+        try:
+            cur.execute("SELECT DISTANCE(STRING_TO_VECTOR('[1]'), STRING_TO_VECTOR('[1]'), 'COSINE') AS distance")
+            cur.fetchall()
+            return True
+        except Exception as e:
+            logger.info(f"MySQL vector functions are not available, ranking vectors on the client: {e}")
+            return False
+        finally:
+            cur.close()
+            conn.close()
+
+    @staticmethod
+    def _scope_column_sql(column: str) -> str:
+        return (
+            f"`{column}` VARCHAR(255) GENERATED ALWAYS AS "
+            f"(JSON_UNQUOTE(JSON_EXTRACT(payload, '$.{column}'))) VIRTUAL"
+        )
+
     def create_col(self, name: str = None, vector_size: int = None, distance: str = "cosine"):
         """
         Create a new collection (table in MySQL).
-        Enables vector extension and creates appropriate indexes.
+
+        Vectors are stored in a VECTOR column when the server has vector functions, otherwise as packed
+        float32 in a binary column. Scope keys get indexed generated columns.
 
         Args:
             name (str, optional): Collection name (uses self.collection_name if not provided)
@@ -176,19 +223,96 @@ class AzureMySQL(VectorStoreBase):
         """
         table_name = name or self.collection_name
         dims = vector_size or self.embedding_model_dims
+        vector_type = f"VECTOR({dims})" if self.use_vector_functions else "LONGBLOB"
+        scope_columns = "".join(f"{self._scope_column_sql(column)},\n" for column in SCOPE_COLUMNS)
+        scope_indexes = ",\n".join(f"INDEX idx_{column} (`{column}`)" for column in SCOPE_COLUMNS)
 
         with self._get_cursor(commit=True) as cur:
             # Create table with vector column
             cur.execute(f"""
                 CREATE TABLE IF NOT EXISTS `{table_name}` (
                     id VARCHAR(255) PRIMARY KEY,
-                    vector JSON,
+                    vector {vector_type},
                     payload JSON,
-                    INDEX idx_payload_keys ((CAST(payload AS CHAR(255)) ARRAY))
+                    {scope_columns}
+                    {scope_indexes}
                 )
             """)
             logger.info(f"Created collection '{table_name}' with vector dimension {dims}")
 
+        if table_name == self.collection_name:
+            self.vector_format = "vector" if self.use_vector_functions else "binary"
+
+    def _prepare_existing_col(self):
+        """Detect the vector format of an existing table and add missing generated scope columns."""
+        with self._get_cursor(commit=True) as cur:
+            cur.execute(
+                """
+                SELECT COLUMN_NAME AS name, DATA_TYPE AS type
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+                """,
+                (self.database, self.collection_name),
+            )
+            columns = {row["name"]: row["type"].lower() for row in cur.fetchall() or []}
+
+            for column in SCOPE_COLUMNS:
+                if columns and column not in columns:
+                    cur.execute(
+                        f"ALTER TABLE `{self.collection_name}` ADD COLUMN {self._scope_column_sql(column)}, "
+                        f"ADD INDEX idx_{column} (`{column}`)"
+                    )
+
+        vector_type = columns.get("vector")
+        if vector_type == "vector":
+            self.vector_format = "vector"
+        elif vector_type == "json":
+            # Tables created by older versions keep JSON vectors
+            self.vector_format = "json"
+        elif vector_type is None:
+            self.vector_format = "vector" if self.use_vector_functions else "binary"
+        else:
+            self.vector_format = "binary"
+        if self.vector_format != "vector":
+            self.use_vector_functions = False
+
+    def _encode_vector(self, vector: List[float]):
+        if self.vector_format == "json":
+            return json.dumps(vector)
+        if self.vector_format == "vector":
+            return json.dumps([float(v) for v in vector])
+        return np.asarray(vector, dtype="<f4").tobytes()
+
+    def _vector_placeholder(self) -> str:
+        return "STRING_TO_VECTOR(%s)" if self.vector_format == "vector" else "%s"
+
+    def _decode_vectors(self, values: List[Any]) -> np.ndarray:
+        """Decode a batch of stored vectors into a single float32 matrix."""
+        if self.vector_format == "json":
+            return np.array([json.loads(v) if isinstance(v, str) else v for v in values], dtype=np.float32)
+        return np.frombuffer(b"".join(values), dtype="<f4").reshape(len(values), -1)
+
+    def _build_filters(self, filters: Optional[Dict]):
+        """Build the WHERE clause, using the indexed generated columns for scope keys."""
+        filter_conditions = []
+        filter_params = []
+
+        if filters:
+            for k, v in filters.items():
+                if k in SCOPE_COLUMNS and isinstance(v, str):
+                    filter_conditions.append(f"`{k}` = %s")
+                    filter_params.append(v)
+                else:
+                    filter_conditions.append("JSON_EXTRACT(payload, %s) = %s")
+                    filter_params.extend([f"$.{k}", json.dumps(v)])
+
+        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        return filter_clause, filter_params
+
+    @staticmethod
+    def _load_payload(payload: Any) -> Optional[dict]:
+        return json.loads(payload) if isinstance(payload, str) else payload
+
     def insert(self, vectors: List[List[float]], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None):
         """
         Insert vectors into the collection.
@@ -203,42 +327,20 @@ class AzureMySQL(VectorStoreBase):
         if payloads is None:
             payloads = [{}] * len(vectors)
         if ids is None:
-            import uuid
             ids = [str(uuid.uuid4()) for _ in range(len(vectors))]
 
         data = []
         for vector, payload, vec_id in zip(vectors, payloads, ids):
-            data.append((vec_id, json.dumps(vector), json.dumps(payload)))
+            data.append((vec_id, self._encode_vector(vector), json.dumps(payload)))
 
         with self._get_cursor(commit=True) as cur:
             cur.executemany(
-                f"INSERT INTO `{self.collection_name}` (id, vector, payload) VALUES (%s, %s, %s) "
+                f"INSERT INTO `{self.collection_name}` (id, vector, payload) "
+                f"VALUES (%s, {self._vector_placeholder()}, %s) "
                 f"ON DUPLICATE KEY UPDATE vector = VALUES(vector), payload = VALUES(payload)",
                 data
             )
 
-    def _cosine_distance(self, vec1_json: str, vec2: List[float]) -> str:
-        """Generate SQL for cosine distance calculation."""
-        # For MySQL, we need to calculate cosine similarity manually
-        # This is a simplified version - in production, you'd use stored procedures or UDFs
-        return """
-            1 - (
-                (SELECT SUM(a.val * b.val) /
-                (SQRT(SUM(a.val * a.val)) * SQRT(SUM(b.val * b.val))))
-                FROM (
-                    SELECT JSON_EXTRACT(vector, CONCAT('$[', idx, ']')) as val
-                    FROM (SELECT @row := @row + 1 as idx FROM (SELECT 0 UNION ALL SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3) t1, (SELECT 0 UNION ALL SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3) t2) indices
-                    WHERE idx < JSON_LENGTH(vector)
-                ) a,
-                (
-                    SELECT JSON_EXTRACT(%s, CONCAT('$[', idx, ']')) as val
-                    FROM (SELECT @row := @row + 1 as idx FROM (SELECT 0 UNION ALL SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3) t1, (SELECT 0 UNION ALL SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3) t2) indices
-                    WHERE idx < JSON_LENGTH(%s)
-                ) b
-                WHERE a.idx = b.idx
-            )
-        """
-
     def search(
         self,
         query: str,
@@ -258,46 +360,70 @@ class AzureMySQL(VectorStoreBase):
         Returns:
             List[OutputData]: Search results
         """
-        filter_conditions = []
-        filter_params = []
+        filter_clause, filter_params = self._build_filters(filters)
+        # Rows without a vector cannot be ranked
+        filter_clause = f"{filter_clause} AND vector IS NOT NULL" if filter_clause else "WHERE vector IS NOT NULL"
 
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("JSON_EXTRACT(payload, %s) = %s")
-                filter_params.extend([f"$.{k}", json.dumps(v)])
-
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
-
-        # For simplicity, we'll compute cosine similarity in Python
-        # In production, you'd want to use MySQL stored procedures or UDFs
-        with self._get_cursor() as cur:
-            query_sql = f"""
+        if self.vector_format == "vector":
+            with self._get_cursor() as cur:
+                cur.execute(
+                    f"""
+                    SELECT id, payload, DISTANCE(vector, STRING_TO_VECTOR(%s), 'COSINE') AS distance
+                    FROM `{self.collection_name}`
+                    {filter_clause}
+                    ORDER BY distance
+                    LIMIT %s
+                    """,
+                    (self._encode_vector(vectors), *filter_params, limit),
+                )
+                results = cur.fetchall()
+            return [
+                OutputData(id=r['id'], score=float(r['distance']), payload=self._load_payload(r['payload']))
+                for r in results
+            ]
+
+        # Without vector functions, rank on the client: stream the rows with an unbuffered cursor, decode
+        # each batch into one matrix and keep the best `limit` candidates with argpartition.
+        query_vec = np.asarray(vectors, dtype=np.float32)
+        query_norm = np.linalg.norm(query_vec)
+        best_ids, best_payloads = [], []
+        best_distances = np.empty(0, dtype=np.float32)
+
+        with self._get_cursor(cursor_class=SSDictCursor) as cur:
+            cur.execute(
+                f"""
                 SELECT id, vector, payload
                 FROM `{self.collection_name}`
                 {filter_clause}
-            """
-            cur.execute(query_sql, filter_params)
-            results = cur.fetchall()
-
-        # Calculate cosine similarity in Python
-        import numpy as np
-        query_vec = np.array(vectors)
-        scored_results = []
-
-        for row in results:
-            vec = np.array(json.loads(row['vector']))
-            # Cosine similarity
-            similarity = np.dot(query_vec, vec) / (np.linalg.norm(query_vec) * np.linalg.norm(vec))
-            distance = 1 - similarity
-            scored_results.append((row['id'], distance, row['payload']))
-
-        # Sort by distance and limit
-        scored_results.sort(key=lambda x: x[1])
-        scored_results = scored_results[:limit]
-
+                """,
+                filter_params,
+            )
+            while True:
+                rows = cur.fetchmany(self.scan_batch_size)
+                if not rows:
+                    break
+                rows = [row for row in rows if row['vector'] is not None]
+                if not rows:
+                    continue
+                matrix = self._decode_vectors([row['vector'] for row in rows])
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    distances = 1 - (matrix @ query_vec) / (np.linalg.norm(matrix, axis=1) * query_norm)
+                distances = np.nan_to_num(distances, nan=1.0)
+
+                ids = best_ids + [row['id'] for row in rows]
+                payloads = best_payloads + [row['payload'] for row in rows]
+                distances = np.concatenate([best_distances, distances])
+                if len(distances) > limit:
+                    keep = np.argpartition(distances, limit - 1)[:limit]
+                    ids = [ids[i] for i in keep]
+                    payloads = [payloads[i] for i in keep]
+                    distances = distances[keep]
+                best_ids, best_payloads, best_distances = ids, payloads, distances
+
+        order = np.argsort(best_distances, kind="stable")
         return [
-            OutputData(id=r[0], score=float(r[1]), payload=json.loads(r[2]) if isinstance(r[2], str) else r[2])
-            for r in scored_results
+            OutputData(id=best_ids[i], score=float(best_distances[i]), payload=self._load_payload(best_payloads[i]))
+            for i in order
         ]
 
     def delete(self, vector_id: str):
@@ -327,8 +453,8 @@ class AzureMySQL(VectorStoreBase):
         with self._get_cursor(commit=True) as cur:
             if vector is not None:
                 cur.execute(
-                    f"UPDATE `{self.collection_name}` SET vector = %s WHERE id = %s",
-                    (json.dumps(vector), vector_id),
+                    f"UPDATE `{self.collection_name}` SET vector = {self._vector_placeholder()} WHERE id = %s",
+                    (self._encode_vector(vector), vector_id),
                 )
             if payload is not None:
                 cur.execute(
@@ -348,17 +474,13 @@ class AzureMySQL(VectorStoreBase):
         """
         with self._get_cursor() as cur:
             cur.execute(
-                f"SELECT id, vector, payload FROM `{self.collection_name}` WHERE id = %s",
+                f"SELECT id, payload FROM `{self.collection_name}` WHERE id = %s",
                 (vector_id,),
             )
             result = cur.fetchone()
             if not result:
                 return None
-            return OutputData(
-                id=result['id'],
-                score=None,
-                payload=json.loads(result['payload']) if isinstance(result['payload'], str) else result['payload']
-            )
+            return OutputData(id=result['id'], score=None, payload=self._load_payload(result['payload']))
 
     def list_cols(self) -> List[str]:
         """
@@ -418,20 +540,12 @@ class AzureMySQL(VectorStoreBase):
         Returns:
             List[List[OutputData]]: List of vectors
         """
-        filter_conditions = []
-        filter_params = []
-
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("JSON_EXTRACT(payload, %s) = %s")
-                filter_params.extend([f"$.{k}", json.dumps(v)])
-
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        filter_clause, filter_params = self._build_filters(filters)
 
         with self._get_cursor() as cur:
             cur.execute(
                 f"""
-                SELECT id, vector, payload
+                SELECT id, payload
                 FROM `{self.collection_name}`
                 {filter_clause}
                 LIMIT %s
@@ -440,13 +554,7 @@ class AzureMySQL(VectorStoreBase):
             )
             results = cur.fetchall()
 
-        return [[
-            OutputData(
-                id=r['id'],
-                score=None,
-                payload=json.loads(r['payload']) if isinstance(r['payload'], str) else r['payload']
-            ) for r in results
-        ]]
+        return [[OutputData(id=r['id'], score=None, payload=self._load_payload(r['payload'])) for r in results]]
 
     def reset(self):
         """Reset the collection by deleting and recreating it."""
@@ -9,6 +9,7 @@ from pydantic import BaseModel
 try:
     from cassandra.cluster import Cluster
     from cassandra.auth import PlainTextAuthProvider
+    from cassandra.query import SimpleStatement
 except ImportError:
     raise ImportError(
         "Apache Cassandra vector store requires cassandra-driver. "
@@ -19,6 +20,12 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# Payload fields promoted to their own indexed columns so filters on them run server side
+SCOPE_COLUMNS = ("user_id", "agent_id", "run_id")
+
+# Candidates fetched per requested result when filters that cannot be pushed into CQL remain
+ANN_OVERFETCH_FACTOR = 10
+
 
 class OutputData(BaseModel):
     id: Optional[str]
@@ -39,6 +46,8 @@ class CassandraDB(VectorStoreBase):
         secure_connect_bundle: Optional[str] = None,
         protocol_version: int = 4,
         load_balancing_policy: Optional[Any] = None,
+        use_vector_index: bool = True,
+        scan_page_size: int = 1000,
     ):
         """
         Initialize the Apache Cassandra vector store.
@@ -54,6 +63,9 @@ class CassandraDB(VectorStoreBase):
             secure_connect_bundle (str, optional): Path to secure connect bundle for Astra DB
             protocol_version (int): CQL protocol version (default: 4)
             load_balancing_policy (Any, optional): Custom load balancing policy
+            use_vector_index (bool): Store vectors as a native vector column with a Storage-Attached
+                Index and search it with ANN queries (default: True)
+            scan_page_size (int): Rows scored per page when falling back to a client side scan (default: 1000)
         """
         self.contact_points = contact_points
         self.port = port
@@ -65,6 +77,12 @@ class CassandraDB(VectorStoreBase):
         self.secure_connect_bundle = secure_connect_bundle
         self.protocol_version = protocol_version
         self.load_balancing_policy = load_balancing_policy
+        self.use_vector_index = use_vector_index
+        self.scan_page_size = scan_page_size
+
+        # Set once the schema is known, ANN needs a native vector column with an SAI index
+        self.ann_enabled = False
+        self.scope_indexed = False
 
         # Initialize connection
         self.cluster = None
@@ -130,22 +148,155 @@ class CassandraDB(VectorStoreBase):
             logger.error(f"Failed to create keyspace: {e}")
             raise
 
-    def _create_table(self):
-        """Create table with vector column if it doesn't exist."""
+    def _create_table(self, table_name: Optional[str] = None, dims: Optional[int] = None):
+        """
+        Create table with vector column if it doesn't exist.
+
+        New tables store the vector as a native `vector<float, n>` column with a
+        Storage-Attached Index for ANN search. Scope fields are promoted to their
+        own columns with SAI indexes. Tables created by older versions (vector as
+        `list<float>`) get the scope columns added and backfilled, and are searched
+        with the client side scan.
+        """
+        table_name = table_name or self.collection_name
+        dims = dims or self.embedding_model_dims
         try:
-            # Create table with vector stored as list<float> and payload as text (JSON)
-            query = f"""
-                CREATE TABLE IF NOT EXISTS {self.keyspace}.{self.collection_name} (
+            vector_type = f"vector<float, {dims}>" if self.use_vector_index else "list<float>"
+            try:
+                self._execute_create_table(table_name, vector_type)
+            except Exception as e:
+                if not self.use_vector_index:
+                    raise
+                # Clusters older than Cassandra 5.0 have no vector type
+                logger.warning(f"Native vector columns are not supported, falling back to list<float>: {e}")
+                vector_type = "list<float>"
+                self._execute_create_table(table_name, vector_type)
+
+            columns = self._table_columns(table_name)
+            missing_scope_columns = [column for column in SCOPE_COLUMNS if columns and column not in columns]
+            for column in missing_scope_columns:
+                self.session.execute(f"ALTER TABLE {self.keyspace}.{table_name} ADD {column} text")
+            if missing_scope_columns:
+                self._backfill_scope_columns(table_name)
+
+            vector_column_type = columns.get("vector", vector_type)
+            ann_enabled = self.use_vector_index and vector_column_type.startswith("vector")
+            if ann_enabled:
+                ann_enabled = self._create_index(
+                    table_name,
+                    "vector",
+                    "WITH OPTIONS = {'similarity_function': 'cosine'}",
+                )
+            scope_indexed = all([self._create_index(table_name, column) for column in SCOPE_COLUMNS])
+
+            if table_name == self.collection_name:
+                self.ann_enabled = ann_enabled
+                self.scope_indexed = scope_indexed
+            logger.info(f"Table '{table_name}' is ready (ANN search: {ann_enabled})")
+        except Exception as e:
+            logger.error(f"Failed to create table: {e}")
+            raise
+
+    def _execute_create_table(self, table_name: str, vector_type: str):
+        query = f"""
+                CREATE TABLE IF NOT EXISTS {self.keyspace}.{table_name} (
                     id text PRIMARY KEY,
-                    vector list<float>,
-                    payload text
+                    vector {vector_type},
+                    payload text,
+                    {", ".join(f"{column} text" for column in SCOPE_COLUMNS)}
                 )
             """
+        self.session.execute(query)
+
+    def _table_columns(self, table_name: str) -> Dict[str, str]:
+        """Return the column types of a table, or an empty dict if the schema can't be read."""
+        try:
+            query = """
+                SELECT column_name, type
+                FROM system_schema.columns
+                WHERE keyspace_name = %s AND table_name = %s
+            """
+            rows = self.session.execute(query, (self.keyspace, table_name))
+            return {row.column_name: row.type for row in rows}
+        except Exception as e:
+            logger.debug(f"Could not read schema of table '{table_name}': {e}")
+            return {}
+
+    def _create_index(self, table_name: str, column: str, options: str = "") -> bool:
+        """Create a Storage-Attached Index on a column, returning whether it is available."""
+        try:
+            query = f"""
+                CREATE CUSTOM INDEX IF NOT EXISTS {table_name}_{column}_idx
+                ON {self.keyspace}.{table_name} ({column})
+                USING 'StorageAttachedIndex' {options}
+            """
             self.session.execute(query)
-            logger.info(f"Table '{self.collection_name}' is ready")
+            return True
         except Exception as e:
-            logger.error(f"Failed to create table: {e}")
-            raise
+            logger.warning(f"Could not create SAI index on {table_name}.{column}: {e}")
+            return False
+
+    def _backfill_scope_columns(self, table_name: str):
+        """Copy scope fields out of the JSON payload of rows written before they had their own columns."""
+        logger.info(f"Backfilling scope columns of table '{table_name}'")
+        statement = SimpleStatement(
+            f"SELECT id, payload FROM {self.keyspace}.{table_name}", fetch_size=self.scan_page_size
+        )
+        update = self.session.prepare(
+            f"""
+                UPDATE {self.keyspace}.{table_name}
+                SET {", ".join(f"{column} = ?" for column in SCOPE_COLUMNS)}
+                WHERE id = ?
+            """
+        )
+        for row in self.session.execute(statement):
+            payload = self._load_payload(row.payload)
+            if payload is None:
+                continue
+            self.session.execute(update, (*self._scope_values(payload), row.id))
+
+    @staticmethod
+    def _load_payload(payload: Optional[str]) -> Optional[Dict]:
+        try:
+            return json.loads(payload) if payload else {}
+        except json.JSONDecodeError:
+            return None
+
+    @staticmethod
+    def _scope_values(payload: Dict) -> tuple:
+        return tuple(payload.get(column) for column in SCOPE_COLUMNS)
+
+    def _split_filters(self, filters: Optional[Dict]):
+        """
+        Split filters into scope filters pushed into CQL and the rest, matched against the payload.
+        """
+        scope_filters, payload_filters = {}, {}
+        for key, value in (filters or {}).items():
+            if key in SCOPE_COLUMNS and isinstance(value, str):
+                scope_filters[key] = value
+            else:
+                payload_filters[key] = value
+        return scope_filters, payload_filters
+
+    def _where_clause(self, scope_filters: Dict[str, str]) -> str:
+        if not scope_filters:
+            return ""
+        return "WHERE " + " AND ".join(f"{key} = ?" for key in scope_filters)
+
+    def _allow_filtering(self, scope_filters: Dict[str, str]) -> str:
+        return "ALLOW FILTERING" if scope_filters and not self.scope_indexed else ""
+
+    def _execute_paged(self, query: str, params: tuple = ()):
+        """Execute a query whose rows are streamed from the cluster `scan_page_size` rows at a time."""
+        if not params:
+            return self.session.execute(SimpleStatement(query, fetch_size=self.scan_page_size))
+        prepared = self.session.prepare(query)
+        prepared.fetch_size = self.scan_page_size
+        return self.session.execute(prepared, params)
+
+    @staticmethod
+    def _matches(payload: Dict, payload_filters: Dict) -> bool:
+        return all(payload.get(k) == v for k, v in payload_filters.items())
 
     def create_col(self, name: str = None, vector_size: int = None, distance: str = "cosine"):
         """
@@ -160,14 +311,7 @@ class CassandraDB(VectorStoreBase):
         dims = vector_size or self.embedding_model_dims
 
         try:
-            query = f"""
-                CREATE TABLE IF NOT EXISTS {self.keyspace}.{table_name} (
-                    id text PRIMARY KEY,
-                    vector list<float>,
-                    payload text
-                )
-            """
-            self.session.execute(query)
+            self._create_table(table_name, dims)
             logger.info(f"Created collection '{table_name}' with vector dimension {dims}")
         except Exception as e:
             logger.error(f"Failed to create collection: {e}")
@@ -196,15 +340,15 @@ class CassandraDB(VectorStoreBase):
 
         try:
             query = f"""
-                INSERT INTO {self.keyspace}.{self.collection_name} (id, vector, payload)
-                VALUES (?, ?, ?)
+                INSERT INTO {self.keyspace}.{self.collection_name} (id, vector, payload, {", ".join(SCOPE_COLUMNS)})
+                VALUES (?, ?, ?, {", ".join("?" for _ in SCOPE_COLUMNS)})
             """
             prepared = self.session.prepare(query)
 
             for vector, payload, vec_id in zip(vectors, payloads, ids):
                 self.session.execute(
                     prepared,
-                    (vec_id, vector, json.dumps(payload))
+                    (vec_id, vector, json.dumps(payload), *self._scope_values(payload))
                 )
         except Exception as e:
             logger.error(f"Failed to insert vectors: {e}")
@@ -220,6 +364,10 @@ class CassandraDB(VectorStoreBase):
         """
         Search for similar vectors using cosine similarity.
 
+        Uses an ANN query on the SAI vector index when available, otherwise scores
+        the rows page by page on the client. Scope filters (`user_id`, `agent_id`,
+        `run_id`) are pushed into CQL in both cases.
+
         Args:
             query (str): Query string (not used in vector search)
             vectors (List[float]): Query vector
@@ -227,58 +375,103 @@ class CassandraDB(VectorStoreBase):
             filters (Dict, optional): Filters to apply to the search
 
         Returns:
-            List[OutputData]: Search results
+            List[OutputData]: Search results, scored by cosine distance
         """
         try:
-            # Fetch all vectors (in production, you'd want pagination or filtering)
-            query_cql = f"""
-                SELECT id, vector, payload
-                FROM {self.keyspace}.{self.collection_name}
-            """
-            rows = self.session.execute(query_cql)
-
-            # Calculate cosine similarity in Python
-            query_vec = np.array(vectors)
-            scored_results = []
-
-            for row in rows:
-                if not row.vector:
-                    continue
-
-                vec = np.array(row.vector)
-                
-                # Cosine similarity
-                similarity = np.dot(query_vec, vec) / (np.linalg.norm(query_vec) * np.linalg.norm(vec))
-                distance = 1 - similarity
-
-                # Apply filters if provided
-                if filters:
-                    try:
-                        payload = json.loads(row.payload) if row.payload else {}
-                        match = all(payload.get(k) == v for k, v in filters.items())
-                        if not match:
-                            continue
-                    except json.JSONDecodeError:
-                        continue
-
-                scored_results.append((row.id, distance, row.payload))
-
-            # Sort by distance and limit
-            scored_results.sort(key=lambda x: x[1])
-            scored_results = scored_results[:limit]
-
-            return [
-                OutputData(
-                    id=r[0],
-                    score=float(r[1]),
-                    payload=json.loads(r[2]) if r[2] else {}
-                )
-                for r in scored_results
-            ]
+            scope_filters, payload_filters = self._split_filters(filters)
+            if self.ann_enabled:
+                return self._search_ann(vectors, limit, scope_filters, payload_filters)
+            return self._search_scan(vectors, limit, scope_filters, payload_filters)
         except Exception as e:
             logger.error(f"Search failed: {e}")
             raise
 
+    def _search_ann(
+        self, vectors: List[float], limit: int, scope_filters: Dict[str, str], payload_filters: Dict
+    ) -> List[OutputData]:
+        """Search with `ORDER BY vector ANN OF`, letting the SAI index pick the candidates."""
+        fetch_limit = limit * ANN_OVERFETCH_FACTOR if payload_filters else limit
+        query_cql = f"""
+            SELECT id, payload, similarity_cosine(vector, ?) AS score
+            FROM {self.keyspace}.{self.collection_name}
+            {self._where_clause(scope_filters)}
+            ORDER BY vector ANN OF ?
+            LIMIT ?
+        """
+        prepared = self.session.prepare(query_cql)
+        rows = self.session.execute(prepared, (vectors, *scope_filters.values(), vectors, fetch_limit))
+
+        results = []
+        for row in rows:
+            payload = self._load_payload(row.payload)
+            if payload is None or not self._matches(payload, payload_filters):
+                continue
+            # similarity_cosine is normalized to [0, 1], map it back to a cosine distance
+            results.append(OutputData(id=row.id, score=2 * (1 - float(row.score)), payload=payload))
+            if len(results) == limit:
+                break
+        return results
+
+    def _search_scan(
+        self, vectors: List[float], limit: int, scope_filters: Dict[str, str], payload_filters: Dict
+    ) -> List[OutputData]:
+        """Score the matching rows on the client, a whole page of vectors at a time."""
+        query_cql = f"""
+            SELECT id, vector, payload
+            FROM {self.keyspace}.{self.collection_name}
+            {self._where_clause(scope_filters)}
+            {self._allow_filtering(scope_filters)}
+        """
+        rows = self._execute_paged(query_cql, tuple(scope_filters.values()))
+
+        query_vec = np.asarray(vectors, dtype=np.float32)
+        query_norm = np.linalg.norm(query_vec)
+
+        best_ids, best_payloads = [], []
+        best_distances = np.empty(0, dtype=np.float32)
+        page_ids, page_payloads, page_vectors = [], [], []
+
+        def score_page():
+            nonlocal best_ids, best_payloads, best_distances
+            matrix = np.asarray(page_vectors, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1) * query_norm
+            with np.errstate(divide="ignore", invalid="ignore"):
+                distances = 1 - (matrix @ query_vec) / norms
+            distances = np.nan_to_num(distances, nan=1.0)
+
+            ids = best_ids + page_ids
+            payloads = best_payloads + page_payloads
+            distances = np.concatenate([best_distances, distances])
+            if len(distances) > limit:
+                keep = np.argpartition(distances, limit - 1)[:limit]
+                ids = [ids[i] for i in keep]
+                payloads = [payloads[i] for i in keep]
+                distances = distances[keep]
+            best_ids, best_payloads, best_distances = ids, payloads, distances
+            page_ids.clear()
+            page_payloads.clear()
+            page_vectors.clear()
+
+        for row in rows:
+            if not row.vector:
+                continue
+            payload = self._load_payload(row.payload)
+            if payload is None or not self._matches(payload, payload_filters):
+                continue
+            page_ids.append(row.id)
+            page_payloads.append(payload)
+            page_vectors.append(row.vector)
+            if len(page_vectors) >= self.scan_page_size:
+                score_page()
+        if page_vectors:
+            score_page()
+
+        order = np.argsort(best_distances, kind="stable")
+        return [
+            OutputData(id=best_ids[i], score=float(best_distances[i]), payload=best_payloads[i])
+            for i in order
+        ]
+
     def delete(self, vector_id: str):
         """
         Delete a vector by ID.
@@ -325,11 +518,11 @@ class CassandraDB(VectorStoreBase):
             if payload is not None:
                 query = f"""
                     UPDATE {self.keyspace}.{self.collection_name}
-                    SET payload = ?
+                    SET payload = ?, {", ".join(f"{column} = ?" for column in SCOPE_COLUMNS)}
                     WHERE id = ?
                 """
                 prepared = self.session.prepare(query)
-                self.session.execute(prepared, (json.dumps(payload), vector_id))
+                self.session.execute(prepared, (json.dumps(payload), *self._scope_values(payload), vector_id))
 
             logger.info(f"Updated vector with id: {vector_id}")
         except Exception as e:
@@ -440,32 +633,27 @@ class CassandraDB(VectorStoreBase):
             List[List[OutputData]]: List of vectors
         """
         try:
+            scope_filters, payload_filters = self._split_filters(filters)
+            # Payload filters are matched on the client, so the LIMIT can only be pushed down without them
+            limit_clause = "" if payload_filters else f"LIMIT {int(limit)}"
             query = f"""
-                SELECT id, vector, payload
+                SELECT id, payload
                 FROM {self.keyspace}.{self.collection_name}
-                LIMIT {limit}
+                {self._where_clause(scope_filters)}
+                {limit_clause}
+                {self._allow_filtering(scope_filters)}
             """
-            rows = self.session.execute(query)
+            rows = self._execute_paged(query, tuple(scope_filters.values()))
 
             results = []
             for row in rows:
-                # Apply filters if provided
-                if filters:
-                    try:
-                        payload = json.loads(row.payload) if row.payload else {}
-                        match = all(payload.get(k) == v for k, v in filters.items())
-                        if not match:
-                            continue
-                    except json.JSONDecodeError:
-                        continue
-
-                results.append(
-                    OutputData(
-                        id=row.id,
-                        score=None,
-                        payload=json.loads(row.payload) if row.payload else {}
-                    )
-                )
+                payload = self._load_payload(row.payload)
+                if payload is None or not self._matches(payload, payload_filters):
+                    continue
+
+                results.append(OutputData(id=row.id, score=None, payload=payload))
+                if len(results) >= limit:
+                    break
 
             return [results]
         except Exception as e:
@@ -32,6 +32,7 @@ class VectorStoreConfig(BaseModel):
         "supabase": "SupabaseConfig",
         "weaviate": "WeaviateConfig",
         "faiss": "FAISSConfig",
+        "numpy_mmap": "NumpyMmapConfig",
         "langchain": "LangchainConfig",
         "s3_vectors": "S3VectorsConfig",
     }
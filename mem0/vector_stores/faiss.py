@@ -30,6 +30,8 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+QUANTIZATION_MODES = ("sq_fp16", "sq8", "binary")
+
 
 class OutputData(BaseModel):
     id: Optional[str]  # memory id
@@ -45,6 +47,8 @@ class FAISS(VectorStoreBase):
         distance_strategy: str = "euclidean",
         normalize_L2: bool = False,
         embedding_model_dims: int = 1536,
+        quantization: Optional[str] = None,
+        rescore_multiplier: int = 4,
     ):
         """
         Initialize the FAISS vector store.
@@ -56,17 +60,28 @@ class FAISS(VectorStoreBase):
                 Defaults to "euclidean".
             normalize_L2 (bool, optional): Whether to normalize L2 vectors. Only applicable for euclidean distance.
                 Defaults to False.
+            quantization (str, optional): Compress the index with 'sq_fp16' (float16 scalar quantizer), 'sq8'
+                (8-bit scalar quantizer) or 'binary' (sign bits, rescored with the float vectors). Defaults to None.
+            rescore_multiplier (int, optional): With binary quantization, limit * rescore_multiplier candidates are
+                rescored with the full-precision vectors. Defaults to 4.
         """
+        if quantization is not None and quantization not in QUANTIZATION_MODES:
+            raise ValueError(f"Invalid quantization: {quantization}. Must be one of {', '.join(QUANTIZATION_MODES)}")
+
         self.collection_name = collection_name
         self.path = path or f"/tmp/faiss/{collection_name}"
         self.distance_strategy = distance_strategy
         self.normalize_L2 = normalize_L2
         self.embedding_model_dims = embedding_model_dims
+        self.quantization = quantization
+        self.rescore_multiplier = rescore_multiplier
 
         # Initialize storage structures
         self.index = None
         self.docstore = {}
         self.index_to_id = {}
+        # Full-precision vectors kept on disk for rescoring binary codes, one row per index position
+        self.float_vectors = None
 
         # Create directory if it doesn't exist
         if self.path:
@@ -89,7 +104,11 @@ class FAISS(VectorStoreBase):
             docstore_path (str): Path to docstore pickle file.
         """
         try:
-            self.index = faiss.read_index(index_path)
+            if self.quantization == "binary":
+                self.index = faiss.read_index_binary(index_path)
+                self._open_float_vectors()
+            else:
+                self.index = faiss.read_index(index_path)
             with open(docstore_path, "rb") as f:
                 self.docstore, self.index_to_id = pickle.load(f)
             logger.info(f"Loaded FAISS index from {index_path} with {self.index.ntotal} vectors")
@@ -109,7 +128,10 @@ class FAISS(VectorStoreBase):
             index_path = f"{self.path}/{self.collection_name}.faiss"
             docstore_path = f"{self.path}/{self.collection_name}.pkl"
 
-            faiss.write_index(self.index, index_path)
+            if self.quantization == "binary":
+                faiss.write_index_binary(self.index, index_path)
+            else:
+                faiss.write_index(self.index, index_path)
             with open(docstore_path, "wb") as f:
                 pickle.dump((self.docstore, self.index_to_id), f)
         except Exception as e:
@@ -169,19 +191,66 @@ class FAISS(VectorStoreBase):
             self: The FAISS instance.
         """
         distance_strategy = distance or self.distance_strategy
+        inner_product = distance_strategy.lower() == "inner_product" or distance_strategy.lower() == "cosine"
 
         # Create index based on distance strategy
-        if distance_strategy.lower() == "inner_product" or distance_strategy.lower() == "cosine":
+        if self.quantization == "binary":
+            # Binary codes are ranked by Hamming distance, the float vectors are kept on disk for rescoring
+            self.index = faiss.IndexBinaryFlat(self._binary_dims())
+        elif self.quantization in ("sq_fp16", "sq8"):
+            metric = faiss.METRIC_INNER_PRODUCT if inner_product else faiss.METRIC_L2
+            if self.quantization == "sq_fp16":
+                qtype = faiss.ScalarQuantizer.QT_fp16
+            else:
+                qtype = faiss.ScalarQuantizer.QT_8bit_uniform
+            self.index = faiss.IndexScalarQuantizer(self.embedding_model_dims, qtype, metric)
+        elif inner_product:
             self.index = faiss.IndexFlatIP(self.embedding_model_dims)
         else:
             self.index = faiss.IndexFlatL2(self.embedding_model_dims)
 
         self.collection_name = name
+        if self.quantization == "binary":
+            self._open_float_vectors(truncate=True)
 
         self._save()
 
         return self
 
+    def _binary_dims(self) -> int:
+        """Number of bits in a binary code, the embedding dimension rounded up to a whole byte."""
+        return (self.embedding_model_dims + 7) // 8 * 8
+
+    def _float_vectors_path(self) -> str:
+        return f"{self.path}/{self.collection_name}.f32"
+
+    def _open_float_vectors(self, truncate: bool = False):
+        """Memory-map the full-precision vectors used to rescore binary search candidates."""
+        os.makedirs(self.path, exist_ok=True)
+        path = self._float_vectors_path()
+        if truncate or not os.path.exists(path):
+            open(path, "wb").close()
+        rows = os.path.getsize(path) // (4 * self.embedding_model_dims)
+        self.float_vectors = (
+            np.memmap(path, dtype=np.float32, mode="r", shape=(rows, self.embedding_model_dims)) if rows else None
+        )
+
+    def _append_float_vectors(self, vectors: np.ndarray):
+        with open(self._float_vectors_path(), "ab") as f:
+            f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+        self._open_float_vectors()
+
+    def _train(self, vectors: np.ndarray):
+        """
+        Train an 8-bit scalar quantizer on the first inserted batch.
+
+        The quantizer uses a single value range for all dimensions, widened by 20% so that later
+        vectors are rarely clipped.
+        """
+        self.index.sq.rangestat = faiss.ScalarQuantizer.RS_minmax
+        self.index.sq.rangestat_arg = 0.2
+        self.index.train(vectors)
+
     def insert(
         self,
         vectors: List[list],
@@ -213,9 +282,16 @@ class FAISS(VectorStoreBase):
         if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
             faiss.normalize_L2(vectors_np)
 
-        self.index.add(vectors_np)
+        # Deleted vectors stay in the index, so new rows start after the last stored one
+        starting_idx = self.index.ntotal
+        if self.quantization == "binary":
+            self.index.add(np.packbits(vectors_np > 0, axis=1))
+            self._append_float_vectors(vectors_np)
+        else:
+            if not self.index.is_trained:
+                self._train(vectors_np)
+            self.index.add(vectors_np)
 
-        starting_idx = len(self.index_to_id)
         for i, (vector_id, payload) in enumerate(zip(ids, payloads)):
             self.docstore[vector_id] = payload.copy()
             self.index_to_id[starting_idx + i] = vector_id
@@ -251,7 +327,10 @@ class FAISS(VectorStoreBase):
             faiss.normalize_L2(query_vectors)
 
         fetch_k = limit * 2 if filters else limit
-        scores, indices = self.index.search(query_vectors, fetch_k)
+        if self.quantization == "binary":
+            scores, indices = self._search_binary(query_vectors, fetch_k)
+        else:
+            scores, indices = self.index.search(query_vectors, fetch_k)
 
         results = self._parse_output(scores[0], indices[0], limit)
 
@@ -266,6 +345,28 @@ class FAISS(VectorStoreBase):
 
         return results
 
+    def _search_binary(self, query_vectors: np.ndarray, k: int):
+        """
+        Rank by Hamming distance over the sign bits, then rescore the best candidates with the float vectors.
+
+        Returns scores and positions in the same form as a flat index search.
+        """
+        _, candidates = self.index.search(np.packbits(query_vectors > 0, axis=1), k * self.rescore_multiplier)
+        candidates = candidates[0][candidates[0] >= 0]
+        if not len(candidates) or self.float_vectors is None:
+            return np.empty((1, 0), dtype=np.float32), np.empty((1, 0), dtype=np.int64)
+
+        # Sorted positions keep the reads from the memory map sequential
+        positions = np.sort(candidates)
+        candidate_vectors = np.asarray(self.float_vectors[positions])
+        if self.distance_strategy.lower() in ("inner_product", "cosine"):
+            scores = candidate_vectors @ query_vectors[0]
+            order = np.argsort(-scores)[:k]
+        else:
+            scores = ((candidate_vectors - query_vectors[0]) ** 2).sum(axis=1)
+            order = np.argsort(scores)[:k]
+        return scores[order][None, :], positions[order][None, :]
+
     def _apply_filters(self, payload: Dict, filters: Dict) -> bool:
         """
         Apply filters to a payload.
@@ -409,6 +510,8 @@ class FAISS(VectorStoreBase):
                     os.remove(index_path)
                 if os.path.exists(docstore_path):
                     os.remove(docstore_path)
+                if self.quantization == "binary" and os.path.exists(self._float_vectors_path()):
+                    os.remove(self._float_vectors_path())
 
                 logger.info(f"Deleted collection {self.collection_name}")
             except Exception as e:
@@ -417,6 +520,7 @@ class FAISS(VectorStoreBase):
         self.index = None
         self.docstore = {}
         self.index_to_id = {}
+        self.float_vectors = None
 
     def col_info(self) -> Dict:
         """
@@ -431,8 +535,9 @@ class FAISS(VectorStoreBase):
         return {
             "name": self.collection_name,
             "count": self.index.ntotal,
-            "dimension": self.index.d,
+            "dimension": self.embedding_model_dims if self.quantization == "binary" else self.index.d,
             "distance": self.distance_strategy,
+            "quantization": self.quantization,
         }
 
     def list(self, filters: Optional[Dict] = None, limit: int = 100) -> List[OutputData]:
@@ -0,0 +1,648 @@
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from mem0.vector_stores.base import VectorStoreBase
+
+logger = logging.getLogger(__name__)
+
+# Payload keys mirrored into indexed SQLite columns
+SCOPE_COLUMNS = ("user_id", "agent_id", "run_id")
+
+RANGE_OPERATORS = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+STORAGE_DTYPES = {"float32": np.float32, "float16": np.float16, "int8": np.int8}
+
+# Compaction isn't worth rewriting the matrix for small collections
+MIN_ROWS_FOR_AUTO_COMPACTION = 1024
+
+
+class OutputData(BaseModel):
+    id: Optional[str]  # memory id
+    score: Optional[float]  # similarity
+    payload: Optional[Dict]  # metadata
+
+
+class NumpyMmap(VectorStoreBase):
+    """
+    Exact, in-process vector store backed by memory-mapped NumPy matrices and SQLite.
+
+    Vectors are appended to a flat matrix file (float32, float16 or int8 with one scale per
+    row) next to a one-byte-per-row live mask. Updates append a new row and deletes clear the
+    live flag, so rows are never rewritten until `compact`. Payloads live in SQLite with
+    indexed scope columns. Files are opened with shared mappings, so several processes can
+    read a collection while one of them writes, and opening a collection doesn't load anything.
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        path: Optional[str] = None,
+        embedding_model_dims: int = 1536,
+        distance_strategy: str = "cosine",
+        dtype: str = "float32",
+        search_batch_size: int = 65536,
+        auto_compact_ratio: Optional[float] = 0.5,
+    ):
+        """
+        Initialize the NumPy memory-mapped vector store.
+
+        Args:
+            collection_name (str): Name of the collection.
+            path (str, optional): Directory holding the collections. Defaults to "/tmp/numpy_mmap".
+            embedding_model_dims (int, optional): Dimension of the embedding vector. Defaults to 1536.
+            distance_strategy (str, optional): "cosine" or "inner_product". Defaults to "cosine".
+            dtype (str, optional): Storage type of the vectors, "float32", "float16" or "int8". Defaults to "float32".
+            search_batch_size (int, optional): Rows scored per matrix-vector product. Defaults to 65536.
+            auto_compact_ratio (float, optional): Compact once this fraction of the rows is dead, None to only
+                compact on demand. Defaults to 0.5.
+        """
+        if distance_strategy not in ("cosine", "inner_product"):
+            raise ValueError("Invalid distance_strategy. Must be one of: 'cosine', 'inner_product'")
+        if dtype not in STORAGE_DTYPES:
+            raise ValueError(f"Invalid dtype. Must be one of: {', '.join(STORAGE_DTYPES)}")
+
+        self.base_path = path or "/tmp/numpy_mmap"
+        self.embedding_model_dims = embedding_model_dims
+        self.distance_strategy = distance_strategy
+        self.dtype = dtype
+        self.search_batch_size = search_batch_size
+        self.auto_compact_ratio = auto_compact_ratio
+        self._lock = threading.Lock()
+        self._maps = {}
+        self._generation = None
+        self.connection = None
+        self.create_col(collection_name)
+
+    @property
+    def _col_path(self) -> str:
+        return os.path.join(self.base_path, self.collection_name)
+
+    def _file(self, kind: str, generation: int) -> str:
+        return os.path.join(self._col_path, f"{kind}.{generation}.bin")
+
+    def create_col(self, name: str, vector_size: Optional[int] = None, distance: Optional[str] = None):
+        """
+        Create (or open) a collection.
+
+        Args:
+            name (str): Name of the collection.
+            vector_size (int, optional): Dimension of the vectors. Defaults to embedding_model_dims.
+            distance (str, optional): Distance strategy. Defaults to distance_strategy.
+        """
+        self.collection_name = name
+        self.embedding_model_dims = vector_size or self.embedding_model_dims
+        self.distance_strategy = distance or self.distance_strategy
+        os.makedirs(self._col_path, exist_ok=True)
+
+        if self.connection is not None:
+            self.connection.close()
+        self.connection = sqlite3.connect(
+            os.path.join(self._col_path, "payloads.db"), check_same_thread=False, isolation_level=None
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA busy_timeout=30000")
+        scope_columns = "".join(f", {column} TEXT" for column in SCOPE_COLUMNS)
+        self.connection.execute(
+            f"CREATE TABLE IF NOT EXISTS vectors (id TEXT PRIMARY KEY, row INTEGER UNIQUE NOT NULL{scope_columns}, "
+            "payload TEXT)"
+        )
+        for column in SCOPE_COLUMNS:
+            self.connection.execute(f"CREATE INDEX IF NOT EXISTS vectors_{column}_idx ON vectors ({column})")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+        settings = {"dims": str(self.embedding_model_dims), "dtype": self.dtype, "distance": self.distance_strategy}
+        with self._write():
+            for key, value in settings.items():
+                self.connection.execute("INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)", (key, value))
+            self.connection.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', '0')")
+            self.connection.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('dead_rows', '0')")
+        stored = dict(self.connection.execute("SELECT key, value FROM meta").fetchall())
+        # An existing collection keeps the layout it was created with
+        self.embedding_model_dims = int(stored["dims"])
+        self.dtype = stored["dtype"]
+        self.distance_strategy = stored["distance"]
+        self._maps = {}
+        self._generation = None
+        return self
+
+    @contextmanager
+    def _write(self):
+        """Serialize writers across threads and processes (BEGIN IMMEDIATE takes SQLite's write lock)."""
+        with self._lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+
+    def _current_generation(self) -> int:
+        return int(self.connection.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()[0])
+
+    def _mapped(self, generation: int):
+        """
+        Return the vector matrix, row scales (int8 only) and live mask of a generation.
+
+        Files are only remapped when a compaction switched generations or another writer appended rows.
+        """
+        if generation != self._generation:
+            self._maps = {}
+            self._generation = generation
+        row_bytes = {"vectors": self.embedding_model_dims * np.dtype(STORAGE_DTYPES[self.dtype]).itemsize, "live": 1}
+        if self.dtype == "int8":
+            row_bytes["scales"] = 4
+        rows = min(
+            os.path.getsize(self._file(kind, generation)) // size if os.path.exists(self._file(kind, generation)) else 0
+            for kind, size in row_bytes.items()
+        )
+        if self._maps.get("rows") != rows:
+            self._maps = {"rows": rows}
+            if rows:
+                self._maps["vectors"] = np.memmap(
+                    self._file("vectors", generation),
+                    dtype=STORAGE_DTYPES[self.dtype],
+                    mode="r",
+                    shape=(rows, self.embedding_model_dims),
+                )
+                self._maps["live"] = np.memmap(self._file("live", generation), dtype=np.uint8, mode="r", shape=(rows,))
+                if self.dtype == "int8":
+                    self._maps["scales"] = np.memmap(
+                        self._file("scales", generation), dtype=np.float32, mode="r", shape=(rows,)
+                    )
+        return self._maps
+
+    def _encode(self, vectors: np.ndarray):
+        """Convert float32 vectors to the storage type, returning the per-row scales for int8."""
+        if self.distance_strategy == "cosine":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1, norms)
+        if self.dtype == "int8":
+            scales = np.abs(vectors).max(axis=1) / 127
+            scales[scales == 0] = 1
+            return np.round(vectors / scales[:, None]).astype(np.int8), scales.astype(np.float32)
+        return vectors.astype(STORAGE_DTYPES[self.dtype]), None
+
+    def _append(self, vectors: np.ndarray, generation: int) -> int:
+        """Append rows to the matrix files and return the index of the first one. Call inside `_write`."""
+        encoded, scales = self._encode(vectors)
+        vectors_path = self._file("vectors", generation)
+        start = os.path.getsize(vectors_path) // encoded[0].nbytes if os.path.exists(vectors_path) else 0
+        with open(vectors_path, "ab") as f:
+            f.write(encoded.tobytes())
+        if scales is not None:
+            with open(self._file("scales", generation), "ab") as f:
+                f.write(scales.tobytes())
+        # The live flags go last, a row only becomes searchable once its vector is complete
+        with open(self._file("live", generation), "ab") as f:
+            f.write(np.ones(len(encoded), dtype=np.uint8).tobytes())
+        return start
+
+    def _kill(self, rows: List[int], generation: int) -> None:
+        """Clear the live flag of rows that were deleted or superseded. Call inside `_write`."""
+        if not rows:
+            return
+        live = np.memmap(self._file("live", generation), dtype=np.uint8, mode="r+")
+        live[np.asarray(rows, dtype=np.int64)] = 0
+        live.flush()
+        del live
+        self.connection.execute(
+            "UPDATE meta SET value = CAST(value AS INTEGER) + ? WHERE key = 'dead_rows'", (len(rows),)
+        )
+
+    @staticmethod
+    def _scope_values(payload: Dict) -> tuple:
+        return tuple(None if payload.get(column) is None else str(payload[column]) for column in SCOPE_COLUMNS)
+
+    def insert(
+        self,
+        vectors: List[list],
+        payloads: Optional[List[Dict]] = None,
+        ids: Optional[List[str]] = None,
+    ):
+        """
+        Insert vectors into the collection, replacing existing ids.
+
+        Args:
+            vectors (List[list]): List of vectors to insert.
+            payloads (Optional[List[Dict]], optional): List of payloads corresponding to vectors. Defaults to None.
+            ids (Optional[List[str]], optional): List of IDs corresponding to vectors. Defaults to None.
+        """
+        if ids is None:
+            ids = [str(uuid.uuid4()) for _ in range(len(vectors))]
+        if payloads is None:
+            payloads = [{} for _ in range(len(vectors))]
+        if len(vectors) != len(ids) or len(vectors) != len(payloads):
+            raise ValueError("Vectors, payloads, and IDs must have the same length")
+        if not vectors:
+            return
+        # The last occurrence of a repeated id wins
+        entries = dict(zip(ids, zip(vectors, payloads)))
+        ids = list(entries)
+        vectors = [vector for vector, _ in entries.values()]
+        payloads = [payload for _, payload in entries.values()]
+
+        with self._write():
+            generation = self._current_generation()
+            placeholders = ", ".join("?" * len(ids))
+            replaced = self.connection.execute(f"SELECT row FROM vectors WHERE id IN ({placeholders})", ids).fetchall()
+            start = self._append(np.asarray(vectors, dtype=np.float32), generation)
+            try:
+                self.connection.executemany(
+                    f"INSERT OR REPLACE INTO vectors (id, row, {', '.join(SCOPE_COLUMNS)}, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (vector_id, start + i, *self._scope_values(payload), json.dumps(payload))
+                        for i, (vector_id, payload) in enumerate(zip(ids, payloads))
+                    ],
+                )
+            except Exception:
+                self._kill(list(range(start, start + len(ids))), generation)
+                raise
+            self._kill([row for (row,) in replaced], generation)
+        logger.info(f"Inserted {len(vectors)} vectors into collection {self.collection_name}")
+        self._maybe_compact()
+
+    def _compile_filters(self, filters: Optional[Dict]):
+        """
+        Compile mem0 filters into a parameterized SQLite condition.
+
+        Scope keys use their indexed columns, other keys `json_extract` on the payload. Supports
+        `eq`, `ne`, `in`, `nin`, `gt`/`gte`/`lt`/`lte`, `contains`/`icontains` and `$or`/`$not`/`$and`
+        groups; `"*"` matches any value.
+
+        Returns:
+            tuple: SQL condition (empty if nothing to filter) and its parameters.
+        """
+        conditions, params = [], []
+        for key, value in (filters or {}).items():
+            if key in ("$or", "OR", "$not", "NOT", "$and", "AND"):
+                groups = [self._compile_filters(condition) for condition in value]
+                groups = [(f"({sql})" if sql else "1", group_params) for sql, group_params in groups]
+                if key in ("$or", "OR"):
+                    sql = "(" + (" OR ".join(sql for sql, _ in groups) or "0") + ")"
+                elif key in ("$not", "NOT"):
+                    sql = "NOT (" + (" OR ".join(sql for sql, _ in groups) or "0") + ")"
+                else:
+                    sql = " AND ".join(sql for sql, _ in groups) or "1"
+                conditions.append(sql)
+                for _, group_params in groups:
+                    params.extend(group_params)
+                continue
+
+            if value == "*":
+                continue
+            if isinstance(value, list):
+                value = {"in": value}
+            elif not isinstance(value, dict):
+                value = {"eq": value}
+            for op, operand in value.items():
+                sql, op_params = self._compile_condition(key, op, operand)
+                conditions.append(sql)
+                params.extend(op_params)
+
+        return " AND ".join(conditions), params
+
+    @staticmethod
+    def _sql_value(value, scoped: bool):
+        if scoped:
+            return str(value)
+        if isinstance(value, bool):
+            # json_extract returns JSON booleans as 0/1
+            return int(value)
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return value
+
+    def _compile_condition(self, key: str, op: str, operand):
+        scoped = key in SCOPE_COLUMNS
+        field = key if scoped else "json_extract(payload, ?)"
+        field_params = [] if scoped else ['$."' + key.replace('"', '\\"') + '"']
+
+        if op == "eq":
+            return f"{field} = ?", [*field_params, self._sql_value(operand, scoped)]
+        if op == "ne":
+            return f"{field} IS NOT ?", [*field_params, self._sql_value(operand, scoped)]
+        if op in ("in", "nin"):
+            if not operand:
+                return ("0" if op == "in" else "1"), []
+            placeholders = ", ".join("?" * len(operand))
+            values = [self._sql_value(v, scoped) for v in operand]
+            if op == "in":
+                return f"{field} IN ({placeholders})", [*field_params, *values]
+            return f"COALESCE({field} NOT IN ({placeholders}), 1)", [*field_params, *values]
+        if op in RANGE_OPERATORS:
+            comparator = RANGE_OPERATORS[op]
+            if isinstance(operand, (int, float)) and not isinstance(operand, bool) and not scoped:
+                # Only numeric payload values take part in numeric comparisons
+                return (
+                    f"(typeof({field}) IN ('integer', 'real') AND {field} {comparator} ?)",
+                    [*field_params, *field_params, operand],
+                )
+            return f"{field} {comparator} ?", [*field_params, str(operand)]
+        if op == "contains":
+            return f"instr({field}, ?) > 0", [*field_params, str(operand)]
+        if op == "icontains":
+            return f"instr(lower({field}), lower(?)) > 0", [*field_params, str(operand)]
+        raise ValueError(f"Unsupported filter operator for numpy_mmap: {op}")
+
+    def _score(self, maps, query: np.ndarray, rows: Optional[np.ndarray], start: int, stop: int) -> np.ndarray:
+        if rows is None:
+            block = maps["vectors"][start:stop]
+            scales = maps["scales"][start:stop] if self.dtype == "int8" else None
+        else:
+            block = maps["vectors"][rows[start:stop]]
+            scales = maps["scales"][rows[start:stop]] if self.dtype == "int8" else None
+        scores = block.astype(np.float32) @ query
+        return scores * scales if scales is not None else scores
+
+    def search(
+        self, query: str, vectors: List[list], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[OutputData]:
+        """
+        Exact search over the live rows, restricted to the rows selected by the filters.
+
+        Args:
+            query (str): Query (not used, kept for API compatibility).
+            vectors (List[list]): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (Optional[Dict], optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            List[OutputData]: Search results, highest similarity first.
+        """
+        query_vector = np.asarray(vectors, dtype=np.float32).reshape(-1)
+        if self.distance_strategy == "cosine":
+            norm = np.linalg.norm(query_vector)
+            query_vector = query_vector / norm if norm else query_vector
+
+        filter_sql, filter_params = self._compile_filters(filters)
+        # A read transaction keeps the rows consistent with the generation they belong to
+        with self._lock:
+            self.connection.execute("BEGIN")
+            try:
+                generation = self._current_generation()
+                rows = None
+                if filter_sql:
+                    selected = self.connection.execute(
+                        f"SELECT row FROM vectors WHERE {filter_sql}", filter_params
+                    ).fetchall()
+                    rows = np.sort(np.fromiter((row for (row,) in selected), dtype=np.int64, count=len(selected)))
+            finally:
+                self.connection.execute("COMMIT")
+
+        maps = self._mapped(generation)
+        if rows is not None:
+            rows = rows[rows < maps["rows"]]
+        total = maps["rows"] if rows is None else len(rows)
+        if not total or limit <= 0:
+            return []
+
+        best_scores = np.empty(0, dtype=np.float32)
+        best_rows = np.empty(0, dtype=np.int64)
+        for start in range(0, total, self.search_batch_size):
+            stop = min(start + self.search_batch_size, total)
+            scores = self._score(maps, query_vector, rows, start, stop)
+            batch_rows = np.arange(start, stop) if rows is None else rows[start:stop]
+            if rows is None:
+                # Rows selected through SQLite are live, a full scan has to skip dead ones
+                alive = maps["live"][start:stop].astype(bool)
+                scores, batch_rows = scores[alive], batch_rows[alive]
+            best_scores = np.concatenate([best_scores, scores])
+            best_rows = np.concatenate([best_rows, batch_rows])
+            if len(best_scores) > limit:
+                top = np.argpartition(-best_scores, limit - 1)[:limit]
+                best_scores, best_rows = best_scores[top], best_rows[top]
+
+        order = np.argsort(-best_scores)
+        best_scores, best_rows = best_scores[order], best_rows[order]
+        return self._rows_to_results(best_rows, best_scores)
+
+    def _rows_to_results(self, rows: np.ndarray, scores: np.ndarray) -> List[OutputData]:
+        if not len(rows):
+            return []
+        placeholders = ", ".join("?" * len(rows))
+        with self._lock:
+            found = self.connection.execute(
+                f"SELECT row, id, payload FROM vectors WHERE row IN ({placeholders})", [int(row) for row in rows]
+            ).fetchall()
+        by_row = {row: (vector_id, payload) for row, vector_id, payload in found}
+        results = []
+        for row, score in zip(rows, scores):
+            # A row can be superseded between scoring and the lookup
+            if int(row) in by_row:
+                vector_id, payload = by_row[int(row)]
+                results.append(OutputData(id=vector_id, score=float(score), payload=json.loads(payload)))
+        return results
+
+    def delete(self, vector_id: str):
+        """
+        Delete a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to delete.
+        """
+        with self._write():
+            found = self.connection.execute("SELECT row FROM vectors WHERE id = ?", (vector_id,)).fetchone()
+            if found is None:
+                logger.warning(f"Vector {vector_id} not found in collection {self.collection_name}")
+                return
+            self._kill([found[0]], self._current_generation())
+            self.connection.execute("DELETE FROM vectors WHERE id = ?", (vector_id,))
+        self._maybe_compact()
+
+    def update(
+        self,
+        vector_id: str,
+        vector: Optional[List[float]] = None,
+        payload: Optional[Dict] = None,
+    ):
+        """
+        Update a vector and its payload.
+
+        Args:
+            vector_id (str): ID of the vector to update.
+            vector (Optional[List[float]], optional): Updated vector. Defaults to None.
+            payload (Optional[Dict], optional): Updated payload. Defaults to None.
+        """
+        with self._write():
+            found = self.connection.execute("SELECT row FROM vectors WHERE id = ?", (vector_id,)).fetchone()
+            if found is None:
+                raise ValueError(f"Vector {vector_id} not found")
+            if vector is not None:
+                generation = self._current_generation()
+                row = self._append(np.asarray([vector], dtype=np.float32), generation)
+                try:
+                    self.connection.execute("UPDATE vectors SET row = ? WHERE id = ?", (row, vector_id))
+                except Exception:
+                    self._kill([row], generation)
+                    raise
+                self._kill([found[0]], generation)
+            if payload is not None:
+                assignments = ", ".join(f"{column} = ?" for column in SCOPE_COLUMNS)
+                self.connection.execute(
+                    f"UPDATE vectors SET {assignments}, payload = ? WHERE id = ?",
+                    (*self._scope_values(payload), json.dumps(payload), vector_id),
+                )
+        if vector is not None:
+            self._maybe_compact()
+
+    def get(self, vector_id: str) -> OutputData:
+        """
+        Retrieve a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to retrieve.
+
+        Returns:
+            OutputData: Retrieved vector.
+        """
+        with self._lock:
+            found = self.connection.execute("SELECT payload FROM vectors WHERE id = ?", (vector_id,)).fetchone()
+        if found is None:
+            return None
+        return OutputData(id=vector_id, score=None, payload=json.loads(found[0]))
+
+    def list_cols(self) -> List[str]:
+        """
+        List all collections.
+
+        Returns:
+            List[str]: List of collection names.
+        """
+        if not os.path.isdir(self.base_path):
+            return []
+        return sorted(
+            name
+            for name in os.listdir(self.base_path)
+            if os.path.exists(os.path.join(self.base_path, name, "payloads.db"))
+        )
+
+    def delete_col(self):
+        """Delete the collection and its files."""
+        with self._lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+            self._maps = {}
+            self._generation = None
+            shutil.rmtree(self._col_path, ignore_errors=True)
+        logger.info(f"Deleted collection {self.collection_name}")
+
+    def col_info(self) -> Dict:
+        """
+        Get information about the collection.
+
+        Returns:
+            Dict: Collection information.
+        """
+        with self._lock:
+            count = self.connection.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+            generation = self._current_generation()
+            dead_rows = self._dead_rows()
+        rows = self._mapped(generation)["rows"]
+        size = sum(
+            os.path.getsize(self._file(kind, generation))
+            for kind in ("vectors", "scales", "live")
+            if os.path.exists(self._file(kind, generation))
+        )
+        return {
+            "name": self.collection_name,
+            "count": count,
+            "rows": rows,
+            "dead_rows": dead_rows,
+            "dimension": self.embedding_model_dims,
+            "dtype": self.dtype,
+            "distance": self.distance_strategy,
+            "size_bytes": size,
+        }
+
+    def list(self, filters: Optional[Dict] = None, limit: int = 100) -> List[OutputData]:
+        """
+        List vectors in the collection.
+
+        Args:
+            filters (Optional[Dict], optional): Filters to apply to the list. Defaults to None.
+            limit (int, optional): Number of vectors to return. Defaults to 100.
+
+        Returns:
+            List[OutputData]: List of vectors.
+        """
+        filter_sql, filter_params = self._compile_filters(filters)
+        where = f"WHERE {filter_sql}" if filter_sql else ""
+        with self._lock:
+            found = self.connection.execute(
+                f"SELECT id, payload FROM vectors {where} ORDER BY row LIMIT ?", (*filter_params, limit)
+            ).fetchall()
+        return [[OutputData(id=vector_id, score=None, payload=json.loads(payload)) for vector_id, payload in found]]
+
+    def _dead_rows(self) -> int:
+        return int(self.connection.execute("SELECT value FROM meta WHERE key = 'dead_rows'").fetchone()[0])
+
+    def _maybe_compact(self) -> None:
+        if self.auto_compact_ratio is None:
+            return
+        with self._lock:
+            generation = self._current_generation()
+            dead_rows = self._dead_rows()
+        rows = self._mapped(generation)["rows"]
+        if rows >= MIN_ROWS_FOR_AUTO_COMPACTION and dead_rows >= self.auto_compact_ratio * rows:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Rewrite the live rows into a new generation of files and drop the dead ones.
+
+        Readers that mapped the previous generation keep a valid view until they notice the new
+        generation on their next search.
+        """
+        with self._write():
+            generation = self._current_generation()
+            maps = self._mapped(generation)
+            live_rows = self.connection.execute("SELECT id, row FROM vectors ORDER BY row").fetchall()
+            new_generation = generation + 1
+            kinds = ["vectors", "live"] + (["scales"] if self.dtype == "int8" else [])
+            with open(self._file("vectors", new_generation), "wb") as vectors_file:
+                scales_file = open(self._file("scales", new_generation), "wb") if self.dtype == "int8" else None
+                try:
+                    for start in range(0, len(live_rows), self.search_batch_size):
+                        rows = [row for _, row in live_rows[start : start + self.search_batch_size]]
+                        vectors_file.write(np.ascontiguousarray(maps["vectors"][rows]).tobytes())
+                        if scales_file is not None:
+                            scales_file.write(np.ascontiguousarray(maps["scales"][rows]).tobytes())
+                finally:
+                    if scales_file is not None:
+                        scales_file.close()
+            with open(self._file("live", new_generation), "wb") as f:
+                f.write(np.ones(len(live_rows), dtype=np.uint8).tobytes())
+
+            # Rows only move down and are renumbered in order, so the UNIQUE constraint always holds
+            renumbered = [(i, vector_id) for i, (vector_id, _) in enumerate(live_rows)]
+            self.connection.executemany("UPDATE vectors SET row = ? WHERE id = ?", renumbered)
+            self.connection.execute("UPDATE meta SET value = ? WHERE key = 'generation'", (str(new_generation),))
+            self.connection.execute("UPDATE meta SET value = '0' WHERE key = 'dead_rows'")
+
+        for kind in kinds:
+            path = self._file(kind, generation)
+            if os.path.exists(path):
+                # Readers that still map the old generation keep their mapping after the unlink
+                os.remove(path)
+        logger.info(
+            f"Compacted collection {self.collection_name}: {maps['rows'] - len(live_rows)} dead rows removed"
+        )
+
+    def reset(self):
+        """Reset the collection by deleting and recreating it."""
+        logger.warning(f"Resetting collection {self.collection_name}...")
+        self.delete_col()
+        self.create_col(self.collection_name)
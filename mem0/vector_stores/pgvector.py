@@ -1,5 +1,7 @@
 import json
 import logging
+import time
+import uuid
 from contextlib import contextmanager
 from typing import Any, List, Optional
 
@@ -25,10 +27,22 @@ except ImportError:
             "Please install one of them using 'pip install psycopg[pool]' or 'pip install psycopg2'"
         )
 
+try:
+    from pgvector.psycopg import register_vector
+except ImportError:
+    register_vector = None
+
 from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# Payload keys mirrored into generated, B-tree indexed columns
+SCOPE_COLUMNS = ("user_id", "agent_id", "run_id")
+
+RANGE_OPERATORS = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+QUANTIZATION_MODES = ("halfvec", "bit")
+
 
 class OutputData(BaseModel):
     id: Optional[str]
@@ -53,6 +67,13 @@ class PGVector(VectorStoreBase):
         sslmode=None,
         connection_string=None,
         connection_pool=None,
+        hnsw_ef_search=None,
+        hnsw_iterative_scan="relaxed_order",
+        defer_index_creation=False,
+        insert_batch_size=1000,
+        quantization=None,
+        rescore_multiplier=4,
+        migrate_filter_columns=False,
     ):
         """
         Initialize the PGVector database.
@@ -72,11 +93,35 @@ class PGVector(VectorStoreBase):
             sslmode (str, optional): SSL mode for PostgreSQL connection (e.g., 'require', 'prefer', 'disable')
             connection_string (str, optional): PostgreSQL connection string (overrides individual connection parameters)
             connection_pool (Any, optional): psycopg2 connection pool object (overrides connection string and individual parameters)
+            hnsw_ef_search (int, optional): hnsw.ef_search used for searches, raised to the requested limit if lower
+            hnsw_iterative_scan (str, optional): hnsw.iterative_scan mode for filtered searches ("relaxed_order",
+                "strict_order" or None to disable), needs pgvector 0.8+
+            defer_index_creation (bool, optional): Build the HNSW/DiskANN index after the first `bulk_insert`
+                instead of in `create_col`
+            insert_batch_size (int, optional): Rows per multi-row upsert statement
+            quantization (str, optional): "halfvec" stores vectors as float16, "bit" indexes binary quantized
+                vectors and re-ranks the best candidates with the stored full-precision vectors
+            rescore_multiplier (int, optional): With "bit" quantization, limit * rescore_multiplier candidates
+                are re-ranked
+            migrate_filter_columns (bool, optional): Run `migrate_filter_columns` on start when an existing
+                collection lacks the generated scope columns
         """
+        if quantization is not None and quantization not in QUANTIZATION_MODES:
+            raise ValueError(f"Invalid quantization: {quantization}. Must be one of {', '.join(QUANTIZATION_MODES)}")
         self.collection_name = collection_name
+        self.hnsw_ef_search = hnsw_ef_search
+        self.hnsw_iterative_scan = hnsw_iterative_scan
         self.use_diskann = diskann
         self.use_hnsw = hnsw
         self.embedding_model_dims = embedding_model_dims
+        self.defer_index_creation = defer_index_creation
+        self.insert_batch_size = insert_batch_size
+        self.quantization = quantization
+        self.rescore_multiplier = rescore_multiplier
+        self.vector_type = "halfvec" if quantization == "halfvec" else "vector"
+        self.index_pending = False
+        # Scope keys stored in generated columns, filters on the others go through the payload
+        self.scope_columns = set(SCOPE_COLUMNS)
         self.connection_pool = None
 
         # Connection setup with priority: connection_pool > connection_string > individual parameters
@@ -109,6 +154,17 @@ class PGVector(VectorStoreBase):
         collections = self.list_cols()
         if collection_name not in collections:
             self.create_col()
+        else:
+            self.scope_columns = self._existing_scope_columns()
+            missing = [column for column in SCOPE_COLUMNS if column not in self.scope_columns]
+            if missing and migrate_filter_columns:
+                self.migrate_filter_columns()
+            elif missing:
+                logger.info(
+                    f"Collection {collection_name} has no generated columns for {', '.join(missing)}, "
+                    "call migrate_filter_columns() once to index them"
+                )
+        self._check_iterative_scan()
 
     @contextmanager
     def _get_cursor(self, commit: bool = False):
@@ -147,57 +203,310 @@ class PGVector(VectorStoreBase):
     def create_col(self) -> None:
         """
         Create a new collection (table in PostgreSQL).
-        Will also initialize vector search index if specified.
+        Will also initialize vector search index if specified, unless index creation is deferred.
         """
+        scope_columns = ",\n".join(self._scope_column_definition(column) for column in SCOPE_COLUMNS)
         with self._get_cursor(commit=True) as cur:
             cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
             cur.execute(
                 f"""
                 CREATE TABLE IF NOT EXISTS {self.collection_name} (
                     id UUID PRIMARY KEY,
-                    vector vector({self.embedding_model_dims}),
-                    payload JSONB
+                    vector {self.vector_type}({self.embedding_model_dims}),
+                    payload JSONB,
+                    {scope_columns}
                 );
                 """
             )
-            if self.use_diskann and self.embedding_model_dims < 2000:
-                cur.execute("SELECT * FROM pg_extension WHERE extname = 'vectorscale'")
-                if cur.fetchone():
-                    # Create DiskANN index if extension is installed for faster search
-                    cur.execute(
-                        f"""
-                        CREATE INDEX IF NOT EXISTS {self.collection_name}_diskann_idx
-                        ON {self.collection_name}
-                        USING diskann (vector);
-                        """
-                    )
-            elif self.use_hnsw:
+            self._create_filter_indexes(cur)
+            self.scope_columns = set(SCOPE_COLUMNS)
+            if self.defer_index_creation:
+                # Building the graph once over the loaded rows is much cheaper than maintaining it per insert
+                self.index_pending = self.use_diskann or self.use_hnsw
+            else:
+                self._create_vector_index(cur)
+
+    def create_index(self) -> None:
+        """Create the HNSW or DiskANN index, e.g. after a bulk load with deferred index creation."""
+        start = time.perf_counter()
+        with self._get_cursor(commit=True) as cur:
+            self._create_vector_index(cur)
+        self.index_pending = False
+        logger.info(f"Built vector index for {self.collection_name} in {time.perf_counter() - start:.2f}s")
+
+    def _create_vector_index(self, cur) -> None:
+        if self.use_diskann and self.embedding_model_dims < 2000:
+            cur.execute("SELECT * FROM pg_extension WHERE extname = 'vectorscale'")
+            if cur.fetchone():
+                # Create DiskANN index if extension is installed for faster search
                 cur.execute(
                     f"""
-                    CREATE INDEX IF NOT EXISTS {self.collection_name}_hnsw_idx
+                    CREATE INDEX IF NOT EXISTS {self.collection_name}_diskann_idx
                     ON {self.collection_name}
-                    USING hnsw (vector vector_cosine_ops)
+                    USING diskann (vector);
                     """
                 )
+        elif self.use_hnsw and self.quantization == "bit":
+            # Only the binary codes are indexed, the table keeps the full vectors for re-ranking
+            cur.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS {self.collection_name}_hnsw_bit_idx
+                ON {self.collection_name}
+                USING hnsw ((binary_quantize(vector)::bit({self.embedding_model_dims})) bit_hamming_ops)
+                """
+            )
+        elif self.use_hnsw:
+            cur.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS {self.collection_name}_hnsw_idx
+                ON {self.collection_name}
+                USING hnsw (vector {self.vector_type}_cosine_ops)
+                """
+            )
+
+    @staticmethod
+    def _scope_column_definition(column: str) -> str:
+        return f"{column} TEXT GENERATED ALWAYS AS (payload->>'{column}') STORED"
+
+    def _existing_scope_columns(self) -> set:
+        with self._get_cursor() as cur:
+            cur.execute(
+                """
+                SELECT column_name FROM information_schema.columns
+                WHERE table_schema = 'public' AND table_name = %s AND column_name = ANY(%s)
+                """,
+                (self.collection_name, list(SCOPE_COLUMNS)),
+            )
+            return {row[0] for row in cur.fetchall()}
+
+    def migrate_filter_columns(self) -> None:
+        """
+        Add the generated scope columns and the filter indexes to a collection created without them.
+
+        Adding a stored generated column rewrites the table under an ACCESS EXCLUSIVE lock, so this is a
+        one-time migration to run when the collection can be locked, not on every start.
+        """
+        existing = self._existing_scope_columns()
+        missing = [column for column in SCOPE_COLUMNS if column not in existing]
+        start = time.perf_counter()
+        with self._get_cursor(commit=True) as cur:
+            for column in missing:
+                definition = self._scope_column_definition(column)
+                cur.execute(f"ALTER TABLE {self.collection_name} ADD COLUMN IF NOT EXISTS {definition}")
+            self._create_filter_indexes(cur)
+        self.scope_columns = set(SCOPE_COLUMNS)
+        logger.info(f"Migrated the filter columns of {self.collection_name} in {time.perf_counter() - start:.2f}s")
+
+    def _create_filter_indexes(self, cur) -> None:
+        """
+        Index the payload for filtered searches.
+
+        A GIN `jsonb_path_ops` index serves containment filters on any key, and the
+        generated scope columns get B-tree indexes.
+        """
+        for column in SCOPE_COLUMNS:
+            cur.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.collection_name}_{column}_idx ON {self.collection_name} ({column})"
+            )
+        cur.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS {self.collection_name}_payload_gin_idx
+            ON {self.collection_name}
+            USING gin (payload jsonb_path_ops)
+            """
+        )
+
+    def _check_iterative_scan(self) -> None:
+        """Disable HNSW iterative scans on pgvector versions older than 0.8, which don't have them."""
+        if not self.hnsw_iterative_scan:
+            return
+        try:
+            with self._get_cursor() as cur:
+                cur.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+                row = cur.fetchone()
+            version = tuple(int(part) for part in str(row[0]).split(".")[:2])
+        except Exception as e:
+            logger.debug(f"Could not read the pgvector version: {e}")
+            return
+        if version < (0, 8):
+            logger.info("pgvector < 0.8 has no iterative index scans, filtered searches may return fewer results")
+            self.hnsw_iterative_scan = None
+
+    def _compile_filters(self, filters: Optional[dict]):
+        """
+        Compile mem0 filters into a parameterized SQL condition.
+
+        Plain values and `eq` use the generated scope columns or JSONB containment
+        (served by the GIN index). `ne`, `in`, `nin`, `gt`/`gte`/`lt`/`lte` (numeric
+        for numbers, text otherwise), `contains`/`icontains`, and `$or`/`$not`/`$and`
+        lists are supported. `"*"` matches any value.
+
+        Args:
+            filters (Dict, optional): Filters to compile.
+
+        Returns:
+            tuple: SQL condition (empty if nothing to filter) and its parameters.
+        """
+        conditions, params = [], []
+        for key, value in (filters or {}).items():
+            if key in ("$or", "OR", "$not", "NOT", "$and", "AND"):
+                groups = [self._compile_filters(condition) for condition in value]
+                groups = [(f"({sql})" if sql else "TRUE", group_params) for sql, group_params in groups]
+                if key in ("$or", "OR"):
+                    sql = "(" + " OR ".join(sql for sql, _ in groups) + ")"
+                elif key in ("$not", "NOT"):
+                    sql = "NOT (" + " OR ".join(sql for sql, _ in groups) + ")"
+                else:
+                    sql = " AND ".join(sql for sql, _ in groups)
+                conditions.append(sql)
+                for _, group_params in groups:
+                    params.extend(group_params)
+                continue
+
+            if value == "*":
+                continue
+            if isinstance(value, list):
+                value = {"in": value}
+            elif not isinstance(value, dict):
+                value = {"eq": value}
+
+            for op, operand in value.items():
+                sql, op_params = self._compile_condition(key, op, operand)
+                conditions.append(sql)
+                params.extend(op_params)
+
+        return " AND ".join(conditions), params
+
+    @staticmethod
+    def _as_text(value) -> str:
+        """Text form of a value as returned by the `->>` operator."""
+        return value if isinstance(value, str) else json.dumps(value)
+
+    def _compile_condition(self, key: str, op: str, operand):
+        field = key if key in self.scope_columns else "(payload->>%s)"
+        field_params = [] if key in self.scope_columns else [key]
+
+        if op == "eq":
+            if key in self.scope_columns:
+                return f"{key} = %s", [self._as_text(operand)]
+            return "payload @> %s::jsonb", [json.dumps({key: operand})]
+        if op == "ne":
+            return f"{field} IS DISTINCT FROM %s", [*field_params, self._as_text(operand)]
+        if op == "in":
+            return f"{field} = ANY(%s)", [*field_params, [self._as_text(v) for v in operand]]
+        if op == "nin":
+            return f"NOT COALESCE({field} = ANY(%s), false)", [*field_params, [self._as_text(v) for v in operand]]
+        if op in RANGE_OPERATORS:
+            comparator = RANGE_OPERATORS[op]
+            if isinstance(operand, (int, float)) and not isinstance(operand, bool):
+                # Only numeric payload values take part in numeric comparisons
+                numeric_field = "(CASE WHEN jsonb_typeof(payload->%s) = 'number' THEN (payload->>%s)::numeric END)"
+                return f"{numeric_field} {comparator} %s", [key, key, operand]
+            return f"{field} {comparator} %s", [*field_params, self._as_text(operand)]
+        if op in ("contains", "icontains"):
+            pattern = str(operand).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            like = "ILIKE" if op == "icontains" else "LIKE"
+            return f"{field} {like} %s", [*field_params, f"%{pattern}%"]
+        raise ValueError(f"Unsupported filter operator for pgvector: {op}")
 
     def insert(self, vectors: list[list[float]], payloads=None, ids=None) -> None:
+        """
+        Insert vectors, replacing the vector and payload of ids that already exist.
+
+        Args:
+            vectors (List[List[float]]): Vectors to insert.
+            payloads (List[Dict], optional): Payloads for the vectors.
+            ids (List[str], optional): IDs for the vectors.
+        """
         logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
-        json_payloads = [json.dumps(payload) for payload in payloads]
+        rows = self._prepare_rows(vectors, payloads, ids)
+        with self._get_cursor(commit=True) as cur:
+            self._upsert_rows(cur, rows)
+
+    def bulk_insert(self, vectors: list[list[float]], payloads=None, ids=None) -> dict[str, float]:
+        """
+        Load many vectors at once with `COPY ... FROM STDIN (FORMAT BINARY)`.
+
+        Rows are copied into a temporary staging table and upserted from there in a single
+        statement. The binary vector adapter from the `pgvector` package is used when it is
+        installed, otherwise vectors are staged as `float4[]` and cast. With psycopg2 this
+        falls back to batched multi-row upserts. A deferred vector index is built once the
+        rows are loaded.
+
+        Args:
+            vectors (List[List[float]]): Vectors to load.
+            payloads (List[Dict], optional): Payloads for the vectors.
+            ids (List[str], optional): IDs for the vectors.
 
-        data = [(id, vector, payload) for id, vector, payload in zip(ids, vectors, json_payloads)]
+        Returns:
+            Dict[str, float]: Number of rows loaded, load time in seconds and rows per second.
+        """
+        rows = self._prepare_rows(vectors, payloads, ids)
+        start = time.perf_counter()
+        with self._get_cursor(commit=True) as cur:
+            if PSYCOPG_VERSION == 3:
+                self._copy_rows(cur, rows)
+            else:
+                self._upsert_rows(cur, rows)
+        elapsed = time.perf_counter() - start
+        stats = {"rows": len(rows), "seconds": elapsed, "rows_per_sec": len(rows) / elapsed if elapsed else 0.0}
+        logger.info(
+            f"Loaded {stats['rows']} vectors into {self.collection_name} in {elapsed:.2f}s "
+            f"({stats['rows_per_sec']:.0f} rows/sec)"
+        )
+
+        if self.index_pending:
+            self.create_index()
+        return stats
+
+    @staticmethod
+    def _prepare_rows(vectors, payloads=None, ids=None) -> list[tuple]:
+        payloads = payloads or [{} for _ in vectors]
+        ids = ids or [str(uuid.uuid4()) for _ in vectors]
+        # A statement can't upsert the same id twice, the last occurrence wins
+        rows = {str(id): (str(id), vector, payload) for id, vector, payload in zip(ids, vectors, payloads)}
+        return list(rows.values())
+
+    def _upsert_rows(self, cur, rows: list[tuple]) -> None:
+        """Upsert rows with one multi-row `INSERT ... ON CONFLICT` statement per batch."""
+        conflict = "ON CONFLICT (id) DO UPDATE SET vector = EXCLUDED.vector, payload = EXCLUDED.payload"
+        data = [(id, vector, json.dumps(payload)) for id, vector, payload in rows]
         if PSYCOPG_VERSION == 3:
-            with self._get_cursor(commit=True) as cur:
-                cur.executemany(
-                    f"INSERT INTO {self.collection_name} (id, vector, payload) VALUES (%s, %s, %s)",
-                    data,
+            for start in range(0, len(data), self.insert_batch_size):
+                batch = data[start : start + self.insert_batch_size]
+                values = ", ".join(["(%s, %s, %s)"] * len(batch))
+                cur.execute(
+                    f"INSERT INTO {self.collection_name} (id, vector, payload) VALUES {values} {conflict}",
+                    [value for row in batch for value in row],
                 )
         else:
-            with self._get_cursor(commit=True) as cur:
-                execute_values(
-                    cur,
-                    f"INSERT INTO {self.collection_name} (id, vector, payload) VALUES %s",
-                    data,
-                )
+            execute_values(
+                cur,
+                f"INSERT INTO {self.collection_name} (id, vector, payload) VALUES %s {conflict}",
+                data,
+                page_size=self.insert_batch_size,
+            )
+
+    def _copy_rows(self, cur, rows: list[tuple]) -> None:
+        """Binary COPY rows into a staging table and upsert them into the collection (psycopg3 only)."""
+        vector_type = "vector" if register_vector is not None else "float4[]"
+        if register_vector is not None:
+            # Cursors copy the connection's adapters when created, so register first and open a new cursor
+            register_vector(cur.connection)
+        staging = f"{self.collection_name}_staging"
+        cur.execute(f"CREATE TEMP TABLE {staging} (id UUID, vector {vector_type}, payload JSONB) ON COMMIT DROP")
+        with cur.connection.cursor() as copy_cur:
+            with copy_cur.copy(f"COPY {staging} (id, vector, payload) FROM STDIN (FORMAT BINARY)") as copy:
+                copy.set_types(["uuid", vector_type, "jsonb"])
+                for id, vector, payload in rows:
+                    copy.write_row((uuid.UUID(id), vector, payload))
+        cur.execute(
+            f"""
+            INSERT INTO {self.collection_name} (id, vector, payload)
+            SELECT id, vector::{self.vector_type}({self.embedding_model_dims}), payload FROM {staging}
+            ON CONFLICT (id) DO UPDATE SET vector = EXCLUDED.vector, payload = EXCLUDED.payload
+            """
+        )
 
     def search(
         self,
@@ -218,29 +527,50 @@ class PGVector(VectorStoreBase):
         Returns:
             list: Search results.
         """
-        filter_conditions = []
-        filter_params = []
-
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
-
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        filter_sql, filter_params = self._compile_filters(filters)
+        filter_clause = f"WHERE {filter_sql}" if filter_sql else ""
 
         with self._get_cursor() as cur:
-            cur.execute(
-                f"""
-                SELECT id, vector <=> %s::vector AS distance, payload
-                FROM {self.collection_name}
-                {filter_clause}
-                ORDER BY distance
-                LIMIT %s
-                """,
-                (vectors, *filter_params, limit),
-            )
+            # With binary quantization the index ranks candidates, which are then re-ranked by exact distance
+            candidates = limit * self.rescore_multiplier if self.quantization == "bit" else limit
+            if self.use_hnsw and not self.use_diskann:
+                # HNSW returns at most ef_search rows, and filtering can drop some of them
+                ef_search = max(self.hnsw_ef_search or 40, candidates)
+                cur.execute("SELECT set_config('hnsw.ef_search', %s, true)", (str(ef_search),))
+                if filter_sql and self.hnsw_iterative_scan:
+                    cur.execute("SELECT set_config('hnsw.iterative_scan', %s, true)", (self.hnsw_iterative_scan,))
+            if self.quantization == "bit":
+                bits = f"bit({self.embedding_model_dims})"
+                cur.execute(
+                    f"""
+                    SELECT id, vector <=> %s::vector AS distance, payload
+                    FROM (
+                        SELECT id, vector, payload
+                        FROM {self.collection_name}
+                        {filter_clause}
+                        ORDER BY binary_quantize(vector)::{bits} <~> binary_quantize(%s::vector)::{bits}
+                        LIMIT %s
+                    ) candidates
+                    ORDER BY distance
+                    LIMIT %s
+                    """,
+                    (vectors, *filter_params, vectors, candidates, limit),
+                )
+            else:
+                cur.execute(
+                    f"""
+                    SELECT id, vector <=> %s::{self.vector_type} AS distance, payload
+                    FROM {self.collection_name}
+                    {filter_clause}
+                    ORDER BY distance
+                    LIMIT %s
+                    """,
+                    (vectors, *filter_params, limit),
+                )
 
             results = cur.fetchall()
+        # Relaxed iterative scans can return rows slightly out of order
+        results = sorted(results, key=lambda r: r[1])
         return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
 
     def delete(self, vector_id: str) -> None:
@@ -267,27 +597,20 @@ class PGVector(VectorStoreBase):
             vector (List[float], optional): Updated vector.
             payload (Dict, optional): Updated payload.
         """
+        assignments, params = [], []
+        if vector:
+            assignments.append("vector = %s")
+            params.append(vector)
+        if payload:
+            assignments.append("payload = %s")
+            params.append(Json(payload))
+        if not assignments:
+            return
         with self._get_cursor(commit=True) as cur:
-            if vector:
-               cur.execute(
-                    f"UPDATE {self.collection_name} SET vector = %s WHERE id = %s",
-                    (vector, vector_id),
-                )
-            if payload:
-                # Handle JSON serialization based on psycopg version
-                if PSYCOPG_VERSION == 3:
-                    # psycopg3 uses psycopg.types.json.Json
-                    cur.execute(
-                        f"UPDATE {self.collection_name} SET payload = %s WHERE id = %s",
-                        (Json(payload), vector_id),
-                    )
-                else:
-                    # psycopg2 uses psycopg2.extras.Json
-                    cur.execute(
-                        f"UPDATE {self.collection_name} SET payload = %s WHERE id = %s",
-                        (Json(payload), vector_id),
-                    )
-
+            cur.execute(
+                f"UPDATE {self.collection_name} SET {', '.join(assignments)} WHERE id = %s",
+                (*params, vector_id),
+            )
 
     def get(self, vector_id: str) -> OutputData:
         """
@@ -362,15 +685,8 @@ class PGVector(VectorStoreBase):
         Returns:
             List[OutputData]: List of vectors.
         """
-        filter_conditions = []
-        filter_params = []
-
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
-
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        filter_sql, filter_params = self._compile_filters(filters)
+        filter_clause = f"WHERE {filter_sql}" if filter_sql else ""
 
         query = f"""
             SELECT id, vector, payload
@@ -4,13 +4,21 @@ import shutil
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
+    DatetimeRange,
     Distance,
     FieldCondition,
     Filter,
+    MatchAny,
+    MatchExcept,
+    MatchText,
     MatchValue,
+    PayloadSchemaType,
     PointIdsList,
     PointStruct,
     Range,
+    TextIndexParams,
+    TextIndexType,
+    TokenizerType,
     VectorParams,
 )
 
@@ -18,6 +26,16 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# Payload fields indexed by default, mem0 filters on them for every request
+DEFAULT_PAYLOAD_INDEXES = {
+    "user_id": "keyword",
+    "agent_id": "keyword",
+    "run_id": "keyword",
+    "actor_id": "keyword",
+}
+
+RANGE_OPERATORS = {"gt", "gte", "lt", "lte"}
+
 
 class Qdrant(VectorStoreBase):
     def __init__(
@@ -31,6 +49,7 @@ class Qdrant(VectorStoreBase):
         url: str = None,
         api_key: str = None,
         on_disk: bool = False,
+        payload_indexes: dict = None,
     ):
         """
         Initialize the Qdrant vector store.
@@ -45,6 +64,8 @@ class Qdrant(VectorStoreBase):
             url (str, optional): Full URL for Qdrant server. Defaults to None.
             api_key (str, optional): API key for Qdrant server. Defaults to None.
             on_disk (bool, optional): Enables persistent storage. Defaults to False.
+            payload_indexes (dict, optional): Extra payload indexes to create, mapping field names to a schema
+                ("keyword", "integer", "float", "bool", "datetime", "text" or "uuid"). Defaults to None.
         """
         if client:
             self.client = client
@@ -73,6 +94,7 @@ class Qdrant(VectorStoreBase):
         self.collection_name = collection_name
         self.embedding_model_dims = embedding_model_dims
         self.on_disk = on_disk
+        self.payload_indexes = {**DEFAULT_PAYLOAD_INDEXES, **(payload_indexes or {})}
         self.create_col(embedding_model_dims, on_disk)
 
     def create_col(self, vector_size: int, on_disk: bool, distance: Distance = Distance.COSINE):
@@ -99,25 +121,34 @@ class Qdrant(VectorStoreBase):
         self._create_filter_indexes()
 
     def _create_filter_indexes(self):
-        """Create indexes for commonly used filter fields to enable filtering."""
+        """Create payload indexes for the configured filter fields so filtered searches use them."""
         # Only create payload indexes for remote Qdrant servers
         if self.is_local:
             logger.debug("Skipping payload index creation for local Qdrant (not supported)")
             return
-            
-        common_fields = ["user_id", "agent_id", "run_id", "actor_id"]
-        
-        for field in common_fields:
+
+        for field, schema in self.payload_indexes.items():
             try:
                 self.client.create_payload_index(
                     collection_name=self.collection_name,
                     field_name=field,
-                    field_schema="keyword"
+                    field_schema=self._payload_schema(schema),
                 )
-                logger.info(f"Created index for {field} in collection {self.collection_name}")
+                logger.info(f"Created {schema} index for {field} in collection {self.collection_name}")
             except Exception as e:
                 logger.debug(f"Index for {field} might already exist: {e}")
 
+    @staticmethod
+    def _payload_schema(schema: str):
+        """
+        Map a configured index type to a Qdrant payload schema.
+
+        Full-text indexes are lowercased so `icontains` filters match regardless of case.
+        """
+        if schema == "text":
+            return TextIndexParams(type=TextIndexType.TEXT, tokenizer=TokenizerType.WORD, lowercase=True)
+        return PayloadSchemaType(schema)
+
     def insert(self, vectors: list, payloads: list = None, ids: list = None):
         """
         Insert vectors into a collection.
@@ -142,6 +173,12 @@ class Qdrant(VectorStoreBase):
         """
         Create a Filter object from the provided filters.
 
+        Translates mem0's filter format: plain values are equality matches, operator
+        dicts (`eq`, `ne`, `gt`, `gte`, `lt`, `lte`, `in`, `nin`, `contains`,
+        `icontains`) map to `MatchValue`, `MatchExcept`, `Range`/`DatetimeRange`,
+        `MatchAny` and `MatchText`, and `$or`/`$not` lists become `should`/`must_not`
+        clauses. A `"*"` value matches any value and adds no condition.
+
         Args:
             filters (dict): Filters to apply.
 
@@ -150,14 +187,76 @@ class Qdrant(VectorStoreBase):
         """
         if not filters:
             return None
-            
-        conditions = []
+
+        must, should, must_not = [], [], []
         for key, value in filters.items():
-            if isinstance(value, dict) and "gte" in value and "lte" in value:
-                conditions.append(FieldCondition(key=key, range=Range(gte=value["gte"], lte=value["lte"])))
+            if key in ("$or", "OR"):
+                should.extend(self._create_group(condition) for condition in value)
+            elif key in ("$not", "NOT"):
+                must_not.extend(self._create_group(condition) for condition in value)
+            elif key in ("$and", "AND"):
+                must.extend(self._create_group(condition) for condition in value)
             else:
-                conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
-        return Filter(must=conditions) if conditions else None
+                must.extend(self._create_conditions(key, value))
+
+        if not (must or should or must_not):
+            return None
+        return Filter(must=must or None, should=should or None, must_not=must_not or None)
+
+    def _create_group(self, condition: dict):
+        """Create a single condition for a sub filter, nesting a Filter when it has several."""
+        sub_filter = self._create_filter(condition)
+        if sub_filter is None:
+            # An empty or wildcard-only condition matches everything
+            return Filter(must=[])
+        if sub_filter.must and len(sub_filter.must) == 1 and not sub_filter.should and not sub_filter.must_not:
+            return sub_filter.must[0]
+        return sub_filter
+
+    @staticmethod
+    def _create_conditions(key: str, value) -> list:
+        """
+        Create the field conditions of a single filter key.
+
+        Args:
+            key (str): Payload field.
+            value: Plain value, list of values or dict of operators.
+
+        Returns:
+            list: Field conditions that must all match.
+        """
+        if value == "*":
+            return []
+        if isinstance(value, list):
+            return [FieldCondition(key=key, match=MatchAny(any=value))]
+        if not isinstance(value, dict):
+            return [FieldCondition(key=key, match=MatchValue(value=value))]
+
+        conditions = []
+        bounds = {op: bound for op, bound in value.items() if op in RANGE_OPERATORS}
+        if bounds:
+            # Datetime payloads are compared as RFC 3339 strings
+            if any(isinstance(bound, str) for bound in bounds.values()):
+                conditions.append(FieldCondition(key=key, range=DatetimeRange(**bounds)))
+            else:
+                conditions.append(FieldCondition(key=key, range=Range(**bounds)))
+
+        for op, operand in value.items():
+            if op in RANGE_OPERATORS:
+                continue
+            if op == "eq":
+                conditions.append(FieldCondition(key=key, match=MatchValue(value=operand)))
+            elif op == "ne":
+                conditions.append(FieldCondition(key=key, match=MatchExcept(**{"except": [operand]})))
+            elif op == "in":
+                conditions.append(FieldCondition(key=key, match=MatchAny(any=list(operand))))
+            elif op == "nin":
+                conditions.append(FieldCondition(key=key, match=MatchExcept(**{"except": list(operand)})))
+            elif op in ("contains", "icontains"):
+                conditions.append(FieldCondition(key=key, match=MatchText(text=operand)))
+            else:
+                raise ValueError(f"Unsupported filter operator for Qdrant: {op}")
+        return conditions
 
     def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None) -> list:
         """
@@ -195,6 +294,30 @@ class Qdrant(VectorStoreBase):
             ),
         )
 
+    def delete_many(self, vector_ids: list):
+        """
+        Delete vectors by ID with a single request.
+
+        Args:
+            vector_ids (list): IDs of the vectors to delete.
+        """
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=PointIdsList(points=vector_ids),
+        )
+
+    def get_many(self, vector_ids: list) -> list:
+        """
+        Retrieve vectors by ID with a single request.
+
+        Args:
+            vector_ids (list): IDs of the vectors to retrieve.
+
+        Returns:
+            list: Retrieved vectors; unknown IDs are omitted.
+        """
+        return self.client.retrieve(collection_name=self.collection_name, ids=vector_ids, with_payload=True)
+
     def update(self, vector_id: int, vector: list = None, payload: dict = None):
         """
         Update a vector and its payload.
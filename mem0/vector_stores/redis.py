@@ -1,5 +1,6 @@
 import json
 import logging
+import re
 from datetime import datetime
 from functools import reduce
 
@@ -9,7 +10,7 @@ import redis
 from redis.commands.search.query import Query
 from redisvl.index import SearchIndex
 from redisvl.query import VectorQuery
-from redisvl.query.filter import Tag
+from redisvl.query.filter import FilterExpression, Num, Tag, Text
 
 from mem0.memory.utils import extract_json
 from mem0.vector_stores.base import VectorStoreBase
@@ -37,6 +38,20 @@ DEFAULT_FIELDS = [
 
 excluded_keys = {"user_id", "agent_id", "run_id", "hash", "data", "created_at", "updated_at"}
 
+RETURN_FIELDS = ["memory_id", "hash", "agent_id", "run_id", "user_id", "memory", "metadata", "created_at", "updated_at"]
+
+# How the filterable payload keys are indexed, see DEFAULT_FIELDS
+TAG_FIELDS = {"memory_id", "hash", "agent_id", "run_id", "user_id"}
+NUMERIC_FIELDS = {"created_at", "updated_at"}
+TEXT_FIELDS = {"data": "memory"}
+
+RANGE_OPERATORS = {"gt": "__gt__", "gte": "__ge__", "lt": "__lt__", "lte": "__le__"}
+
+# Extra candidates fetched when part of the filter has to be checked on the results
+FILTER_OVERFETCH_FACTOR = 10
+# Extra KNN candidates re-ranked with the full-text score in hybrid searches
+HYBRID_OVERFETCH_FACTOR = 4
+
 
 class MemoryResult:
     def __init__(self, id: str, payload: dict, score: float = None):
@@ -51,6 +66,8 @@ class RedisDB(VectorStoreBase):
         redis_url: str,
         collection_name: str,
         embedding_model_dims: int,
+        hybrid_search: bool = False,
+        hybrid_alpha: float = 0.7,
     ):
         """
         Initialize the Redis vector store.
@@ -59,8 +76,13 @@ class RedisDB(VectorStoreBase):
             redis_url (str): Redis URL.
             collection_name (str): Collection name.
             embedding_model_dims (int): Embedding model dimensions.
+            hybrid_search (bool, optional): Combine a BM25 score on the memory text with the KNN search.
+            hybrid_alpha (float, optional): Weight of the vector similarity in hybrid scores, the text
+                score gets the rest.
         """
         self.embedding_model_dims = embedding_model_dims
+        self.hybrid_search = hybrid_search
+        self.hybrid_alpha = hybrid_alpha
         index_schema = {
             "name": collection_name,
             "prefix": f"mem0:{collection_name}",
@@ -119,111 +141,319 @@ class RedisDB(VectorStoreBase):
 
         return index
 
+    def _key(self, vector_id: str) -> str:
+        return f"{self.schema['index']['prefix']}:{vector_id}"
+
+    @staticmethod
+    def _build_entry(vector_id: str, vector: list = None, payload: dict = None) -> dict:
+        entry = {
+            "memory_id": vector_id,
+            "hash": payload["hash"],
+            "memory": payload["data"],
+            "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
+        }
+        if payload.get("updated_at"):
+            entry["updated_at"] = int(datetime.fromisoformat(payload["updated_at"]).timestamp())
+        if vector is not None:
+            entry["embedding"] = np.array(vector, dtype=np.float32).tobytes()
+
+        # Conditionally add optional fields
+        for field in ["agent_id", "run_id", "user_id"]:
+            if field in payload:
+                entry[field] = payload[field]
+
+        # Add metadata excluding specific keys
+        entry["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
+        return entry
+
+    @staticmethod
+    def _load_metadata(metadata) -> dict:
+        # Metadata is written with json.dumps, only fall back to extracting JSON for unexpected values
+        try:
+            return json.loads(metadata)
+        except (TypeError, ValueError):
+            return json.loads(extract_json(metadata))
+
+    @staticmethod
+    def _format_timestamp(value) -> str:
+        return datetime.fromtimestamp(int(value), tz=pytz.timezone("US/Pacific")).isoformat(timespec="microseconds")
+
+    def _build_result(self, result, score: float = None) -> MemoryResult:
+        fields = result if isinstance(result, dict) else result.__dict__
+        payload = {
+            "hash": fields["hash"],
+            "data": fields["memory"],
+            "created_at": self._format_timestamp(fields["created_at"]),
+        }
+        if fields.get("updated_at"):
+            payload["updated_at"] = self._format_timestamp(fields["updated_at"])
+        payload.update({field: fields[field] for field in ["agent_id", "run_id", "user_id"] if field in fields})
+        payload.update(self._load_metadata(fields["metadata"]))
+        return MemoryResult(id=fields["memory_id"], payload=payload, score=score)
+
     def insert(self, vectors: list, payloads: list = None, ids: list = None):
-        data = []
-        for vector, payload, id in zip(vectors, payloads, ids):
-            # Start with required fields
-            entry = {
-                "memory_id": id,
-                "hash": payload["hash"],
-                "memory": payload["data"],
-                "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-                "embedding": np.array(vector, dtype=np.float32).tobytes(),
-            }
-
-            # Conditionally add optional fields
-            for field in ["agent_id", "run_id", "user_id"]:
-                if field in payload:
-                    entry[field] = payload[field]
-
-            # Add metadata excluding specific keys
-            entry["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
-
-            data.append(entry)
+        data = [self._build_entry(id, vector, payload) for vector, payload, id in zip(vectors, payloads, ids)]
+        # SearchIndex.load writes the entries through a pipeline
         self.index.load(data, id_field="memory_id")
 
+    def _build_filter(self, filters: dict = None):
+        """
+        Translate mem0 filters into a RediSearch filter expression.
+
+        Tag fields support `eq`, `ne`, `in`, `nin` and `contains`, `created_at` and `updated_at` are
+        numeric (ISO timestamps are converted) and support every comparison, and `$or`/`$not`/`$and`
+        groups are combined. Conditions on `data` are narrowed with a full-text phrase match. Whatever
+        can't be expressed exactly in RediSearch is checked on the results.
+
+        Args:
+            filters (dict, optional): Filters to translate.
+
+        Returns:
+            tuple: The filter expression (None to match everything) and whether it is exact.
+        """
+        expressions, exact = [], True
+        for key, value in (filters or {}).items():
+            if key in ("$or", "OR", "$not", "NOT", "$and", "AND"):
+                groups = [self._build_filter(condition) for condition in value]
+                if key in ("$and", "AND"):
+                    expressions.extend(expression for expression, _ in groups if expression is not None)
+                    exact = exact and all(group_exact for _, group_exact in groups)
+                    continue
+                if key in ("$or", "OR") and any(expr is None and group_exact for expr, group_exact in groups):
+                    # One of the alternatives matches everything
+                    continue
+                if not groups or any(expression is None for expression, _ in groups):
+                    exact = False
+                    continue
+                expression = reduce(lambda x, y: x | y, [expression for expression, _ in groups])
+                groups_exact = all(group_exact for _, group_exact in groups)
+                if key in ("$not", "NOT"):
+                    # The negation of a partial filter would drop matching memories
+                    if not groups_exact:
+                        exact = False
+                        continue
+                    expression = FilterExpression(f"-({expression})")
+                expressions.append(expression)
+                exact = exact and groups_exact
+                continue
+
+            if value is None or value == "*":
+                continue
+            if isinstance(value, list):
+                value = {"in": value}
+            elif not isinstance(value, dict):
+                value = {"eq": value}
+            for op, operand in value.items():
+                expression, condition_exact = self._build_condition(key, op, operand)
+                if expression is not None:
+                    expressions.append(expression)
+                exact = exact and condition_exact
+
+        if not expressions:
+            return None, exact
+        return reduce(lambda x, y: x & y, expressions), exact
+
+    def _build_condition(self, key: str, op: str, operand):
+        if op not in ("eq", "ne", "in", "nin", "contains", "icontains", *RANGE_OPERATORS):
+            raise ValueError(f"Unsupported filter operator for Redis: {op}")
+
+        if key in TAG_FIELDS:
+            tag = Tag(key)
+            if op == "eq":
+                return tag == str(operand), True
+            if op == "ne":
+                return tag != str(operand), True
+            if op == "in":
+                return tag == [str(v) for v in operand], True
+            if op == "nin":
+                return tag != [str(v) for v in operand], True
+            if op == "contains":
+                return tag % f"*{operand}*", True
+        elif key in NUMERIC_FIELDS:
+            num = Num(key)
+            if op == "eq":
+                return num == self._to_number(operand), True
+            if op == "ne":
+                return num != self._to_number(operand), True
+            if op in RANGE_OPERATORS:
+                return getattr(num, RANGE_OPERATORS[op])(self._to_number(operand)), True
+            if op == "in":
+                return reduce(lambda x, y: x | y, [num == self._to_number(v) for v in operand]), True
+            if op == "nin":
+                return reduce(lambda x, y: x & y, [num != self._to_number(v) for v in operand]), True
+        elif key in TEXT_FIELDS:
+            # A phrase match is case and punctuation insensitive, so it only narrows the candidates
+            text = Text(TEXT_FIELDS[key])
+            if op == "eq":
+                return text == str(operand), False
+            if op == "in":
+                return reduce(lambda x, y: x | y, [text == str(v) for v in operand]), False
+        return None, False
+
+    @staticmethod
+    def _to_number(value):
+        if isinstance(value, str):
+            return int(datetime.fromisoformat(value).timestamp())
+        return value
+
+    def _matches(self, payload: dict, filters: dict) -> bool:
+        """Check a payload against mem0 filters, for conditions that couldn't be pushed to RediSearch."""
+        for key, value in filters.items():
+            if key in ("$or", "OR"):
+                if not any(self._matches(payload, condition) for condition in value):
+                    return False
+                continue
+            if key in ("$not", "NOT"):
+                if any(self._matches(payload, condition) for condition in value):
+                    return False
+                continue
+            if key in ("$and", "AND"):
+                if not all(self._matches(payload, condition) for condition in value):
+                    return False
+                continue
+
+            if value is None or value == "*":
+                continue
+            if isinstance(value, list):
+                value = {"in": value}
+            elif not isinstance(value, dict):
+                value = {"eq": value}
+            actual = payload.get(key)
+            if key in NUMERIC_FIELDS and actual is not None:
+                actual = self._to_number(actual)
+            for op, operand in value.items():
+                if key in NUMERIC_FIELDS:
+                    operand = [self._to_number(v) for v in operand] if op in ("in", "nin") else self._to_number(operand)
+                if not self._compare(actual, op, operand):
+                    return False
+        return True
+
+    @staticmethod
+    def _compare(actual, op: str, operand) -> bool:
+        if op == "eq":
+            return actual == operand
+        if op == "ne":
+            return actual != operand
+        if op == "in":
+            return actual in operand
+        if op == "nin":
+            return actual not in operand
+        if op in ("contains", "icontains"):
+            if not isinstance(actual, str):
+                return False
+            if op == "icontains":
+                return str(operand).lower() in actual.lower()
+            return str(operand) in actual
+        if actual is None:
+            return False
+        try:
+            return getattr(actual, RANGE_OPERATORS[op])(operand) is True
+        except TypeError:
+            return False
+
+    @staticmethod
+    def _query_terms(query: str) -> list:
+        return list(dict.fromkeys(re.findall(r"\w+", (query or "").lower())))
+
     def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None):
-        conditions = [Tag(key) == value for key, value in filters.items() if value is not None]
-        filter = reduce(lambda x, y: x & y, conditions)
-
-        v = VectorQuery(
-            vector=np.array(vectors, dtype=np.float32).tobytes(),
-            vector_field_name="embedding",
-            return_fields=["memory_id", "hash", "agent_id", "run_id", "user_id", "memory", "metadata", "created_at"],
-            filter_expression=filter,
-            num_results=limit,
-        )
+        """
+        Search for similar vectors, optionally combined with a full-text score on the memory text.
 
-        results = self.index.query(v)
-
-        return [
-            MemoryResult(
-                id=result["memory_id"],
-                score=result["vector_distance"],
-                payload={
-                    "hash": result["hash"],
-                    "data": result["memory"],
-                    "created_at": datetime.fromtimestamp(
-                        int(result["created_at"]), tz=pytz.timezone("US/Pacific")
-                    ).isoformat(timespec="microseconds"),
-                    **(
-                        {
-                            "updated_at": datetime.fromtimestamp(
-                                int(result["updated_at"]), tz=pytz.timezone("US/Pacific")
-                            ).isoformat(timespec="microseconds")
-                        }
-                        if "updated_at" in result
-                        else {}
-                    ),
-                    **{field: result[field] for field in ["agent_id", "run_id", "user_id"] if field in result},
-                    **{k: v for k, v in json.loads(extract_json(result["metadata"])).items()},
-                },
+        Args:
+            query (str): Query text, used for the text score in hybrid mode.
+            vectors (list): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (dict, optional): Filters to apply to the search.
+
+        Returns:
+            list: Search results, ordered by ascending score.
+        """
+        filter_expression, exact = self._build_filter(filters)
+        num_results = limit if exact else limit * FILTER_OVERFETCH_FACTOR
+
+        terms = self._query_terms(query) if self.hybrid_search else []
+        if terms:
+            results = self._hybrid_search(terms, vectors, num_results, filter_expression)
+        else:
+            v = VectorQuery(
+                vector=np.array(vectors, dtype=np.float32).tobytes(),
+                vector_field_name="embedding",
+                return_fields=RETURN_FIELDS,
+                filter_expression=filter_expression,
+                num_results=num_results,
             )
-            for result in results
-        ]
+            results = [
+                self._build_result(result, score=float(result["vector_distance"]))
+                for result in self.index.query(v)
+            ]
+
+        if not exact:
+            results = [result for result in results if self._matches(result.payload, filters)]
+        return results[:limit]
+
+    def _hybrid_search(self, terms: list, vectors: list, num_results: int, filter_expression=None) -> list:
+        """
+        Score KNN candidates with BM25 on the memory text in a single FT.SEARCH.
+
+        The text terms are optional, so candidates without them are still returned. Scores combine
+        the cosine similarity and the max-normalized BM25 score, and are reported as cosine distances
+        (`2 * (1 - hybrid score)`) so they sort like plain vector search results.
+        """
+        k = num_results * HYBRID_OVERFETCH_FACTOR
+        text = f"~@memory:({' | '.join(terms)})"
+        prefilter = f"({text} {filter_expression})" if filter_expression is not None else f"({text})"
+        query = (
+            Query(f"{prefilter}=>[KNN {k} @embedding $vector AS vector_distance]")
+            .return_fields(*RETURN_FIELDS, "vector_distance")
+            .scorer("BM25STD")
+            .with_scores()
+            .paging(0, k)
+            .dialect(2)
+        )
+        docs = self.index.search(query, query_params={"vector": np.array(vectors, dtype=np.float32).tobytes()}).docs
+
+        max_text_score = max((float(doc.score or 0) for doc in docs), default=0.0) or 1.0
+        results = []
+        for doc in docs:
+            similarity = 1 - float(doc.vector_distance) / 2
+            text_score = float(doc.score or 0) / max_text_score
+            hybrid = self.hybrid_alpha * similarity + (1 - self.hybrid_alpha) * text_score
+            results.append(self._build_result(doc, score=2 * (1 - hybrid)))
+        return sorted(results, key=lambda result: result.score)[:num_results]
 
     def delete(self, vector_id):
-        self.index.drop_keys(f"{self.schema['index']['prefix']}:{vector_id}")
+        self.delete_many([vector_id])
+
+    def delete_many(self, vector_ids: list):
+        """
+        Delete several vectors in one pipelined round trip.
+
+        Args:
+            vector_ids (list): IDs of the vectors to delete.
+        """
+        if vector_ids:
+            self.index.drop_keys([self._key(vector_id) for vector_id in vector_ids])
 
     def update(self, vector_id=None, vector=None, payload=None):
-        data = {
-            "memory_id": vector_id,
-            "hash": payload["hash"],
-            "memory": payload["data"],
-            "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-            "updated_at": int(datetime.fromisoformat(payload["updated_at"]).timestamp()),
-            "embedding": np.array(vector, dtype=np.float32).tobytes(),
-        }
+        self.update_many([vector_id], [vector], [payload])
 
-        for field in ["agent_id", "run_id", "user_id"]:
-            if field in payload:
-                data[field] = payload[field]
+    def update_many(self, vector_ids: list, vectors: list = None, payloads: list = None):
+        """
+        Update several vectors and their payloads in one pipelined round trip.
 
-        data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
-        self.index.load(data=[data], keys=[f"{self.schema['index']['prefix']}:{vector_id}"], id_field="memory_id")
+        Args:
+            vector_ids (list): IDs of the vectors to update.
+            vectors (list, optional): New vectors, None entries keep the stored embedding.
+            payloads (list): New payloads.
+        """
+        vectors = vectors or [None] * len(vector_ids)
+        pipeline = self.client.pipeline(transaction=False)
+        for vector_id, vector, payload in zip(vector_ids, vectors, payloads):
+            pipeline.hset(self._key(vector_id), mapping=self._build_entry(vector_id, vector, payload))
+        pipeline.execute()
 
     def get(self, vector_id):
-        result = self.index.fetch(vector_id)
-        payload = {
-            "hash": result["hash"],
-            "data": result["memory"],
-            "created_at": datetime.fromtimestamp(int(result["created_at"]), tz=pytz.timezone("US/Pacific")).isoformat(
-                timespec="microseconds"
-            ),
-            **(
-                {
-                    "updated_at": datetime.fromtimestamp(
-                        int(result["updated_at"]), tz=pytz.timezone("US/Pacific")
-                    ).isoformat(timespec="microseconds")
-                }
-                if "updated_at" in result
-                else {}
-            ),
-            **{field: result[field] for field in ["agent_id", "run_id", "user_id"] if field in result},
-            **{k: v for k, v in json.loads(extract_json(result["metadata"])).items()},
-        }
-
-        return MemoryResult(id=result["memory_id"], payload=payload)
+        return self._build_result(self.index.fetch(vector_id))
 
     def list_cols(self):
         return self.index.listall()
@@ -256,40 +486,12 @@ class RedisDB(VectorStoreBase):
         """
         List all recent created memories from the vector store.
         """
-        conditions = [Tag(key) == value for key, value in filters.items() if value is not None]
-        filter = reduce(lambda x, y: x & y, conditions)
-        query = Query(str(filter)).sort_by("created_at", asc=False)
+        filter_expression, exact = self._build_filter(filters)
+        query = Query(str(filter_expression) if filter_expression is not None else "*").sort_by("created_at", asc=False)
         if limit is not None:
-            query = Query(str(filter)).sort_by("created_at", asc=False).paging(0, limit)
-
-        results = self.index.search(query)
-        return [
-            [
-                MemoryResult(
-                    id=result["memory_id"],
-                    payload={
-                        "hash": result["hash"],
-                        "data": result["memory"],
-                        "created_at": datetime.fromtimestamp(
-                            int(result["created_at"]), tz=pytz.timezone("US/Pacific")
-                        ).isoformat(timespec="microseconds"),
-                        **(
-                            {
-                                "updated_at": datetime.fromtimestamp(
-                                    int(result["updated_at"]), tz=pytz.timezone("US/Pacific")
-                                ).isoformat(timespec="microseconds")
-                            }
-                            if result.__dict__.get("updated_at")
-                            else {}
-                        ),
-                        **{
-                            field: result[field]
-                            for field in ["agent_id", "run_id", "user_id"]
-                            if field in result.__dict__
-                        },
-                        **{k: v for k, v in json.loads(extract_json(result["metadata"])).items()},
-                    },
-                )
-                for result in results.docs
-            ]
-        ]
+            query = query.paging(0, limit if exact else limit * FILTER_OVERFETCH_FACTOR)
+
+        results = [self._build_result(result) for result in self.index.search(query).docs]
+        if not exact:
+            results = [result for result in results if self._matches(result.payload, filters)]
+        return [results[:limit] if limit is not None else results]
@@ -366,6 +366,14 @@ class ValkeyDB(VectorStoreBase):
             logger.error(f"Search failed with query '{query}': {e}")
             raise
 
+    @staticmethod
+    def _load_metadata(metadata):
+        # Metadata is written with json.dumps, only fall back to extracting JSON for unexpected values
+        try:
+            return json.loads(metadata)
+        except (TypeError, ValueError):
+            return json.loads(extract_json(metadata))
+
     def _process_search_results(self, results):
         """
         Process search results into OutputData objects.
@@ -400,7 +408,7 @@ class ValkeyDB(VectorStoreBase):
             # Add metadata
             if hasattr(doc, "metadata"):
                 try:
-                    metadata = json.loads(extract_json(doc.metadata))
+                    metadata = self._load_metadata(doc.metadata)
                     payload.update(metadata)
                 except (json.JSONDecodeError, TypeError) as e:
                     logger.warning(f"Failed to parse metadata: {e}")
@@ -595,7 +603,7 @@ class ValkeyDB(VectorStoreBase):
         # Add metadata
         if "metadata" in result:
             try:
-                metadata = json.loads(extract_json(result["metadata"]))
+                metadata = self._load_metadata(result["metadata"])
                 payload.update(metadata)
             except (json.JSONDecodeError, TypeError):
                 logger.warning(f"Failed to parse metadata: {result.get('metadata')}")
@@ -23,8 +23,8 @@ import uuid
 
 from app.database import SessionLocal
 from app.models import Memory, MemoryAccessLog, MemoryState, MemoryStatusHistory
-from app.utils.db import get_user_and_app
-from app.utils.memory import get_memory_client
+from app.utils.db import bulk_update_memory_state, chunked, get_user_and_app
+from app.utils.memory import delete_memories_from_vector_store, get_memory_client
 from app.utils.permissions import check_memory_access_permissions
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
@@ -320,41 +320,25 @@ async def delete_memories(memory_ids: list[str]) -> str:
                 return "Error: No accessible memories found with provided IDs"
 
             # Delete from vector store
-            for memory_id in ids_to_delete:
-                try:
-                    memory_client.delete(str(memory_id))
-                except Exception as delete_error:
-                    logging.warning(f"Failed to delete memory {memory_id} from vector store: {delete_error}")
-
-            # Update each memory's state and create history entries
-            now = datetime.datetime.now(datetime.UTC)
-            for memory_id in ids_to_delete:
-                memory = db.query(Memory).filter(Memory.id == memory_id).first()
-                if memory:
-                    # Update memory state
-                    memory.state = MemoryState.deleted
-                    memory.deleted_at = now
-
-                    # Create history entry
-                    history = MemoryStatusHistory(
-                        memory_id=memory_id,
-                        changed_by=user.id,
-                        old_state=MemoryState.active,
-                        new_state=MemoryState.deleted
-                    )
-                    db.add(history)
-
-                    # Create access log entry
-                    access_log = MemoryAccessLog(
-                        memory_id=memory_id,
-                        app_id=app.id,
-                        access_type="delete",
-                        metadata_={"operation": "delete_by_id"}
-                    )
-                    db.add(access_log)
-
-            db.commit()
-            return f"Successfully deleted {len(ids_to_delete)} memories"
+            delete_memories_from_vector_store(memory_client, ids_to_delete)
+
+            # Transition state and write history in bulk, then log the access
+            deleted_ids = bulk_update_memory_state(db, ids_to_delete, MemoryState.deleted, user.id)
+            for chunk in chunked(deleted_ids):
+                db.bulk_insert_mappings(
+                    MemoryAccessLog,
+                    [
+                        {
+                            "memory_id": memory_id,
+                            "app_id": app.id,
+                            "access_type": "delete",
+                            "metadata_": {"operation": "delete_by_id"},
+                        }
+                        for memory_id in chunk
+                    ],
+                )
+                db.commit()
+            return f"Successfully deleted {len(deleted_ids)} memories"
         finally:
             db.close()
     except Exception as e:
@@ -386,39 +370,24 @@ async def delete_all_memories() -> str:
             accessible_memory_ids = [memory.id for memory in user_memories if check_memory_access_permissions(db, memory, app.id)]
 
             # delete the accessible memories only
-            for memory_id in accessible_memory_ids:
-                try:
-                    memory_client.delete(str(memory_id))
-                except Exception as delete_error:
-                    logging.warning(f"Failed to delete memory {memory_id} from vector store: {delete_error}")
-
-            # Update each memory's state and create history entries
-            now = datetime.datetime.now(datetime.UTC)
-            for memory_id in accessible_memory_ids:
-                memory = db.query(Memory).filter(Memory.id == memory_id).first()
-                # Update memory state
-                memory.state = MemoryState.deleted
-                memory.deleted_at = now
-
-                # Create history entry
-                history = MemoryStatusHistory(
-                    memory_id=memory_id,
-                    changed_by=user.id,
-                    old_state=MemoryState.active,
-                    new_state=MemoryState.deleted
-                )
-                db.add(history)
-
-                # Create access log entry
-                access_log = MemoryAccessLog(
-                    memory_id=memory_id,
-                    app_id=app.id,
-                    access_type="delete_all",
-                    metadata_={"operation": "bulk_delete"}
+            delete_memories_from_vector_store(memory_client, accessible_memory_ids)
+
+            # Transition state and write history in bulk, then log the access
+            deleted_ids = bulk_update_memory_state(db, accessible_memory_ids, MemoryState.deleted, user.id)
+            for chunk in chunked(deleted_ids):
+                db.bulk_insert_mappings(
+                    MemoryAccessLog,
+                    [
+                        {
+                            "memory_id": memory_id,
+                            "app_id": app.id,
+                            "access_type": "delete_all",
+                            "metadata_": {"operation": "bulk_delete"},
+                        }
+                        for memory_id in chunk
+                    ],
                 )
-                db.add(access_log)
-
-            db.commit()
+                db.commit()
             return "Successfully deleted all memories"
         finally:
             db.close()
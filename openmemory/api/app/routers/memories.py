@@ -15,7 +15,8 @@ from app.models import (
     User,
 )
 from app.schemas import MemoryResponse
-from app.utils.memory import get_memory_client
+from app.utils.db import bulk_update_memory_state, chunked
+from app.utils.memory import delete_memories_from_vector_store, get_memory_client
 from app.utils.permissions import check_memory_access_permissions
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi_pagination import Page, Params
@@ -34,27 +35,17 @@ def get_memory_or_404(db: Session, memory_id: UUID) -> Memory:
     return memory
 
 
-def update_memory_state(db: Session, memory_id: UUID, new_state: MemoryState, user_id: UUID):
-    memory = get_memory_or_404(db, memory_id)
-    old_state = memory.state
-
-    # Update memory state
-    memory.state = new_state
-    if new_state == MemoryState.archived:
-        memory.archived_at = datetime.now(UTC)
-    elif new_state == MemoryState.deleted:
-        memory.deleted_at = datetime.now(UTC)
-
-    # Record state change
-    history = MemoryStatusHistory(
-        memory_id=memory_id,
-        changed_by=user_id,
-        old_state=old_state,
-        new_state=new_state
-    )
-    db.add(history)
-    db.commit()
-    return memory
+def ensure_memories_exist(db: Session, memory_ids: List[UUID]) -> None:
+    """Raise 404 if any of the given memory IDs is unknown."""
+    found_ids = set()
+    for chunk in chunked(dict.fromkeys(memory_ids)):
+        found_ids.update(row.id for row in db.query(Memory.id).filter(Memory.id.in_(chunk)))
+    missing_ids = [memory_id for memory_id in memory_ids if memory_id not in found_ids]
+    if missing_ids:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Memory not found: {', '.join(str(memory_id) for memory_id in missing_ids)}"
+        )
 
 
 def get_accessible_memory_ids(db: Session, app_id: UUID) -> Set[UUID]:
@@ -361,6 +352,8 @@ async def delete_memories(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
+    ensure_memories_exist(db, request.memory_ids)
+
     # Get memory client to delete from vector store
     try:
         memory_client = get_memory_client()
@@ -379,15 +372,10 @@ async def delete_memories(
         )
 
     # Delete from vector store then mark as deleted in database
-    for memory_id in request.memory_ids:
-        try:
-            memory_client.delete(str(memory_id))
-        except Exception as delete_error:
-            logging.warning(f"Failed to delete memory {memory_id} from vector store: {delete_error}")
-
-        update_memory_state(db, memory_id, MemoryState.deleted, user.id)
+    delete_memories_from_vector_store(memory_client, request.memory_ids)
+    deleted_ids = bulk_update_memory_state(db, request.memory_ids, MemoryState.deleted, user.id)
 
-    return {"message": f"Successfully deleted {len(request.memory_ids)} memories"}
+    return {"message": f"Successfully deleted {len(deleted_ids)} memories"}
 
 
 # Archive memories
@@ -397,9 +385,9 @@ async def archive_memories(
     user_id: UUID,
     db: Session = Depends(get_db)
 ):
-    for memory_id in memory_ids:
-        update_memory_state(db, memory_id, MemoryState.archived, user_id)
-    return {"message": f"Successfully archived {len(memory_ids)} memories"}
+    ensure_memories_exist(db, memory_ids)
+    archived_ids = bulk_update_memory_state(db, memory_ids, MemoryState.archived, user_id)
+    return {"message": f"Successfully archived {len(archived_ids)} memories"}
 
 
 class PauseMemoriesRequest(BaseModel):
@@ -433,52 +421,47 @@ async def pause_memories(
     
     if global_pause:
         # Pause all memories
-        memories = db.query(Memory).filter(
+        memory_ids = db.query(Memory.id).filter(
             Memory.state != MemoryState.deleted,
             Memory.state != MemoryState.archived
-        ).all()
-        for memory in memories:
-            update_memory_state(db, memory.id, state, user_id)
+        )
+        bulk_update_memory_state(db, [row.id for row in memory_ids], state, user_id)
         return {"message": "Successfully paused all memories"}
 
     if app_id:
         # Pause all memories for an app
-        memories = db.query(Memory).filter(
+        memory_ids = db.query(Memory.id).filter(
             Memory.app_id == app_id,
             Memory.user_id == user.id,
             Memory.state != MemoryState.deleted,
             Memory.state != MemoryState.archived
-        ).all()
-        for memory in memories:
-            update_memory_state(db, memory.id, state, user_id)
+        )
+        bulk_update_memory_state(db, [row.id for row in memory_ids], state, user_id)
         return {"message": f"Successfully paused all memories for app {app_id}"}
     
     if all_for_app and memory_ids:
         # Pause all memories for an app
-        memories = db.query(Memory).filter(
+        memory_ids = db.query(Memory.id).filter(
             Memory.user_id == user.id,
             Memory.state != MemoryState.deleted,
             Memory.id.in_(memory_ids)
-        ).all()
-        for memory in memories:
-            update_memory_state(db, memory.id, state, user_id)
+        )
+        bulk_update_memory_state(db, [row.id for row in memory_ids], state, user_id)
         return {"message": "Successfully paused all memories"}
 
     if memory_ids:
         # Pause specific memories
-        for memory_id in memory_ids:
-            update_memory_state(db, memory_id, state, user_id)
-        return {"message": f"Successfully paused {len(memory_ids)} memories"}
+        paused_ids = bulk_update_memory_state(db, memory_ids, state, user_id)
+        return {"message": f"Successfully paused {len(paused_ids)} memories"}
 
     if category_ids:
         # Pause memories by category
-        memories = db.query(Memory).join(Memory.categories).filter(
+        memory_ids = db.query(Memory.id).join(Memory.categories).filter(
             Category.id.in_(category_ids),
             Memory.state != MemoryState.deleted,
             Memory.state != MemoryState.archived
-        ).all()
-        for memory in memories:
-            update_memory_state(db, memory.id, state, user_id)
+        ).distinct()
+        bulk_update_memory_state(db, [row.id for row in memory_ids], state, user_id)
         return {"message": f"Successfully paused memories in {len(category_ids)} categories"}
 
     raise HTTPException(status_code=400, detail="Invalid pause request parameters")
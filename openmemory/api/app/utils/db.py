@@ -1,8 +1,15 @@
-from typing import Tuple
+import datetime
+from typing import Iterable, List, Tuple
+from uuid import UUID
 
-from app.models import App, User
+from app.models import App, Memory, MemoryState, MemoryStatusHistory, User
 from sqlalchemy.orm import Session
 
+# Upper bound on the number of rows touched by a single bulk transaction.
+# Keeps lock time and transaction size bounded when pausing or deleting
+# thousands of memories at once.
+BULK_CHUNK_SIZE = 500
+
 
 def get_or_create_user(db: Session, user_id: str) -> User:
     """Get or create a user with the given user_id"""
@@ -31,3 +38,72 @@ def get_user_and_app(db: Session, user_id: str, app_id: str) -> Tuple[User, App]
     user = get_or_create_user(db, user_id)
     app = get_or_create_app(db, user, app_id)
     return user, app
+
+
+def chunked(items: Iterable, size: int = BULK_CHUNK_SIZE):
+    """Yield successive lists of at most `size` items"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def bulk_update_memory_state(
+    db: Session,
+    memory_ids: Iterable[UUID],
+    new_state: MemoryState,
+    changed_by: UUID,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> List[UUID]:
+    """
+    Move many memories to `new_state` using set-based updates.
+
+    Each chunk is handled in its own transaction: the current states are read
+    with one SELECT, the memories are transitioned with a single
+    `UPDATE ... WHERE id IN (...)` and the status history rows are written with
+    one bulk INSERT. IDs that do not exist are skipped.
+
+    Returns:
+        The IDs of the memories that were updated.
+    """
+    now = datetime.datetime.now(datetime.UTC)
+    values = {Memory.state: new_state}
+    if new_state == MemoryState.archived:
+        values[Memory.archived_at] = now
+    elif new_state == MemoryState.deleted:
+        values[Memory.deleted_at] = now
+
+    updated_ids = []
+    # dict.fromkeys de-duplicates while preserving the caller's order
+    for chunk in chunked(dict.fromkeys(memory_ids), chunk_size):
+        old_states = db.query(Memory.id, Memory.state).filter(Memory.id.in_(chunk)).all()
+        if not old_states:
+            continue
+
+        found_ids = [row.id for row in old_states]
+        try:
+            db.query(Memory).filter(Memory.id.in_(found_ids)).update(values, synchronize_session=False)
+            db.bulk_insert_mappings(
+                MemoryStatusHistory,
+                [
+                    {
+                        "memory_id": row.id,
+                        "changed_by": changed_by,
+                        "old_state": row.state,
+                        "new_state": new_state,
+                        "changed_at": now,
+                    }
+                    for row in old_states
+                ],
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        updated_ids.extend(found_ids)
+
+    return updated_ids
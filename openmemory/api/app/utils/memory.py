@@ -29,6 +29,7 @@ Example configuration that will be automatically adjusted:
 
 import hashlib
 import json
+import logging
 import os
 import socket
 
@@ -387,5 +388,35 @@ def get_memory_client(custom_instructions: str = None):
         return None
 
 
+def delete_memories_from_vector_store(memory_client, memory_ids, chunk_size: int = 500):
+    """
+    Remove many memories from the vector store.
+
+    Deletes go through `Memory.delete_many`, which removes each chunk with one
+    request when the vector store supports it and keeps the memory history,
+    hashes and search indexes in sync. Older mem0 releases without
+    `delete_many` fall back to one `Memory.delete` per memory. Failures are
+    logged and skipped so the caller can still transition the database rows.
+
+    Returns:
+        list: IDs that could not be deleted from the vector store.
+    """
+    if not hasattr(memory_client, "delete_many"):
+        failed = []
+        for memory_id in memory_ids:
+            try:
+                memory_client.delete(str(memory_id))
+            except Exception as delete_error:
+                logging.warning(f"Failed to delete memory {memory_id} from vector store: {delete_error}")
+                failed.append(str(memory_id))
+        return failed
+
+    try:
+        return memory_client.delete_many(memory_ids, batch_size=chunk_size)
+    except Exception as delete_error:
+        logging.warning(f"Failed to delete {len(memory_ids)} memories from vector store: {delete_error}")
+        return [str(memory_id) for memory_id in memory_ids]
+
+
 def get_default_user_id():
     return "default_user"
@@ -0,0 +1,121 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.cache import CachedLLM
+from mem0.llms.configs import LlmCacheConfig
+from mem0.utils.factory import LlmFactory
+
+MESSAGES = [
+    {"role": "system", "content": "Extract the facts."},
+    {"role": "user", "content": "Input:\nI like tea"},
+]
+
+
+@pytest.fixture
+def mock_llm():
+    llm = MagicMock()
+    llm.config = BaseLlmConfig(model="gpt-4.1-nano-2025-04-14", temperature=0)
+    llm.generate_response.side_effect = lambda **kwargs: f"response {llm.generate_response.call_count}"
+    return llm
+
+
+def test_identical_calls_hit_the_cache(mock_llm):
+    cached = CachedLLM(mock_llm, "openai", LlmCacheConfig(path=None))
+
+    first = cached.generate_response(messages=MESSAGES, response_format={"type": "json_object"})
+    # Surrounding whitespace is normalized away
+    second = cached.generate_response(
+        messages=[{**MESSAGES[0]}, {"role": "user", "content": "Input:\nI like tea  \n"}],
+        response_format={"type": "json_object"},
+    )
+    third = cached.generate_response(messages=MESSAGES)
+
+    assert first == second == "response 1"
+    assert third == "response 2"
+    assert mock_llm.generate_response.call_count == 2
+    assert cached.stats() == {
+        "hits": 1,
+        "memory_hits": 1,
+        "disk_hits": 0,
+        "misses": 2,
+        "hit_rate": 1 / 3,
+        "size": 2,
+    }
+
+
+def test_tool_call_responses_are_cached(mock_llm):
+    tool_response = {"content": "", "tool_calls": [{"name": "extract_entities", "arguments": {"entities": []}}]}
+    mock_llm.generate_response.side_effect = None
+    mock_llm.generate_response.return_value = tool_response
+    cached = CachedLLM(mock_llm, "openai", LlmCacheConfig(path=None))
+    tools = [{"type": "function", "function": {"name": "extract_entities"}}]
+
+    assert cached.generate_response(messages=MESSAGES, tools=tools) == tool_response
+    assert cached.generate_response(messages=MESSAGES, tools=tools) == tool_response
+    # Without the tools it is another call
+    cached.generate_response(messages=MESSAGES)
+    assert mock_llm.generate_response.call_count == 2
+
+
+def test_disk_tier_is_shared_and_expires(mock_llm, tmp_path):
+    path = str(tmp_path / "llm_cache.db")
+    CachedLLM(mock_llm, "openai", LlmCacheConfig(path=path)).generate_response(messages=MESSAGES)
+
+    cached = CachedLLM(mock_llm, "openai", LlmCacheConfig(path=path))
+    assert cached.generate_response(messages=MESSAGES) == "response 1"
+    assert cached.stats()["disk_hits"] == 1
+
+    with patch("mem0.llms.cache.time.time", return_value=10**12):
+        expired = CachedLLM(mock_llm, "openai", LlmCacheConfig(path=path, ttl=60))
+        assert expired.generate_response(messages=MESSAGES) == "response 2"
+
+
+def test_non_zero_temperature_is_not_cached_unless_flagged(mock_llm):
+    mock_llm.config.temperature = 0.7
+    cached = CachedLLM(mock_llm, "openai", LlmCacheConfig(path=None))
+
+    cached.generate_response(messages=MESSAGES)
+    cached.generate_response(messages=MESSAGES)
+    assert mock_llm.generate_response.call_count == 2
+    assert "cacheable" not in mock_llm.generate_response.call_args.kwargs
+
+    cached.generate_response(messages=MESSAGES, cacheable=True)
+    cached.generate_response(messages=MESSAGES, cacheable=True)
+    assert mock_llm.generate_response.call_count == 3
+
+
+def test_lru_evicts_the_least_recently_used(mock_llm):
+    cached = CachedLLM(mock_llm, "openai", LlmCacheConfig(path=None, max_size=2))
+    prompts = [[{"role": "user", "content": text}] for text in ("a", "b", "c")]
+
+    for messages in prompts:
+        cached.generate_response(messages=messages)
+    cached.generate_response(messages=prompts[0])
+
+    assert mock_llm.generate_response.call_count == 4
+    assert cached.stats()["size"] == 2
+
+
+def test_factory_wraps_configured_llms():
+    with patch("mem0.llms.openai.OpenAI"):
+        llm = LlmFactory.create("openai", {"model": "gpt-4.1-nano-2025-04-14"}, cache={"path": None})
+        assert isinstance(llm, CachedLLM)
+        assert llm.config.model == "gpt-4.1-nano-2025-04-14"
+
+        assert not isinstance(LlmFactory.create("openai", {"model": "gpt-4.1-nano-2025-04-14"}), CachedLLM)
+
+
+def test_streamed_responses_share_the_cache(mock_llm):
+    mock_llm.generate_response_stream.side_effect = lambda **kwargs: iter(['{"facts": ', '["Likes tea"]}'])
+    cached = CachedLLM(mock_llm, "openai", LlmCacheConfig(path=None))
+
+    first = list(cached.generate_response_stream(messages=MESSAGES, response_format={"type": "json_object"}))
+    second = list(cached.generate_response_stream(messages=MESSAGES, response_format={"type": "json_object"}))
+
+    assert first == ['{"facts": ', '["Likes tea"]}']
+    assert second == ['{"facts": ["Likes tea"]}']
+    assert cached.generate_response(messages=MESSAGES, response_format={"type": "json_object"}) == second[0]
+    assert mock_llm.generate_response_stream.call_count == 1
+    mock_llm.generate_response.assert_not_called()
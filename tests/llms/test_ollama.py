@@ -32,3 +32,21 @@ def test_generate_response_without_tools(mock_ollama_client):
         model="llama3.1:70b", messages=messages, options={"temperature": 0.7, "num_predict": 100, "top_p": 1.0}
     )
     assert response == "I'm doing well, thank you for asking!"
+
+
+def test_generate_response_stream(mock_ollama_client):
+    config = OllamaConfig(model="llama3.1:70b", temperature=0.7, max_tokens=100, top_p=1.0)
+    llm = OllamaLLM(config)
+    messages = [{"role": "user", "content": "Hello, how are you?"}]
+
+    mock_ollama_client.chat.return_value = iter(
+        [{"message": {"content": "I'm doing "}}, {"message": {"content": "well"}}, {"message": {"content": ""}}]
+    )
+
+    assert list(llm.generate_response_stream(messages)) == ["I'm doing ", "well"]
+    mock_ollama_client.chat.assert_called_once_with(
+        stream=True,
+        model="llama3.1:70b",
+        messages=messages,
+        options={"temperature": 0.7, "num_predict": 100, "top_p": 1.0},
+    )
@@ -207,3 +207,28 @@ def test_callback_with_tools(mock_openai_client):
     mock_callback.assert_called_once()
     # Check that tool_calls exists in the message
     assert hasattr(mock_callback.call_args[0][1].choices[0].message, 'tool_calls')
+
+
+def test_generate_response_stream(mock_openai_client):
+    config = OpenAIConfig(model="gpt-4.1-nano-2025-04-14", temperature=0.7, max_tokens=100, top_p=1.0)
+    llm = OpenAILLM(config)
+    messages = [{"role": "user", "content": "Extract the facts."}]
+
+    mock_openai_client.chat.completions.create.return_value = iter(
+        [Mock(choices=[Mock(delta=Mock(content=text))]) for text in ('{"facts": ', None, '["Likes tea"]}')]
+        + [Mock(choices=[])]
+    )
+
+    chunks = list(llm.generate_response_stream(messages, response_format={"type": "json_object"}))
+
+    mock_openai_client.chat.completions.create.assert_called_once_with(
+        stream=True,
+        model="gpt-4.1-nano-2025-04-14",
+        messages=messages,
+        temperature=0.7,
+        max_tokens=100,
+        top_p=1.0,
+        store=False,
+        response_format={"type": "json_object"},
+    )
+    assert chunks == ['{"facts": ', '["Likes tea"]}']
@@ -35,6 +35,21 @@ def test_generate_response_without_tools(mock_vllm_client):
     assert response == "I'm doing well, thank you for asking!"
 
 
+def test_generate_response_stream(mock_vllm_client):
+    config = BaseLlmConfig(model="Qwen/Qwen2.5-32B-Instruct", temperature=0.7, max_tokens=100, top_p=1.0)
+    llm = VllmLLM(config)
+    messages = [{"role": "user", "content": "Hello, how are you?"}]
+
+    mock_vllm_client.chat.completions.create.return_value = iter(
+        [Mock(choices=[Mock(delta=Mock(content=text))]) for text in ("I'm doing ", "well")]
+    )
+
+    assert list(llm.generate_response_stream(messages)) == ["I'm doing ", "well"]
+    mock_vllm_client.chat.completions.create.assert_called_once_with(
+        stream=True, model="Qwen/Qwen2.5-32B-Instruct", messages=messages, temperature=0.7, max_tokens=100, top_p=1.0
+    )
+
+
 def test_generate_response_with_tools(mock_vllm_client):
     config = BaseLlmConfig(model="Qwen/Qwen2.5-32B-Instruct", temperature=0.7, max_tokens=100, top_p=1.0)
     llm = VllmLLM(config)
@@ -150,7 +165,8 @@ def test_thinking_tags_sync():
         '        <think>Sync memory actions</think>  \n{"memory": [{"text": "Loves sci-fi", "event": "ADD"}]}'
     ]
     
-    mock_vector_store.search.return_value = []
+    # An existing memory, so that the memory actions are asked to the LLM
+    mock_vector_store.search.return_value = [MagicMock(id="mem_1", payload={"data": "Likes movies"})]
     
     result = memory._add_to_vector_store(
         messages=[{"role": "user", "content": "I love sci-fi movies"}],
@@ -175,6 +191,9 @@ async def test_async_thinking_tags_async():
         '        <think>Async fact extraction</think>  \n{"facts": ["User loves sci-fi"]}',
         '        <think>Async memory actions</think>  \n{"memory": [{"text": "Loves sci-fi", "event": "ADD"}]}'
     ]
+
+    # An existing memory, so that the memory actions are asked to the LLM
+    mock_vector_store.search.return_value = [MagicMock(id="mem_1", payload={"data": "Likes movies"})]
     
     # Mock asyncio.to_thread to call the function directly (bypass threading)
     async def mock_to_thread(func, *args, **kwargs):
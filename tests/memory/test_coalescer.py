@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mem0.memory.coalescer import AddCoalescer, AsyncAddCoalescer
+
+
+def _message(text):
+    return [{"role": "user", "content": text}]
+
+
+def test_concurrent_adds_of_a_key_share_one_cycle():
+    coalescer = AddCoalescer(window=0.2)
+    runs = []
+
+    def run(messages):
+        runs.append([m["content"] for m in messages])
+        return {"results": [{"memory": "merged"}]}
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(coalescer.submit, "alice", "alice", _message(text), run) for text in "abc"]
+        results = [future.result() for future in futures]
+
+    assert len(runs) == 1
+    assert sorted(runs[0]) == ["a", "b", "c"]
+    assert all(result == {"results": [{"memory": "merged"}]} for result in results)
+    assert coalescer.stats() == {"adds": 3, "batches": 1, "saved_cycles": 2}
+
+
+def test_full_batches_run_without_waiting_for_the_window():
+    coalescer = AddCoalescer(window=10, max_batch_size=2)
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(coalescer.submit, "alice", "alice", _message(t), len) for t in "ab"]
+        assert [future.result() for future in futures] == [2, 2]
+    assert time.monotonic() - start < 5
+
+
+def test_errors_reach_every_caller_of_the_batch():
+    coalescer = AddCoalescer(window=0.2)
+
+    def run(messages):
+        raise RuntimeError("extraction failed")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(coalescer.submit, "alice", "alice", _message(t), run) for t in "ab"]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="extraction failed"):
+                future.result()
+
+
+def test_batches_of_a_scope_do_not_overlap():
+    coalescer = AddCoalescer(window=0.01)
+    running = []
+    overlaps = []
+    lock = threading.Lock()
+
+    def run(messages):
+        with lock:
+            overlaps.append(bool(running))
+            running.append(1)
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+
+    # Different keys of the same scope, e.g. adds with different metadata, are not merged but still serialized
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(coalescer.submit, "alice", key, _message(key), run) for key in ("a", "b", "c")]
+        for future in futures:
+            future.result()
+
+    assert overlaps == [False, False, False]
+    assert coalescer.stats()["batches"] == 3
+
+
+@pytest.mark.asyncio
+async def test_async_coalescer_merges_and_serializes():
+    coalescer = AsyncAddCoalescer(window=0.05)
+    runs = []
+
+    async def run(messages):
+        runs.append([m["content"] for m in messages])
+        await asyncio.sleep(0.01)
+        return len(messages)
+
+    results = await asyncio.gather(
+        coalescer.submit("alice", "alice", _message("a"), run),
+        coalescer.submit("alice", "alice", _message("b"), run),
+        coalescer.submit("bob", "bob", _message("c"), run),
+    )
+
+    assert results == [2, 2, 1]
+    assert runs == [["a", "b"], ["c"]]
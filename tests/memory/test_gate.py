@@ -0,0 +1,79 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from mem0.configs.base import ExtractionGateConfig
+from mem0.memory.gate import EmbeddingFilter, ExtractionGate, RuleFilter
+
+
+def _messages(*contents):
+    return [{"role": "user" if i % 2 == 0 else "assistant", "content": c} for i, c in enumerate(contents)]
+
+
+def _embedding_model(vectors):
+    """Embeds known texts to fixed vectors, and anything else to an orthogonal one."""
+    model = MagicMock()
+    model.embed_batch.side_effect = lambda texts, action: [vectors.get(t, [0.0, 0.0, 1.0]) for t in texts]
+    return model
+
+
+def test_rule_filter():
+    rules = RuleFilter(skip_patterns=[r"tool call \w+ succeeded"])
+
+    assert rules.is_uninformative("")
+    assert rules.is_uninformative("ok!")
+    assert rules.is_uninformative("Thanks, got it.")
+    assert rules.is_uninformative("Tool call search succeeded")
+    assert not rules.is_uninformative("I'm allergic to peanuts")
+    assert not rules.is_uninformative("ok, I moved to Berlin")
+
+
+def test_gate_skips_only_when_every_message_is_uninformative():
+    gate = ExtractionGate([RuleFilter()])
+
+    assert not gate.should_extract(_messages("thanks!", ""))
+    assert gate.should_extract(_messages("ok", "Noted that you live in Berlin."))
+    assert gate.should_extract([{"role": "system", "content": "You are helpful."}])
+    assert gate.should_extract([{"role": "user", "content": {"type": "image_url", "image_url": {"url": "x"}}}])
+    assert gate.stats() == {"checked": 4, "skipped": 1, "skip_rate": 0.25, "flagged": {"rules": 2}}
+
+
+def test_embedding_filter_learns_no_fact_centroids():
+    model = _embedding_model(
+        {
+            "noted": [1.0, 0.0, 0.0],
+            "roger that": [0.95, 0.1, 0.0],
+            "will do": [0.0, 1.0, 0.0],
+            "will do, boss": [0.1, 0.98, 0.0],
+        }
+    )
+    embedding = EmbeddingFilter(model, examples=["noted"], threshold=0.9)
+    gate = ExtractionGate([RuleFilter(stopwords=[]), embedding], learn_from_extraction=True)
+
+    assert not gate.should_extract(_messages("roger that"))
+    assert gate.should_extract(_messages("will do, boss"))
+
+    # The extraction of "will do" returned no facts, similar messages are skipped from now on
+    gate.record_no_facts(_messages("will do"))
+    assert not gate.should_extract(_messages("will do, boss"))
+    assert gate.stats()["flagged"] == {"rules": 0, "embedding": 2}
+
+
+def test_embedding_filter_merges_into_the_nearest_centroid_when_full():
+    model = _embedding_model({"a": [1.0, 0.0, 0.0], "b": [0.0, 1.0, 0.0], "c": [0.8, 0.6, 0.0]})
+    embedding = EmbeddingFilter(model, examples=["a", "b"], max_centroids=2)
+
+    embedding.learn(["c"])
+
+    assert embedding._counts.tolist() == [2, 1]
+    assert np.allclose(embedding._sums[0], [1.8, 0.6, 0.0])
+
+
+def test_gate_from_config():
+    model = _embedding_model({})
+    config = ExtractionGateConfig(embedding_filter=True, no_fact_examples=["ok"], skip_patterns=["ack"])
+
+    gate = ExtractionGate.from_config(config, model)
+
+    assert [f.name for f in gate.filters] == ["rules", "embedding"]
+    assert not gate.should_extract(_messages("ACK"))
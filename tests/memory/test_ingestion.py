@@ -0,0 +1,168 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from mem0.memory.ingestion import IngestionQueue, default_queue_path
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "ingestion_queue.db")
+
+
+def test_jobs_of_a_scope_run_in_order(db_path):
+    applied = []
+    lock = threading.Lock()
+
+    def handler(payload):
+        # Give the other workers a chance to run a later job of the same scope out of order
+        time.sleep(0.01)
+        with lock:
+            applied.append((payload["user_id"], payload["n"]))
+        return payload["n"]
+
+    queue = IngestionQueue(handler, db_path=db_path, workers=4)
+    job_ids = [queue.enqueue({"user_id": user, "n": n}, scope=user) for n in range(5) for user in ("alice", "bob")]
+
+    assert queue.flush(timeout=10)
+    for user in ("alice", "bob"):
+        assert [n for u, n in applied if u == user] == list(range(5))
+    assert queue.get_status(job_ids[-1])["status"] == "done"
+    assert queue.get_status(job_ids[-1])["result"] == 4
+    queue.close()
+
+
+def test_failed_jobs_are_retried_then_dead_lettered(db_path):
+    attempts = {"flaky": 0}
+
+    def handler(payload):
+        if payload["kind"] == "flaky":
+            attempts["flaky"] += 1
+            if attempts["flaky"] < 3:
+                raise RuntimeError("temporarily unavailable")
+            return "ok"
+        raise ValueError("malformed")
+
+    queue = IngestionQueue(handler, db_path=db_path, workers=1, max_retries=2, retry_backoff=0.01)
+    flaky = queue.enqueue({"kind": "flaky"}, scope="alice")
+    broken = queue.enqueue({"kind": "broken"}, scope="bob")
+
+    assert queue.flush(timeout=10)
+    assert queue.get_status(flaky)["status"] == "done"
+    assert queue.get_status(flaky)["attempts"] == 3
+    dead = queue.get_status(broken)
+    assert dead["status"] == "dead"
+    assert dead["attempts"] == 3
+    assert dead["error"] == "malformed"
+    assert queue.get_status("missing") is None
+    queue.close()
+
+
+def test_queued_jobs_survive_a_restart(db_path):
+    release = threading.Event()
+
+    def blocked(payload):
+        release.wait(10)
+        return payload
+
+    queue = IngestionQueue(blocked, db_path=db_path, workers=1)
+    first = queue.enqueue({"n": 1}, scope="alice")
+    second = queue.enqueue({"n": 2}, scope="alice")
+    assert not queue.flush(timeout=0.1)
+    # Simulate a crash: the running job is left behind in the database and its lease is not renewed
+    queue.connection.execute(
+        "UPDATE jobs SET status = 'running', claimed_by = 'crashed', lease_expires_at = 0 WHERE id = ?", (first,)
+    )
+    queue.connection.commit()
+
+    applied = []
+    restarted = IngestionQueue(lambda payload: applied.append(payload["n"]), db_path=db_path, workers=2)
+    assert restarted.flush(timeout=10)
+    assert applied == [1, 2]
+    assert restarted.get_status(second)["status"] == "done"
+
+    release.set()
+    restarted.close()
+
+
+def test_jobs_leased_by_a_live_queue_are_not_run_again(db_path):
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocked(payload):
+        started.set()
+        release.wait(10)
+        return payload["n"]
+
+    first = IngestionQueue(blocked, db_path=db_path, workers=1, lease_duration=0.3)
+    job_id = first.enqueue({"n": 1}, scope="alice")
+    assert started.wait(10)
+
+    # A second process opening the same queue leaves the running job alone while its lease is renewed
+    applied = []
+    second = IngestionQueue(lambda payload: applied.append(payload["n"]), db_path=db_path, workers=2)
+    time.sleep(1)
+    assert applied == []
+    status = second.get_status(job_id)
+    assert status["status"] == "running"
+    assert status["attempts"] == 1
+
+    release.set()
+    assert second.flush(timeout=10)
+    assert second.get_status(job_id)["result"] == 1
+    assert applied == []
+    first.close()
+    second.close()
+
+
+def test_claims_are_exclusive_across_queues(db_path):
+    applied = []
+    lock = threading.Lock()
+
+    def handler(payload):
+        with lock:
+            applied.append(payload["n"])
+
+    queues = [IngestionQueue(handler, db_path=db_path, workers=4) for _ in range(3)]
+    for n in range(30):
+        queues[n % 3].enqueue({"n": n}, scope=f"user-{n}")
+    for queue in queues:
+        assert queue.flush(timeout=10)
+    assert sorted(applied) == list(range(30))
+    for queue in queues:
+        queue.close()
+
+
+def test_workers_survive_database_errors(db_path, monkeypatch):
+    errors = {"claim": 2, "finish": 2}
+    claim, finish = IngestionQueue._claim, IngestionQueue._finish
+
+    def locked(name, method):
+        def wrapper(self, *args):
+            if errors[name]:
+                errors[name] -= 1
+                raise sqlite3.OperationalError("database is locked")
+            return method(self, *args)
+
+        return wrapper
+
+    monkeypatch.setattr(IngestionQueue, "_claim", locked("claim", claim))
+    monkeypatch.setattr(IngestionQueue, "_finish", locked("finish", finish))
+    queue = IngestionQueue(lambda payload: payload["n"], db_path=db_path, workers=1)
+    job_id = queue.enqueue({"n": 1}, scope="alice")
+
+    assert queue.flush(timeout=10)
+    assert errors == {"claim": 0, "finish": 0}
+    status = queue.get_status(job_id)
+    assert status["status"] == "done"
+    assert status["attempts"] == 1
+    assert status["result"] == 1
+    queue.close()
+
+
+def test_default_queue_path_follows_the_history_and_collection():
+    assert default_queue_path("/data/history.db", "memories") == "/data/history_memories_ingestion_queue.db"
+    assert default_queue_path("/data/history.db", "other") != default_queue_path("/data/history.db", "memories")
+    assert default_queue_path(":memory:", "memories") == ":memory:"
@@ -58,6 +58,7 @@ class TestKuzu:
             return self.embeddings[text]
 
         mock_model.embed.side_effect = mock_embed
+        mock_model.embed_batch.side_effect = lambda texts: [mock_embed(text) for text in texts]
         return mock_model
 
     @pytest.fixture
@@ -190,6 +191,145 @@ class TestKuzu:
         assert get_node_count(kuzu_memory) == 0
         assert get_edge_count(kuzu_memory) == 0
 
+    @patch("mem0.memory.kuzu_memory.EmbedderFactory")
+    @patch("mem0.memory.kuzu_memory.LlmFactory")
+    def test_vector_index_filters_scope(
+        self, mock_llm_factory, mock_embedder_factory, mock_config, mock_embedding_model, mock_llm
+    ):
+        """Test that lookups through the vector index only return nodes of the scope"""
+        mock_embedder_factory.create.return_value = mock_embedding_model
+        mock_llm_factory.create.return_value = mock_llm
+
+        kuzu_memory = MemoryGraph(mock_config)
+        assert kuzu_memory.vector_index == "entity_embedding"
+
+        alice_filters = {"user_id": "alice_user"}
+        bob_filters = {"user_id": "bob_user", "agent_id": "agent"}
+        alice_data = [{"source": "alice", "destination": "bob", "relationship": "knows"}]
+        bob_data = [{"source": "bob", "destination": "dave", "relationship": "likes"}]
+        kuzu_memory._add_entities(alice_data, alice_filters, {})
+        kuzu_memory._add_entities(bob_data, bob_filters, {})
+        assert get_node_count(kuzu_memory) == 4
+
+        hits = kuzu_memory._query_vector_index(self.embeddings["bob"], bob_filters, threshold=0.8)
+        assert len(hits) == 1
+        assert hits[0]["similarity"] == pytest.approx(1.0)
+        assert kuzu_memory._query_vector_index(self.embeddings["charlie"], bob_filters, threshold=0.8) == []
+
+        results = kuzu_memory._search_graph_db(["bob"], bob_filters, threshold=0.8)
+        assert [(r["source"], r["relationship"], r["destination"]) for r in results] == [("bob", "likes", "dave")]
+        results = kuzu_memory._search_graph_db(["bob"], alice_filters, threshold=0.8)
+        assert [(r["source"], r["relationship"], r["destination"]) for r in results] == [("alice", "knows", "bob")]
+
+    @patch("mem0.memory.kuzu_memory.EmbedderFactory")
+    @patch("mem0.memory.kuzu_memory.LlmFactory")
+    def test_add_entities_in_one_batch(
+        self, mock_llm_factory, mock_embedder_factory, mock_config, mock_embedding_model, mock_llm
+    ):
+        """Test that a batch embeds once, counts repeated mentions and reuses nodes created earlier in the batch"""
+        mock_embedding_model.embed_batch.side_effect = lambda texts: [
+            self.embeddings["bob" if text == "robert" else text] for text in texts
+        ]
+        mock_embedder_factory.create.return_value = mock_embedding_model
+        mock_llm_factory.create.return_value = mock_llm
+
+        kuzu_memory = MemoryGraph(mock_config)
+        filters = {"user_id": "test_user"}
+        data = [
+            {"source": "alice", "destination": "bob", "relationship": "knows"},
+            {"source": "alice", "destination": "bob", "relationship": "knows"},
+            {"source": "robert", "destination": "charlie", "relationship": "likes"},
+        ]
+
+        result = kuzu_memory._add_entities(data, filters, {})
+
+        mock_embedding_model.embed_batch.assert_called_once_with(["alice", "bob", "robert", "charlie"])
+        mock_embedding_model.embed.assert_not_called()
+        assert result == [
+            [{"source": "alice", "relationship": "knows", "target": "bob"}],
+            [{"source": "alice", "relationship": "knows", "target": "bob"}],
+            [{"source": "bob", "relationship": "likes", "target": "charlie"}],
+        ]
+        mentions = kuzu_memory.kuzu_execute("MATCH (n:Entity) RETURN n.name AS name, n.mentions AS mentions")
+        assert {row["name"]: row["mentions"] for row in mentions} == {"alice": 2, "bob": 3, "charlie": 1}
+        relations = kuzu_memory.kuzu_execute(
+            "MATCH ()-[r:CONNECTED_TO]->() RETURN r.name AS name, r.mentions AS mentions"
+        )
+        assert {row["name"]: row["mentions"] for row in relations} == {"knows": 2, "likes": 1}
+
+        result = kuzu_memory._delete_entities(data, filters)
+        assert result == [
+            [{"source": "alice", "relationship": "knows", "target": "bob"}],
+            [],
+            [],
+        ]
+        assert get_edge_count(kuzu_memory) == 1
+
+    @patch("mem0.memory.kuzu_memory.EmbedderFactory")
+    @patch("mem0.memory.kuzu_memory.LlmFactory")
+    def test_relationship_between_existing_nodes_sets_updated(
+        self, mock_llm_factory, mock_embedder_factory, mock_config, mock_embedding_model, mock_llm
+    ):
+        """Test that only relationships between two existing nodes get an updated timestamp on creation"""
+        mock_embedder_factory.create.return_value = mock_embedding_model
+        mock_llm_factory.create.return_value = mock_llm
+
+        kuzu_memory = MemoryGraph(mock_config)
+        filters = {"user_id": "test_user"}
+        kuzu_memory._add_entities([{"source": "alice", "destination": "bob", "relationship": "knows"}], filters, {})
+        kuzu_memory._add_entities([{"source": "bob", "destination": "alice", "relationship": "likes"}], filters, {})
+
+        relations = kuzu_memory.kuzu_execute(
+            "MATCH ()-[r:CONNECTED_TO]->() RETURN r.name AS name, r.created IS NULL AS no_created, "
+            "r.updated IS NULL AS no_updated"
+        )
+        assert {row["name"]: (row["no_created"], row["no_updated"]) for row in relations} == {
+            "knows": (False, True),
+            "likes": (False, False),
+        }
+
+    @patch("mem0.memory.kuzu_memory.EmbedderFactory")
+    @patch("mem0.memory.kuzu_memory.LlmFactory")
+    def test_legacy_variable_length_embeddings(
+        self, mock_llm_factory, mock_embedder_factory, mock_config, mock_embedding_model, mock_llm, tmp_path
+    ):
+        """Test that databases created with FLOAT[] embeddings are still written and searched, without an index"""
+        import kuzu
+
+        db_path = str(tmp_path / "graph.kuzu")
+        connection = kuzu.Connection(kuzu.Database(db_path))
+        connection.execute(
+            "CREATE NODE TABLE Entity(id SERIAL PRIMARY KEY, user_id STRING, agent_id STRING, run_id STRING, "
+            "name STRING, mentions INT64, created TIMESTAMP, embedding FLOAT[]);"
+        )
+        connection.execute(
+            "CREATE REL TABLE CONNECTED_TO(FROM Entity TO Entity, name STRING, mentions INT64, "
+            "created TIMESTAMP, updated TIMESTAMP);"
+        )
+        connection.close()
+
+        mock_config.graph_store.config.db = db_path
+        mock_embedder_factory.create.return_value = mock_embedding_model
+        mock_llm_factory.create.return_value = mock_llm
+
+        kuzu_memory = MemoryGraph(mock_config)
+        assert kuzu_memory.vector_index is None
+
+        filters = {"user_id": "test_user"}
+        kuzu_memory._add_entities([{"source": "alice", "destination": "bob", "relationship": "knows"}], filters, {})
+        result = kuzu_memory._add_entities(
+            [{"source": "bob", "destination": "charlie", "relationship": "likes"}], filters, {}
+        )
+        assert result == [[{"source": "bob", "relationship": "likes", "target": "charlie"}]]
+        assert get_node_count(kuzu_memory) == 3
+
+        results = kuzu_memory._search_graph_db(["bob"], filters, threshold=0.8)
+        assert {(r["source"], r["relationship"], r["destination"]) for r in results} == {
+            ("alice", "knows", "bob"),
+            ("bob", "likes", "charlie"),
+        }
+
+
 def get_node_count(kuzu_memory):
     results = kuzu_memory.kuzu_execute(
         """
@@ -0,0 +1,90 @@
+import sqlite3
+
+from mem0.memory.lexical import BM25Index, lexical_filters_supported, reciprocal_rank_fusion
+
+
+def _index(db_path=":memory:"):
+    index = BM25Index(db_path)
+    index.upsert("1", "Alice's employee id is EMP-4821", {"user_id": "alice"})
+    index.upsert("2", "Alice likes green tea", {"user_id": "alice"})
+    index.upsert("3", "Bob's employee id is EMP-1234", {"user_id": "bob"})
+    return index
+
+
+def test_search_ranks_exact_terms_within_the_scope():
+    index = _index()
+    hits = index.search("What is EMP-4821?", {"user_id": "alice"})
+    assert [memory_id for memory_id, _ in hits] == ["1"]
+
+    assert [memory_id for memory_id, _ in index.search("employee id", {"user_id": "bob"})] == ["3"]
+    assert index.search("employee id", {"user_id": "carol"}) == []
+    assert index.search("employee id", {"actor_id": "alice"}) == []
+
+
+def test_search_intersects_session_ids():
+    index = _index()
+    index.upsert("4", "Alice likes black tea", {"user_id": "alice", "run_id": "r1"})
+    assert [memory_id for memory_id, _ in index.search("tea", {"user_id": "alice", "run_id": "r1"})] == ["4"]
+    assert {memory_id for memory_id, _ in index.search("tea", {"user_id": "alice"})} == {"2", "4"}
+
+
+def test_updates_and_deletes_are_incremental():
+    index = _index()
+    index.upsert("2", "Alice likes coffee", {"user_id": "alice"})
+    assert index.search("tea", {"user_id": "alice"}) == []
+    assert [memory_id for memory_id, _ in index.search("coffee", {"user_id": "alice"})] == ["2"]
+
+    index.delete("2")
+    assert index.search("coffee", {"user_id": "alice"}) == []
+    assert len(index) == 2
+
+
+def test_index_is_rebuilt_from_disk(tmp_path):
+    db_path = str(tmp_path / "history.db")
+    _index(db_path).delete("3")
+
+    reopened = BM25Index(db_path)
+    assert len(reopened) == 2
+    assert [memory_id for memory_id, _ in reopened.search("green tea", {"user_id": "alice"})] == ["2"]
+
+    reopened.clear()
+    assert len(BM25Index(db_path)) == 0
+
+
+def test_collections_sharing_a_database_keep_their_own_index(tmp_path):
+    db_path = str(tmp_path / "history.db")
+    _index(db_path)
+    other = BM25Index(db_path, collection="qdrant:other")
+    assert len(other) == 0
+
+    other.upsert("1", "Alice likes coffee", {"user_id": "alice"})
+    other.clear()
+    reopened = BM25Index(db_path)
+    assert len(reopened) == 3
+    assert [memory_id for memory_id, _ in reopened.search("employee id", {"user_id": "bob"})] == ["3"]
+
+
+def test_index_without_collections_is_recreated(tmp_path):
+    db_path = str(tmp_path / "history.db")
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE lexical_index (memory_id TEXT PRIMARY KEY, scopes TEXT, text TEXT)")
+    connection.execute("""INSERT INTO lexical_index VALUES ('1', '["user_id=alice"]', 'Alice likes tea')""")
+    connection.commit()
+    connection.close()
+
+    index = BM25Index(db_path, collection="qdrant:memories")
+    assert len(index) == 0
+    index.upsert("1", "Alice likes tea", {"user_id": "alice"})
+    assert len(BM25Index(db_path, collection="qdrant:memories")) == 1
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "c"]], k=60)
+    assert [memory_id for memory_id, _ in fused] == ["b", "c", "a"]
+    assert fused[0][1] == 1 / 62 + 1 / 61
+
+
+def test_only_plain_filters_use_the_lexical_search():
+    assert lexical_filters_supported({"user_id": "alice", "actor_id": "bob"})
+    assert not lexical_filters_supported({"user_id": "alice", "score": {"gt": 1}})
+    assert not lexical_filters_supported({"actor_id": "bob"})
@@ -1,9 +1,19 @@
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
 import pytest
 
+from mem0.configs.base import HybridSearchConfig, IngestionQueueConfig
+from mem0.exceptions import ValidationError as Mem0ValidationError
+from mem0.memory.coalescer import AddCoalescer
+from mem0.memory.gate import ExtractionFilter, ExtractionGate, RuleFilter
+from mem0.memory.lexical import BM25Index
 from mem0.memory.main import AsyncMemory, Memory
+from mem0.memory.search_cache import SearchCache
+from mem0.memory.storage import SQLiteManager
 
 
 def _setup_mocks(mocker):
@@ -65,6 +75,7 @@ class TestAddToVectorStoreErrors:
         # Setup
         # First call returns valid JSON, second call returns empty string
         mock_memory.llm.generate_response.side_effect = ['{"facts": ["test fact"]}', ""]
+        mock_memory.vector_store.search.return_value = [MagicMock(id="mem_1", payload={"data": "old fact"})]
 
         # Execute
         with caplog.at_level(logging.WARNING):
@@ -116,6 +127,7 @@ class TestAsyncAddToVectorStoreErrors:
         """Test empty response in AsyncMemory._add_to_vector_store"""
         mocker.patch("mem0.utils.factory.EmbedderFactory.create", return_value=MagicMock())
         mock_async_memory.llm.generate_response.side_effect = ['{"facts": ["test fact"]}', ""]
+        mock_async_memory.vector_store.search.return_value = [MagicMock(id="mem_1", payload={"data": "old fact"})]
         mock_capture_event = mocker.MagicMock()
         mocker.patch("mem0.memory.main.capture_event", mock_capture_event)
 
@@ -127,3 +139,368 @@ class TestAsyncAddToVectorStoreErrors:
         assert result == []
         assert "Empty response from LLM, no memories to extract" in caplog.text
         assert mock_capture_event.call_count == 1
+
+
+class TestAddShortCircuits:
+    @pytest.fixture
+    def mock_memory(self, mocker):
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+
+        memory = Memory()
+        memory.config = mocker.MagicMock()
+        memory.config.custom_fact_extraction_prompt = None
+        memory.config.custom_update_memory_prompt = None
+        memory.api_version = "v1.1"
+        memory.db = SQLiteManager(":memory:")
+        # The vector store returns the memories inserted through it
+        stored = {}
+        memory.vector_store.insert.side_effect = lambda vectors, ids, payloads: stored.update(zip(ids, payloads))
+        memory.vector_store.get_many.side_effect = lambda vector_ids: [
+            MagicMock(id=vector_id, payload=stored[vector_id]) for vector_id in vector_ids if vector_id in stored
+        ]
+        return memory
+
+    def test_uninformative_messages_skip_extraction(self, mock_memory):
+        """Messages flagged by the extraction gate don't reach the LLM"""
+        mock_memory.extraction_gate = ExtractionGate([RuleFilter()])
+
+        result = mock_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "thanks!"}, {"role": "assistant", "content": "You're welcome!"}],
+            metadata={"user_id": "alice"},
+            filters={"user_id": "alice"},
+            infer=True,
+        )
+
+        assert result == []
+        mock_memory.llm.generate_response.assert_not_called()
+        assert mock_memory.extraction_gate.stats()["skipped"] == 1
+
+    @pytest.mark.parametrize("response, learned", [("not json", False), ('{"facts": []}', True)])
+    def test_gate_only_learns_from_well_formed_empty_extractions(self, mock_memory, response, learned):
+        """A malformed extraction is not learned as a no-fact example"""
+
+        class RecordingFilter(ExtractionFilter):
+            name = "recording"
+
+            def __init__(self):
+                self.learned = []
+
+            def is_uninformative(self, content):
+                return False
+
+            def learn(self, contents):
+                self.learned.extend(contents)
+
+        recording = RecordingFilter()
+        mock_memory.extraction_gate = ExtractionGate([recording], learn_from_extraction=True)
+        mock_memory.llm.generate_response.return_value = response
+
+        mock_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "I will think about it"}],
+            metadata={"user_id": "alice"},
+            filters={"user_id": "alice"},
+            infer=True,
+        )
+
+        assert recording.learned == (["I will think about it"] if learned else [])
+
+    def test_streamed_facts_are_searched_while_generating(self, mock_memory):
+        """Each fact is embedded and searched as soon as it is generated, before the extraction completes"""
+        mock_memory.streaming_extraction = True
+        mock_memory._create_memory("Likes tea", {"Likes tea": [0.1, 0.2, 0.3]}, {"user_id": "alice"})
+        first_fact_searched = threading.Event()
+        mock_memory.vector_store.search.side_effect = lambda **kwargs: first_fact_searched.set() or []
+
+        def stream(**kwargs):
+            yield '{"facts": ["Likes tea", "Likes coffee", '
+            # The next fact only comes once the previous one was searched
+            assert first_fact_searched.wait(5)
+            yield '"Lives in Paris"]}'
+
+        mock_memory.llm.generate_response_stream.side_effect = stream
+        mock_memory.embedding_model.embed.reset_mock()
+
+        result = mock_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "test"}],
+            metadata={"user_id": "alice"},
+            filters={"user_id": "alice"},
+            infer=True,
+        )
+
+        mock_memory.llm.generate_response.assert_not_called()
+        assert sorted(r["memory"] for r in result) == ["Likes coffee", "Lives in Paris"]
+        # The stored fact is neither embedded nor searched
+        assert mock_memory.vector_store.search.call_count == 2
+
+    def test_new_facts_are_added_without_update_call(self, mock_memory):
+        """Facts with no existing memory to compare against skip the update LLM call"""
+        mock_memory.llm.generate_response.return_value = '{"facts": ["Likes tea", "Likes tea", "Lives in Paris"]}'
+
+        result = mock_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "test"}],
+            metadata={"user_id": "alice"},
+            filters={"user_id": "alice"},
+            infer=True,
+        )
+
+        assert mock_memory.llm.generate_response.call_count == 1
+        assert [(r["memory"], r["event"]) for r in result] == [("Likes tea", "ADD"), ("Lives in Paris", "ADD")]
+        assert mock_memory.vector_store.insert.call_count == 2
+
+    def test_stored_facts_are_skipped(self, mock_memory):
+        """Facts stored verbatim in the same scope are dropped before embedding them"""
+        mock_memory._create_memory("Likes tea", {"Likes tea": [0.1, 0.2, 0.3]}, {"user_id": "alice"})
+        mock_memory.embedding_model.embed.reset_mock()
+        mock_memory.llm.generate_response.return_value = '{"facts": ["Likes tea"]}'
+
+        result = mock_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "test"}],
+            metadata={"user_id": "alice"},
+            filters={"user_id": "alice"},
+            infer=True,
+        )
+
+        assert result == []
+        assert mock_memory.llm.generate_response.call_count == 1
+        mock_memory.embedding_model.embed.assert_not_called()
+        mock_memory.vector_store.search.assert_not_called()
+
+        # Another user holding the same fact is not a duplicate
+        result = mock_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "test"}],
+            metadata={"user_id": "bob"},
+            filters={"user_id": "bob"},
+            infer=True,
+        )
+        assert [r["memory"] for r in result] == ["Likes tea"]
+
+    def test_stored_facts_of_other_collections_are_kept(self, mock_memory):
+        """The hash index is shared through the history database, but only matches memories of the same collection"""
+        mock_memory._create_memory("Likes tea", {"Likes tea": [0.1, 0.2, 0.3]}, {"user_id": "alice"})
+        mock_memory.collection_scope = "qdrant:other"
+        mock_memory.llm.generate_response.return_value = '{"facts": ["Likes tea"]}'
+
+        result = mock_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "test"}],
+            metadata={"user_id": "alice"},
+            filters={"user_id": "alice"},
+            infer=True,
+        )
+
+        assert [r["memory"] for r in result] == ["Likes tea"]
+
+    def test_stored_facts_missing_from_the_vector_store_are_kept(self, mock_memory):
+        """A hash whose memory is gone from the vector store (e.g. a wiped collection) is forgotten"""
+        mock_memory._create_memory("Likes tea", {"Likes tea": [0.1, 0.2, 0.3]}, {"user_id": "alice"})
+        content_hash = hashlib.md5(b"Likes tea").hexdigest()
+        mock_memory.vector_store.get_many.side_effect = lambda vector_ids: []
+        mock_memory.llm.generate_response.return_value = '{"facts": ["Likes tea"]}'
+
+        result = mock_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "test"}],
+            metadata={"user_id": "alice"},
+            filters={"user_id": "alice"},
+            infer=True,
+        )
+
+        assert [r["memory"] for r in result] == ["Likes tea"]
+        stored = mock_memory.db.get_memory_hashes([content_hash], {"user_id": "alice"}, mock_memory.collection_scope)
+        assert list(stored) == [content_hash]
+        assert stored[content_hash] != mock_memory.vector_store.insert.call_args_list[0].kwargs["ids"][0]
+
+
+class TestQueuedAdd:
+    @pytest.fixture
+    def mock_memory(self, mocker, tmp_path):
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+
+        memory = Memory()
+        queue_config = IngestionQueueConfig(path=str(tmp_path / "ingestion_queue.db"), retry_backoff=0.01)
+        memory.config = memory.config.model_copy(update={"ingestion_queue": queue_config})
+        memory.db = SQLiteManager(":memory:")
+        return memory
+
+    def test_add_returns_a_job_and_applies_it_in_the_background(self, mocker, mock_memory):
+        added = [{"id": "1", "memory": "Likes tea", "event": "ADD"}]
+        add_to_vector_store = mocker.patch.object(mock_memory, "_add_to_vector_store", return_value=added)
+
+        queued = mock_memory.add("I like tea", user_id="alice", metadata={"source": "chat"}, wait=False)
+
+        assert queued["status"] == "pending"
+        assert mock_memory.flush(timeout=10)
+        status = mock_memory.get_job_status(queued["job_id"])
+        assert status["status"] == "done"
+        assert status["result"] == {"results": added}
+        messages, metadata, filters, infer = add_to_vector_store.call_args.args
+        assert messages == [{"role": "user", "content": "I like tea"}]
+        assert metadata == {"source": "chat", "user_id": "alice"}
+        assert filters == {"user_id": "alice"}
+
+    def test_invalid_adds_are_rejected_before_queueing(self, mock_memory):
+        with pytest.raises(Mem0ValidationError):
+            mock_memory.add("I like tea", wait=False)
+        assert mock_memory._ingestion_queue is None
+
+    def test_default_queue_is_stored_next_to_the_history(self, mock_memory, tmp_path):
+        history_db_path = str(tmp_path / "history.db")
+        mock_memory.config = mock_memory.config.model_copy(
+            update={"history_db_path": history_db_path, "ingestion_queue": IngestionQueueConfig()}
+        )
+
+        mock_memory._get_ingestion_queue()
+
+        assert (tmp_path / f"history_{mock_memory.collection_name}_ingestion_queue.db").exists()
+        mock_memory._ingestion_queue.close()
+
+
+class TestCoalescedAdd:
+    def test_concurrent_adds_of_a_user_run_one_cycle(self, mocker):
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+        memory = Memory()
+        memory._add_coalescer = AddCoalescer(window=0.2)
+        added = [{"id": "1", "memory": "Likes tea and coffee", "event": "ADD"}]
+        add_to_vector_store = mocker.patch.object(memory, "_add_to_vector_store", return_value=added)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(memory.add, text, user_id="alice") for text in ("I like tea", "I like coffee")]
+            results = [future.result() for future in futures]
+
+        assert results == [{"results": added}, {"results": added}]
+        add_to_vector_store.assert_called_once()
+        messages = add_to_vector_store.call_args.args[0]
+        assert sorted(m["content"] for m in messages) == ["I like coffee", "I like tea"]
+
+
+class TestSearchCache:
+    def test_repeated_search_is_served_until_a_write(self, mocker):
+        _, mock_vector_store = _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+        memory = Memory()
+        memory.db = SQLiteManager(":memory:")
+        memory.search_cache = SearchCache()
+
+        first = memory.search("What does Alice like?", user_id="alice")
+        assert memory.search("what does alice like?", user_id="alice") == first
+        assert mock_vector_store.return_value.search.call_count == 1
+
+        memory._create_memory("Likes tea", {"Likes tea": [0.1, 0.2, 0.3]}, metadata={"user_id": "alice"})
+        memory.search("What does Alice like?", user_id="alice")
+        assert mock_vector_store.return_value.search.call_count == 2
+        assert memory.search_cache.stats()["hits"] == 1
+
+
+class TestHybridSearch:
+    def test_bm25_hits_are_fused_with_vector_results(self, mocker):
+        _, mock_vector_store = _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+        memory = Memory()
+        memory.db = SQLiteManager(":memory:")
+        memory.hybrid_search = HybridSearchConfig(candidates=10)
+        memory.lexical_index = BM25Index()
+
+        memory._create_memory("Works on ticket MEM-42", {"Works on ticket MEM-42": [0.1]}, {"user_id": "alice"})
+        memory._create_memory("Likes tea", {"Likes tea": [0.1]}, {"user_id": "alice"})
+        inserts = mock_vector_store.return_value.insert.call_args_list
+        bm25_id, vector_id = [call.kwargs["ids"][0] for call in inserts]
+        payloads = {call.kwargs["ids"][0]: call.kwargs["payloads"][0] for call in inserts}
+
+        vector_hit = MagicMock(id=vector_id, payload=payloads[vector_id], score=0.9)
+        mock_vector_store.return_value.search.return_value = [vector_hit]
+        mock_vector_store.return_value.get.side_effect = lambda vector_id: MagicMock(
+            id=vector_id, payload=payloads[vector_id]
+        )
+
+        results = memory.search("MEM-42", user_id="alice", limit=2)["results"]
+
+        assert [result["memory"] for result in results] == ["Likes tea", "Works on ticket MEM-42"]
+        # The vector similarity is kept, the fused score is returned next to it
+        assert [result["score"] for result in results] == [0.9, None]
+        # Each is first of one ranking
+        assert [result["fused_score"] for result in results] == [pytest.approx(1 / 61)] * 2
+        assert mock_vector_store.return_value.search.call_args.kwargs["limit"] == 10
+        mock_vector_store.return_value.get.assert_called_once_with(vector_id=bm25_id)
+
+        # BM25 hits have no similarity to check against a threshold
+        results = memory.search("MEM-42", user_id="alice", limit=2, threshold=0.5)["results"]
+        assert [result["memory"] for result in results] == ["Likes tea"]
+
+    def test_memories_stored_before_hybrid_search_are_backfilled(self, mocker):
+        _, mock_vector_store = _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+        memory = Memory()
+        memory.db = SQLiteManager(":memory:")
+        memory._create_memory("Works on ticket MEM-42", {"Works on ticket MEM-42": [0.1]}, {"user_id": "alice"})
+        insert = mock_vector_store.return_value.insert.call_args
+        stored = MagicMock(id=insert.kwargs["ids"][0], payload=insert.kwargs["payloads"][0])
+        mock_vector_store.return_value.list.return_value = ([stored], None)
+        mock_vector_store.return_value.get.return_value = stored
+
+        memory.hybrid_search = HybridSearchConfig(candidates=10)
+        memory.lexical_index = BM25Index()
+        results = memory.search("MEM-42", user_id="alice")["results"]
+        memory.search("MEM-42", user_id="alice")
+
+        assert [result["memory"] for result in results] == ["Works on ticket MEM-42"]
+        mock_vector_store.return_value.list.assert_called_once_with(filters=None, limit=10000)
+
+
+class TestDeleteMany:
+    @pytest.fixture
+    def memory_with_two(self, mocker):
+        _, mock_vector_store = _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+        memory = Memory()
+        memory.db = SQLiteManager(":memory:")
+        memory.search_cache = SearchCache()
+        memory.lexical_index = BM25Index()
+
+        memory._create_memory("Likes tea", {"Likes tea": [0.1]}, {"user_id": "alice"})
+        memory._create_memory("Likes jazz", {"Likes jazz": [0.1]}, {"user_id": "alice"})
+        inserts = mock_vector_store.return_value.insert.call_args_list
+        payloads = {call.kwargs["ids"][0]: call.kwargs["payloads"][0] for call in inserts}
+        mock_vector_store.return_value.get.side_effect = lambda vector_id: (
+            MagicMock(id=vector_id, payload=payloads[vector_id]) if vector_id in payloads else None
+        )
+        mock_vector_store.return_value.get_many.side_effect = lambda vector_ids: [
+            MagicMock(id=vector_id, payload=payloads[vector_id]) for vector_id in vector_ids if vector_id in payloads
+        ]
+        return memory, mock_vector_store.return_value, list(payloads)
+
+    def test_deletes_in_one_request_with_bookkeeping(self, memory_with_two):
+        memory, vector_store, memory_ids = memory_with_two
+        versions = memory.search_cache.versions(["user_id=alice"])
+
+        failed = memory.delete_many([*memory_ids, "missing"])
+
+        assert failed == ["missing"]
+        vector_store.get_many.assert_called_once_with(vector_ids=[*memory_ids, "missing"])
+        vector_store.delete_many.assert_called_once_with(vector_ids=memory_ids)
+        vector_store.delete.assert_not_called()
+        for memory_id in memory_ids:
+            assert {row["event"] for row in memory.db.get_history(memory_id)} == {"ADD", "DELETE"}
+        assert memory.db.get_memory_hashes(
+            [payload["hash"] for payload in (vector_store.get(memory_id).payload for memory_id in memory_ids)],
+            {"user_id": "alice"},
+        ) == {}
+        assert len(memory.lexical_index) == 0
+        assert memory.search_cache.versions(["user_id=alice"]) != versions
+
+    def test_falls_back_to_single_gets(self, memory_with_two):
+        memory, vector_store, memory_ids = memory_with_two
+        del vector_store.get_many
+
+        assert memory.delete_many([*memory_ids, "missing"]) == ["missing"]
+        assert vector_store.get.call_count == 3
+        vector_store.delete_many.assert_called_once_with(vector_ids=memory_ids)
+
+    def test_failed_batch_keeps_bookkeeping(self, memory_with_two):
+        memory, vector_store, memory_ids = memory_with_two
+        vector_store.delete_many.side_effect = RuntimeError("unavailable")
+
+        assert memory.delete_many(memory_ids) == memory_ids
+        assert len(memory.lexical_index) == 2
+        for memory_id in memory_ids:
+            assert [row["event"] for row in memory.db.get_history(memory_id)] == ["ADD"]
@@ -241,53 +241,31 @@ class TestNeptuneMemory(unittest.TestCase):
         self.memory_graph._delete_all_cypher.assert_called_once_with(self.test_filters)
         self.mock_graph.query.assert_called_once_with(mock_cypher, params=mock_params)
 
-    def test_search_source_node(self):
-        """Test the _search_source_node method."""
-        # Mock embedding
-        mock_embedding = [0.1, 0.2, 0.3]
-
-        # Mock the _search_source_node_cypher method
-        mock_cypher = "MATCH (n) RETURN n"
-        mock_params = {"source_embedding": mock_embedding, "user_id": self.user_id, "threshold": 0.9}
-        self.memory_graph._search_source_node_cypher = MagicMock(return_value=(mock_cypher, mock_params))
-
-        # Mock the graph.query result
-        mock_query_result = [{"id(source_candidate)": 123, "cosine_similarity": 0.95}]
-        self.mock_graph.query.return_value = mock_query_result
-
-        # Call the _search_source_node method
-        result = self.memory_graph._search_source_node(mock_embedding, self.user_id, threshold=0.9)
-
-        # Verify the method calls
-        self.memory_graph._search_source_node_cypher.assert_called_once_with(mock_embedding, self.user_id, 0.9)
-        self.mock_graph.query.assert_called_once_with(mock_cypher, params=mock_params)
-
-        # Check the result
-        self.assertEqual(result, mock_query_result)
-
-    def test_search_destination_node(self):
-        """Test the _search_destination_node method."""
-        # Mock embedding
-        mock_embedding = [0.1, 0.2, 0.3]
+    def test_search_nodes(self):
+        """Test the _search_nodes method."""
+        # Mock embeddings
+        embeddings = {"alice": [0.1, 0.2, 0.3], "bob": [0.4, 0.5, 0.6]}
 
-        # Mock the _search_destination_node_cypher method
+        # Mock the _search_nodes_cypher method
         mock_cypher = "MATCH (n) RETURN n"
-        mock_params = {"destination_embedding": mock_embedding, "user_id": self.user_id, "threshold": 0.9}
-        self.memory_graph._search_destination_node_cypher = MagicMock(return_value=(mock_cypher, mock_params))
+        mock_params = {"user_id": self.user_id, "threshold": 0.9}
+        self.memory_graph._search_nodes_cypher = MagicMock(return_value=(mock_cypher, mock_params))
 
-        # Mock the graph.query result
-        mock_query_result = [{"id(destination_candidate)": 456, "cosine_similarity": 0.92}]
-        self.mock_graph.query.return_value = mock_query_result
+        # Mock the graph.query result, ordered from the closest candidate
+        self.mock_graph.query.return_value = [
+            {"name": "alice", "id": 123},
+            {"name": "alice", "id": 124},
+        ]
 
-        # Call the _search_destination_node method
-        result = self.memory_graph._search_destination_node(mock_embedding, self.user_id, threshold=0.9)
+        # Call the _search_nodes method
+        result = self.memory_graph._search_nodes(embeddings, self.user_id, threshold=0.9)
 
         # Verify the method calls
-        self.memory_graph._search_destination_node_cypher.assert_called_once_with(mock_embedding, self.user_id, 0.9)
+        self.memory_graph._search_nodes_cypher.assert_called_once_with(embeddings, self.user_id, 0.9)
         self.mock_graph.query.assert_called_once_with(mock_cypher, params=mock_params)
 
         # Check the result
-        self.assertEqual(result, mock_query_result)
+        self.assertEqual(result, {"alice": 123})
 
     def test_search_graph_db(self):
         """Test the _search_graph_db method."""
@@ -323,66 +301,100 @@ class TestNeptuneMemory(unittest.TestCase):
     def test_add_entities(self):
         """Test the _add_entities method."""
         # Mock data
-        to_be_added = [{"source": "alice", "relationship": "knows", "destination": "bob"}]
-        entity_type_map = {"alice": "person", "bob": "person"}
+        to_be_added = [
+            {"source": "alice", "relationship": "knows", "destination": "bob"},
+            {"source": "alice", "relationship": "knows", "destination": "charlie"},
+        ]
+        entity_type_map = {"alice": "person", "bob": "person", "charlie": "person"}
 
         # Mock embeddings
-        mock_embedding = [0.1, 0.2, 0.3]
-        self.mock_embedding_model.embed.return_value = mock_embedding
+        self.mock_embedding_model.embed_batch.return_value = [[1.0, 0.0], [0.0, 1.0], [0.0, -1.0]]
 
-        # Mock search results
-        mock_source_search = [{"id(source_candidate)": 123, "cosine_similarity": 0.95}]
-        mock_dest_search = [{"id(destination_candidate)": 456, "cosine_similarity": 0.92}]
-
-        # Mock the search methods
-        self.memory_graph._search_source_node = MagicMock(return_value=mock_source_search)
-        self.memory_graph._search_destination_node = MagicMock(return_value=mock_dest_search)
+        # Mock the search method, only alice is in the graph
+        self.memory_graph._search_nodes = MagicMock(return_value={"alice": 123})
 
         # Mock the _add_entities_cypher method
         mock_cypher = "MATCH (n) RETURN n"
-        mock_params = {"source_id": 123, "destination_id": 456}
+        mock_params = {"rows": []}
         self.memory_graph._add_entities_cypher = MagicMock(return_value=(mock_cypher, mock_params))
 
         # Mock the graph.query result
-        mock_query_result = [{"source": "alice", "relationship": "knows", "target": "bob"}]
-        self.mock_graph.query.return_value = mock_query_result
+        self.mock_graph.query.return_value = [
+            {"row": 1, "source": "alice", "relationship": "knows", "target": "charlie"},
+            {"row": 0, "source": "alice", "relationship": "knows", "target": "bob"},
+        ]
 
         # Call the _add_entities method
         result = self.memory_graph._add_entities(to_be_added, self.user_id, entity_type_map)
 
         # Verify the method calls
-        self.assertEqual(self.mock_embedding_model.embed.call_count, 2)
-        self.memory_graph._search_source_node.assert_called_once_with(mock_embedding, self.user_id, threshold=0.7)
-        self.memory_graph._search_destination_node.assert_called_once_with(mock_embedding, self.user_id, threshold=0.7)
+        self.mock_embedding_model.embed_batch.assert_called_once_with(["alice", "bob", "charlie"])
+        self.mock_embedding_model.embed.assert_not_called()
+        self.memory_graph._search_nodes.assert_called_once()
         self.memory_graph._add_entities_cypher.assert_called_once()
+        rows = self.memory_graph._add_entities_cypher.call_args[0][0]
+        self.assertEqual([row["source_id"] for row in rows], [123, 123])
+        self.assertEqual([row["destination"] for row in rows], ["bob", "charlie"])
+        self.assertEqual([row["destination_id"] for row in rows], [None, None])
+        self.assertEqual(self.memory_graph._add_entities_cypher.call_args[0][1:], (
+            "person", "person", False, True, "knows", self.user_id
+        ))
         self.mock_graph.query.assert_called_once_with(mock_cypher, params=mock_params)
 
         # Check the result
-        self.assertEqual(result, [mock_query_result])
+        self.assertEqual(result, [
+            [{"source": "alice", "relationship": "knows", "target": "bob"}],
+            [{"source": "alice", "relationship": "knows", "target": "charlie"}],
+        ])
+
+    def test_add_entities_cypher_relationship_properties(self):
+        """Test that relationships between two existing nodes keep their created_at and updated_at properties"""
+        rows = [{"row": 0, "source": "alice", "destination": "bob", "source_id": 1, "destination_id": 2}]
+
+        cypher, _ = self.memory_graph._add_entities_cypher(
+            rows, "person", "person", False, False, "knows", self.user_id
+        )
+        self.assertIn("r.created_at = timestamp()", cypher)
+        self.assertIn("r.updated_at = timestamp()", cypher)
+        self.assertNotIn("r.created = timestamp()", cypher)
+
+        cypher, _ = self.memory_graph._add_entities_cypher(
+            rows, "person", "person", False, True, "knows", self.user_id
+        )
+        self.assertIn("r.created = timestamp()", cypher)
+        self.assertNotIn("r.created_at", cypher)
 
     def test_delete_entities(self):
         """Test the _delete_entities method."""
         # Mock data
-        to_be_deleted = [{"source": "alice", "relationship": "knows", "destination": "bob"}]
+        to_be_deleted = [
+            {"source": "alice", "relationship": "knows", "destination": "bob"},
+            {"source": "alice", "relationship": "likes", "destination": "charlie"},
+        ]
 
         # Mock the _delete_entities_cypher method
         mock_cypher = "MATCH (n) RETURN n"
-        mock_params = {"source_name": "alice", "dest_name": "bob", "user_id": self.user_id}
+        mock_params = {"rows": [], "user_id": self.user_id}
         self.memory_graph._delete_entities_cypher = MagicMock(return_value=(mock_cypher, mock_params))
 
         # Mock the graph.query result
-        mock_query_result = [{"source": "alice", "relationship": "knows", "target": "bob"}]
-        self.mock_graph.query.return_value = mock_query_result
+        self.mock_graph.query.return_value = [{"row": 0, "source": "alice", "relationship": "knows", "target": "bob"}]
 
         # Call the _delete_entities method
         result = self.memory_graph._delete_entities(to_be_deleted, self.user_id)
 
         # Verify the method calls
-        self.memory_graph._delete_entities_cypher.assert_called_once_with("alice", "bob", "knows", self.user_id)
+        self.memory_graph._delete_entities_cypher.assert_called_once_with(
+            [
+                {"row": 0, "source": "alice", "destination": "bob", "relationship": "knows"},
+                {"row": 1, "source": "alice", "destination": "charlie", "relationship": "likes"},
+            ],
+            self.user_id,
+        )
         self.mock_graph.query.assert_called_once_with(mock_cypher, params=mock_params)
 
         # Check the result
-        self.assertEqual(result, [mock_query_result])
+        self.assertEqual(result, [[{"source": "alice", "relationship": "knows", "target": "bob"}], []])
 
 
 if __name__ == "__main__":
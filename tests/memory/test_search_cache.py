@@ -0,0 +1,124 @@
+import time
+from unittest.mock import MagicMock
+
+from mem0.memory.search_cache import RedisSearchCache, SearchCache
+
+
+def test_repeated_queries_hit_until_a_write_of_their_scope():
+    cache = SearchCache()
+    key = cache.key("search", "What does Alice like?", {"user_id": "alice"}, limit=5)
+    cache.set(key, {"results": [{"memory": "Likes tea"}]})
+
+    # Whitespace and case don't change the key
+    same_key = cache.key("search", "  what does alice   LIKE? ", {"user_id": "alice"}, limit=5)
+    assert same_key == key
+    assert cache.get(key) == (True, {"results": [{"memory": "Likes tea"}]})
+
+    cache.invalidate({"user_id": "bob", "data": "Likes coffee"})
+    assert cache.key("search", "What does Alice like?", {"user_id": "alice"}, limit=5) == key
+
+    cache.invalidate({"user_id": "alice", "agent_id": "helper", "data": "Likes coffee"})
+    assert cache.key("search", "What does Alice like?", {"user_id": "alice"}, limit=5) != key
+    assert cache.stats() == {"hits": 1, "misses": 0, "hit_rate": 1.0, "size": 1}
+
+
+def test_cached_results_are_copies():
+    cache = SearchCache()
+    key = cache.key("get_all", None, {"user_id": "alice"}, limit=100)
+    result = {"results": [{"memory": "Likes tea"}]}
+    cache.set(key, result)
+    result["results"].clear()
+
+    _, cached = cache.get(key)
+    cached["results"].append({"memory": "Likes coffee"})
+    assert cache.get(key) == (True, {"results": [{"memory": "Likes tea"}]})
+
+
+def test_filters_without_a_plain_session_id_are_not_cached():
+    cache = SearchCache()
+    assert cache.key("search", "tea", {"user_id": {"in": ["alice", "bob"]}}) is None
+
+
+def test_entries_expire_and_are_bounded():
+    cache = SearchCache(max_size=2, ttl=0.05)
+    for name in ("a", "b", "c"):
+        cache.set(name, name)
+    assert cache.get("a") == (False, None)
+    assert cache.get("c") == (True, "c")
+
+    time.sleep(0.1)
+    assert cache.get("c") == (False, None)
+
+
+def test_clear_invalidates_every_scope():
+    cache = SearchCache()
+    key = cache.key("search", "tea", {"user_id": "alice"})
+    cache.set(key, {"results": []})
+    cache.clear()
+    assert cache.get(key) == (False, None)
+    assert cache.key("search", "tea", {"user_id": "alice"}) != key
+
+
+def test_redis_cache_shares_versions_and_results():
+    client = MagicMock()
+    client.mget.return_value = [None, b"3"]
+    cache = RedisSearchCache("redis://localhost:6379", ttl=60, client=client)
+
+    key = cache.key("search", "tea", {"user_id": "alice"})
+    client.mget.assert_called_once_with(["mem0:search:version:__epoch__", "mem0:search:version:user_id=alice"])
+
+    cache.set(key, {"results": [{"memory": "Likes tea"}]})
+    client.set.assert_called_once_with(f"mem0:search:result:{key}", '{"results": [{"memory": "Likes tea"}]}', px=60000)
+
+    client.get.return_value = b'{"results": [{"memory": "Likes tea"}]}'
+    assert cache.get(key) == (True, {"results": [{"memory": "Likes tea"}]})
+
+    cache.invalidate({"user_id": "alice", "run_id": "r1"})
+    pipeline = client.pipeline.return_value
+    assert [c.args[0] for c in pipeline.incr.call_args_list] == [
+        "mem0:search:version:run_id=r1",
+        "mem0:search:version:user_id=alice",
+    ]
+    pipeline.execute.assert_called_once()
+
+
+def test_redis_caches_of_different_collections_are_kept_apart():
+    client = MagicMock()
+    client.mget.return_value = [None, None]
+    memories = RedisSearchCache("redis://localhost:6379", client=client, namespace="qdrant:memories")
+    other = RedisSearchCache("redis://localhost:6379", client=client, namespace="qdrant:other")
+
+    key = memories.key("search", "tea", {"user_id": "alice"})
+    client.mget.assert_called_once_with(
+        ["mem0:search:qdrant:memories:version:__epoch__", "mem0:search:qdrant:memories:version:user_id=alice"]
+    )
+    memories.set(key, {"results": []})
+    other.set(other.key("search", "tea", {"user_id": "alice"}), {"results": []})
+    assert [c.args[0] for c in client.set.call_args_list] == [
+        f"mem0:search:qdrant:memories:result:{key}",
+        f"mem0:search:qdrant:other:result:{key}",
+    ]
+
+    other.invalidate({"user_id": "alice"})
+    assert [c.args[0] for c in client.pipeline.return_value.incr.call_args_list] == [
+        "mem0:search:qdrant:other:version:user_id=alice"
+    ]
+
+
+def test_redis_cache_is_bypassed_when_redis_fails():
+    client = MagicMock()
+    client.mget.side_effect = ConnectionError("redis is down")
+    client.pipeline.return_value.execute.side_effect = ConnectionError("redis is down")
+    cache = RedisSearchCache("redis://localhost:6379", client=client)
+
+    assert cache.key("search", "tea", {"user_id": "alice"}) is None
+    cache.invalidate({"user_id": "alice"})
+
+
+def test_redis_cache_keeps_sub_second_ttls():
+    client = MagicMock()
+    client.mget.return_value = [None, None]
+    cache = RedisSearchCache("redis://localhost:6379", ttl=0.25, client=client)
+
+    cache.set(cache.key("search", "tea", {"user_id": "alice"}), {"results": []})
+    assert client.set.call_args.kwargs["px"] == 250
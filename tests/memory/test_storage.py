@@ -248,6 +248,58 @@ class TestSQLiteManager:
             result = sqlite_manager.get_history(memory_id)
             assert len(result) == 1
 
+    def test_memory_hashes_by_scope(self, sqlite_manager):
+        """Test that memory hashes are looked up within the given scope."""
+        sqlite_manager.add_memory_hash("m1", "h1", user_id="alice")
+        sqlite_manager.add_memory_hash("m2", "h2", user_id="alice", agent_id="a1")
+        sqlite_manager.add_memory_hash("m3", "h1", user_id="bob")
+
+        assert sqlite_manager.get_memory_hashes(["h1", "h2"], {"user_id": "alice"}) == {"h1": "m1", "h2": "m2"}
+        assert sqlite_manager.get_memory_hashes(["h1", "h2"], {"user_id": "alice", "agent_id": "a1"}) == {"h2": "m2"}
+        assert sqlite_manager.get_memory_hashes(["h1"], {"user_id": "bob"}) == {"h1": "m3"}
+        assert sqlite_manager.get_memory_hashes([], {"user_id": "bob"}) == {}
+
+        # Updating a memory replaces its hash
+        sqlite_manager.add_memory_hash("m1", "h3", user_id="alice")
+        assert sqlite_manager.get_memory_hashes(["h1", "h3"], {"user_id": "alice"}) == {"h3": "m1"}
+
+        sqlite_manager.delete_memory_hash("m1")
+        assert sqlite_manager.get_memory_hashes(["h3"], {"user_id": "alice"}) == {}
+
+        sqlite_manager.reset_memory_hashes()
+        assert sqlite_manager.get_memory_hashes(["h1", "h2"], {"user_id": "alice"}) == {}
+
+    def test_memory_hashes_by_collection(self, sqlite_manager):
+        """Test that memory hashes of one collection are not seen from another."""
+        sqlite_manager.add_memory_hash("m1", "h1", user_id="alice", collection="qdrant:a")
+        sqlite_manager.add_memory_hash("m2", "h1", user_id="alice", collection="qdrant:b")
+
+        assert sqlite_manager.get_memory_hashes(["h1"], {"user_id": "alice"}, collection="qdrant:a") == {"h1": "m1"}
+        assert sqlite_manager.get_memory_hashes(["h1"], {"user_id": "alice"}, collection="qdrant:b") == {"h1": "m2"}
+        assert sqlite_manager.get_memory_hashes(["h1"], {"user_id": "alice"}) == {}
+
+        sqlite_manager.delete_memory_hash("m1", collection="qdrant:b")
+        assert sqlite_manager.get_memory_hashes(["h1"], {"user_id": "alice"}, collection="qdrant:a") == {"h1": "m1"}
+
+        sqlite_manager.reset_memory_hashes("qdrant:a")
+        assert sqlite_manager.get_memory_hashes(["h1"], {"user_id": "alice"}, collection="qdrant:a") == {}
+        assert sqlite_manager.get_memory_hashes(["h1"], {"user_id": "alice"}, collection="qdrant:b") == {"h1": "m2"}
+
+    def test_memory_hashes_without_collection_are_recreated(self, temp_db_path):
+        """Test that a memory hashes table from before collections were tracked is rebuilt."""
+        conn = sqlite3.connect(temp_db_path)
+        conn.execute(
+            "CREATE TABLE memory_hashes (memory_id TEXT PRIMARY KEY, hash TEXT, user_id TEXT, agent_id TEXT, run_id TEXT)"
+        )
+        conn.execute("INSERT INTO memory_hashes VALUES ('m1', 'h1', 'alice', NULL, NULL)")
+        conn.commit()
+        conn.close()
+
+        manager = SQLiteManager(temp_db_path)
+        manager.add_memory_hash("m2", "h1", user_id="alice", collection="qdrant:a")
+        assert manager.get_memory_hashes(["h1"], {"user_id": "alice"}, collection="qdrant:a") == {"h1": "m2"}
+        manager.close()
+
     # ========== Tests for Migration, Reset, and Close ==========
 
     def test_explicit_old_schema_migration(self, temp_db_path):
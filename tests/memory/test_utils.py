@@ -0,0 +1,39 @@
+import pytest
+
+from mem0.memory.utils import JsonArrayStreamParser
+
+RESPONSE = (
+    '```json\n{"facts": ["Likes \\"tea\\", a lot", {"text": "[nested]", "tags": [1, 2]}, bad, "Lives in Paris"]}'
+    "\n```"
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, len(RESPONSE)])
+def test_json_array_stream_parser_yields_items_as_they_complete(chunk_size):
+    parser = JsonArrayStreamParser("facts")
+
+    completed = []
+    for start in range(0, len(RESPONSE), chunk_size):
+        completed.extend(parser.feed(RESPONSE[start : start + chunk_size]))
+
+    assert completed == ['Likes "tea", a lot', {"text": "[nested]", "tags": [1, 2]}, "Lives in Paris"]
+    assert parser.items == completed
+    assert parser.done
+    assert parser.text == RESPONSE
+
+
+def test_json_array_stream_parser_items_complete_before_the_array():
+    parser = JsonArrayStreamParser("facts")
+
+    assert parser.feed('{"fa') == []
+    assert parser.feed('cts": ["Likes tea", "Lives') == ["Likes tea"]
+    assert parser.feed(' in Paris"') == []
+    assert parser.feed("]}") == ["Lives in Paris"]
+    assert parser.feed("trailing") == []
+
+
+def test_json_array_stream_parser_without_the_key():
+    parser = JsonArrayStreamParser("facts")
+
+    assert parser.feed('{"memories": ["Likes tea"]}') == []
+    assert not parser.done
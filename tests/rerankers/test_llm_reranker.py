@@ -0,0 +1,122 @@
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from mem0.reranker.llm_reranker import LLMReranker
+
+
+def _documents(count):
+    return [{"id": str(i), "memory": f"memory {i}"} for i in range(count)]
+
+
+@pytest.fixture
+def mock_llm():
+    with patch("mem0.reranker.llm_reranker.LlmFactory.create") as mock_create:
+        yield mock_create.return_value
+
+
+def _listwise_response(scores):
+    return json.dumps({"scores": [{"id": i, "score": score} for i, score in enumerate(scores)]})
+
+
+def test_listwise_scores_every_chunk_in_one_call(mock_llm):
+    mock_llm.generate_response.side_effect = [_listwise_response([0.1, 0.9]), _listwise_response([0.5])]
+    reranker = LLMReranker({"chunk_size": 2, "max_workers": 1})
+
+    results = reranker.rerank("query", _documents(3))
+
+    assert [doc["id"] for doc in results] == ["1", "2", "0"]
+    assert [doc["rerank_score"] for doc in results] == [0.9, 0.5, 0.1]
+    assert mock_llm.generate_response.call_count == 2
+    assert mock_llm.generate_response.call_args.kwargs["response_format"] == {"type": "json_object"}
+
+
+def test_documents_missing_from_a_listwise_response_are_scored_pointwise(mock_llm):
+    mock_llm.generate_response.side_effect = ['{"scores": [{"id": 1, "score": 0.2}]}', "0.8"]
+    reranker = LLMReranker({})
+
+    results = reranker.rerank("query", _documents(2))
+
+    assert [(doc["id"], doc["rerank_score"]) for doc in results] == [("0", 0.8), ("1", 0.2)]
+
+
+def test_pointwise_calls_run_in_parallel_and_only_rerank_top_n(mock_llm):
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def generate_response(messages, **kwargs):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.pop()
+        return "0.9" if "memory 2" in messages[0]["content"] else "0.1"
+
+    mock_llm.generate_response.side_effect = generate_response
+    reranker = LLMReranker({"mode": "pointwise", "top_n": 4, "max_workers": 4})
+
+    results = reranker.rerank("query", _documents(6))
+
+    assert [doc["id"] for doc in results] == ["2", "0", "1", "3", "4", "5"]
+    assert "rerank_score" not in results[4]
+    assert mock_llm.generate_response.call_count == 4
+    assert max(peak) > 1
+
+
+def test_deadline_returns_the_scored_documents_first(mock_llm):
+    def generate_response(messages, **kwargs):
+        if "memory 0" in messages[0]["content"]:
+            time.sleep(1)
+        return "0.7"
+
+    mock_llm.generate_response.side_effect = generate_response
+    reranker = LLMReranker({"mode": "pointwise", "timeout": 0.2})
+
+    start = time.monotonic()
+    results = reranker.rerank("query", _documents(3), top_k=2)
+
+    assert time.monotonic() - start < 0.9
+    assert [(doc["id"], doc.get("rerank_score")) for doc in results] == [("1", 0.7), ("2", 0.7)]
+
+
+def test_calls_past_a_deadline_do_not_hold_back_the_next_rerank(mock_llm):
+    release = threading.Event()
+
+    def generate_response(messages, **kwargs):
+        if "memory 0" in messages[0]["content"]:
+            release.wait(5)
+        return "0.7"
+
+    mock_llm.generate_response.side_effect = generate_response
+    reranker = LLMReranker({"mode": "pointwise", "timeout": 0.2, "max_workers": 1})
+
+    assert "rerank_score" not in reranker.rerank("query", _documents(1))[0]
+    results = reranker.rerank("query", [{"id": "1", "memory": "memory 1"}])
+
+    release.set()
+    assert results[0]["rerank_score"] == 0.7
+
+
+def test_unknown_mode_is_rejected(mock_llm):
+    with pytest.raises(ValidationError):
+        LLMReranker({"mode": "pairwise"})
+
+
+def test_custom_scoring_prompt_selects_pointwise_mode(mock_llm, caplog):
+    mock_llm.generate_response.return_value = "0.6"
+    reranker = LLMReranker({"scoring_prompt": "Score {document} for {query}"})
+
+    results = reranker.rerank("tea", _documents(1))
+
+    assert results[0]["rerank_score"] == 0.6
+    assert mock_llm.generate_response.call_args.kwargs["messages"][0]["content"] == "Score memory 0 for tea"
+    assert LLMReranker({"scoring_prompt": "{query}", "listwise_prompt": "{query}"}).mode == "listwise"
+
+    LLMReranker({"scoring_prompt": "{query} {document}", "mode": "listwise"})
+    assert "only used for pointwise calls" in caplog.text
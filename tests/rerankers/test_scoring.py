@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+import numpy as np
+
+from mem0.reranker.scoring import ScoreCache, length_bucketed_batches, score_documents
+
+
+def test_batches_group_items_of_similar_length():
+    lengths = [50, 3, 48, 2, 100, 4]
+    assert length_bucketed_batches(lengths, 2) == [[3, 1], [5, 2], [0, 4]]
+    assert length_bucketed_batches([], 2) == []
+
+
+def test_cached_scores_are_not_recomputed():
+    calls = []
+
+    def score_batch(query, texts):
+        calls.append(texts)
+        return [len(text) for text in texts]
+
+    cache = ScoreCache()
+    texts = ["a longer memory", "short", "short"]
+    assert score_documents("query", texts, score_batch, batch_size=2, cache=cache) == [15.0, 5.0, 5.0]
+    # Identical texts are scored once, in batches sorted by length
+    assert calls == [["short", "a longer memory"]]
+
+    assert score_documents("query", texts + ["new"], score_batch, batch_size=2, cache=cache) == [15.0, 5.0, 5.0, 3.0]
+    assert calls[1:] == [["new"]]
+    assert score_documents("other query", ["short"], score_batch, batch_size=2, cache=cache) == [5.0]
+    assert len(calls) == 3
+    assert cache.stats()["hits"] == 3
+
+
+def test_cache_is_keyed_by_memory_hash_and_bounded():
+    cache = ScoreCache(max_size=2)
+    score_documents("q", ["x"], lambda query, texts: [1.0], 8, cache=cache, doc_hashes=["h1"])
+    # Same hash, the cached score is reused
+    assert score_documents("q", ["y"], lambda query, texts: [2.0], 8, cache=cache, doc_hashes=["h1"]) == [1.0]
+
+    score_documents("q", ["a", "b"], lambda query, texts: [3.0, 4.0], 8, cache=cache)
+    assert cache.stats()["size"] == 2
+    assert score_documents("q", ["x"], lambda query, texts: [5.0], 8, cache=cache, doc_hashes=["h1"]) == [5.0]
+
+
+def test_sentence_transformer_reranker_reuses_scores():
+    module = "mem0.reranker.sentence_transformer_reranker"
+    with patch(f"{module}.SENTENCE_TRANSFORMERS_AVAILABLE", True), patch(
+        f"{module}.CrossEncoder", create=True
+    ) as mock_cross_encoder:
+        from mem0.reranker.sentence_transformer_reranker import SentenceTransformerReranker
+
+        model = mock_cross_encoder.return_value
+        model.predict.side_effect = lambda pairs, **kwargs: np.array([len(doc) for _, doc in pairs], dtype=float)
+        reranker = SentenceTransformerReranker({"batch_size": 8})
+        documents = [{"memory": "Likes tea", "hash": "1"}, {"memory": "Lives in Paris", "hash": "2"}]
+
+        first = reranker.rerank("query", documents)
+        second = reranker.rerank("query", documents)
+
+    assert [doc["memory"] for doc in first] == ["Lives in Paris", "Likes tea"]
+    assert second == first
+    model.predict.assert_called_once()
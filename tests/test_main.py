@@ -62,6 +62,7 @@ def memory_custom_instance():
             version="v1.1",
             custom_fact_extraction_prompt="custom prompt extracting memory",
             custom_update_memory_prompt="custom prompt determining memory update",
+            history_db_path=":memory:",
         )
         config.graph_store.config = {"some_config": "value"}
         return Memory(config)
@@ -267,6 +268,7 @@ def test_custom_prompts(memory_custom_instance):
     memory_custom_instance.llm.generate_response = Mock()
     memory_custom_instance.llm.generate_response.return_value = '{"facts": ["fact1", "fact2"]}'
     memory_custom_instance.embedding_model = MockEmbeddings()
+    memory_custom_instance.vector_store.search.return_value = [Mock(id="mem_1", payload={"data": "old fact"})]
 
     with patch("mem0.memory.main.parse_messages", return_value="Test message") as mock_parse_messages:
         with patch(
@@ -289,7 +291,9 @@ def test_custom_prompts(memory_custom_instance):
             ## custom update memory prompt
             ##
             mock_get_update_memory_messages.assert_called_once_with(
-                [], ["fact1", "fact2"], memory_custom_instance.config.custom_update_memory_prompt
+                [{"id": "0", "text": "old fact"}],
+                ["fact1", "fact2"],
+                memory_custom_instance.config.custom_update_memory_prompt,
             )
 
             memory_custom_instance.llm.generate_response.assert_any_call(
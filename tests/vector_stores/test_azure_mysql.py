@@ -2,6 +2,8 @@ import json
 import pytest
 from unittest.mock import Mock, patch
 
+from pymysql.cursors import SSDictCursor
+
 from mem0.vector_stores.azure_mysql import AzureMySQL, OutputData
 
 
@@ -100,28 +102,80 @@ def test_insert(azure_mysql_instance):
 
 
 def test_search(azure_mysql_instance):
-    """Test vector search."""
+    """Test vector search ranked by DISTANCE() in SQL."""
     # Mock the database response
     conn = azure_mysql_instance.connection_pool.connection()
     cursor = conn.cursor()
     cursor.fetchall = Mock(return_value=[
         {
             'id': 'id1',
-            'vector': json.dumps([0.1, 0.2, 0.3]),
+            'distance': 0.1,
             'payload': json.dumps({"text": "test1"})
         },
         {
             'id': 'id2',
-            'vector': json.dumps([0.4, 0.5, 0.6]),
+            'distance': 0.3,
             'payload': json.dumps({"text": "test2"})
         }
     ])
 
     query_vector = [0.2, 0.3, 0.4]
-    results = azure_mysql_instance.search(query="test", vectors=query_vector, limit=5)
+    results = azure_mysql_instance.search(
+        query="test", vectors=query_vector, limit=5, filters={"user_id": "alice"}
+    )
 
-    assert isinstance(results, list)
-    assert cursor.execute.called
+    assert [result.id for result in results] == ['id1', 'id2']
+    assert results[0].score == 0.1
+    sql, params = cursor.execute.call_args[0]
+    assert "ORDER BY distance" in sql
+    assert "`user_id` = %s" in sql
+    assert params == (json.dumps(query_vector), "alice", 5)
+
+
+@pytest.mark.parametrize("vector_format", ["binary", "json"])
+def test_search_without_vector_functions(azure_mysql_instance, vector_format):
+    """Test client side ranking over batches of decoded vectors."""
+    azure_mysql_instance.vector_format = vector_format
+    azure_mysql_instance.scan_batch_size = 2
+    stored = [[1.0, 0.0], [0.0, 1.0], [0.7, 0.7], [-1.0, 0.0], [0.9, 0.1]]
+    rows = [
+        {
+            'id': f'id{i}',
+            'vector': azure_mysql_instance._encode_vector(vector),
+            'payload': json.dumps({"text": f"test{i}"})
+        }
+        for i, vector in enumerate(stored)
+    ]
+
+    conn = azure_mysql_instance.connection_pool.connection()
+    cursor = conn.cursor()
+    cursor.fetchmany = Mock(side_effect=[rows[:2], rows[2:4], rows[4:], []])
+
+    results = azure_mysql_instance.search(query="test", vectors=[1.0, 0.0], limit=3)
+
+    assert [result.id for result in results] == ['id0', 'id4', 'id2']
+    assert results[0].score == pytest.approx(0.0, abs=1e-6)
+    assert results[0].payload == {"text": "test0"}
+    sql = cursor.execute.call_args[0][0]
+    assert "vector IS NOT NULL" in sql
+    assert conn.cursor.call_args[0] == (SSDictCursor,)
+
+
+def test_search_without_vector_functions_skips_missing_vectors(azure_mysql_instance):
+    """Rows stored without a vector are not ranked."""
+    azure_mysql_instance.vector_format = "binary"
+    rows = [
+        {'id': 'id0', 'vector': None, 'payload': json.dumps({})},
+        {'id': 'id1', 'vector': azure_mysql_instance._encode_vector([1.0, 0.0]), 'payload': json.dumps({})},
+    ]
+
+    conn = azure_mysql_instance.connection_pool.connection()
+    cursor = conn.cursor()
+    cursor.fetchmany = Mock(side_effect=[rows, [rows[0]], []])
+
+    results = azure_mysql_instance.search(query="test", vectors=[1.0, 0.0], limit=3)
+
+    assert [result.id for result in results] == ['id1']
 
 
 def test_delete(azure_mysql_instance):
@@ -91,26 +91,51 @@ def test_insert(cassandra_instance):
 
 
 def test_search(cassandra_instance):
-    """Test vector search."""
+    """Test ANN vector search."""
     # Mock the database response
     mock_row1 = Mock()
     mock_row1.id = 'id1'
-    mock_row1.vector = [0.1, 0.2, 0.3]
+    mock_row1.score = 0.9
     mock_row1.payload = json.dumps({"text": "test1"})
 
     mock_row2 = Mock()
     mock_row2.id = 'id2'
-    mock_row2.vector = [0.4, 0.5, 0.6]
+    mock_row2.score = 0.6
     mock_row2.payload = json.dumps({"text": "test2"})
 
     cassandra_instance.session.execute = Mock(return_value=[mock_row1, mock_row2])
 
     query_vector = [0.2, 0.3, 0.4]
-    results = cassandra_instance.search(query="test", vectors=query_vector, limit=5)
+    results = cassandra_instance.search(query="test", vectors=query_vector, limit=5, filters={"user_id": "alice"})
 
-    assert isinstance(results, list)
-    assert len(results) <= 5
-    assert cassandra_instance.session.execute.called
+    assert [result.id for result in results] == ['id1', 'id2']
+    assert results[0].score == pytest.approx(0.2)
+    query_cql = cassandra_instance.session.prepare.call_args[0][0]
+    assert "ORDER BY vector ANN OF ?" in query_cql
+    assert "WHERE user_id = ?" in query_cql
+    assert cassandra_instance.session.execute.call_args[0][1] == (query_vector, "alice", query_vector, 5)
+
+
+def test_search_without_vector_index(cassandra_instance):
+    """Test the vectorized client side scan used when ANN is unavailable."""
+    cassandra_instance.ann_enabled = False
+    cassandra_instance.scan_page_size = 2
+
+    rows = []
+    for i, vector in enumerate([[1.0, 0.0], [0.0, 1.0], [0.7, 0.7], [-1.0, 0.0], [0.9, 0.1]]):
+        row = Mock()
+        row.id = f'id{i}'
+        row.vector = vector
+        row.payload = json.dumps({"text": f"test{i}"})
+        rows.append(row)
+
+    cassandra_instance.session.execute = Mock(return_value=rows)
+
+    results = cassandra_instance.search(query="test", vectors=[1.0, 0.0], limit=3)
+
+    assert [result.id for result in results] == ['id0', 'id4', 'id2']
+    assert results[0].score == pytest.approx(0.0, abs=1e-6)
+    assert "ANN" not in cassandra_instance.session.execute.call_args[0][0].query_string
 
 
 def test_delete(cassandra_instance):
@@ -250,12 +275,12 @@ def test_search_with_filters(cassandra_instance):
     # Mock the database response
     mock_row1 = Mock()
     mock_row1.id = 'id1'
-    mock_row1.vector = [0.1, 0.2, 0.3]
+    mock_row1.score = 0.9
     mock_row1.payload = json.dumps({"text": "test1", "category": "A"})
 
     mock_row2 = Mock()
     mock_row2.id = 'id2'
-    mock_row2.vector = [0.4, 0.5, 0.6]
+    mock_row2.score = 0.8
     mock_row2.payload = json.dumps({"text": "test2", "category": "B"})
 
     cassandra_instance.session.execute = Mock(return_value=[mock_row1, mock_row2])
@@ -270,8 +295,9 @@ def test_search_with_filters(cassandra_instance):
 
     assert isinstance(results, list)
     # Should only return filtered results
-    for result in results:
-        assert result.payload.get("category") == "A"
+    assert [result.id for result in results] == ['id1']
+    # Payload filters are matched on the client, so more candidates are fetched
+    assert cassandra_instance.session.execute.call_args[0][1][-1] == 50
 
 
 def test_output_data_model():
@@ -289,3 +289,48 @@ def test_normalize_L2(faiss_instance, mock_faiss_index):
 
             # Verify faiss.normalize_L2 was called
             mock_normalize.assert_called_once()
+
+
+@pytest.mark.parametrize("quantization", ["sq_fp16", "sq8", "binary"])
+def test_quantized_search(tmp_path, quantization):
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((20, 64))
+    vectors = (np.repeat(centers, 10, axis=0) + 0.1 * rng.standard_normal((200, 64))).astype(np.float32)
+    store = FAISS(
+        collection_name="test",
+        path=str(tmp_path / "faiss"),
+        distance_strategy="inner_product",
+        embedding_model_dims=64,
+        quantization=quantization,
+    )
+    store.insert(vectors.tolist(), [{"n": i} for i in range(200)], [f"id{i}" for i in range(200)])
+
+    results = store.search("query", vectors[42].tolist(), limit=5)
+
+    assert results[0].id == "id42"
+    assert {r.id for r in results} <= {f"id{i}" for i in range(40, 50)}
+    assert store.col_info()["quantization"] == quantization
+
+
+def test_binary_quantization_rescores_with_float_vectors(tmp_path):
+    rng = np.random.default_rng(1)
+    vectors = rng.standard_normal((50, 12)).astype(np.float32)
+    path = str(tmp_path / "faiss")
+    store = FAISS(collection_name="test", path=path, embedding_model_dims=12, quantization="binary")
+    store.insert(vectors.tolist(), ids=[f"id{i}" for i in range(50)])
+    store.update("id3", vector=(vectors[3] + 100).tolist())
+
+    reopened = FAISS(collection_name="test", path=path, embedding_model_dims=12, quantization="binary")
+    results = reopened.search("query", vectors[7].tolist(), limit=3)
+
+    assert isinstance(reopened.index, faiss.IndexBinaryFlat)
+    assert reopened.index.ntotal == 51
+    assert results[0].id == "id7"
+    assert results[0].score == pytest.approx(0.0, abs=1e-5)
+    assert [r.score for r in results] == sorted(r.score for r in results)
+    assert reopened.search("query", (vectors[3] + 100).tolist(), limit=1)[0].id == "id3"
+
+
+def test_invalid_quantization(tmp_path):
+    with pytest.raises(ValueError):
+        FAISS(collection_name="test", path=str(tmp_path / "faiss"), quantization="pq")
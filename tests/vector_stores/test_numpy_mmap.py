@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from mem0.vector_stores.numpy_mmap import NumpyMmap
+
+
+@pytest.fixture
+def vectors():
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((200, 16)).astype(np.float32)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return NumpyMmap(collection_name="test", path=str(tmp_path), embedding_model_dims=16, search_batch_size=64)
+
+
+def _insert(store, vectors):
+    payloads = [
+        {"user_id": f"user{i % 3}", "n": i, "data": "Likes Pizza" if i % 2 else "other"} for i in range(len(vectors))
+    ]
+    store.insert(vectors.tolist(), payloads, [f"id{i}" for i in range(len(vectors))])
+
+
+def _expected(vectors, query, limit, offset=0):
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return [f"id{offset + i}" for i in np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:limit]]
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float16", "int8"])
+def test_search_is_exact(tmp_path, vectors, dtype):
+    store = NumpyMmap(
+        collection_name="test", path=str(tmp_path), embedding_model_dims=16, dtype=dtype, search_batch_size=64
+    )
+    _insert(store, vectors)
+
+    results = store.search("query", vectors[7].tolist(), limit=5)
+
+    assert [r.id for r in results] == _expected(vectors, vectors[7], 5)
+    assert results[0].score == pytest.approx(1.0, abs=0.02)
+    assert results[0].payload == {"user_id": "user1", "n": 7, "data": "Likes Pizza"}
+
+
+def test_search_with_filters(store, vectors):
+    _insert(store, vectors)
+
+    results = store.search(
+        "query",
+        vectors[7].tolist(),
+        limit=100,
+        filters={"user_id": "user1", "n": {"gte": 100}, "data": {"icontains": "pizza"}},
+    )
+
+    assert results
+    assert all(r.payload["user_id"] == "user1" and r.payload["n"] >= 100 and r.payload["n"] % 2 for r in results)
+    assert [r.score for r in results] == sorted((r.score for r in results), reverse=True)
+
+
+def test_compile_filters(store):
+    sql, params = store._compile_filters(
+        {"user_id": {"in": ["a", "b"]}, "$or": [{"n": {"gt": 1}}, {"flag": True}], "agent_id": "*"}
+    )
+
+    assert sql == (
+        "user_id IN (?, ?) AND (((typeof(json_extract(payload, ?)) IN ('integer', 'real') "
+        "AND json_extract(payload, ?) > ?)) OR (json_extract(payload, ?) = ?))"
+    )
+    assert params == ["a", "b", '$."n"', '$."n"', 1, '$."flag"', 1]
+    with pytest.raises(ValueError):
+        store._compile_filters({"user_id": {"regex": "a.*"}})
+
+
+def test_update_and_delete(store, vectors):
+    _insert(store, vectors)
+
+    store.update("id7", vector=(-vectors[7]).tolist(), payload={"user_id": "user9"})
+    store.delete("id8")
+
+    assert store.search("query", vectors[7].tolist(), limit=1)[0].id != "id7"
+    assert store.search("query", (-vectors[7]).tolist(), limit=1)[0].id == "id7"
+    assert store.get("id7").payload == {"user_id": "user9"}
+    assert store.get("id8") is None
+    assert [r.id for r in store.list(filters={"user_id": "user9"})[0]] == ["id7"]
+    info = store.col_info()
+    assert (info["count"], info["rows"], info["dead_rows"]) == (199, 201, 2)
+
+
+def test_compact_keeps_readers_consistent(tmp_path, vectors):
+    writer = NumpyMmap(collection_name="test", path=str(tmp_path), embedding_model_dims=16, auto_compact_ratio=None)
+    _insert(writer, vectors)
+    reader = NumpyMmap(collection_name="test", path=str(tmp_path), embedding_model_dims=16)
+    assert reader.search("query", vectors[150].tolist(), limit=1)[0].id == "id150"
+
+    for i in range(100):
+        writer.delete(f"id{i}")
+    writer.compact()
+
+    info = writer.col_info()
+    assert (info["count"], info["rows"], info["dead_rows"]) == (100, 100, 0)
+    results = reader.search("query", vectors[150].tolist(), limit=3)
+    assert [r.id for r in results] == _expected(vectors[100:], vectors[150], 3, offset=100)
+
+
+def test_reopen_keeps_layout(tmp_path, vectors):
+    store = NumpyMmap(collection_name="test", path=str(tmp_path), embedding_model_dims=16, dtype="int8")
+    _insert(store, vectors)
+
+    reopened = NumpyMmap(collection_name="test", path=str(tmp_path), embedding_model_dims=16)
+
+    assert reopened.dtype == "int8"
+    assert reopened.col_info()["count"] == 200
+    assert reopened.list_cols() == ["test"]
+
+
+def test_reset(store, vectors):
+    _insert(store, vectors)
+
+    store.reset()
+
+    assert store.col_info()["count"] == 0
+    assert store.search("query", vectors[0].tolist(), limit=5) == []
@@ -317,17 +317,15 @@ class TestPGVector(unittest.TestCase):
         # Verify the _get_cursor context manager was called
         mock_get_cursor.assert_called()
         
-        # Verify insert query was executed (psycopg3 uses executemany)
-        insert_calls = [call for call in self.mock_cursor.executemany.call_args_list 
+        # Verify a single multi-row upsert was executed
+        insert_calls = [call for call in self.mock_cursor.execute.call_args_list
                        if "INSERT INTO test_collection" in str(call)]
-        self.assertTrue(len(insert_calls) > 0)
-        
-        # Verify data format
-        call_args = self.mock_cursor.executemany.call_args
-        data_arg = call_args[0][1]
-        self.assertEqual(len(data_arg), 2)
-        self.assertEqual(data_arg[0][0], self.test_ids[0])
-        self.assertEqual(data_arg[1][0], self.test_ids[1])
+        self.assertEqual(len(insert_calls), 1)
+        query, params = insert_calls[0][0]
+        self.assertIn("VALUES (%s, %s, %s), (%s, %s, %s)", query)
+        self.assertIn("ON CONFLICT (id) DO UPDATE", query)
+        self.assertEqual(params[0], self.test_ids[0])
+        self.assertEqual(params[3], self.test_ids[1])
 
     @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 2)
     @patch('mem0.vector_stores.pgvector.ConnectionPool')
@@ -2043,14 +2041,11 @@ class TestPGVector(unittest.TestCase):
         test_payload = {"updated": True}
         pgvector.update("test-id", vector=test_vector, payload=test_payload)
         
-        # Verify both vector and payload update queries were executed
-        vector_update_calls = [call for call in self.mock_cursor.execute.call_args_list 
-                              if "UPDATE test_collection SET vector" in str(call)]
-        payload_update_calls = [call for call in self.mock_cursor.execute.call_args_list 
-                               if "UPDATE test_collection SET payload" in str(call)]
-        
-        self.assertTrue(len(vector_update_calls) > 0)
-        self.assertTrue(len(payload_update_calls) > 0)
+        # Verify vector and payload are updated in a single statement
+        update_calls = [call for call in self.mock_cursor.execute.call_args_list
+                       if "UPDATE test_collection" in str(call)]
+        self.assertEqual(len(update_calls), 1)
+        self.assertIn("SET vector = %s, payload = %s WHERE id = %s", update_calls[0][0][0])
 
     # Enhanced Tests for Connection String Handling
     @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
@@ -2166,6 +2161,320 @@ class TestPGVector(unittest.TestCase):
         self.assertEqual(pgvector.collection_name, "test_collection")
         self.assertEqual(pgvector.embedding_model_dims, 3)
 
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_create_col_creates_filter_indexes_psycopg3(self, mock_get_cursor, mock_connection_pool):
+        """Test collection creation adds the GIN payload index and generated scope columns."""
+        mock_get_cursor.return_value.__enter__.return_value = self.mock_cursor
+        mock_get_cursor.return_value.__exit__.return_value = None
+        self.mock_cursor.fetchall.return_value = []
+
+        PGVector(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=True,
+        )
+
+        statements = " ".join(str(call) for call in self.mock_cursor.execute.call_args_list)
+        self.assertIn("USING gin (payload jsonb_path_ops)", statements)
+        for column in ("user_id", "agent_id", "run_id"):
+            self.assertIn(f"{column} TEXT GENERATED ALWAYS AS (payload->>'{column}') STORED", statements)
+            self.assertIn(f"test_collection_{column}_idx ON test_collection ({column})", statements)
+        self.assertNotIn("ALTER TABLE", statements)
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_existing_collection_without_filter_columns_psycopg3(self, mock_get_cursor, mock_connection_pool):
+        """Test an existing collection is not altered on start and filters fall back to the payload."""
+        mock_get_cursor.return_value.__enter__.return_value = self.mock_cursor
+        mock_get_cursor.return_value.__exit__.return_value = None
+        self.mock_cursor.fetchall.side_effect = [[("test_collection",)], [("user_id",)]]
+
+        pgvector = PGVector(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=True,
+        )
+
+        statements = " ".join(str(call) for call in self.mock_cursor.execute.call_args_list)
+        self.assertNotIn("ALTER TABLE", statements)
+        self.assertNotIn("CREATE INDEX", statements)
+        self.assertEqual(pgvector.scope_columns, {"user_id"})
+        sql, params = pgvector._compile_filters({"user_id": "alice", "agent_id": "bot"})
+        self.assertEqual(sql, "user_id = %s AND payload @> %s::jsonb")
+        self.assertEqual(params, ["alice", '{"agent_id": "bot"}'])
+
+        self.mock_cursor.execute.reset_mock()
+        self.mock_cursor.fetchall.side_effect = [[("user_id",)]]
+        pgvector.migrate_filter_columns()
+
+        statements = " ".join(str(call) for call in self.mock_cursor.execute.call_args_list)
+        self.assertNotIn("ADD COLUMN IF NOT EXISTS user_id", statements)
+        for column in ("agent_id", "run_id"):
+            self.assertIn(f"ADD COLUMN IF NOT EXISTS {column} TEXT GENERATED ALWAYS AS (payload->>'{column}')", statements)
+        self.assertIn("USING gin (payload jsonb_path_ops)", statements)
+        self.assertEqual(pgvector.scope_columns, {"user_id", "agent_id", "run_id"})
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_compile_filters(self, mock_get_cursor, mock_connection_pool):
+        """Test the filter format is compiled to parameterized SQL."""
+        mock_get_cursor.return_value.__enter__.return_value = self.mock_cursor
+        mock_get_cursor.return_value.__exit__.return_value = None
+        self.mock_cursor.fetchall.return_value = []
+        pgvector = PGVector(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=False,
+        )
+
+        sql, params = pgvector._compile_filters({
+            "user_id": "alice",
+            "category": {"in": ["work", "travel"]},
+            "status": {"nin": ["archived"]},
+            "score": {"gte": 3},
+            "text": {"icontains": "50%"},
+            "agent_id": "*",
+            "$or": [{"topic": "food"}, {"topic": "sports", "priority": {"ne": 1}}],
+            "$not": [{"run_id": "r1"}],
+        })
+
+        self.assertEqual(
+            sql,
+            "user_id = %s"
+            " AND (payload->>%s) = ANY(%s)"
+            " AND NOT COALESCE((payload->>%s) = ANY(%s), false)"
+            " AND (CASE WHEN jsonb_typeof(payload->%s) = 'number' THEN (payload->>%s)::numeric END) >= %s"
+            " AND (payload->>%s) ILIKE %s"
+            " AND ((payload @> %s::jsonb) OR (payload @> %s::jsonb AND (payload->>%s) IS DISTINCT FROM %s))"
+            " AND NOT ((run_id = %s))",
+        )
+        self.assertEqual(
+            params,
+            [
+                "alice",
+                "category", ["work", "travel"],
+                "status", ["archived"],
+                "score", "score", 3,
+                "text", "%50\\%%",
+                '{"topic": "food"}', '{"topic": "sports"}', "priority", "1",
+                "r1",
+            ],
+        )
+
+        with self.assertRaises(ValueError):
+            pgvector._compile_filters({"user_id": {"regex": "a.*"}})
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_search_sets_hnsw_scan_options_psycopg3(self, mock_get_cursor, mock_connection_pool):
+        """Test filtered HNSW searches raise ef_search and enable iterative scans."""
+        mock_get_cursor.return_value.__enter__.return_value = self.mock_cursor
+        mock_get_cursor.return_value.__exit__.return_value = None
+        self.mock_cursor.fetchall.return_value = []
+        pgvector = PGVector(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=True,
+        )
+        self.mock_cursor.execute.reset_mock()
+        self.mock_cursor.fetchall.return_value = [
+            (self.test_ids[1], 0.3, {"user_id": "alice"}),
+            (self.test_ids[0], 0.2, {"user_id": "alice"}),
+        ]
+
+        results = pgvector.search("test query", [0.1, 0.2, 0.3], limit=100, filters={"user_id": "alice"})
+
+        calls = self.mock_cursor.execute.call_args_list
+        self.assertEqual(calls[0][0], ("SELECT set_config('hnsw.ef_search', %s, true)", ("100",)))
+        self.assertEqual(calls[1][0], ("SELECT set_config('hnsw.iterative_scan', %s, true)", ("relaxed_order",)))
+        self.assertIn("WHERE user_id = %s", calls[2][0][0])
+        self.assertEqual([r.id for r in results], [self.test_ids[0], self.test_ids[1]])
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_halfvec_quantization_psycopg3(self, mock_get_cursor, mock_connection_pool):
+        """Test halfvec quantization stores, indexes and queries float16 vectors."""
+        mock_get_cursor.return_value.__enter__.return_value = self.mock_cursor
+        mock_get_cursor.return_value.__exit__.return_value = None
+        self.mock_cursor.fetchall.return_value = []
+        pgvector = PGVector(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=True,
+            quantization="halfvec",
+        )
+        queries = [call[0][0] for call in self.mock_cursor.execute.call_args_list]
+        self.assertTrue(any("vector halfvec(3)" in query for query in queries))
+        self.assertTrue(any("USING hnsw (vector halfvec_cosine_ops)" in query for query in queries))
+
+        self.mock_cursor.execute.reset_mock()
+        pgvector.search("test query", [0.1, 0.2, 0.3], limit=5)
+
+        self.assertIn("vector <=> %s::halfvec AS distance", self.mock_cursor.execute.call_args_list[-1][0][0])
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_bit_quantization_reranks_candidates_psycopg3(self, mock_get_cursor, mock_connection_pool):
+        """Test bit quantization indexes binary codes and re-ranks the Hamming candidates by exact distance."""
+        mock_get_cursor.return_value.__enter__.return_value = self.mock_cursor
+        mock_get_cursor.return_value.__exit__.return_value = None
+        self.mock_cursor.fetchall.return_value = []
+        pgvector = PGVector(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=True,
+            quantization="bit",
+            rescore_multiplier=10,
+        )
+        queries = [call[0][0] for call in self.mock_cursor.execute.call_args_list]
+        self.assertTrue(any("vector vector(3)" in query for query in queries))
+        self.assertTrue(any("(binary_quantize(vector)::bit(3)) bit_hamming_ops" in query for query in queries))
+
+        self.mock_cursor.execute.reset_mock()
+        pgvector.search("test query", [0.1, 0.2, 0.3], limit=5, filters={"user_id": "alice"})
+
+        calls = self.mock_cursor.execute.call_args_list
+        self.assertEqual(calls[0][0], ("SELECT set_config('hnsw.ef_search', %s, true)", ("50",)))
+        query, params = calls[-1][0]
+        self.assertIn("binary_quantize(vector)::bit(3) <~> binary_quantize(%s::vector)::bit(3)", query)
+        self.assertIn("ORDER BY distance", query)
+        self.assertEqual(params, ([0.1, 0.2, 0.3], "alice", [0.1, 0.2, 0.3], 50, 5))
+
+    def test_invalid_quantization(self):
+        with self.assertRaises(ValueError):
+            PGVector(
+                dbname="test_db",
+                collection_name="test_collection",
+                embedding_model_dims=3,
+                user="test_user",
+                password="test_pass",
+                host="localhost",
+                port=5432,
+                diskann=False,
+                hnsw=True,
+                quantization="pq",
+            )
+
+    @patch('mem0.vector_stores.pgvector.register_vector', None)
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_bulk_insert_copies_rows_and_builds_deferred_index_psycopg3(self, mock_get_cursor, mock_connection_pool):
+        """Test bulk_insert binary-copies rows into a staging table and builds the deferred HNSW index."""
+        mock_get_cursor.return_value.__enter__.return_value = self.mock_cursor
+        mock_get_cursor.return_value.__exit__.return_value = None
+        self.mock_cursor.fetchall.return_value = []
+        pgvector = PGVector(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=True,
+            defer_index_creation=True,
+        )
+        statements = " ".join(str(call) for call in self.mock_cursor.execute.call_args_list)
+        self.assertNotIn("USING hnsw", statements)
+        self.assertTrue(pgvector.index_pending)
+
+        copy_cursor = self.mock_cursor.connection.cursor.return_value.__enter__.return_value
+        copy = copy_cursor.copy.return_value.__enter__.return_value
+        self.mock_cursor.execute.reset_mock()
+
+        stats = pgvector.bulk_insert(self.test_vectors, self.test_payloads, self.test_ids)
+
+        copy_cursor.copy.assert_called_once_with(
+            "COPY test_collection_staging (id, vector, payload) FROM STDIN (FORMAT BINARY)"
+        )
+        copy.set_types.assert_called_once_with(["uuid", "float4[]", "jsonb"])
+        written = [call[0][0] for call in copy.write_row.call_args_list]
+        self.assertEqual([str(row[0]) for row in written], self.test_ids)
+        self.assertEqual(written[0][1:], (self.test_vectors[0], self.test_payloads[0]))
+
+        statements = [str(call[0][0]) for call in self.mock_cursor.execute.call_args_list]
+        self.assertIn("CREATE TEMP TABLE test_collection_staging", statements[0])
+        self.assertIn("ON CONFLICT (id) DO UPDATE", statements[1])
+        self.assertIn("USING hnsw (vector vector_cosine_ops)", statements[2])
+        self.assertFalse(pgvector.index_pending)
+        self.assertEqual(stats["rows"], 2)
+        self.assertGreaterEqual(stats["rows_per_sec"], 0)
+
+    @patch('mem0.vector_stores.pgvector.PSYCOPG_VERSION', 3)
+    @patch('mem0.vector_stores.pgvector.ConnectionPool')
+    @patch.object(PGVector, '_get_cursor')
+    def test_insert_batches_and_deduplicates_ids_psycopg3(self, mock_get_cursor, mock_connection_pool):
+        """Test inserts are split into batches and repeated ids keep their last vector."""
+        mock_get_cursor.return_value.__enter__.return_value = self.mock_cursor
+        mock_get_cursor.return_value.__exit__.return_value = None
+        self.mock_cursor.fetchall.return_value = []
+        pgvector = PGVector(
+            dbname="test_db",
+            collection_name="test_collection",
+            embedding_model_dims=3,
+            user="test_user",
+            password="test_pass",
+            host="localhost",
+            port=5432,
+            diskann=False,
+            hnsw=False,
+            insert_batch_size=2,
+        )
+        self.mock_cursor.execute.reset_mock()
+        ids = [str(uuid.uuid4()) for _ in range(3)]
+
+        pgvector.insert([[0.1] * 3, [0.2] * 3, [0.3] * 3, [0.4] * 3], [{}, {}, {}, {"last": True}], [*ids, ids[0]])
+
+        insert_calls = [call[0] for call in self.mock_cursor.execute.call_args_list]
+        self.assertEqual(len(insert_calls), 2)
+        self.assertEqual(insert_calls[0][1][:3], [ids[0], [0.4] * 3, '{"last": true}'])
+        self.assertEqual(insert_calls[1][1][0], ids[2])
+
     # Enhanced Test for Pool Cleanup
     def test_pool_cleanup_psycopg3(self):
         """Test that psycopg3 pool is properly closed on object deletion."""
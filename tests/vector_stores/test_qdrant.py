@@ -4,8 +4,15 @@ from unittest.mock import MagicMock
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
+    DatetimeRange,
     Distance,
+    FieldCondition,
     Filter,
+    MatchAny,
+    MatchExcept,
+    MatchText,
+    MatchValue,
+    PayloadSchemaType,
     PointIdsList,
     PointStruct,
     VectorParams,
@@ -185,6 +192,66 @@ class TestQdrant(unittest.TestCase):
         self.assertEqual(len(string_conditions), 1)
         self.assertEqual(string_conditions[0].key, "user_id")
 
+    def test_create_filter_operators(self):
+        """Test _create_filter with every operator of the filter format."""
+        filters = {
+            "user_id": "alice",
+            "category": {"in": ["work", "travel"]},
+            "status": {"nin": ["archived"]},
+            "owner": {"ne": "bob"},
+            "text": {"icontains": "paris"},
+            "score": {"gt": 1, "lte": 5},
+            "created_at": {"gte": "2024-01-01T00:00:00Z"},
+            "agent_id": "*",
+        }
+        result = self.qdrant._create_filter(filters)
+
+        conditions = {cond.key: cond for cond in result.must}
+        self.assertNotIn("agent_id", conditions)
+        self.assertEqual(conditions["user_id"].match, MatchValue(value="alice"))
+        self.assertEqual(conditions["category"].match, MatchAny(any=["work", "travel"]))
+        self.assertEqual(conditions["status"].match, MatchExcept(**{"except": ["archived"]}))
+        self.assertEqual(conditions["owner"].match, MatchExcept(**{"except": ["bob"]}))
+        self.assertEqual(conditions["text"].match, MatchText(text="paris"))
+        self.assertEqual((conditions["score"].range.gt, conditions["score"].range.lte), (1, 5))
+        self.assertIsInstance(conditions["created_at"].range, DatetimeRange)
+
+    def test_create_filter_logical_operators(self):
+        """Test $or and $not lists become should and must_not clauses."""
+        filters = {
+            "user_id": "alice",
+            "$or": [{"category": "work"}, {"category": "travel", "priority": {"gte": 3}}],
+            "$not": [{"status": "archived"}],
+        }
+        result = self.qdrant._create_filter(filters)
+
+        self.assertEqual(len(result.must), 1)
+        self.assertEqual(len(result.should), 2)
+        self.assertIsInstance(result.should[0], FieldCondition)
+        self.assertIsInstance(result.should[1], Filter)
+        self.assertEqual(len(result.should[1].must), 2)
+        self.assertEqual(result.must_not[0].key, "status")
+
+    def test_create_filter_unsupported_operator(self):
+        with self.assertRaises(ValueError):
+            self.qdrant._create_filter({"user_id": {"regex": "a.*"}})
+
+    def test_create_filter_indexes(self):
+        """Test configured payload indexes are created next to the default ones."""
+        self.qdrant.is_local = False
+        self.qdrant.payload_indexes = {"user_id": "keyword", "created_at": "datetime", "text": "text"}
+        self.client_mock.create_payload_index.reset_mock()
+
+        self.qdrant._create_filter_indexes()
+
+        schemas = {
+            call.kwargs["field_name"]: call.kwargs["field_schema"]
+            for call in self.client_mock.create_payload_index.call_args_list
+        }
+        self.assertEqual(schemas["user_id"], PayloadSchemaType.KEYWORD)
+        self.assertEqual(schemas["created_at"], PayloadSchemaType.DATETIME)
+        self.assertTrue(schemas["text"].lowercase)
+
     def test_delete(self):
         vector_id = str(uuid.uuid4())
         self.qdrant.delete(vector_id=vector_id)
@@ -194,6 +261,15 @@ class TestQdrant(unittest.TestCase):
             points_selector=PointIdsList(points=[vector_id]),
         )
 
+    def test_delete_many(self):
+        vector_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        self.qdrant.delete_many(vector_ids=vector_ids)
+
+        self.client_mock.delete.assert_called_once_with(
+            collection_name="test_collection",
+            points_selector=PointIdsList(points=vector_ids),
+        )
+
     def test_update(self):
         vector_id = str(uuid.uuid4())
         updated_vector = [0.2, 0.3]
@@ -219,6 +295,17 @@ class TestQdrant(unittest.TestCase):
         self.assertEqual(result["id"], vector_id)
         self.assertEqual(result["payload"], {"key": "value"})
 
+    def test_get_many(self):
+        vector_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        self.client_mock.retrieve.return_value = [{"id": vector_ids[0], "payload": {"key": "value"}}]
+
+        result = self.qdrant.get_many(vector_ids=vector_ids)
+
+        self.client_mock.retrieve.assert_called_once_with(
+            collection_name="test_collection", ids=vector_ids, with_payload=True
+        )
+        self.assertEqual(result, [{"id": vector_ids[0], "payload": {"key": "value"}}])
+
     def test_list_cols(self):
         self.client_mock.get_collections.return_value = MagicMock(collections=[{"name": "test_collection"}])
         result = self.qdrant.list_cols()
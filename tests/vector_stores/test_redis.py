@@ -0,0 +1,136 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from redis.commands.search.document import Document
+
+from mem0.vector_stores.redis import RedisDB
+
+
+@pytest.fixture
+def mock_index():
+    with patch("mem0.vector_stores.redis.SearchIndex") as mock_search_index:
+        yield mock_search_index.from_dict.return_value
+
+
+@pytest.fixture
+def redis_db(mock_index):
+    with patch("redis.Redis.from_url") as mock_from_url:
+        db = RedisDB(redis_url="redis://localhost:6379", collection_name="test_collection", embedding_model_dims=3)
+        db.client = mock_from_url.return_value
+        yield db
+
+
+def _result(memory_id, distance, **fields):
+    return {
+        "memory_id": memory_id,
+        "hash": f"hash_{memory_id}",
+        "memory": f"memory {memory_id}",
+        "created_at": "1704067200",
+        "metadata": json.dumps(fields.pop("metadata", {})),
+        "vector_distance": str(distance),
+        **fields,
+    }
+
+
+def test_build_filter_translates_operators(redis_db):
+    expression, exact = redis_db._build_filter(
+        {
+            "user_id": "alice",
+            "agent_id": {"nin": ["a", "b"]},
+            "created_at": {"gte": "2024-01-01T00:00:00+00:00", "lt": 1800000000},
+            "$or": [{"run_id": "r1"}, {"hash": {"contains": "ab"}}],
+            "$not": [{"user_id": "bob"}],
+        }
+    )
+
+    assert exact
+    assert str(expression) == (
+        "(((((@user_id:{alice} (-@agent_id:{a|b})) @created_at:[1704067200 +inf]) @created_at:[-inf (1800000000])"
+        " (@run_id:{r1} | @hash:{*ab*})) -(@user_id:{bob}))"
+    )
+
+
+def test_build_filter_empty_filters(redis_db):
+    assert redis_db._build_filter(None) == (None, True)
+    assert redis_db._build_filter({"user_id": "*"}) == (None, True)
+
+
+def test_build_filter_unsupported_operator(redis_db):
+    with pytest.raises(ValueError):
+        redis_db._build_filter({"user_id": {"regex": "a.*"}})
+
+
+def test_search_without_filters(redis_db, mock_index):
+    mock_index.query.return_value = [_result("1", 0.1, user_id="alice", metadata={"category": "food"})]
+
+    results = redis_db.search("query", [0.1, 0.2, 0.3], limit=5)
+
+    vector_query = mock_index.query.call_args[0][0]
+    assert str(vector_query._filter_expression) == "*"
+    assert results[0].id == "1"
+    assert results[0].score == 0.1
+    assert results[0].payload["category"] == "food"
+    assert results[0].payload["user_id"] == "alice"
+
+
+def test_search_checks_unindexed_filters_on_results(redis_db, mock_index):
+    mock_index.query.return_value = [
+        _result("1", 0.1, user_id="alice", metadata={"category": "work"}),
+        _result("2", 0.2, user_id="alice", metadata={"category": "food"}),
+    ]
+
+    results = redis_db.search("query", [0.1, 0.2, 0.3], limit=1, filters={"user_id": "alice", "category": "food"})
+
+    vector_query = mock_index.query.call_args[0][0]
+    assert vector_query._num_results == 10
+    assert [result.id for result in results] == ["2"]
+
+
+def test_hybrid_search_combines_text_and_vector_scores(redis_db, mock_index):
+    redis_db.hybrid_search = True
+    redis_db.hybrid_alpha = 0.5
+    near = Document("k1", score="0", **_result("1", 0.2))
+    keyword = Document("k2", score="4", **_result("2", 0.4))
+    mock_index.search.return_value = MagicMock(docs=[near, keyword])
+
+    results = redis_db.search("Pizza, pizza!", [0.1, 0.2, 0.3], limit=2, filters={"user_id": "alice"})
+
+    query = mock_index.search.call_args[0][0]
+    assert query.query_string() == "(~@memory:(pizza) @user_id:{alice})=>[KNN 8 @embedding $vector AS vector_distance]"
+    params = mock_index.search.call_args[1]["query_params"]
+    assert params["vector"] == np.array([0.1, 0.2, 0.3], dtype=np.float32).tobytes()
+    assert [result.id for result in results] == ["2", "1"]
+    assert results[0].score == pytest.approx(2 * (1 - (0.5 * 0.8 + 0.5)))
+
+
+def test_update_many_pipelines_writes(redis_db):
+    payload = {"hash": "h", "data": "d", "created_at": "2024-01-01T00:00:00+00:00", "user_id": "alice", "k": "v"}
+
+    redis_db.update_many(["1", "2"], [[0.1, 0.2, 0.3], None], [payload, payload])
+
+    pipeline = redis_db.client.pipeline.return_value
+    assert pipeline.hset.call_count == 2
+    first, second = pipeline.hset.call_args_list
+    assert first[0][0] == "mem0:test_collection:1"
+    assert "embedding" in first[1]["mapping"]
+    assert "embedding" not in second[1]["mapping"]
+    assert json.loads(second[1]["mapping"]["metadata"]) == {"k": "v"}
+    pipeline.execute.assert_called_once()
+
+
+def test_delete_many_drops_keys_together(redis_db, mock_index):
+    redis_db.delete_many(["1", "2"])
+
+    mock_index.drop_keys.assert_called_once_with(["mem0:test_collection:1", "mem0:test_collection:2"])
+
+
+def test_list_with_filters(redis_db, mock_index):
+    mock_index.search.return_value = MagicMock(docs=[Document("k1", **_result("1", 0, user_id="alice"))])
+
+    results = redis_db.list(filters={"user_id": "alice"}, limit=10)
+
+    query = mock_index.search.call_args[0][0]
+    assert query.query_string() == "@user_id:{alice}"
+    assert [result.id for result in results[0]] == ["1"]